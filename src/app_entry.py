@@ -7,10 +7,16 @@ import sys
 
 def _run_ui_with_recorder_service() -> None:
     """Run ui with recorder service."""
+    from core import startup_profile
+
+    # Vor allen schweren Imports starten, sonst fehlen sie im Profil (IRVC_STARTUP_PROFILE=1).
+    startup_profile.begin()
     from core import persistence
     from core.irsdk.recorder_service import RecorderService
     import ui.app as ui_app
 
+    startup_profile.mark("ui_imported")
+
     recorder_service = RecorderService()
 
     def _current_irsdk_sample_hz() -> int:
@@ -48,4 +54,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Gefrorene Builds: spawn-Worker (Chunk-Render) starten ueber diese exe; vor jeder Argument-Auswertung,
+    # sonst startet jeder Worker GUI und RecorderService.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
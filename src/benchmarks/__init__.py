@@ -0,0 +1 @@
+"""Offline performance benchmarks (synthetic inputs, no sim or real recordings needed)."""
@@ -0,0 +1,115 @@
+"""Parity check: precomputed frame mapping arrays vs. the per-frame reference builder.
+
+Run from ``src``::
+
+    python -m benchmarks.frame_map_parity
+    python -m benchmarks.frame_map_parity --frames 3000 --seed 7
+
+Compares FrameMappingArrays.window() with _build_frame_window_mapping() for every slow frame over synthetic
+sync maps (gaps, negative and out-of-range fast indices, short or non-numeric time maps), plus the
+vectorized sample selection of the curve HUDs against the per-element loop it replaced. Exit code 1 on mismatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from typing import Any
+
+import numpy as np
+
+from features.huds.common import window_sample_positions
+from features.render_split import _build_frame_window_mapping, _precompute_frame_mapping
+
+_FIELDS = ("idxs", "offsets", "t_slow", "fast_idx", "t_fast")
+
+
+def _synthetic_maps(n: int, rng: random.Random) -> list[tuple[str, int, list[Any] | None, list[Any] | None]]:
+    """(name, fast_frame_count, slow_to_fast_frame, slow_frame_to_fast_time_s) variants."""
+    fast_n = max(1, int(n * 0.97))
+    fi = [min(fast_n + 5, max(-3, int(round(k * 0.97 + rng.uniform(-2.0, 2.0))))) for k in range(n)]
+    tf = [float(v) / 60.0 + rng.uniform(-0.01, 0.01) for v in fi]
+    tf_odd = list(tf)
+    for k in range(0, n, max(1, n // 17)):
+        tf_odd[k] = "x" if k % 2 else None
+    return [
+        ("full", fast_n, fi, tf),
+        ("no_maps", fast_n, None, None),
+        ("short_maps", fast_n, fi[: n // 2], tf[: n // 3]),
+        ("odd_time_entries", fast_n, fi, tf_odd),
+        ("no_fast_count", 0, fi, tf),
+    ]
+
+
+def _reference_positions(idxs: list[int], offsets: list[int], i_lo: int, i_hi: int, stride: int) -> list[int]:
+    """Per-element selection loop as used by the curve HUDs before window_sample_positions()."""
+    out: list[int] = []
+    for k, (idx_i, off_m) in enumerate(zip(idxs, offsets)):
+        if idx_i < i_lo or idx_i > i_hi:
+            continue
+        if idx_i == i_lo or idx_i == i_hi or (int(off_m) % int(stride)) == 0:
+            out.append(k)
+    return out
+
+
+def check(frames: int, seed: int, fps: float = 60.0) -> list[str]:
+    """Return mismatch descriptions (empty = parity)."""
+    rng = random.Random(int(seed))
+    errors: list[str] = []
+    windows = ((1, 1), (30, 30), (600, 600), (45, 90))
+    for name, fast_n, fi, tf in _synthetic_maps(int(frames), rng):
+        arrays = _precompute_frame_mapping(
+            fps=fps,
+            slow_frame_count=int(frames),
+            fast_frame_count=fast_n,
+            slow_to_fast_frame=fi,
+            slow_frame_to_fast_time_s=tf,
+        )
+        for before_f, after_f in windows:
+            # Der Render-Loop fragt nur gueltige Slow-Frames ab (i ausserhalb wird vorher uebersprungen).
+            for i in range(int(frames)):
+                ref = _build_frame_window_mapping(
+                    i=i,
+                    before_f=before_f,
+                    after_f=after_f,
+                    fps=fps,
+                    slow_frame_count=int(frames),
+                    fast_frame_count=fast_n,
+                    slow_to_fast_frame=fi,
+                    slow_frame_to_fast_time_s=tf,
+                )
+                win = arrays.window(i, before_f, after_f)
+                if (ref.iL, ref.iR) != (win.iL, win.iR):
+                    errors.append(f"{name} i={i} window={before_f}/{after_f}: bounds {ref.iL}..{ref.iR} != {win.iL}..{win.iR}")
+                    continue
+                for field in _FIELDS:
+                    if list(getattr(ref, field)) != np.asarray(getattr(win, field)).tolist():
+                        errors.append(f"{name} i={i} window={before_f}/{after_f}: field {field} differs")
+                for stride in (1, 3, 7):
+                    i_lo = max(0, i - before_f + 2)
+                    i_hi = min(int(frames) - 1, i + after_f - 1)
+                    want = _reference_positions(list(ref.idxs), list(ref.offsets), i_lo, i_hi, stride)
+                    got = window_sample_positions(win.idxs, win.offsets, i_lo=i_lo, i_hi=i_hi, stride=stride).tolist()
+                    if want != got:
+                        errors.append(f"{name} i={i} window={before_f}/{after_f} stride={stride}: sample positions differ")
+                if len(errors) > 20:
+                    return errors
+    return errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Implement main logic."""
+    ap = argparse.ArgumentParser(description="iWAS frame mapping parity check (offline)")
+    ap.add_argument("--frames", type=int, default=1500, help="Anzahl Slow-Frames der synthetischen Sync-Map")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    errors = check(int(args.frames), int(args.seed))
+    for line in errors:
+        print(f"[parity] MISMATCH {line}")
+    print(f"[parity] frames={int(args.frames)} seed={int(args.seed)} {'ok' if not errors else 'FAIL'}")
+    return 0 if not errors else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,43 @@
+"""Process resource helpers shared by the benchmarks (RSS, CPU, percentiles)."""
+
+from __future__ import annotations
+
+import math
+import sys
+from typing import Sequence
+
+
+def peak_rss_mb() -> tuple[float, float]:
+    """Return (self, children) peak RSS in MB; 0.0 where the platform does not report it."""
+    try:
+        import resource
+    except Exception:
+        return 0.0, 0.0
+    scale = 1.0 / 1024.0 if sys.platform != "darwin" else 1.0 / (1024.0 * 1024.0)
+    try:
+        self_kb = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        child_kb = float(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    except Exception:
+        return 0.0, 0.0
+    return round(self_kb * scale, 1), round(child_kb * scale, 1)
+
+
+def current_rss_mb() -> float:
+    """Return the current RSS in MB (Linux /proc only, else 0.0)."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        import resource
+
+        return round(pages * resource.getpagesize() / (1024.0 * 1024.0), 1)
+    except Exception:
+        return 0.0
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100); 0.0 for empty input."""
+    if not values:
+        return 0.0
+    ordered = sorted(float(v) for v in values)
+    rank = int(math.ceil(max(0.0, min(100.0, float(q))) / 100.0 * len(ordered)))
+    return ordered[max(0, min(len(ordered) - 1, rank - 1))]
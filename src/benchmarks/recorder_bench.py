@@ -0,0 +1,685 @@
+"""Recorder ingest benchmark: replay telemetry through RecorderService without a running sim.
+
+Run from ``src``::
+
+    python -m benchmarks.recorder_bench --out bench_recorder.json
+    python -m benchmarks.recorder_bench --rates 360 --seconds 30
+    python -m benchmarks.recorder_bench --replay C:/iWAS/data/coaching/<session>/run_0001.parquet
+
+A stand-in IRSDK object is plugged into the real IRSDKClient, so channel resolution and the
+per-field reads stay the production code paths. RecorderService._run_loop runs unchanged
+(run detector, LapSegmenter, ParquetRunWriter, debug dumps); a thin subclass only records
+tick latency, chunk flushes and run finalization. Every rate runs in its own child process so
+peak RSS is per case.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+from pathlib import Path
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import types
+from typing import Any, Iterator
+
+from benchmarks.procstats import current_rss_mb, peak_rss_mb, percentile
+from benchmarks.synthetic import SyntheticTrack, build_synthetic_lap
+from core.irsdk.channels import REQUESTED_CHANNELS
+from core.irsdk.irsdk_client import IRSDKClient
+from core.irsdk.recorder_service import RecorderService
+
+DEFAULT_RATES = (120, 360, 720)
+
+# Array-Kanaele wie im SDK (ein Header, count > 1), damit der Resolver sie expandiert.
+_ARRAY_CHANNELS: dict[str, int] = {"ShockDefl": 4, "RideHeight": 4, "TirePressure": 4, "TireTemp": 12}
+# Einige Specs werden bewusst unter ihrem Alias angeboten (Alias-Aufloesung mitmessen).
+_EXPOSED_NAMES: dict[str, str] = {
+    "ABSactive": "ABSActive",
+    "BrakeBias": "dcBrakeBias",
+    "TractionControl": "dcTractionControl",
+}
+_INT_CHANNELS = {"Gear", "Lap", "LapCompleted", "SessionState", "PlayerTrackSurface", "PlayerCarMyIncidentCount"}
+_BOOL_CHANNELS = {"OnPitRoad", "IsOnTrack", "IsOnTrackCar", "ABSActive", "TractionControlActive"}
+_DOUBLE_CHANNELS = {"SessionTime", "Lat", "Lon"}
+_BITFIELD_CHANNELS = {"SessionFlags"}
+_SKIPPED_REPLAY_COLUMNS = {"ts", "monotonic_ts", "SessionUniqueID"}
+
+_TRACK_SURFACE_PIT_STALL = 1
+_TRACK_SURFACE_ON_TRACK = 3
+_SESSION_STATE_RACING = 4
+_FLAG_GREEN = 0x00000004
+
+_SYNTHETIC_SESSION_INFO_YAML = """---
+WeekendInfo:
+ TrackDisplayName: Synthetic Ring
+ TrackConfigName: Bench
+ SessionID: 0
+ SubSessionID: 0
+ EventType: Practice
+SessionInfo:
+ CurrentSessionNum: 0
+ Sessions:
+ - SessionNum: 0
+   SessionType: Practice
+DriverInfo:
+ DriverCarIdx: 0
+ Drivers:
+ - CarIdx: 0
+   UserName: Bench Driver
+   CarScreenName: Synthetic Car
+   CarClassShortName: SYN
+   IsSpectator: 0
+...
+"""
+
+
+def _sdk_type_for_channel(name: str) -> str:
+    """Map an exposed channel name to the SDK var type used in its header."""
+    if name in _INT_CHANNELS:
+        return "irsdk_int"
+    if name in _BOOL_CHANNELS:
+        return "irsdk_bool"
+    if name in _DOUBLE_CHANNELS:
+        return "irsdk_double"
+    if name in _BITFIELD_CHANNELS:
+        return "irsdk_bitfield"
+    return "irsdk_float"
+
+
+class SyntheticReplaySource:
+    """Endless practice stint built from one synthetic lap, sampled at the target rate."""
+
+    def __init__(
+        self,
+        *,
+        sample_hz: int,
+        total_seconds: float,
+        lap_m: float = 1800.0,
+        pit_lead_in_s: float = 1.0,
+    ) -> None:
+        """Implement init logic."""
+        self.sample_hz = max(1, int(sample_hz))
+        self.session_info_yaml = _SYNTHETIC_SESSION_INFO_YAML
+        self._dt = 1.0 / float(self.sample_hz)
+        lap = build_synthetic_lap(SyntheticTrack(length_m=float(lap_m)), sample_hz=float(self.sample_hz))
+        self.lap_time_s = float(lap.lap_time_s)
+        self._lap_m = float(lap_m)
+        self._lap_rows = [self._sdk_row(i, row) for i, row in enumerate(lap.rows)]
+        self._lead_in = max(2, int(round(float(pit_lead_in_s) * self.sample_hz)))
+        self._total_ticks = self._lead_in + max(1, int(round(float(total_seconds) * self.sample_hz)))
+        pit_row = dict(self._lap_rows[0])
+        pit_row.update(
+            {
+                "Speed": 0.0,
+                "OnPitRoad": True,
+                "PlayerTrackSurface": _TRACK_SURFACE_PIT_STALL,
+                "Throttle": 0.0,
+                "Gear": 0,
+            }
+        )
+        self._pit_row = pit_row
+        self._k = 0
+
+    @property
+    def total_ticks(self) -> int:
+        """Number of samples this source will serve."""
+        return int(self._total_ticks)
+
+    def var_headers(self) -> list[dict[str, Any]]:
+        """Return SDK-style var headers for every exposed channel."""
+        headers: list[dict[str, Any]] = []
+        for spec in REQUESTED_CHANNELS:
+            if "[" in spec or spec == "SessionUniqueID":
+                continue
+            name = _EXPOSED_NAMES.get(spec, spec)
+            headers.append({"name": name, "type": _sdk_type_for_channel(name), "count": 1})
+        for name, count in _ARRAY_CHANNELS.items():
+            headers.append({"name": name, "type": "irsdk_float", "count": int(count)})
+        return headers
+
+    def _sdk_row(self, index: int, row: dict[str, Any]) -> dict[str, Any]:
+        """Translate one Garage61-style row into SDK channel values."""
+        speed = float(row["Speed"])
+        pct = float(row["LapDistPct"])
+        yaw = float(row["Yaw"])
+        lat_acc = float(row["LatAccel"])
+        long_acc = float(row["LongAccel"])
+        phase = 0.013 * float(index)
+        wheel_load = [0.02 + 0.004 * math.sin(phase + w) + 0.0005 * lat_acc * (1 if w % 2 else -1) for w in range(4)]
+        return {
+            "SessionState": _SESSION_STATE_RACING,
+            "SessionFlags": _FLAG_GREEN,
+            "LapDist": pct * self._lap_m,
+            "LapDistPct": pct,
+            "LapCurrentLapTime": float(row["Time_s"]),
+            "LapDeltaToBestLap": 0.25 * math.sin(phase),
+            "LapDeltaToSessionBestLap": 0.3 * math.sin(phase + 0.5),
+            "LapDeltaToSessionOptimalLap": 0.4 * math.sin(phase + 1.0),
+            "LapDeltaToOptimalLap": 0.35 * math.sin(phase + 1.5),
+            "Speed": speed,
+            "Yaw": yaw,
+            "Pitch": 0.01 * math.sin(phase),
+            "Roll": 0.02 * lat_acc / 9.81,
+            "VelocityX": speed * math.cos(yaw),
+            "VelocityY": speed * math.sin(yaw),
+            "VelocityZ": 0.0,
+            "VelocityLocalX": speed,
+            "VelocityLocalY": 0.01 * lat_acc,
+            "VelocityLocalZ": 0.0,
+            "YawRate": float(row["YawRate"]),
+            "LatAccel": lat_acc,
+            "LongAccel": long_acc,
+            "VertAccel": 9.81 + 0.3 * math.sin(3.0 * phase),
+            "Throttle": float(row["Throttle"]),
+            "Brake": float(row["Brake"]),
+            "Clutch": float(row["Clutch"]),
+            "SteeringWheelAngle": float(row["SteeringWheelAngle"]),
+            "SteeringWheelTorque": 4.0 * float(row["SteeringWheelAngle"]),
+            "SteeringWheelPctTorque": min(1.0, abs(0.1 * float(row["SteeringWheelAngle"]))),
+            "RPM": float(row["RPM"]),
+            "Gear": int(row["Gear"]),
+            "FuelUsePerHour": 20.0 + 60.0 * float(row["Throttle"]),
+            "ShockDefl": wheel_load,
+            "RideHeight": [0.05 - v for v in wheel_load],
+            "TirePressure": [170.0 + 2.0 * math.sin(phase * 0.1 + w) for w in range(4)],
+            "TireTemp": [80.0 + 5.0 * math.sin(phase * 0.05 + i) for i in range(12)],
+            "ABSActive": str(row["ABSActive"]) == "true",
+            "dcTractionControl": 3.0,
+            "TractionControlActive": False,
+            "dcBrakeBias": 54.5,
+            "Lat": float(row["Lat"]),
+            "Lon": float(row["Lon"]),
+            "Alt": 420.0 + 3.0 * math.sin(2.0 * math.pi * pct),
+            "TrackTemp": 31.5,
+            "AirTemp": 22.0,
+            "OnPitRoad": False,
+            "IsOnTrack": True,
+            "IsOnTrackCar": True,
+            "PlayerTrackSurface": _TRACK_SURFACE_ON_TRACK,
+            "PlayerCarMyIncidentCount": 0,
+        }
+
+    def next_row(self) -> dict[str, Any] | None:
+        """Return the next sample row, or None when the stint is over."""
+        k = self._k
+        if k >= self._total_ticks:
+            return None
+        self._k = k + 1
+        session_time = float(k) * self._dt
+        if k < self._lead_in:
+            row = dict(self._pit_row)
+            lap_no = 0
+        else:
+            j = k - self._lead_in
+            lap_no, i = divmod(j, len(self._lap_rows))
+            row = dict(self._lap_rows[i])
+        driven_s = max(0.0, session_time - float(self._lead_in) * self._dt)
+        row["SessionTime"] = session_time
+        row["Lap"] = int(lap_no) + 1
+        row["LapCompleted"] = int(lap_no)
+        row["LapLastLapTime"] = self.lap_time_s if lap_no > 0 else -1.0
+        row["LapBestLapTime"] = self.lap_time_s if lap_no > 0 else -1.0
+        row["FuelLevel"] = max(0.0, 60.0 - 0.045 * driven_s)
+        row["FuelLevelPct"] = row["FuelLevel"] / 60.0
+        return row
+
+
+class ParquetReplaySource:
+    """Serve the rows of a recorded run_XXXX.parquet at the target rate."""
+
+    def __init__(self, path: Path, *, sample_hz: int, pit_lead_in_s: float = 1.0, batch_rows: int = 4096) -> None:
+        """Implement init logic."""
+        import pyarrow.parquet as pq  # type: ignore
+
+        self.path = Path(path)
+        self.sample_hz = max(1, int(sample_hz))
+        self._file = pq.ParquetFile(self.path)
+        self._batch_rows = max(1, int(batch_rows))
+        yaml_path = self.path.parent / "session_info.yaml"
+        try:
+            self.session_info_yaml = yaml_path.read_text(encoding="utf-8")
+        except Exception:
+            self.session_info_yaml = _SYNTHETIC_SESSION_INFO_YAML
+
+        names = [str(n) for n in self._file.schema_arrow.names if str(n) not in _SKIPPED_REPLAY_COLUMNS]
+        self._array_groups: dict[str, list[str]] = {}
+        self._scalar_columns: list[str] = []
+        for name in names:
+            m = re.match(r"^(.+)_(\d+)$", name)
+            if m and m.group(1) in _ARRAY_CHANNELS:
+                self._array_groups.setdefault(m.group(1), []).append(name)
+            else:
+                self._scalar_columns.append(name)
+        for base, cols in self._array_groups.items():
+            cols.sort(key=lambda c: int(c.rsplit("_", 1)[1]))
+
+        self._types = {str(f.name): self._sdk_type_for_arrow(f.type) for f in self._file.schema_arrow}
+        self._total_rows = int(self._file.metadata.num_rows)
+        self._lead_in = max(2, int(round(float(pit_lead_in_s) * self.sample_hz))) if self._total_rows > 0 else 0
+        self._rows = self._iter_rows()
+        self._pit_row: dict[str, Any] | None = None
+        self._first_row: dict[str, Any] | None = None
+        self._served = 0
+
+    @property
+    def total_ticks(self) -> int:
+        """Number of samples this source will serve."""
+        return int(self._total_rows + self._lead_in)
+
+    @staticmethod
+    def _sdk_type_for_arrow(arrow_type: Any) -> str:
+        """Map an Arrow column type back to the SDK var type."""
+        import pyarrow as pa  # type: ignore
+
+        if pa.types.is_boolean(arrow_type):
+            return "irsdk_bool"
+        if pa.types.is_uint32(arrow_type):
+            return "irsdk_bitfield"
+        if pa.types.is_integer(arrow_type):
+            return "irsdk_int"
+        if pa.types.is_float64(arrow_type):
+            return "irsdk_double"
+        if pa.types.is_floating(arrow_type):
+            return "irsdk_float"
+        return "irsdk_char"
+
+    def var_headers(self) -> list[dict[str, Any]]:
+        """Return SDK-style var headers for the replayed columns."""
+        headers = [{"name": n, "type": self._types.get(n, "irsdk_float"), "count": 1} for n in self._scalar_columns]
+        for base, cols in self._array_groups.items():
+            headers.append({"name": base, "type": self._types.get(cols[0], "irsdk_float"), "count": len(cols)})
+        return headers
+
+    def _iter_rows(self) -> Iterator[dict[str, Any]]:
+        """Implement iter rows logic."""
+        for batch in self._file.iter_batches(batch_size=self._batch_rows):
+            for rec in batch.to_pylist():
+                row = {name: rec.get(name) for name in self._scalar_columns}
+                for base, cols in self._array_groups.items():
+                    row[base] = [rec.get(c) for c in cols]
+                yield row
+
+    def next_row(self) -> dict[str, Any] | None:
+        """Return the next sample row, or None when the run is exhausted."""
+        if self._pit_row is None:
+            first = next(self._rows, None)
+            if first is None:
+                return None
+            self._first_row = first
+            pit_row = dict(first)
+            pit_row.update({"OnPitRoad": True, "PlayerTrackSurface": _TRACK_SURFACE_PIT_STALL, "Speed": 0.0})
+            self._pit_row = pit_row
+        self._served += 1
+        if self._served <= self._lead_in:
+            return dict(self._pit_row)
+        if self._served == self._lead_in + 1:
+            return self._first_row
+        return next(self._rows, None)
+
+
+class _ReplayIR:
+    """Stand-in for the pyirsdk IRSDK object (headers, session info, item access)."""
+
+    def __init__(self, source: Any) -> None:
+        """Implement init logic."""
+        self._source = source
+        self._row: dict[str, Any] = {}
+        self._done = False
+        self.var_headers = source.var_headers()
+        self.session_info = str(source.session_info_yaml or "")
+
+    @property
+    def is_initialized(self) -> bool:
+        """Implement is initialized logic."""
+        return not self._done
+
+    def startup(self) -> bool:
+        """Implement startup logic."""
+        return not self._done
+
+    def shutdown(self) -> None:
+        """Implement shutdown logic."""
+        return None
+
+    def advance(self) -> bool:
+        """Load the next row; False once the source is exhausted."""
+        row = self._source.next_row()
+        if row is None:
+            self._done = True
+            return False
+        self._row = row
+        return True
+
+    def __getitem__(self, name: str) -> Any:
+        """Implement getitem logic."""
+        return self._row[name]
+
+
+class _TickStats:
+    """Per-tick timings collected from the instrumented recorder."""
+
+    def __init__(self) -> None:
+        """Implement init logic."""
+        self.tick_starts: list[float] = []
+        self.tick_ms: list[float] = []
+        self.source_ms_total = 0.0
+        self.flush_ms: list[float] = []
+        self.flush_rows = 0
+        self.flush_errors = 0
+        self.finalize_ms: list[float] = []
+        self._pending: float | None = None
+
+    def tick_started(self, started: float, source_s: float) -> None:
+        """Implement tick started logic."""
+        self._pending = started
+        self.tick_starts.append(started)
+        self.source_ms_total += 1000.0 * float(source_s)
+
+    def tick_finished(self, now: float) -> None:
+        """Implement tick finished logic."""
+        started = self._pending
+        if started is None:
+            return
+        self._pending = None
+        self.tick_ms.append(1000.0 * (now - started))
+
+    def record_flush(self, summary: dict[str, Any]) -> None:
+        """Implement record flush logic."""
+        if not bool(summary.get("ok")):
+            self.flush_errors += 1
+            return
+        try:
+            self.flush_ms.append(float(summary.get("duration_ms")))
+            self.flush_rows += int(summary.get("rows") or 0)
+        except Exception:
+            pass
+
+
+class ReplayIRSDKClient(IRSDKClient):
+    """IRSDKClient backed by a replay source instead of the sim's shared memory."""
+
+    def __init__(self, source: Any, stats: _TickStats | None = None) -> None:
+        """Implement init logic."""
+        super().__init__()
+        self.replay_ir = _ReplayIR(source)
+        self._irsdk_module = types.SimpleNamespace(IRSDK=lambda: self.replay_ir)
+        self.finished = threading.Event()
+        self._stats = stats
+
+    def read_sample(self, fields: Any = None) -> dict[str, Any] | None:
+        """Advance the replay by one row and read it through the regular client path."""
+        started = time.perf_counter()
+        if not self.replay_ir.advance():
+            self.finished.set()
+            return None
+        source_s = time.perf_counter() - started
+        sample = super().read_sample(fields)
+        if sample is not None and self._stats is not None:
+            self._stats.tick_started(started, source_s)
+        return sample
+
+
+class _BenchRecorderService(RecorderService):
+    """RecorderService writing into the benchmark folder and reporting tick/flush timings."""
+
+    def __init__(self, client: IRSDKClient, *, storage_dir: Path, stats: _TickStats) -> None:
+        """Implement init logic."""
+        super().__init__(client=client)
+        self._bench_storage_dir = Path(storage_dir)
+        self._bench_stats = stats
+
+    def _resolve_session_root_dir(self) -> Path | None:
+        """Resolve session root dir."""
+        return self._bench_storage_dir
+
+    def _sleep_interruptible(self, seconds: float) -> None:
+        """Close the current tick before the loop paces itself."""
+        self._bench_stats.tick_finished(time.perf_counter())
+        super()._sleep_interruptible(seconds)
+
+    def _record_chunk_io_summary(self, *, active_run_id: int, summary: dict[str, Any]) -> None:
+        """Implement record chunk io summary logic."""
+        if isinstance(summary, dict):
+            self._bench_stats.record_flush(summary)
+        super()._record_chunk_io_summary(active_run_id=active_run_id, summary=summary)
+
+    def _finalize_run(self, run_id: int | None, *, reason: str | None = None) -> None:
+        """Implement finalize run logic."""
+        started = time.perf_counter()
+        try:
+            super()._finalize_run(run_id, reason=reason)
+        finally:
+            self._bench_stats.finalize_ms.append(1000.0 * (time.perf_counter() - started))
+
+
+def _build_source(case: dict[str, Any]) -> Any:
+    """Implement build source logic."""
+    replay = str(case.get("replay") or "").strip()
+    if replay:
+        return ParquetReplaySource(Path(replay), sample_hz=int(case["rate"]))
+    return SyntheticReplaySource(
+        sample_hz=int(case["rate"]),
+        total_seconds=float(case["seconds"]),
+        lap_m=float(case["lap_m"]),
+    )
+
+
+def _dir_stats(root: Path) -> dict[str, Any]:
+    """Implement dir stats logic."""
+    out = {"files": 0, "bytes": 0, "parquet_files": 0, "parquet_bytes": 0, "lap_meta_files": 0, "debug_bytes": 0}
+    if not root.exists():
+        return out
+    for p in root.rglob("*"):
+        if not p.is_file():
+            continue
+        size = int(p.stat().st_size)
+        out["files"] += 1
+        out["bytes"] += size
+        if p.suffix == ".parquet":
+            out["parquet_files"] += 1
+            out["parquet_bytes"] += size
+        elif re.match(r"^run_\d+_lap_\d+_meta\.json$", p.name):
+            out["lap_meta_files"] += 1
+        elif p.name.startswith("debug_") or p.name == "vars_dump.json":
+            out["debug_bytes"] += size
+    return out
+
+
+def _ms_summary(values: list[float]) -> dict[str, float]:
+    """Implement ms summary logic."""
+    return {
+        "p50": round(percentile(values, 50), 4),
+        "p90": round(percentile(values, 90), 4),
+        "p99": round(percentile(values, 99), 4),
+        "max": round(max(values), 4) if values else 0.0,
+        "mean": round(sum(values) / len(values), 4) if values else 0.0,
+    }
+
+
+def run_case_in_process(case: dict[str, Any], result_path: Path) -> None:
+    """Child entry point: replay one stint through RecorderService and write its result JSON."""
+    rate = int(case["rate"])
+    storage_dir = Path(case["work_dir"]) / "coaching" / str(case["name"])
+    shutil.rmtree(storage_dir, ignore_errors=True)
+    storage_dir.mkdir(parents=True, exist_ok=True)
+
+    t_build = time.perf_counter()
+    source = _build_source(case)
+    build_s = time.perf_counter() - t_build
+
+    stats = _TickStats()
+    client = ReplayIRSDKClient(source, stats)
+    service = _BenchRecorderService(client, storage_dir=storage_dir, stats=stats)
+    expected_s = float(source.total_ticks) / float(max(1, rate))
+
+    rss_start = current_rss_mb()
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    error = ""
+    try:
+        service.start(rate)
+        if not client.finished.wait(timeout=expected_s * 3.0 + 30.0):
+            error = "timeout: replay did not finish"
+        t_fed = time.perf_counter()
+        service.stop()
+        while service.running:
+            time.sleep(0.02)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        t_fed = time.perf_counter()
+    wall_s = time.perf_counter() - t0
+    stop_s = time.perf_counter() - t_fed
+    cpu_s = time.process_time() - cpu0
+    rss_end = current_rss_mb()
+    rss_peak, _rss_children = peak_rss_mb()
+
+    starts = stats.tick_starts
+    intervals_ms = [1000.0 * (b - a) for a, b in zip(starts, starts[1:])]
+    achieved_hz = 0.0
+    if len(starts) >= 2 and starts[-1] > starts[0]:
+        achieved_hz = float(len(starts) - 1) / float(starts[-1] - starts[0])
+    interval_budget_ms = 1000.0 / float(rate) if rate > 0 else 0.0
+    overruns = sum(1 for v in stats.tick_ms if interval_budget_ms > 0.0 and v > interval_budget_ms)
+    status = service.get_status()
+
+    result = {
+        "samples": int(status.get("sample_count") or len(starts)),
+        "source_build_s": round(build_s, 3),
+        "wall_s": round(wall_s, 3),
+        "stop_s": round(stop_s, 3),
+        "target_hz": rate,
+        "achieved_hz": round(achieved_hz, 2),
+        "achieved_ratio": round(achieved_hz / float(rate), 4) if rate > 0 else 0.0,
+        "tick_ms": _ms_summary(stats.tick_ms),
+        "tick_interval_ms": _ms_summary(intervals_ms),
+        "tick_budget_ms": round(interval_budget_ms, 4),
+        "tick_overruns": int(overruns),
+        "replay_overhead_ms_per_tick": round(stats.source_ms_total / len(starts), 4) if starts else 0.0,
+        "flushes": len(stats.flush_ms),
+        "flush_rows": int(stats.flush_rows),
+        "flush_errors": int(stats.flush_errors),
+        "flush_ms": _ms_summary(stats.flush_ms),
+        "finalize_ms": [round(v, 2) for v in stats.finalize_ms],
+        "cpu_s": round(cpu_s, 3),
+        "cpu_pct": round(100.0 * cpu_s / wall_s, 1) if wall_s > 0 else 0.0,
+        "rss_start_mb": rss_start,
+        "rss_end_mb": rss_end,
+        "peak_rss_mb": rss_peak,
+        "writer_error": status.get("writer_error"),
+        "output": _dir_stats(storage_dir),
+        "error": error,
+    }
+    result_path.write_text(json.dumps(result), encoding="utf-8")
+
+
+def run_case(case: dict[str, Any], *, src_dir: Path, verbose: bool = False) -> dict[str, Any]:
+    """Run one case in a child process and return its result."""
+    work_dir = Path(case["work_dir"])
+    case_path = work_dir / "cases" / f"{case['name']}.json"
+    result_path = work_dir / "cases" / f"{case['name']}.result.json"
+    case_path.parent.mkdir(parents=True, exist_ok=True)
+    case_path.write_text(json.dumps(case), encoding="utf-8")
+    try:
+        result_path.unlink()
+    except Exception:
+        pass
+
+    cmd = [sys.executable, "-m", "benchmarks.recorder_bench", "--run-case", str(case_path), "--result", str(result_path)]
+    p = subprocess.run(
+        cmd,
+        cwd=str(src_dir),
+        stdout=None if verbose else subprocess.DEVNULL,
+        stderr=None if verbose else subprocess.DEVNULL,
+    )
+    try:
+        child = json.loads(result_path.read_text(encoding="utf-8"))
+    except Exception:
+        child = {"error": f"no result (rc={p.returncode})"}
+    return {"name": case["name"], "rate": int(case["rate"]), "returncode": int(p.returncode or 0), **child}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Implement main logic."""
+    ap = argparse.ArgumentParser(description="iWAS recorder ingest benchmark (replay, no sim needed)")
+    ap.add_argument("--work-dir", default="", help="Arbeitsordner (Default: <repo>/_bench/recorder)")
+    ap.add_argument("--out", default="", help="Ergebnis-JSON (Default: <work-dir>/bench_recorder.json)")
+    ap.add_argument("--rates", default="", help="Sample-Raten in Hz, z.B. 120,360,720")
+    ap.add_argument("--seconds", type=float, default=75.0, help="Simulierte Stint-Dauer (synthetisch)")
+    ap.add_argument("--lap-m", type=float, default=1800.0, help="Streckenlaenge der synthetischen Runde in Metern")
+    ap.add_argument("--replay", default="", help="run_XXXX.parquet statt synthetischer Daten abspielen")
+    ap.add_argument("--verbose", action="store_true")
+    ap.add_argument("--run-case", default="", help=argparse.SUPPRESS)
+    ap.add_argument("--result", default="", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.run_case:
+        case = json.loads(Path(args.run_case).read_text(encoding="utf-8"))
+        run_case_in_process(case, Path(args.result))
+        return 0
+
+    src_dir = Path(__file__).resolve().parents[1]
+    work_dir = Path(args.work_dir).resolve() if args.work_dir else (src_dir.parent / "_bench" / "recorder")
+    out_path = Path(args.out).resolve() if args.out else (work_dir / "bench_recorder.json")
+    replay = str(Path(args.replay).resolve()) if args.replay else ""
+    if replay and not Path(replay).is_file():
+        ap.error(f"Replay-Datei nicht gefunden: {replay}")
+
+    try:
+        rates = [int(s) for s in str(args.rates or "").split(",") if s.strip()] or list(DEFAULT_RATES)
+    except ValueError:
+        ap.error("--rates erwartet ganze Zahlen, z.B. 120,360,720")
+    results: list[dict[str, Any]] = []
+    for rate in rates:
+        name = f"{'replay' if replay else 'synthetic'}_{int(rate)}hz"
+        case = {
+            "name": name,
+            "rate": int(rate),
+            "seconds": float(args.seconds),
+            "lap_m": float(args.lap_m),
+            "replay": replay,
+            "work_dir": str(work_dir),
+        }
+        print(f"[bench] {name} ...", flush=True)
+        res = run_case(case, src_dir=src_dir, verbose=bool(args.verbose))
+        results.append(res)
+        status = "ok" if not res.get("error") and res.get("returncode", 0) == 0 else f"FAIL {res.get('error')}"
+        tick = res.get("tick_ms") or {}
+        flush = res.get("flush_ms") or {}
+        print(
+            f"[bench] {name} {status} achieved={float(res.get('achieved_hz', 0.0)):.1f}Hz "
+            f"tick p50/p99={float(tick.get('p50', 0.0)):.3f}/{float(tick.get('p99', 0.0)):.3f}ms "
+            f"flush p99={float(flush.get('p99', 0.0)):.1f}ms cpu={float(res.get('cpu_pct', 0.0)):.0f}% "
+            f"rss={float(res.get('peak_rss_mb', 0.0)):.0f}MB",
+            flush=True,
+        )
+
+    report = {
+        "env": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "inputs": {
+            "source": "parquet" if replay else "synthetic",
+            "replay": replay,
+            "seconds": float(args.seconds),
+            "lap_m": float(args.lap_m),
+        },
+        "cases": results,
+    }
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"[bench] report={out_path}")
+    return 0 if all(not r.get("error") for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,297 @@
+"""Reproducible render benchmark: synthetic telemetry + testsrc videos through render_split_screen_sync.
+
+Run from ``src``::
+
+    python -m benchmarks.render_bench --out bench_render.json
+    python -m benchmarks.render_bench --modes full --presets 1920x1080 --huds tables,all --lap-m 1500
+
+Every case runs in its own child process so peak RSS is per case. Stage timings, HUD ms/frame and
+encoder fps come from the structured render event channel (core.render_events).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.procstats import peak_rss_mb
+from benchmarks.synthetic import (
+    SyntheticTrack,
+    build_synthetic_lap,
+    format_lap_time_token,
+    write_g61_csv,
+    write_test_video,
+)
+from core.ffmpeg_tools import resolve_ffmpeg_bin
+from core.render_events import RenderEventListener, RenderProfile
+
+HUD_COMBOS: dict[str, tuple[str, ...]] = {
+    "none": (),
+    "tables": ("Speed", "Gear & RPM"),
+    "scroll": ("Throttle / Brake", "Steering", "Delta"),
+    "all": (
+        "Speed",
+        "Gear & RPM",
+        "Throttle / Brake",
+        "Steering",
+        "Delta",
+        "Line Delta",
+        "Under-/Oversteer",
+    ),
+}
+
+DEFAULT_PRESETS = ("1920x1080", "3840x2160")
+DEFAULT_MODES = ("full", "cut")
+DEFAULT_HUDS = ("none", "tables", "all")
+
+
+def _hud_boxes_for(names: tuple[str, ...], hud_width_px: int, out_h: int) -> dict[str, dict[str, int]]:
+    """Stack the selected HUDs vertically in the HUD column (relative coordinates)."""
+    if not names:
+        return {}
+    h_each = max(40, int(out_h) // len(names))
+    return {
+        name: {"x": 0, "y": int(i * h_each), "w": int(hud_width_px), "h": int(h_each)}
+        for i, name in enumerate(names)
+    }
+
+
+def prepare_inputs(work_dir: Path, *, lap_m: float, fps: int, video_size: tuple[int, int]) -> dict[str, str]:
+    """Generate (or reuse) synthetic slow/fast CSV + video pairs."""
+    inputs_dir = work_dir / "input"
+    manifest_path = inputs_dir / "manifest.json"
+    key = {"lap_m": float(lap_m), "fps": int(fps), "video_size": list(video_size)}
+    try:
+        cached = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if cached.get("key") == key and all(Path(p).exists() for p in cached.get("paths", {}).values()):
+            return dict(cached["paths"])
+    except Exception:
+        pass
+
+    track = SyntheticTrack(length_m=float(lap_m))
+    paths: dict[str, str] = {}
+    for label, pace, pattern in (("slow", 1.0, "testsrc"), ("fast", 1.03, "testsrc2")):
+        lap = build_synthetic_lap(track, pace=pace, sample_hz=60.0)
+        stem = f"bench_{label}_{format_lap_time_token(lap.lap_time_s)}"
+        csv_path = write_g61_csv(inputs_dir / "csv" / f"{stem}.csv", lap)
+        video_path = write_test_video(
+            inputs_dir / "video" / f"{stem}.mp4",
+            duration_s=lap.lap_time_s,
+            width=int(video_size[0]),
+            height=int(video_size[1]),
+            fps=int(fps),
+            pattern=pattern,
+        )
+        paths[f"{label}_csv"] = str(csv_path)
+        paths[f"{label}_video"] = str(video_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps({"key": key, "paths": paths}, indent=2), encoding="utf-8")
+    return paths
+
+
+def run_case_in_process(case: dict[str, Any], result_path: Path) -> None:
+    """Child entry point: run one render and write its result JSON."""
+    from features.render_split import ExtraLap, render_split_screen_sync
+
+    preset = str(case["preset"])
+    out_w, out_h = (int(v) for v in preset.lower().split("x", 1))
+    hud_width_px = int(case.get("hud_width_px") or 320)
+    names = tuple(case.get("huds") or ())
+    hud_enabled = {name: True for name in names}
+    out_video = Path(case["work_dir"]) / "output" / "video" / f"{case['name']}.mp4"
+    log_file = Path(case["work_dir"]) / "_logs" / f"{case['name']}.txt"
+
+    t0 = time.perf_counter()
+    error = ""
+    try:
+        render_split_screen_sync(
+            slow=Path(case["slow_video"]),
+            fast=Path(case["fast_video"]),
+            slow_csv=Path(case["slow_csv"]),
+            fast_csv=Path(case["fast_csv"]),
+            outp=out_video,
+            start_s=0.0,
+            duration_s=0.0,
+            preset_w=out_w,
+            preset_h=out_h,
+            hud_width_px=hud_width_px,
+            hud_enabled=hud_enabled,
+            hud_boxes=_hud_boxes_for(names, hud_width_px, out_h),
+            video_mode=str(case["mode"]),
+            log_file=log_file,
+            extra_laps=[ExtraLap(video=Path(x["video"]), csv=Path(x["csv"])) for x in case.get("extra_laps") or ()],
+        )
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    wall_s = time.perf_counter() - t0
+    rss_self, rss_children = peak_rss_mb()
+    result = {
+        "wall_s": round(wall_s, 3),
+        "error": error,
+        "peak_rss_mb": rss_self,
+        "peak_rss_children_mb": rss_children,
+        "out_bytes": int(out_video.stat().st_size) if out_video.exists() else 0,
+    }
+    result_path.write_text(json.dumps(result), encoding="utf-8")
+
+
+def run_case(case: dict[str, Any], *, src_dir: Path, verbose: bool = False) -> dict[str, Any]:
+    """Run one case in a child process and merge its result with the event profile."""
+    work_dir = Path(case["work_dir"])
+    case_path = work_dir / "cases" / f"{case['name']}.json"
+    result_path = work_dir / "cases" / f"{case['name']}.result.json"
+    case_path.parent.mkdir(parents=True, exist_ok=True)
+    case_path.write_text(json.dumps(case), encoding="utf-8")
+    try:
+        result_path.unlink()
+    except Exception:
+        pass
+
+    listener = RenderEventListener()
+    env = os.environ.copy()
+    if listener.start():
+        env.update(listener.env())
+    env.setdefault("IRVC_NO_MSGBOX", "1")
+    profile = RenderProfile()
+    cmd = [sys.executable, "-m", "benchmarks.render_bench", "--run-case", str(case_path), "--result", str(result_path)]
+    p = subprocess.Popen(
+        cmd,
+        cwd=str(src_dir),
+        env=env,
+        stdout=None if verbose else subprocess.DEVNULL,
+        stderr=None if verbose else subprocess.DEVNULL,
+    )
+    while p.poll() is None:
+        for ev in listener.drain():
+            profile.consume(ev)
+        time.sleep(0.05)
+    time.sleep(0.1)
+    for ev in listener.drain():
+        profile.consume(ev)
+    listener.close()
+
+    try:
+        child = json.loads(result_path.read_text(encoding="utf-8"))
+    except Exception:
+        child = {"error": f"no result (rc={p.returncode})"}
+
+    prof = profile.to_dict()
+    return {
+        "name": case["name"],
+        "mode": case["mode"],
+        "preset": case["preset"],
+        "huds": list(case.get("huds") or ()),
+        "returncode": int(p.returncode or 0),
+        **child,
+        "stages": prof.get("stages", {}),
+        "frames": prof.get("expected_frames", 0),
+        "hud_frames": prof.get("hud_frames", 0),
+        "hud_ms_per_frame": prof.get("hud_ms_per_frame", 0.0),
+        "hud_fps": prof.get("hud_fps", 0.0),
+        "encoder_fps": prof.get("encoder_fps", 0.0),
+        "log": prof.get("log", {}),
+    }
+
+
+def _ffmpeg_version() -> str:
+    """Implement ffmpeg version logic."""
+    try:
+        p = subprocess.run([resolve_ffmpeg_bin(), "-version"], capture_output=True, text=True)
+        return (p.stdout or "").splitlines()[0].strip()
+    except Exception:
+        return ""
+
+
+def _split_csv_arg(raw: str, default: tuple[str, ...]) -> list[str]:
+    """Implement split csv arg logic."""
+    items = [s.strip() for s in str(raw or "").split(",") if s.strip()]
+    return items or list(default)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Implement main logic."""
+    ap = argparse.ArgumentParser(description="iWAS render benchmark (synthetic, offline)")
+    ap.add_argument("--work-dir", default="", help="Arbeitsordner (Default: <repo>/_bench/render)")
+    ap.add_argument("--out", default="", help="Ergebnis-JSON (Default: <work-dir>/bench_render.json)")
+    ap.add_argument("--modes", default="", help="full,cut")
+    ap.add_argument("--presets", default="", help="z.B. 1920x1080,3840x2160")
+    ap.add_argument("--huds", default="", help=f"Kombinationen aus {','.join(HUD_COMBOS)}")
+    ap.add_argument("--lap-m", type=float, default=2000.0, help="Streckenlaenge der synthetischen Runde in Metern")
+    ap.add_argument("--fps", type=int, default=60)
+    ap.add_argument("--video-size", default="1280x720")
+    ap.add_argument("--hud-width", type=int, default=320)
+    ap.add_argument("--verbose", action="store_true")
+    ap.add_argument("--run-case", default="", help=argparse.SUPPRESS)
+    ap.add_argument("--result", default="", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.run_case:
+        case = json.loads(Path(args.run_case).read_text(encoding="utf-8"))
+        run_case_in_process(case, Path(args.result))
+        return 0
+
+    src_dir = Path(__file__).resolve().parents[1]
+    work_dir = Path(args.work_dir).resolve() if args.work_dir else (src_dir.parent / "_bench" / "render")
+    out_path = Path(args.out).resolve() if args.out else (work_dir / "bench_render.json")
+    vw, vh = (int(v) for v in str(args.video_size).lower().split("x", 1))
+
+    t_prep = time.perf_counter()
+    inputs = prepare_inputs(work_dir, lap_m=float(args.lap_m), fps=int(args.fps), video_size=(vw, vh))
+    prep_s = time.perf_counter() - t_prep
+
+    huds = _split_csv_arg(args.huds, DEFAULT_HUDS)
+    unknown = [h for h in huds if h not in HUD_COMBOS]
+    if unknown:
+        ap.error(f"unbekannte HUD-Kombination: {','.join(unknown)}")
+
+    results: list[dict[str, Any]] = []
+    for mode in _split_csv_arg(args.modes, DEFAULT_MODES):
+        for preset in _split_csv_arg(args.presets, DEFAULT_PRESETS):
+            for hud_key in huds:
+                name = f"{mode}_{preset}_{hud_key}"
+                case = {
+                    "name": name,
+                    "mode": mode,
+                    "preset": preset,
+                    "huds": list(HUD_COMBOS[hud_key]),
+                    "hud_width_px": int(args.hud_width),
+                    "work_dir": str(work_dir),
+                    **inputs,
+                }
+                print(f"[bench] {name} ...", flush=True)
+                res = run_case(case, src_dir=src_dir, verbose=bool(args.verbose))
+                res["hud_combo"] = hud_key
+                results.append(res)
+                status = "ok" if not res.get("error") and res.get("returncode", 0) == 0 else f"FAIL {res.get('error')}"
+                print(
+                    f"[bench] {name} {status} wall={float(res.get('wall_s', 0.0)):.2f}s "
+                    f"hud_ms/frame={float(res.get('hud_ms_per_frame', 0.0)):.2f} "
+                    f"rss={float(res.get('peak_rss_mb', 0.0)):.0f}MB",
+                    flush=True,
+                )
+
+    report = {
+        "env": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "ffmpeg": _ffmpeg_version(),
+        },
+        "inputs": {"lap_m": float(args.lap_m), "fps": int(args.fps), "video_size": [vw, vh], "prepare_s": round(prep_s, 3)},
+        "cases": results,
+    }
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"[bench] report={out_path}")
+    return 0 if all(not r.get("error") for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,222 @@
+"""Synthetic Garage61-style telemetry and test videos for offline benchmarks."""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+import math
+from pathlib import Path
+import subprocess
+
+from core.ffmpeg_tools import resolve_ffmpeg_bin
+from core.subprocess_utils import windows_no_window_subprocess_kwargs
+
+G61_COLUMNS: tuple[str, ...] = (
+    "Time_s",
+    "LapDistPct",
+    "Speed",
+    "Lat",
+    "Lon",
+    "Yaw",
+    "YawRate",
+    "SteeringWheelAngle",
+    "Throttle",
+    "Brake",
+    "Clutch",
+    "Gear",
+    "RPM",
+    "ABSActive",
+    "LatAccel",
+    "LongAccel",
+)
+
+_EARTH_M_PER_DEG = 111_111.0
+
+
+@dataclass(frozen=True)
+class SyntheticTrack:
+    """Container and behavior for Synthetic Track."""
+    length_m: float = 4000.0
+    corner_count: int = 8
+    v_max_ms: float = 72.0
+    v_min_ms: float = 24.0
+    corner_width_pct: float = 0.035
+    lat0: float = 47.22
+    lon0: float = 8.81
+
+
+@dataclass(frozen=True)
+class SyntheticLap:
+    """Container and behavior for Synthetic Lap."""
+    rows: list[dict[str, float | int | str]]
+    lap_time_s: float
+
+
+def _corner_centers(track: SyntheticTrack) -> list[float]:
+    """Implement corner centers logic."""
+    n = max(1, int(track.corner_count))
+    # Leicht unregelmaessig, damit Geraden unterschiedlich lang sind.
+    return [((i + 0.5) / float(n) + 0.15 * math.sin(1.7 * i) / float(n)) % 1.0 for i in range(n)]
+
+
+def _corner_weight(pct: float, centers: list[float], width: float) -> float:
+    """Implement corner weight logic."""
+    w = 0.0
+    for c in centers:
+        d = abs(pct - c)
+        d = min(d, 1.0 - d)
+        w = max(w, math.exp(-0.5 * (d / max(1e-6, width)) ** 2))
+    return w
+
+
+def build_synthetic_lap(
+    track: SyntheticTrack,
+    *,
+    pace: float = 1.0,
+    sample_hz: float = 60.0,
+) -> SyntheticLap:
+    """Build one lap of telemetry rows matching what load_g61_csv expects."""
+    centers = _corner_centers(track)
+    grid_n = 4000
+    width = float(track.corner_width_pct)
+    v_max = float(track.v_max_ms) * float(pace)
+    v_min = float(track.v_min_ms) * float(pace)
+
+    # Geschwindigkeits- und Kurvenprofil ueber LapDistPct, dann Zeit integrieren.
+    pct_grid = [i / float(grid_n) for i in range(grid_n + 1)]
+    speed_grid = [v_max - (v_max - v_min) * _corner_weight(p, centers, width) for p in pct_grid]
+    curv_grid = [_corner_weight(p, centers, width * 0.8) for p in pct_grid]
+    curv_sum = sum(curv_grid[:-1]) or 1.0
+    ds = float(track.length_m) / float(grid_n)
+
+    t_grid = [0.0]
+    heading_grid = [0.0]
+    x_grid = [0.0]
+    y_grid = [0.0]
+    for i in range(grid_n):
+        v = 0.5 * (speed_grid[i] + speed_grid[i + 1])
+        t_grid.append(t_grid[-1] + ds / max(1.0, v))
+        # Summe der Richtungsaenderungen = 2*pi -> geschlossene Runde.
+        heading = heading_grid[-1] + (2.0 * math.pi) * curv_grid[i] / curv_sum
+        heading_grid.append(heading)
+        x_grid.append(x_grid[-1] + ds * math.cos(heading))
+        y_grid.append(y_grid[-1] + ds * math.sin(heading))
+    lap_time_s = float(t_grid[-1])
+
+    cos_lat = math.cos(math.radians(float(track.lat0)))
+    rows: list[dict[str, float | int | str]] = []
+    n_samples = int(math.floor(lap_time_s * float(sample_hz)))
+    j = 0
+    prev_speed = speed_grid[0]
+    prev_heading = heading_grid[0]
+    dt = 1.0 / float(sample_hz)
+    for k in range(max(2, n_samples)):
+        t = float(k) * dt
+        while j < grid_n - 1 and t_grid[j + 1] <= t:
+            j += 1
+        t0 = t_grid[j]
+        t1 = t_grid[j + 1]
+        a = 0.0 if t1 <= t0 else min(1.0, max(0.0, (t - t0) / (t1 - t0)))
+
+        def _lerp(xs: list[float]) -> float:
+            return float(xs[j] + (xs[j + 1] - xs[j]) * a)
+
+        pct = _lerp(pct_grid) % 1.0
+        speed = _lerp(speed_grid)
+        heading = _lerp(heading_grid)
+        x = _lerp(x_grid)
+        y = _lerp(y_grid)
+        long_acc = (speed - prev_speed) / dt if k > 0 else 0.0
+        yaw_rate = (heading - prev_heading) / dt if k > 0 else 0.0
+        prev_speed = speed
+        prev_heading = heading
+
+        braking = long_acc < -1.0
+        throttle = 0.0 if braking else min(1.0, max(0.15, 0.4 + long_acc / 8.0))
+        if long_acc >= -0.05 and speed >= v_max * 0.97:
+            throttle = 1.0
+        brake = min(1.0, max(0.0, -long_acc / 25.0)) if braking else 0.0
+        gear = max(1, min(6, 1 + int(speed / (v_max / 6.0 + 1e-6))))
+        gear_lo = (gear - 1) * (v_max / 6.0)
+        rpm = 4200.0 + 3600.0 * min(1.0, max(0.0, (speed - gear_lo) / (v_max / 6.0)))
+
+        rows.append(
+            {
+                "Time_s": round(t, 6),
+                "LapDistPct": round(pct, 7),
+                "Speed": round(speed, 4),
+                "Lat": round(float(track.lat0) + y / _EARTH_M_PER_DEG, 8),
+                "Lon": round(float(track.lon0) + x / (_EARTH_M_PER_DEG * cos_lat), 8),
+                "Yaw": round(math.atan2(math.sin(heading), math.cos(heading)), 6),
+                "YawRate": round(yaw_rate, 6),
+                "SteeringWheelAngle": round(-12.0 * 2.7 * yaw_rate / max(5.0, speed), 6),
+                "Throttle": round(throttle, 4),
+                "Brake": round(brake, 4),
+                "Clutch": 1.0,
+                "Gear": int(gear),
+                "RPM": round(rpm, 1),
+                "ABSActive": "true" if brake > 0.85 else "false",
+                "LatAccel": round(speed * yaw_rate, 4),
+                "LongAccel": round(long_acc, 4),
+            }
+        )
+    return SyntheticLap(rows=rows, lap_time_s=lap_time_s)
+
+
+def write_g61_csv(path: Path, lap: SyntheticLap) -> Path:
+    """Write lap rows as Garage61-style CSV."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(G61_COLUMNS))
+        writer.writeheader()
+        for row in lap.rows:
+            writer.writerow(row)
+    return path
+
+
+def format_lap_time_token(lap_time_s: float) -> str:
+    """Format lap time as mm.ss.mmm (file name convention used for slow/fast detection)."""
+    total_ms = int(round(float(lap_time_s) * 1000.0))
+    mm = total_ms // 60_000
+    ss = (total_ms // 1000) % 60
+    ms = total_ms % 1000
+    return f"{mm:02d}.{ss:02d}.{ms:03d}"
+
+
+def write_test_video(
+    path: Path,
+    *,
+    duration_s: float,
+    width: int = 1280,
+    height: int = 720,
+    fps: int = 60,
+    pattern: str = "testsrc",
+) -> Path:
+    """Encode a synthetic test video via ffmpeg lavfi (testsrc/testsrc2)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        resolve_ffmpeg_bin(),
+        "-hide_banner",
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        f"{pattern}=size={int(width)}x{int(height)}:rate={int(fps)}:duration={float(duration_s):.3f}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        "-pix_fmt",
+        "yuv420p",
+        "-g",
+        str(int(fps)),
+        str(path),
+    ]
+    p = subprocess.run(cmd, capture_output=True, text=True, **windows_no_window_subprocess_kwargs())
+    if p.returncode != 0 or not path.exists():
+        raise RuntimeError(f"ffmpeg testsrc failed (rc={p.returncode}): {(p.stderr or '').strip()[-400:]}")
+    return path
@@ -9,10 +9,11 @@ import logging
 import os
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, Iterable
 
 from core.coaching.lap_segmenter import LapSegmenter
 from core.coaching.lap_metrics import RunLapMetrics, compute_run_lap_metrics
+from core.coaching.parquet_reader import open_run_parquet, read_row_range, row_group_starts
 from core.coaching.storage import ACTIVE_SESSION_LOCK_FILENAME, SESSION_FINALIZED_FILENAME
 
 
@@ -67,6 +68,8 @@ class CoachingIndex:
     session_count: int = 0
     run_count: int = 0
     lap_count: int = 0
+    best_ids: set[str] = field(default_factory=set)
+    parent_by_id: dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -109,8 +112,12 @@ class _SessionCacheEntry:
 _SESSION_CACHE: dict[str, _SessionCacheEntry] = {}
 
 
-def scan_storage(root_dir: Path) -> CoachingIndex:
-    """Scan storage."""
+def scan_storage(root_dir: Path, *, changed_paths: Iterable[Path] | None = None) -> CoachingIndex:
+    """Scan storage.
+
+    changed_paths (from a filesystem watcher) limits re-validation to the session folders that contain
+    them; other cached sessions are reused without re-listing their folders.
+    """
     root = Path(root_dir)
     tracks: list[CoachingTreeNode] = []
     nodes_by_id: dict[str, CoachingTreeNode] = {}
@@ -135,7 +142,15 @@ def scan_storage(root_dir: Path) -> CoachingIndex:
         candidates = [p for p in root.iterdir() if p.is_dir()]
     except Exception:
         candidates = []
+    touched = _touched_session_keys(root, changed_paths) if changed_paths is not None else None
     for session_dir in candidates:
+        if touched is not None:
+            key = _cache_key(session_dir)
+            cached = _SESSION_CACHE.get(key)
+            if cached is not None and key not in touched:
+                live_keys.add(key)
+                sessions.append(cached.parsed)
+                continue
         effective_dir = _maybe_rename_offline_testing_unknown_session_dir(session_dir)
         parsed = _scan_session_dir_cached(effective_dir)
         if parsed is None:
@@ -188,8 +203,9 @@ def scan_storage(root_dir: Path) -> CoachingIndex:
         tracks.append(track_node)
     tracks.sort(key=lambda node: (-(node.summary.last_driven_ts or 0.0), _sort_key_text(node.label)))
 
+    parent_by_id: dict[str, str] = {}
     for track_node in tracks:
-        _register_tree_nodes(nodes_by_id, track_node)
+        _register_tree_nodes(nodes_by_id, track_node, parent_by_id=parent_by_id)
 
     return CoachingIndex(
         root_dir=root,
@@ -199,9 +215,25 @@ def scan_storage(root_dir: Path) -> CoachingIndex:
         session_count=session_count,
         run_count=run_count,
         lap_count=lap_count,
+        best_ids=_compute_best_ids(tracks),
+        parent_by_id=parent_by_id,
     )
 
 
+def _touched_session_keys(root: Path, changed_paths: Iterable[Path]) -> set[str]:
+    """Map changed file/folder paths to the cache keys of their session folders (first level below root)."""
+    keys: set[str] = set()
+    for raw in changed_paths:
+        try:
+            rel = Path(raw).relative_to(root)
+        except Exception:
+            continue
+        if not rel.parts:
+            continue
+        keys.add(_cache_key(root / rel.parts[0]))
+    return keys
+
+
 def _scan_session_dir_cached(session_dir: Path) -> _SessionScan | None:
     """Scan session dir cached."""
     key = _cache_key(session_dir)
@@ -847,6 +879,8 @@ def _build_lap_node(session: _SessionScan, run: _RunScan, idx: int, segment: dic
     lap_meta = dict(segment)
     lap_meta["lap_incomplete"] = lap_incomplete
     lap_meta["lap_offtrack"] = lap_offtrack
+    # Fuer Render direkt aus dem Parquet (core.coaching.run_data.load_parquet_lap).
+    lap_meta["parquet_path"] = str(run.parquet_path) if run.parquet_path else ""
     lap_meta["lap_summary"] = _build_normalized_lap_summary(
         segment=segment,
         lap_time_s=duration,
@@ -867,11 +901,125 @@ def _build_lap_node(session: _SessionScan, run: _RunScan, idx: int, segment: dic
     )
 
 
-def _register_tree_nodes(nodes_by_id: dict[str, CoachingTreeNode], node: CoachingTreeNode) -> None:
+def _register_tree_nodes(
+    nodes_by_id: dict[str, CoachingTreeNode],
+    node: CoachingTreeNode,
+    *,
+    parent_by_id: dict[str, str] | None = None,
+) -> None:
     """Implement register tree nodes logic."""
     nodes_by_id[node.id] = node
     for child in node.children:
-        _register_tree_nodes(nodes_by_id, child)
+        if parent_by_id is not None:
+            parent_by_id[child.id] = node.id
+        _register_tree_nodes(nodes_by_id, child, parent_by_id=parent_by_id)
+
+
+def _best_time_for_node(node: CoachingTreeNode) -> float | None:
+    """Return comparison time for best-time highlighting (None or <=0 means no valid time)."""
+    if node.kind == "lap":
+        return node.summary.total_time_s
+    return node.summary.fastest_lap_s
+
+
+def _find_best_id(nodes: list[CoachingTreeNode]) -> str | None:
+    """Return the id of the node with the smallest valid time among *nodes*, or None."""
+    best_id: str | None = None
+    best_t: float | None = None
+    for node in nodes:
+        t = _best_time_for_node(node)
+        if t is not None and t > 0 and (best_t is None or t < best_t):
+            best_t = t
+            best_id = node.id
+    return best_id
+
+
+def _compute_best_ids(tracks: list[CoachingTreeNode]) -> set[str]:
+    """Return the set of node IDs that the coaching browser highlights in purple.
+
+    Highlighting rules per level:
+      L1 - Track nodes: NO highlighting
+      L2 - one car node per track (fastest within track)
+      L3 - one session node per car (fastest within car)
+      L4 - one run node per car (fastest across ALL sessions of that car)
+      L5 - one lap node per car (fastest valid lap - not incomplete, not offtrack)
+    """
+    result: set[str] = set()
+
+    for track in tracks:
+        # Level 2: fastest car within this track
+        bid = _find_best_id(track.children)
+        if bid:
+            result.add(bid)
+
+        for car in track.children:
+            # Level 3: fastest session within this car
+            bid = _find_best_id(car.children)
+            if bid:
+                result.add(bid)
+
+            all_runs: list[CoachingTreeNode] = []
+            all_laps: list[CoachingTreeNode] = []
+            for session in car.children:
+                for run in session.children:
+                    all_runs.append(run)
+                    for lap in run.children:
+                        lap_sum = node_lap_summary(lap)
+                        if not lap_is_incomplete(lap.summary, lap_summary=lap_sum) \
+                                and not lap_is_offtrack(lap.summary, lap_summary=lap_sum):
+                            all_laps.append(lap)
+
+            # Level 4: fastest run (one per car, across all sessions)
+            bid = _find_best_id(all_runs)
+            if bid:
+                result.add(bid)
+
+            # Level 5: fastest valid lap (not incomplete, not offtrack)
+            bid = _find_best_id(all_laps)
+            if bid:
+                result.add(bid)
+
+    return result
+
+
+def node_lap_summary(node: CoachingTreeNode) -> dict[str, Any]:
+    """Return the normalized lap summary stored on a lap node (or {})."""
+    meta = getattr(node, "meta", {})
+    if isinstance(meta, dict):
+        summary = meta.get("lap_summary")
+        if isinstance(summary, dict):
+            return summary
+    return {}
+
+
+def lap_is_incomplete(summary: NodeSummary, *, lap_summary: dict[str, Any]) -> bool:
+    """Implement lap is incomplete logic."""
+    if bool(getattr(summary, "lap_incomplete", False)):
+        return True
+    if "incomplete" in lap_summary:
+        explicit = _coerce_optional_bool(lap_summary.get("incomplete"))
+        if explicit is not None:
+            return bool(explicit)
+    if "lap_incomplete" in lap_summary:
+        explicit = _coerce_optional_bool(lap_summary.get("lap_incomplete"))
+        if explicit is not None:
+            return bool(explicit)
+    lap_complete = _coerce_optional_bool(lap_summary.get("lap_complete"))
+    if lap_complete is not None:
+        return not bool(lap_complete)
+    return False
+
+
+def lap_is_offtrack(summary: NodeSummary, *, lap_summary: dict[str, Any]) -> bool:
+    """Implement lap is offtrack logic."""
+    if bool(getattr(summary, "lap_offtrack", False)):
+        return True
+    for key in ("offtrack_surface", "lap_offtrack", "offtrack"):
+        if key in lap_summary:
+            explicit = _coerce_optional_bool(lap_summary.get(key))
+            if explicit is not None:
+                return bool(explicit)
+    return False
 
 
 def _aggregate_summary(nodes: list[CoachingTreeNode]) -> NodeSummary:
@@ -992,28 +1140,14 @@ def _refresh_segment_validity_from_parquet(*, parquet_path: Path | None, lap_seg
     if parquet_path is None or not parquet_path.exists() or not lap_segments:
         return
     try:
-        import pyarrow.parquet as pq  # type: ignore
-    except Exception:
-        return
-
-    try:
-        table = pq.read_table(
-            parquet_path,
-            columns=["PlayerTrackSurface", "PlayerCarMyIncidentCount", "OnPitRoad", "IsOnTrackCar"],
-        )
+        parquet_file = open_run_parquet(parquet_path)
+        row_count = int(parquet_file.metadata.num_rows)
+        group_starts = row_group_starts(parquet_file)
     except Exception:
         return
-
-    row_count = int(table.num_rows)
     if row_count <= 0:
         return
-    names = set(table.schema.names)
-    track_values = table.column("PlayerTrackSurface").to_pylist() if "PlayerTrackSurface" in names else [None] * row_count
-    incident_values = (
-        table.column("PlayerCarMyIncidentCount").to_pylist() if "PlayerCarMyIncidentCount" in names else [None] * row_count
-    )
-    pit_values = table.column("OnPitRoad").to_pylist() if "OnPitRoad" in names else [None] * row_count
-    on_track_values = table.column("IsOnTrackCar").to_pylist() if "IsOnTrackCar" in names else [None] * row_count
+    columns = ["PlayerTrackSurface", "PlayerCarMyIncidentCount", "OnPitRoad", "IsOnTrackCar"]
 
     for segment in lap_segments:
         if not isinstance(segment, dict):
@@ -1024,12 +1158,23 @@ def _refresh_segment_validity_from_parquet(*, parquet_path: Path | None, lap_seg
         start_idx, end_idx = bounds
         if end_idx < start_idx:
             continue
+        # Nur die Row-Groups der Runde lesen (bei lap-aligned Dateien exakt die Runde).
+        # Lesefehler: nur diese Runde unveraendert lassen, die uebrigen trotzdem aktualisieren.
+        try:
+            lap_table = read_row_range(parquet_file, start_idx, end_idx, columns=columns, starts=group_starts)
+        except Exception:
+            continue
         sample_count = int(end_idx - start_idx + 1)
         segment["sample_count"] = sample_count
-        slice_tracks = track_values[start_idx : end_idx + 1]
-        slice_incidents = incident_values[start_idx : end_idx + 1]
-        slice_pit = pit_values[start_idx : end_idx + 1]
-        slice_on_track = on_track_values[start_idx : end_idx + 1]
+        names = set(lap_table.schema.names)
+        slice_tracks = lap_table.column("PlayerTrackSurface").to_pylist() if "PlayerTrackSurface" in names else [None] * sample_count
+        slice_incidents = (
+            lap_table.column("PlayerCarMyIncidentCount").to_pylist()
+            if "PlayerCarMyIncidentCount" in names
+            else [None] * sample_count
+        )
+        slice_pit = lap_table.column("OnPitRoad").to_pylist() if "OnPitRoad" in names else [None] * sample_count
+        slice_on_track = lap_table.column("IsOnTrackCar").to_pylist() if "IsOnTrackCar" in names else [None] * sample_count
 
         track_min: int | None = None
         track_max: int | None = None
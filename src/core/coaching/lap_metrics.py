@@ -4,9 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import math
+import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is a hard dependency of the app, keep the pure-Python path usable
+    np = None  # type: ignore[assignment]
+
 """
 Lap summary rules:
 - complete lap: closed by LapCompleted transition (preferred) or LapDistPct wrap fallback,
@@ -350,7 +356,15 @@ def _compute_from_meta_only(
     )
 
 
-def _read_parquet_columns(path: Path) -> tuple[dict[str, list[Any]], int]:
+def _vectorized_enabled() -> bool:
+    """Return whether the NumPy column path may be used (IRVC_LAP_METRICS_PYTHON=1 forces the list path)."""
+    if np is None:
+        return False
+    raw = str(os.environ.get("IRVC_LAP_METRICS_PYTHON", "") or "").strip().lower()
+    return raw not in ("1", "true", "yes", "on")
+
+
+def _read_parquet_columns(path: Path) -> tuple[dict[str, Any], int]:
     """Read parquet columns."""
     import pyarrow.parquet as pq  # type: ignore
 
@@ -374,8 +388,14 @@ def _read_parquet_columns(path: Path) -> tuple[dict[str, list[Any]], int]:
     selected = [name for name in requested if name in available_names]
     if selected:
         table = parquet_file.read(columns=selected)
-        data = table.to_pydict()
         row_count = int(table.num_rows)
+        arrays = _table_to_float_arrays(table) if _vectorized_enabled() else None
+        if arrays is not None:
+            for name in requested:
+                if name not in arrays:
+                    arrays[name] = np.full(row_count, np.nan, dtype=np.float64)
+            return arrays, row_count
+        data = table.to_pydict()
     else:
         data = {}
         meta = getattr(parquet_file, "metadata", None)
@@ -386,12 +406,62 @@ def _read_parquet_columns(path: Path) -> tuple[dict[str, list[Any]], int]:
     return data, row_count
 
 
+def _table_to_float_arrays(table: Any) -> dict[str, Any] | None:
+    """Convert numeric columns to float64 arrays; None if any column needs the generic list path."""
+    # float64 mit NaN fuer null: die Listen-Coercer behandeln null, NaN und +-inf gleich (-> None),
+    # ints/bools bleiben fuer die kleinen Zaehler und Flags hier verlustfrei.
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.compute as pc  # type: ignore
+    except Exception:
+        return None
+    arrays: dict[str, Any] = {}
+    try:
+        for field_ in table.schema:
+            arrow_type = field_.type
+            if not (
+                pa.types.is_floating(arrow_type)
+                or pa.types.is_integer(arrow_type)
+                or pa.types.is_boolean(arrow_type)
+                or pa.types.is_null(arrow_type)
+            ):
+                return None
+            column = table.column(field_.name)
+            if pa.types.is_integer(arrow_type) and column.null_count < len(column):
+                lo_hi = pc.min_max(column).as_py()
+                if max(abs(int(lo_hi["min"])), abs(int(lo_hi["max"]))) > 2**53:
+                    return None
+            values = pc.cast(column, pa.float64()).to_numpy()
+            arrays[str(field_.name)] = np.asarray(values, dtype=np.float64)
+    except Exception:
+        return None
+    return arrays
+
+
+def _is_array(values: Any) -> bool:
+    """Return whether values is a NumPy column from the vectorized read path."""
+    return np is not None and isinstance(values, np.ndarray)
+
+
 def _lap_completed_boundaries(
     *,
     lap_completed_values: list[Any],
     lap_last_time_values: list[Any],
 ) -> list[_Boundary]:
     """Implement lap completed boundaries logic."""
+    if _is_array(lap_completed_values):
+        positions = np.flatnonzero(np.isfinite(lap_completed_values))
+        counters = np.trunc(lap_completed_values[positions])
+        rising = np.flatnonzero(counters[1:] > counters[:-1]) + 1
+        return [
+            _Boundary(
+                idx=int(positions[k]),
+                reason="LapCompleted",
+                lap_no=int(counters[k]),
+                lap_time_hint_s=_clean_lap_time_hint(lap_last_time_values, int(positions[k])),
+            )
+            for k in rising
+        ]
     boundaries: list[_Boundary] = []
     prev_value: int | None = None
     for idx, raw in enumerate(lap_completed_values):
@@ -422,6 +492,13 @@ def _lap_dist_wrap_boundaries(
     lap_last_time_values: list[Any],
 ) -> list[_Boundary]:
     """Implement lap dist wrap boundaries logic."""
+    if _is_array(lap_dist_pct_values):
+        return _lap_dist_wrap_boundaries_np(
+            lap_dist_pct_values=lap_dist_pct_values,
+            lap_values=lap_values,
+            lap_completed_values=lap_completed_values,
+            lap_last_time_values=lap_last_time_values,
+        )
     boundaries: list[_Boundary] = []
     cooldown_active = False
     prev_pct: float | None = None
@@ -457,6 +534,46 @@ def _lap_dist_wrap_boundaries(
     return boundaries
 
 
+def _lap_dist_wrap_boundaries_np(
+    *,
+    lap_dist_pct_values: Any,
+    lap_values: Any,
+    lap_completed_values: Any,
+    lap_last_time_values: Any,
+) -> list[_Boundary]:
+    """Vectorized twin of _lap_dist_wrap_boundaries (same cooldown semantics)."""
+    positions = np.flatnonzero(np.isfinite(lap_dist_pct_values))
+    pct = lap_dist_pct_values[positions]
+    if pct.size < 2:
+        return []
+    candidates = np.flatnonzero((pct[:-1] >= 0.99) & (pct[1:] <= 0.01)) + 1
+    releases = np.flatnonzero((pct > 0.10) & (pct < 0.99))
+    boundaries: list[_Boundary] = []
+    # Nach einem Wrap zaehlt der naechste erst nach einer Freigabe (0.10 < pct < 0.99).
+    cooldown_until: float | None = None
+    for k in candidates:
+        if cooldown_until is not None and k <= cooldown_until:
+            continue
+        idx = int(positions[k])
+        end_idx = max(0, idx - 1)
+        lap_no = _coerce_optional_int(_list_get(lap_values, end_idx))
+        if lap_no is None:
+            completed = _coerce_optional_int(_list_get(lap_completed_values, idx))
+            if completed is not None:
+                lap_no = completed
+        boundaries.append(
+            _Boundary(
+                idx=idx,
+                reason="LapDistPctWrap",
+                lap_no=lap_no,
+                lap_time_hint_s=_clean_lap_time_hint(lap_last_time_values, idx),
+            )
+        )
+        nxt = int(np.searchsorted(releases, k, side="right"))
+        cooldown_until = float(releases[nxt]) if nxt < releases.size else math.inf
+    return boundaries
+
+
 def _build_lap_slice(
     *,
     lap_no: int | None,
@@ -509,6 +626,13 @@ def _resolve_lap_offtrack(
 
 def _scan_offtrack_signal(values: list[Any], start_idx: int, end_idx: int) -> tuple[bool, bool]:
     """Scan offtrack signal."""
+    if _is_array(values):
+        if values.size == 0:
+            return (False, False)
+        window = values[max(0, start_idx) : end_idx + 1]
+        if bool(np.any(window == 0.0)):
+            return (True, True)
+        return (False, bool(np.any(window == 1.0)))
     if not values:
         return (False, False)
     seen = False
@@ -662,6 +786,16 @@ def _infer_current_lap_no(
     complete_slices: list[LapSlice],
 ) -> int | None:
     """Implement infer current lap no logic."""
+    if _is_array(lap_values) and _is_array(lap_completed_values):
+        lap_positions = np.flatnonzero(np.isfinite(lap_values))
+        if lap_positions.size:
+            return int(np.trunc(lap_values[lap_positions[-1]]))
+        completed_positions = np.flatnonzero(np.isfinite(lap_completed_values))
+        if completed_positions.size:
+            return int(np.trunc(lap_completed_values[completed_positions[-1]])) + 1
+        if complete_slices and complete_slices[-1].lap_no is not None:
+            return complete_slices[-1].lap_no + 1
+        return None
     for raw in reversed(lap_values):
         lap_no = _coerce_optional_int(raw)
         if lap_no is not None:
@@ -757,6 +891,17 @@ def _lap_dist_pct_coverage(
     end_idx: int,
 ) -> tuple[float | None, float | None, float | None, bool] | None:
     """Implement lap dist pct coverage logic."""
+    if _is_array(values):
+        if values.size == 0 or start_idx > end_idx:
+            return None
+        window = values[max(0, start_idx) : end_idx + 1]
+        window = window[np.isfinite(window)]
+        if window.size == 0:
+            return None
+        lo_np = float(window.min())
+        hi_np = float(window.max())
+        wrap_np = bool(np.any((window[:-1] >= 0.99) & (window[1:] <= 0.01))) if window.size > 1 else False
+        return (lo_np, hi_np, hi_np - lo_np, wrap_np)
     if not values or start_idx > end_idx:
         return None
     lo: float | None = None
@@ -781,6 +926,12 @@ def _lap_dist_pct_range(values: list[Any], start_idx: int, end_idx: int) -> floa
     """Implement lap dist pct range logic."""
     if start_idx > end_idx:
         return None
+    if _is_array(values):
+        window = values[max(0, start_idx) : end_idx + 1]
+        window = window[np.isfinite(window)]
+        if window.size == 0:
+            return None
+        return float(window.max()) - float(window.min())
     lo: float | None = None
     hi: float | None = None
     for idx in range(start_idx, end_idx + 1):
@@ -820,6 +971,12 @@ def _clean_lap_time_hint(values: list[Any], idx: int) -> float | None:
 
 def _series_duration(values: list[Any]) -> float | None:
     """Implement series duration logic."""
+    if _is_array(values):
+        finite_np = values[np.isfinite(values)]
+        if finite_np.size < 2:
+            return None
+        delta_np = float(finite_np.max()) - float(finite_np.min())
+        return delta_np if delta_np >= 0 else None
     finite = [v for raw in values if (v := _coerce_optional_float(raw)) is not None and math.isfinite(v)]
     if len(finite) < 2:
         return None
@@ -831,6 +988,9 @@ def _series_duration(values: list[Any]) -> float | None:
 
 def _max_finite(values: list[Any]) -> float | None:
     """Implement max finite logic."""
+    if _is_array(values):
+        finite_np = values[np.isfinite(values)]
+        return float(finite_np.max()) if finite_np.size else None
     finite = [v for raw in values if (v := _coerce_optional_float(raw)) is not None and math.isfinite(v)]
     if not finite:
         return None
@@ -856,6 +1016,8 @@ def _duration_from_bounds(start: float | None, end: float | None) -> float | Non
 
 def _count_finite(values: list[Any]) -> int:
     """Implement count finite logic."""
+    if _is_array(values):
+        return int(np.count_nonzero(np.isfinite(values)))
     count = 0
     for raw in values:
         value = _coerce_optional_float(raw)
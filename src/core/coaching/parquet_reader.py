@@ -0,0 +1,84 @@
+"""Runtime module for core/coaching/parquet_reader.py."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+import json
+from pathlib import Path
+from typing import Any, Sequence
+
+from core.coaching.parquet_writer import LAP_INDEX_METADATA_KEY
+
+
+def open_run_parquet(path: str | Path) -> Any:
+    """Open a run parquet file (pyarrow.parquet.ParquetFile)."""
+    import pyarrow.parquet as pq  # type: ignore
+
+    return pq.ParquetFile(Path(path))
+
+
+def read_lap_index(parquet_file: Any) -> list[dict[str, Any]]:
+    """Return the lap -> row range entries stored by ParquetRunWriter, or [] for older files."""
+    try:
+        kv = parquet_file.metadata.metadata or {}
+    except Exception:
+        return []
+    raw = kv.get(LAP_INDEX_METADATA_KEY.encode("utf-8"))
+    if not raw:
+        return []
+    try:
+        payload = json.loads(raw.decode("utf-8"))
+    except Exception:
+        return []
+    laps = payload.get("laps") if isinstance(payload, dict) else None
+    if not isinstance(laps, list):
+        return []
+    return [item for item in laps if isinstance(item, dict)]
+
+
+def row_group_starts(parquet_file: Any) -> list[int]:
+    """Return the first row index of every row group."""
+    starts: list[int] = []
+    total = 0
+    meta = parquet_file.metadata
+    for i in range(int(meta.num_row_groups)):
+        starts.append(total)
+        total += int(meta.row_group(i).num_rows)
+    return starts
+
+
+def read_row_range(
+    parquet_file: Any,
+    start_row: int,
+    end_row: int,
+    *,
+    columns: Sequence[str] | None = None,
+    starts: list[int] | None = None,
+) -> Any:
+    """Read rows [start_row, end_row] (inclusive), touching only the row groups that contain them."""
+    meta = parquet_file.metadata
+    total_rows = int(meta.num_rows)
+    start = max(0, int(start_row))
+    end = min(total_rows - 1, int(end_row))
+    names = list(parquet_file.schema_arrow.names)
+    selected = [name for name in columns if name in names] if columns is not None else None
+    if end < start or total_rows <= 0:
+        return parquet_file.schema_arrow.empty_table().select(selected if selected is not None else names)
+    group_starts = starts if starts is not None else row_group_starts(parquet_file)
+    first = max(0, bisect_right(group_starts, start) - 1)
+    last = max(first, bisect_right(group_starts, end) - 1)
+    table = parquet_file.read_row_groups(list(range(first, last + 1)), columns=selected)
+    offset = start - int(group_starts[first])
+    return table.slice(offset, end - start + 1)
+
+
+def read_lap(parquet_file: Any, lap_index: int, *, columns: Sequence[str] | None = None) -> Any | None:
+    """Read one lap via the footer lap index; None if the file has no entry for it."""
+    for item in read_lap_index(parquet_file):
+        try:
+            if int(item.get("lap_index")) != int(lap_index):
+                continue
+            return read_row_range(parquet_file, int(item["start_row"]), int(item["end_row"]), columns=columns)
+        except Exception:
+            return None
+    return None
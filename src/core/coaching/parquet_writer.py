@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections.abc import Mapping, Sequence
+import json
 import math
 from pathlib import Path
 import time
 from typing import Any
 
+# Key-value footer entry holding the lap -> row range index (JSON).
+LAP_INDEX_METADATA_KEY = "iwas.lap_index"
+LAP_INDEX_VERSION = 1
+
 
 class ParquetRunWriter:
     """Container and behavior for Parquet Run Writer."""
@@ -20,6 +26,7 @@ class ParquetRunWriter:
         dtype_decisions: Mapping[str, str] | None = None,
         chunk_seconds: float = 1.0,
         sample_hz: float | int = 120,
+        lap_aligned: bool = False,
     ) -> None:
         """Implement init logic."""
         self.run_path = Path(run_path)
@@ -32,6 +39,8 @@ class ParquetRunWriter:
             hz = 0.0
         chunk_rows = int(round(self.chunk_seconds * hz)) if hz > 0 else 1
         self.chunk_rows = max(1, chunk_rows)
+        # Row groups also end at lap boundaries, so one lap can be read without touching its neighbours.
+        self.lap_aligned = bool(lap_aligned)
 
         self._buffer: list[dict[str, Any]] = []
         self._writer: Any | None = None
@@ -40,6 +49,10 @@ class ParquetRunWriter:
         self._pq: Any | None = None
         self._closed = False
         self._last_flush_summary: dict[str, Any] | None = None
+        self._rows_written = 0
+        self._row_group_starts: list[int] = []
+        self._laps: list[dict[str, Any]] = []
+        self._open_lap_start = 0
 
     def append(self, sample: Mapping[str, Any], now_ts: float | None = None) -> bool:
         """Implement append logic."""
@@ -68,15 +81,42 @@ class ParquetRunWriter:
         self.flush()
         return True
 
+    @property
+    def rows_total(self) -> int:
+        """Rows written plus rows still buffered."""
+        return int(self._rows_written + len(self._buffer))
+
+    def mark_lap_end(self, end_row: int, *, segmenter_lap_no: int | None = None, reason: str | None = None) -> bool:
+        """Record a lap ending at end_row (inclusive); returns True if a row group was cut for it."""
+        if self._closed:
+            return False
+        end = int(end_row)
+        if end < self._open_lap_start or end >= self.rows_total:
+            return False
+        self._laps.append(self._build_lap_entry(self._open_lap_start, end, segmenter_lap_no=segmenter_lap_no, reason=reason))
+        self._open_lap_start = end + 1
+        if not self.lap_aligned:
+            return False
+        rows_in_lap = end + 1 - self._rows_written
+        if rows_in_lap <= 0:
+            return False
+        self._flush_rows(rows_in_lap)
+        return True
+
     def flush(self) -> None:
         """Implement flush logic."""
+        self._flush_rows(len(self._buffer))
+
+    def _flush_rows(self, count: int) -> None:
+        """Write the first `count` buffered rows as one row group."""
         if self._closed or not self._buffer:
             return
+        rows_in_chunk = max(1, min(int(count), len(self._buffer)))
+        chunk = self._buffer[:rows_in_chunk]
         started = time.perf_counter()
-        rows_in_chunk = len(self._buffer)
         self._ensure_backend()
         if self._schema is None:
-            self._schema = self._build_schema(self._buffer)
+            self._schema = self._build_schema(chunk)
         if self._writer is None:
             self.run_path.parent.mkdir(parents=True, exist_ok=True)
             self._writer = self._pq.ParquetWriter(self.run_path, self._schema)
@@ -84,7 +124,7 @@ class ParquetRunWriter:
         try:
             arrays = []
             for field in self._schema:
-                values = [self._coerce_value(row.get(field.name), field.type) for row in self._buffer]
+                values = [self._coerce_value(row.get(field.name), field.type) for row in chunk]
                 arrays.append(self._pa.array(values, type=field.type))
             table = self._pa.Table.from_arrays(arrays, schema=self._schema)
             table_nbytes = None
@@ -93,7 +133,9 @@ class ParquetRunWriter:
             except Exception:
                 table_nbytes = None
             self._writer.write_table(table)
-            self._buffer.clear()
+            del self._buffer[:rows_in_chunk]
+            self._row_group_starts.append(self._rows_written)
+            self._rows_written += rows_in_chunk
             file_size_bytes = None
             try:
                 file_size_bytes = int(self.run_path.stat().st_size)
@@ -134,6 +176,7 @@ class ParquetRunWriter:
         self._writer = None
         self._closed = True
         if writer is not None:
+            self._write_lap_index(writer)
             writer.close()
 
     def consume_last_flush_summary(self) -> dict[str, Any] | None:
@@ -142,6 +185,51 @@ class ParquetRunWriter:
         self._last_flush_summary = None
         return dict(summary) if isinstance(summary, dict) else None
 
+    def lap_index(self) -> dict[str, Any]:
+        """Return the lap -> row range index for the rows written so far."""
+        laps = [dict(item) for item in self._laps if int(item["end_row"]) < self._rows_written]
+        if self._rows_written > self._open_lap_start:
+            laps.append(self._build_lap_entry(self._open_lap_start, self._rows_written - 1, segmenter_lap_no=None, reason="run_end"))
+        for item in laps:
+            item["row_group_first"] = max(0, bisect_right(self._row_group_starts, int(item["start_row"])) - 1)
+            item["row_group_last"] = max(0, bisect_right(self._row_group_starts, int(item["end_row"])) - 1)
+        return {
+            "version": LAP_INDEX_VERSION,
+            "lap_aligned": bool(self.lap_aligned),
+            "rows": int(self._rows_written),
+            "row_groups": len(self._row_group_starts),
+            "laps": laps,
+        }
+
+    def _build_lap_entry(
+        self, start_row: int, end_row: int, *, segmenter_lap_no: int | None, reason: str | None
+    ) -> dict[str, Any]:
+        """Build and return lap entry."""
+        entry: dict[str, Any] = {
+            "lap_index": len(self._laps),
+            "start_row": int(start_row),
+            "end_row": int(end_row),
+        }
+        # Rundennummer aus dem LAP_END-Event des Segmenters (nicht der rohe Sim-Lap-Zaehler).
+        if segmenter_lap_no is not None:
+            entry["segmenter_lap_no"] = int(segmenter_lap_no)
+        if reason:
+            entry["reason"] = str(reason)
+        return entry
+
+    def _write_lap_index(self, writer: Any) -> None:
+        """Store the lap index in the footer key-value metadata (pyarrow >= 11)."""
+        if self._rows_written <= 0:
+            return
+        add_metadata = getattr(writer, "add_key_value_metadata", None)
+        if not callable(add_metadata):
+            return
+        try:
+            payload = json.dumps(self.lap_index(), separators=(",", ":"))
+            add_metadata({LAP_INDEX_METADATA_KEY: payload})
+        except Exception:
+            return
+
     def _ensure_backend(self) -> None:
         """Implement ensure backend logic."""
         if self._pa is not None and self._pq is not None:
@@ -0,0 +1,131 @@
+"""Read one lap of a coaching run Parquet file as RunData (renderer input without CSV export)."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Any
+
+from core.coaching.parquet_reader import open_run_parquet, read_lap, read_lap_index, read_row_range
+from core.csv_g61 import RunData
+
+# Garage61-Spaltenname -> Kandidaten im Parquet (iRacing-Namen, Aliase wie beim Recorder).
+RENDER_COLUMNS: dict[str, tuple[str, ...]] = {
+    "LapDistPct": ("LapDistPct",),
+    "Speed": ("Speed",),
+    "Gear": ("Gear",),
+    "RPM": ("RPM",),
+    "SteeringWheelAngle": ("SteeringWheelAngle",),
+    "Throttle": ("Throttle",),
+    "Brake": ("Brake",),
+    "ABSActive": ("ABSActive", "ABSactive", "BrakeABSactive", "BrakeABSActive"),
+    "Lat": ("Lat", "Latitude"),
+    "Lon": ("Lon", "Longitude"),
+    "Yaw": ("Yaw",),
+}
+
+# Zeitbasis fuer Time_s: Sim-Uhr zuerst (ohne Polling-Jitter), sonst Recorder-Zeitstempel.
+_TIME_COLUMNS = ("SessionTime", "ts", "monotonic_ts")
+
+
+# Lap-Meta (*_meta.json) -> Indexer-Segment, gleiche Abbildung wie beim Mergen im Indexer.
+_LAP_META_SAMPLE_KEYS = (("lap_start_sample", "start_sample"), ("lap_end_sample", "end_sample"))
+
+
+def _lap_sample_bounds(lap: dict[str, Any], *, row_count: int) -> tuple[int, int] | None:
+    """Return the inclusive sample range of an indexer segment or lap meta dict; None without sample keys."""
+    from core.coaching.indexer import _segment_sample_bounds
+
+    segment = dict(lap)
+    for source_key, target_key in _LAP_META_SAMPLE_KEYS:
+        if segment.get(target_key) is None and segment.get(source_key) is not None:
+            segment[target_key] = segment[source_key]
+    return _segment_sample_bounds(segment, row_count=row_count)
+
+
+def _float_list(values: list[Any]) -> list[float]:
+    """Convert a column to floats (None/invalid -> nan, like empty CSV cells)."""
+    out: list[float] = []
+    for v in values:
+        try:
+            out.append(float(v) if v is not None else math.nan)
+        except Exception:
+            out.append(math.nan)
+    return out
+
+
+def load_parquet_lap(
+    parquet_path: str | Path,
+    *,
+    lap: dict[str, Any] | None = None,
+    lap_index: int | None = None,
+) -> RunData:
+    """
+    Load one lap of a run Parquet file with the Garage61 column names the render pipeline expects.
+    lap is an indexer segment (start_sample/end_sample, or start_idx/end_idx) or a lap meta dict
+    (lap_start_sample/lap_end_sample), inclusive sample rows; without sample keys its lap_index is used.
+    lap_index selects the lap via the footer lap index. Only the lap's row groups and the render columns are read.
+    """
+    p = Path(parquet_path).resolve()
+    if not p.exists():
+        raise FileNotFoundError(f"Parquet nicht gefunden: {p}")
+    if lap is None and lap_index is None:
+        raise ValueError("lap oder lap_index muss gesetzt sein.")
+
+    pf = open_run_parquet(p)
+    row_count = int(pf.metadata.num_rows)
+    if row_count <= 0:
+        raise ValueError("Parquet hat keine Datenzeilen.")
+
+    names = set(pf.schema_arrow.names)
+    source: dict[str, str] = {}
+    for target, candidates in RENDER_COLUMNS.items():
+        found = next((c for c in candidates if c in names), None)
+        if found is not None:
+            source[target] = found
+    time_col = next((c for c in _TIME_COLUMNS if c in names), None)
+    projection = sorted(set(source.values()) | ({time_col} if time_col else set()))
+    bounds = _lap_sample_bounds(lap, row_count=row_count) if lap is not None else None
+    if bounds is not None:
+        table = read_row_range(pf, bounds[0], bounds[1], columns=projection)
+    else:
+        if lap_index is None and lap is not None:
+            try:
+                lap_index = int(lap.get("lap_index"))
+            except Exception:
+                lap_index = None
+        if lap_index is None:
+            raise ValueError("Runde nicht im Parquet gefunden (keine Sample-Grenzen).")
+        available = sorted({int(item["lap_index"]) for item in read_lap_index(pf) if isinstance(item.get("lap_index"), int)})
+        if int(lap_index) not in available:
+            raise ValueError(
+                f"Runde lap_index={int(lap_index)} nicht im Parquet gefunden "
+                f"(vorhanden: {', '.join(str(i) for i in available) or 'keine'})."
+            )
+        table = read_lap(pf, lap_index, columns=projection)
+        if table is None:
+            raise ValueError(f"Runde lap_index={int(lap_index)} konnte nicht aus dem Parquet gelesen werden.")
+    n = int(table.num_rows)
+    if n <= 0:
+        raise ValueError("Runde hat keine Datenzeilen.")
+
+    cols: dict[str, list[Any]] = {}
+    if time_col is not None:
+        t = _float_list(table.column(time_col).to_pylist())
+        t0 = next((v for v in t if math.isfinite(v)), math.nan)
+        # Time_s relativ zum Rundenstart, wie in Garage61-Exports.
+        cols["Time_s"] = [v - t0 for v in t]
+    for target, name in source.items():
+        raw = table.column(name).to_pylist()
+        if target == "ABSActive":
+            cols[target] = [bool(v) if v is not None else False for v in raw]
+        elif target == "Gear":
+            cols[target] = [int(v) if isinstance(v, (int, float)) and math.isfinite(float(v)) else 0 for v in raw]
+        else:
+            cols[target] = _float_list(raw)
+
+    for required in ("LapDistPct", "Speed"):
+        if required not in cols:
+            raise ValueError(f"Pflicht-Spalte fehlt: {required}")
+
+    return RunData(csv_path=p, columns=cols, row_count=n)
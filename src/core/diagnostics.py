@@ -10,7 +10,7 @@ import zipfile
 from pathlib import Path
 from typing import Callable, Iterable, Sequence
 
-from core import persistence
+from core import persistence, ui_watchdog
 
 _SECRET_KEY_RE = re.compile(
     r"(?i)(password|passwd|secret|token|api[_-]?key|auth[_-]?key|access[_-]?key|client[_-]?secret)"
@@ -294,6 +294,7 @@ def export_diagnostics_bundle(
         "included_logs": [],
         "included_configs": [],
         "included_session_meta": [],
+        "ui_stall_count": None,
         "notes": [],
     }
     used_arcnames: set[str] = set()
@@ -378,6 +379,16 @@ def export_diagnostics_bundle(
                     if isinstance(notes, list):
                         notes.append(f"config skipped: {config_path} ({type(exc).__name__}: {exc})")
 
+            _progress("Writing UI responsiveness report...")
+            ui_report = ui_watchdog.snapshot()
+            if ui_report is not None:
+                zf.writestr("ui_responsiveness.json", json.dumps(ui_report, indent=2))
+                manifest["ui_stall_count"] = ui_report.get("stall_count")
+            else:
+                notes = manifest.get("notes")
+                if isinstance(notes, list):
+                    notes.append("ui responsiveness report skipped: stall detector not running")
+
             _progress("Writing Windows dump pointers...")
             dump_instructions = (
                 "Windows crash dump pointers\n"
@@ -0,0 +1,401 @@
+"""Encoder preflight: tiny synthetic test encodes per candidate, persisted per ffmpeg binary + driver fingerprint."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import platform
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Collection, Sequence
+
+from core import persistence
+from core.ffmpeg_plan import EncodeSpec
+from core.ffmpeg_tools import resolve_ffmpeg_bin
+from core.subprocess_utils import windows_no_window_subprocess_kwargs
+
+ENCODER_PREFLIGHT_ENV = "IRVC_ENCODER_PREFLIGHT"
+ENCODER_HEALTH_FILE_ENV = "IRVC_ENCODER_HEALTH_FILE"
+ENCODER_HEALTH_VERSION = 2
+
+# CPU-Fallback wird nie getestet und bleibt immer als letzter Kandidat drin.
+CPU_ENCODER = "libx264"
+
+_PREFLIGHT_FRAMES = 48
+_PREFLIGHT_TIMEOUT_S = 20.0
+_OK_TTL_S = 30 * 86400.0
+_FAIL_TTL_S = 7 * 86400.0
+# Preflight-Ergebnis ohne eindeutige Encoder-Init-Meldung (Timeout, Startfehler, sonstiger rc): nie cachen.
+SOURCE_UNKNOWN = "unknown"
+
+
+def encoder_preflight_enabled() -> bool:
+    """Return whether hardware encoders are preflighted (IRVC_ENCODER_PREFLIGHT=0 disables it)."""
+    raw = str(os.environ.get(ENCODER_PREFLIGHT_ENV) or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def encoder_health_path() -> Path:
+    """Return the health cache file (IRVC_ENCODER_HEALTH_FILE or <project>/cache/encoder_health.json)."""
+    raw = str(os.environ.get(ENCODER_HEALTH_FILE_ENV) or "").strip()
+    if raw:
+        return Path(raw)
+    return persistence.cache_dir / "encoder_health.json"
+
+
+@dataclass(frozen=True)
+class EncoderHealth:
+    """Result of one preflight (or a runtime failure) for an encoder at one resolution."""
+    vcodec: str
+    ok: bool
+    fps: float = 0.0
+    source: str = "preflight"
+    checked: float = 0.0
+    error: str = ""
+
+    def expired(self, now: float | None = None) -> bool:
+        """Return whether the entry should be re-checked."""
+        ttl = _OK_TTL_S if self.ok else _FAIL_TTL_S
+        return (float(now if now is not None else time.time()) - float(self.checked)) > ttl
+
+
+def _windows_gpu_drivers() -> list[str]:
+    """Read display adapter name + driver version from the registry (no WMI/PowerShell startup)."""
+    try:
+        import winreg
+    except Exception:
+        return []
+    out: list[str] = []
+    base = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+    try:
+        root = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base)
+    except Exception:
+        return []
+    with root:
+        for i in range(16):
+            try:
+                sub = winreg.EnumKey(root, i)
+            except OSError:
+                break
+            try:
+                with winreg.OpenKey(root, sub) as key:
+                    desc = winreg.QueryValueEx(key, "DriverDesc")[0]
+                    ver = winreg.QueryValueEx(key, "DriverVersion")[0]
+                out.append(f"{desc}|{ver}")
+            except Exception:
+                continue
+    return out
+
+
+def _nvidia_driver() -> str:
+    """Implement nvidia driver logic."""
+    exe = shutil.which("nvidia-smi")
+    if not exe:
+        return ""
+    try:
+        p = subprocess.run(
+            [exe, "--query-gpu=name,driver_version", "--format=csv,noheader"],
+            capture_output=True,
+            text=True,
+            timeout=5.0,
+            **windows_no_window_subprocess_kwargs(),
+        )
+        return (p.stdout or "").strip() if p.returncode == 0 else ""
+    except Exception:
+        return ""
+
+
+_FINGERPRINTS: dict[str, str] = {}
+
+
+def driver_fingerprint(ffmpeg_bin: str) -> str:
+    """Return a key for ffmpeg binary + OS + GPU drivers; a driver update invalidates all entries."""
+    if ffmpeg_bin in _FINGERPRINTS:
+        return _FINGERPRINTS[ffmpeg_bin]
+    parts = [f"v{ENCODER_HEALTH_VERSION}", platform.system(), platform.release(), platform.version()]
+    exe = shutil.which(ffmpeg_bin) or ffmpeg_bin
+    try:
+        st = Path(exe).stat()
+        parts.append(f"{os.path.normcase(str(Path(exe).resolve()))}|{int(st.st_size)}|{int(st.st_mtime_ns)}")
+    except Exception:
+        parts.append(str(exe))
+    if sys.platform.startswith("win"):
+        parts += _windows_gpu_drivers()
+    else:
+        parts.append(_nvidia_driver())
+    if sys.platform.startswith("linux"):
+        try:
+            parts += sorted(p.name for p in Path("/dev/dri").iterdir())
+        except Exception:
+            pass
+    fp = hashlib.sha1("\n".join(parts).encode("utf-8", errors="replace")).hexdigest()
+    _FINGERPRINTS[ffmpeg_bin] = fp
+    return fp
+
+
+def _health_key(fingerprint: str, spec: EncodeSpec, W: int, H: int) -> str:
+    """Implement health key logic."""
+    return f"{fingerprint}|{spec.vcodec}|{int(W)}x{int(H)}|{spec.pix_fmt}|{' '.join(spec.extra)}"
+
+
+class EncoderHealthCache:
+    """JSON file of EncoderHealth entries; written atomically, tolerant of a missing or broken file."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Implement init logic."""
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Return the cache file."""
+        return self._path if self._path is not None else encoder_health_path()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Implement load logic."""
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(raw, dict) or int(raw.get("version") or 0) != ENCODER_HEALTH_VERSION:
+            return {}
+        entries = raw.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key: str) -> EncoderHealth | None:
+        """Return a non-expired entry for key."""
+        data = self._load().get(key)
+        if not isinstance(data, dict):
+            return None
+        try:
+            health = EncoderHealth(**data)
+        except Exception:
+            return None
+        return None if health.expired() else health
+
+    def put(self, key: str, health: EncoderHealth) -> None:
+        """Store one entry (drops expired ones on the way)."""
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            kept: dict[str, dict[str, Any]] = {}
+            for k, v in entries.items():
+                try:
+                    if not EncoderHealth(**v).expired(now):
+                        kept[k] = v
+                except Exception:
+                    continue
+            kept[key] = asdict(health)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(
+                    json.dumps({"version": ENCODER_HEALTH_VERSION, "entries": kept}, indent=2),
+                    encoding="utf-8",
+                )
+                os.replace(tmp, self.path)
+            except Exception:
+                pass
+
+
+_CACHE: EncoderHealthCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_encoder_health_cache() -> EncoderHealthCache:
+    """Return the process-wide encoder health cache."""
+    global _CACHE
+    if _CACHE is not None:
+        return _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = EncoderHealthCache()
+    return _CACHE
+
+
+def probe_encoder(
+    spec: EncodeSpec,
+    *,
+    W: int,
+    H: int,
+    ffmpeg_bin: str | None = None,
+    frames: int = _PREFLIGHT_FRAMES,
+) -> EncoderHealth:
+    """Encode a few synthetic frames at W x H into the null muxer and measure the throughput."""
+    fps = float(spec.fps) if spec.fps and spec.fps > 0.1 else 30.0
+    cmd = [
+        ffmpeg_bin or resolve_ffmpeg_bin(),
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        f"testsrc2=size={int(W)}x{int(H)}:rate={fps}",
+        "-frames:v",
+        str(int(frames)),
+        "-c:v",
+        spec.vcodec,
+        "-pix_fmt",
+        spec.pix_fmt,
+    ]
+    cmd += list(spec.extra)
+    cmd += ["-f", "null", "-"]
+    t0 = time.perf_counter()
+    try:
+        p = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=_PREFLIGHT_TIMEOUT_S,
+            **windows_no_window_subprocess_kwargs(),
+        )
+    except subprocess.TimeoutExpired:
+        return EncoderHealth(vcodec=spec.vcodec, ok=False, source=SOURCE_UNKNOWN, checked=time.time(), error="timeout")
+    except Exception as e:
+        return EncoderHealth(
+            vcodec=spec.vcodec,
+            ok=False,
+            source=SOURCE_UNKNOWN,
+            checked=time.time(),
+            error=f"{type(e).__name__}: {e}",
+        )
+    elapsed = max(1e-6, time.perf_counter() - t0)
+    if p.returncode != 0:
+        err = (p.stderr or "").strip().splitlines()
+        return EncoderHealth(
+            vcodec=spec.vcodec,
+            ok=False,
+            source="preflight" if is_encoder_failure(p.returncode, err) else SOURCE_UNKNOWN,
+            checked=time.time(),
+            error=(err[-1] if err else f"rc={p.returncode}")[:200],
+        )
+    return EncoderHealth(vcodec=spec.vcodec, ok=True, fps=round(float(frames) / elapsed, 2), checked=time.time())
+
+
+def preflight_encode_specs(
+    specs: list[EncodeSpec],
+    *,
+    W: int,
+    H: int,
+    ffmpeg_bin: str | None = None,
+    log_fn: Callable[[str], None] | None = None,
+    cache: EncoderHealthCache | None = None,
+) -> list[EncodeSpec]:
+    """
+    Drop hardware encoders that fail a test encode and order the working ones by measured fps.
+    Only successes and encoder init failures are cached; unknown outcomes (timeout etc.) keep the encoder after
+    the measured ones and are probed again on the next render.
+    libx264 is never probed and stays last (CPU bleibt fuer den Python-HUD-Stream frei).
+    """
+    if not encoder_preflight_enabled():
+        return list(specs)
+    hw = [s for s in specs if s.vcodec != CPU_ENCODER]
+    if not hw:
+        return list(specs)
+    ffmpeg_bin = ffmpeg_bin or resolve_ffmpeg_bin()
+    cache = cache or get_encoder_health_cache()
+    fp = driver_fingerprint(ffmpeg_bin)
+    measured: list[tuple[float, int, EncodeSpec]] = []
+    unknown: list[EncodeSpec] = []
+    for idx, spec in enumerate(hw):
+        key = _health_key(fp, spec, W, H)
+        health = cache.get(key)
+        cached = health is not None
+        if health is None:
+            health = probe_encoder(spec, W=W, H=H, ffmpeg_bin=ffmpeg_bin)
+            if health.ok or health.source != SOURCE_UNKNOWN:
+                cache.put(key, health)
+        if log_fn is not None:
+            if health.ok:
+                state = f"ok fps={health.fps:.1f}"
+            elif health.source == SOURCE_UNKNOWN:
+                state = f"UNKNOWN {health.error}"
+            else:
+                state = f"FAIL ({health.source}) {health.error}"
+            log_fn(f"[encode] preflight vcodec={spec.vcodec} {int(W)}x{int(H)} {state}{' cached' if cached else ''}")
+        if health.ok:
+            measured.append((float(health.fps), idx, spec))
+        elif health.source == SOURCE_UNKNOWN:
+            unknown.append(spec)
+    # Schnellster zuerst; bei Gleichstand bleibt die Reihenfolge aus build_encode_specs.
+    ordered = [spec for _fps, _idx, spec in sorted(measured, key=lambda m: (-m[0], m[1]))]
+    # Unklare Encoder bleiben Kandidat (Laufzeit-Fallback greift), aber hinter den gemessenen.
+    ordered += unknown
+    ordered += [s for s in specs if s.vcodec == CPU_ENCODER]
+    return ordered
+
+
+# ffmpeg-Meldungen, die auf einen nicht startbaren Encoder zeigen (kleingeschrieben).
+_ENCODER_INIT_ERRORS = (
+    "error initializing output stream",
+    "error while opening encoder",
+    "could not open encoder",
+    "unknown encoder",
+    "openencodesessionex failed",
+    "no nvenc capable devices",
+    "no capable devices found",
+    "cannot load nvcuda",
+    "cannot load libnvidia-encode",
+    "driver does not support the required nvenc api version",
+    "initializeencoder failed",
+    "error creating a mfx session",
+    "failed to create hardware device",
+    "device creation failed",
+    "encoder creation error",
+    "createcomponent() failed",
+)
+
+
+def is_encoder_failure(rc: int, output_lines: Sequence[str]) -> bool:
+    """Return whether a failed ffmpeg run points at the encoder (open/init), not at the HUD stream or a cancel."""
+    if int(rc) == 0:
+        return False
+    text = "\n".join(str(line) for line in output_lines).lower()
+    return any(marker in text for marker in _ENCODER_INIT_ERRORS)
+
+
+def record_encoder_fallback(
+    specs: list[EncodeSpec],
+    selected_vcodec: str,
+    *,
+    W: int,
+    H: int,
+    encoder_failures: Collection[str] = (),
+    ffmpeg_bin: str | None = None,
+    cache: EncoderHealthCache | None = None,
+) -> None:
+    """
+    Mark encoders that failed before selected_vcodec succeeded on the same job as unhealthy, but only those in
+    encoder_failures (failure classified by is_encoder_failure; HUD pipe errors or a cancel do not count).
+    """
+    if not selected_vcodec or not encoder_preflight_enabled():
+        return
+    failed = []
+    for spec in specs:
+        if spec.vcodec == selected_vcodec:
+            break
+        if spec.vcodec != CPU_ENCODER and spec.vcodec in encoder_failures:
+            failed.append(spec)
+    if not failed:
+        return
+    ffmpeg_bin = ffmpeg_bin or resolve_ffmpeg_bin()
+    cache = cache or get_encoder_health_cache()
+    fp = driver_fingerprint(ffmpeg_bin)
+    for spec in failed:
+        cache.put(
+            _health_key(fp, spec, W, H),
+            EncoderHealth(
+                vcodec=spec.vcodec,
+                ok=False,
+                source="runtime",
+                checked=time.time(),
+                error=f"render failed, {selected_vcodec} succeeded",
+            ),
+        )
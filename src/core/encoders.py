@@ -174,6 +174,17 @@ def build_encode_specs(*, W: int, fps: float, available: set[str]) -> list[Encod
     return specs
 
 
+def build_draft_encode_specs(*, W: int, fps: float) -> list[EncodeSpec]:
+    # Draft: nur CPU ultrafast, kein HW-Encoder-Start und kein Preflight fuer ein paar Sekunden Video.
+    return [
+        EncodeSpec(
+            vcodec="libx264",
+            extra=["-preset", "ultrafast", "-crf", "28", "-tune", "fastdecode"],
+            fps=fps,
+        )
+    ]
+
+
 def run_encode_with_fallback(
     *,
     build_cmd_fn: Callable[[str], tuple[int, bool]],
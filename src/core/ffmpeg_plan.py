@@ -7,8 +7,10 @@ import io
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 from core.ffmpeg_tools import resolve_ffmpeg_bin
+from core.render_events import EVENT_ENCODE_PROGRESS, get_render_events, parse_ffmpeg_progress_value
+from core.render_log import append_log_line
 from core.subprocess_utils import windows_no_window_subprocess_kwargs
 
 
@@ -20,6 +22,14 @@ class DecodeSpec:
     hud_stdin_raw: bool = False
     hud_size: tuple[int, int] | None = None
     hud_pix_fmt: str = "rgba"
+    # HUD-stdin als Matroska mit Zeitstempeln (nur geaenderte Frames) statt rawvideo mit fester Rate.
+    hud_stdin_vfr: bool = False
+    # Gecachter HUD-Layer (verlustfrei mit Alpha) statt stdin-Stream; belegt ebenfalls Input 0.
+    hud_file: Path | None = None
+    # Multi-Output: HUD-Layer weiterer Ziele als Inputs 1..N (vor slow/fast).
+    extra_hud_files: tuple[Path, ...] = ()
+    # Multi-Lap: Videos weiterer Runden als Inputs direkt nach slow/fast (jedes Video wird einmal dekodiert).
+    extra_inputs: tuple[Path, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -37,6 +47,15 @@ class EncodeSpec:
     fps: float = 0.0
 
 
+@dataclass(frozen=True)
+class OutputSpec:
+    """Additional output of a multi-output plan (own map, encoder and file)."""
+    outp: Path
+    video_map: str
+    enc: EncodeSpec
+    audio_map: str | None = None
+
+
 @dataclass(frozen=True)
 class Plan:
     cmd: list[str]
@@ -72,6 +91,7 @@ def build_plan(
     audio_source: str,
     outp: Path,
     debug_max_s: float = 0.0,
+    extra_outputs: tuple[OutputSpec, ...] = (),
 ) -> Plan:
     filter_dir = outp.parent.parent / "debug" / "_tmp_filters"
 
@@ -84,10 +104,19 @@ def build_plan(
         "pipe:1",
     ]
 
-    has_hud_input = bool(decode.hud_stdin_raw)
+    has_hud_input = bool(decode.hud_stdin_raw) or decode.hud_file is not None
 
     # Optional: HUD als Input 0
-    if decode.hud_stdin_raw:
+    if decode.hud_file is not None:
+        # -r als Input-Option: Zeitstempel exakt aus der Framerate statt aus der 1-ms-Zeitbasis des Containers.
+        hud_r = decode.hud_fps if decode.hud_fps and decode.hud_fps > 0.1 else 0.0
+        if hud_r > 0.1:
+            cmd += ["-r", f"{hud_r}"]
+        cmd += ["-i", str(decode.hud_file)]
+    elif decode.hud_stdin_raw and decode.hud_stdin_vfr:
+        # Zeitstempel kommen aus dem Container; overlay haelt den letzten HUD-Frame.
+        cmd += ["-f", "matroska", "-i", "-"]
+    elif decode.hud_stdin_raw:
         hud_r = decode.hud_fps if decode.hud_fps and decode.hud_fps > 0.1 else 0.0
         if hud_r > 0.1:
             cmd += ["-r", f"{hud_r}"]
@@ -105,6 +134,14 @@ def build_plan(
             "-",
         ]
 
+    hud_input_count = 1 if has_hud_input else 0
+    for hud_file in decode.extra_hud_files:
+        hud_r = decode.hud_fps if decode.hud_fps and decode.hud_fps > 0.1 else 0.0
+        if hud_r > 0.1:
+            cmd += ["-r", f"{hud_r}"]
+        cmd += ["-i", str(hud_file)]
+        hud_input_count += 1
+
     # Inputs 0/1 bleiben slow/fast
     cmd += [
         "-i",
@@ -112,6 +149,8 @@ def build_plan(
         "-i",
         str(decode.fast),
     ]
+    for extra_input in decode.extra_inputs:
+        cmd += ["-i", str(extra_input)]
 
     filter_args, filter_script_path = _filter_args_for_ffmpeg(flt.filter_complex, filter_dir)
     cmd += filter_args
@@ -126,8 +165,8 @@ def build_plan(
         cmd += ["-map", flt.audio_map]
     else:
         # Wenn HUD-Stream aktiv ist, ist Input 0 = HUD, Input 1 = slow, Input 2 = fast
-        slow_ai = "1:a?" if has_hud_input else "0:a?"
-        fast_ai = "2:a?" if has_hud_input else "1:a?"
+        slow_ai = f"{hud_input_count}:a?"
+        fast_ai = f"{hud_input_count + 1}:a?"
 
         if audio_source == "slow":
             cmd += ["-map", slow_ai]
@@ -148,6 +187,17 @@ def build_plan(
 
     cmd += [str(outp)]
 
+    # Multi-Output: weitere Encoder am selben Filtergraph
+    for extra in extra_outputs:
+        cmd += ["-map", extra.video_map]
+        if extra.audio_map:
+            cmd += ["-map", extra.audio_map]
+        cmd += ["-c:v", extra.enc.vcodec, "-pix_fmt", extra.enc.pix_fmt]
+        cmd += list(extra.enc.extra)
+        if extra.enc.fps and extra.enc.fps > 0.1:
+            cmd += ["-r", f"{extra.enc.fps}"]
+        cmd += [str(extra.outp)]
+
     if debug_max_s > 0.0:
         # sicher: -t muss VOR den Inputs stehen (Input-Trim)
         # wir haengen es direkt nach "ffmpeg -hide_banner -y -nostats -progress pipe:1"
@@ -168,21 +218,23 @@ def run_ffmpeg(
     log_file: Path | None = None,
     live_stdout: bool = False,
     stdin_write_fn: Any | None = None,
+    tail_out: list[str] | None = None,
 ) -> int:
     """
     Runs ffmpeg while:
       - always appending FULL ffmpeg output (stdout+stderr) to log_file (if provided)
       - printing ONLY -progress lines to stdout (so UI progress keeps working)
+      - emitting parsed -progress blocks as encode_progress events (render event channel)
       - optionally printing full ffmpeg output live to stdout if live_stdout=True
       - on failure: prints last tail_n lines to stdout
+      - tail_out (optional) receives the last tail_n output lines
     """
     def _append(line: str) -> None:
+        # Gepufferter Sink: ein Dateihandle pro Log, Schreiben im Hintergrund-Thread.
         if log_file is None:
             return
         try:
-            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(line.rstrip("\n") + "\n")
+            append_log_line(log_file, line)
         except Exception:
             pass
 
@@ -202,6 +254,26 @@ def run_ffmpeg(
             )
         )
 
+    events = get_render_events()
+    progress_block: dict[str, float] = {}
+
+    def _track_progress(line: str) -> None:
+        # -progress liefert Bloecke aus key=value, abgeschlossen durch progress=continue|end.
+        if not events.enabled:
+            return
+        s = (line or "").strip()
+        if "=" not in s:
+            return
+        key, value = s.split("=", 1)
+        if key == "progress":
+            if progress_block:
+                events.emit(EVENT_ENCODE_PROGRESS, state=value.strip(), **progress_block)
+            progress_block.clear()
+            return
+        parsed = parse_ffmpeg_progress_value(key, value)
+        if parsed is not None:
+            progress_block[parsed[0]] = parsed[1]
+
     use_stdin_writer = stdin_write_fn is not None
     tail: list[str] = []
     writer_error: Exception | None = None
@@ -240,37 +312,24 @@ def run_ffmpeg(
     assert p.stdout is not None
     if use_stdin_writer:
         out_stream = io.TextIOWrapper(p.stdout, encoding="utf-8", errors="replace")
-        for raw in out_stream:
-            line = (raw or "").rstrip("\n")
-            _append(line)
-
-            if live_stdout:
-                print(line)
-                continue
-
-            if _is_progress_line(line):
-                print(line, flush=True)
-
-            if tail_n > 0:
-                tail.append(line)
-                if len(tail) > tail_n:
-                    tail = tail[-tail_n:]
     else:
-        for raw in p.stdout:
-            line = (raw or "").rstrip("\n")
-            _append(line)
-
-            if live_stdout:
-                print(line)
-                continue
+        out_stream = p.stdout
+    for raw in out_stream:
+        line = (raw or "").rstrip("\n")
+        _append(line)
+        _track_progress(line)
+
+        if live_stdout:
+            print(line)
+            continue
 
-            if _is_progress_line(line):
-                print(line, flush=True)
+        if _is_progress_line(line):
+            print(line, flush=True)
 
-            if tail_n > 0:
-                tail.append(line)
-                if len(tail) > tail_n:
-                    tail = tail[-tail_n:]
+        if tail_n > 0:
+            tail.append(line)
+            if len(tail) > tail_n:
+                tail = tail[-tail_n:]
 
     rc = p.wait()
     if writer_thread is not None:
@@ -285,6 +344,8 @@ def run_ffmpeg(
         print(f"[ffmpeg-tail] last {min(tail_n, len(tail))} lines:")
         for t in tail[-tail_n:]:
             print(t)
+    if tail_out is not None:
+        tail_out[:] = tail
     return int(rc)
 
 
@@ -663,23 +724,84 @@ def build_stream_sync_filter(
     hud_boxes: Any | None = None,
     hud_cmd_file: "Path | None" = None,
     hud_input_label: str | None = None,  # z.B. "[hudin]"
+    sync_range: tuple[int, int] | None = None,  # Segment-Raster eines groesseren Bereichs (Chunks)
+    extra_time_s: Sequence[Any] = (),  # Multi-Lap: Zeit-Map pro weiterer Runde (Inputs nach slow/fast)
 ) -> tuple[str, str | None]:
     # Ein ffmpeg-Run:
     # - Slow wird auf [cut] getrimmt
     # - Fast wird in Segmente getrimmt und pro Segment zeitlich gestreckt/gestaucht
     # - Danach normaler Split-Render (crop/overlay)
-    W = int(getattr(geom, "W"))
-    H = int(getattr(geom, "H"))
-    r = int(round(fps)) if fps and fps > 0.1 else 30
+    # Input-Index verschiebt sich um 1, wenn HUD als Input 0 existiert.
+    in_offset = 1 if hud_input_label else 0
+    video_parts, audio_parts, audio_map = _build_stream_sync_sources(
+        fps=fps,
+        fast_time_s=fast_time_s,
+        speed_diff=speed_diff,
+        cut_i0=cut_i0,
+        cut_i1=cut_i1,
+        audio_source=audio_source,
+        in_offset=in_offset,
+        sync_range=sync_range,
+        extra_time_s=extra_time_s,
+    )
+    composite = _build_stream_sync_composite(
+        geom=geom,
+        fps=fps,
+        view_L=view_L,
+        view_R=view_R,
+        hud_enabled=hud_enabled,
+        hud_boxes=hud_boxes,
+        hud_input_label=hud_input_label,
+        slow_label="slowcut",
+        fast_label="fastsync",
+        extra_labels=[f"extrasync{k}" for k in range(len(extra_time_s))],
+    )
+    return ";".join(video_parts + composite + audio_parts), audio_map
 
-    vL = _view_get(view_L)
-    vR = _view_get(view_R)
-    video_layout = str(getattr(geom, "video_layout", "LR") or "LR").strip().upper()
-    fit_to_height = video_layout != "TB"
-    vL["fit_to_height"] = fit_to_height
-    vR["fit_to_height"] = fit_to_height
-    slow_x, slow_y, slow_w, slow_h = _geom_video_rect(geom, "video_slow_rect")
-    fast_x, fast_y, fast_w, fast_h = _geom_video_rect(geom, "video_fast_rect")
+
+def build_stream_sync_audio_filter(
+    *,
+    fps: float,
+    fast_time_s: Any,
+    speed_diff: Any | None,
+    cut_i0: int,
+    cut_i1: int,
+    audio_source: str,
+    in_offset: int,
+) -> tuple[str, str | None]:
+    """
+    Nur der Audio-Teil von build_stream_sync_filter (z.B. fuer den Concat video-only gerenderter Chunks).
+    Liefert (filter_complex, audio_map); ohne Audio ("", None).
+    """
+    _video_parts, audio_parts, audio_map = _build_stream_sync_sources(
+        fps=fps,
+        fast_time_s=fast_time_s,
+        speed_diff=speed_diff,
+        cut_i0=cut_i0,
+        cut_i1=cut_i1,
+        audio_source=audio_source,
+        in_offset=in_offset,
+    )
+    return ";".join(audio_parts), audio_map
+
+
+def _build_stream_sync_sources(
+    *,
+    fps: float,
+    fast_time_s: Any,
+    speed_diff: Any | None,
+    cut_i0: int,
+    cut_i1: int,
+    audio_source: str,
+    in_offset: int,
+    sync_range: tuple[int, int] | None = None,
+    extra_time_s: Sequence[Any] = (),
+) -> tuple[list[str], list[str], str | None]:
+    """
+    Geometry-independent part: [slowcut], warped [fastsync] and optional [aout].
+    Extra laps (inputs after slow/fast) are warped on the same keyframe grid to [extrasync<k>].
+    """
+    r = int(round(fps)) if fps and fps > 0.1 else 30
 
     # Default (wie bisher)
     try:
@@ -728,15 +850,16 @@ def build_stream_sync_filter(
     ts0 = float(cut_i0) / float(r)
     ts1 = float(cut_i1) / float(r)
 
-    # Keyframes/Indices bauen
+    # Keyframes/Indices bauen (ueber sync_range, damit Chunks dasselbe Raster wie ein Gesamt-Render nutzen)
+    seg_i0, seg_i1 = (int(sync_range[0]), int(sync_range[1])) if sync_range else (int(cut_i0), int(cut_i1))
     idxs: list[int] = []
 
     if not dyn_on:
-        i = cut_i0
-        while i < cut_i1:
+        i = seg_i0
+        while i < seg_i1:
             idxs.append(i)
             i += k_base
-        idxs.append(cut_i1)
+        idxs.append(seg_i1)
         print(f"[sync6] segments=fixed k_frames={k_base} segs={max(0, len(idxs)-1)}")
     else:
         # 1) Kruemmung des Mappings: d2 aus fast_time_s
@@ -752,7 +875,7 @@ def build_stream_sync_filter(
                 prev_d1 = d1
 
         # nur Cut-Bereich
-        d2_cut = [d2[i] for i in range(cut_i0, cut_i1 + 1) if 0 <= i < n]
+        d2_cut = [d2[i] for i in range(seg_i0, seg_i1 + 1) if 0 <= i < n]
         d2_p95 = _percentile(d2_cut, 0.95)
         if d2_p95 <= 1e-12:
             d2_p95 = 1e-12
@@ -760,7 +883,7 @@ def build_stream_sync_filter(
         # 2) Speed-Diff normalisieren (optional)
         sp_p95 = 0.0
         if speed_diff:
-            sp_cut = [float(speed_diff[i]) for i in range(cut_i0, cut_i1 + 1) if 0 <= i < len(speed_diff)]
+            sp_cut = [float(speed_diff[i]) for i in range(seg_i0, seg_i1 + 1) if 0 <= i < len(speed_diff)]
             sp_p95 = _percentile(sp_cut, 0.95)
             if sp_p95 <= 1e-12:
                 sp_p95 = 1e-12
@@ -792,8 +915,8 @@ def build_stream_sync_filter(
         # 5) Indices bauen + Segment-Cap
         def _build_idxs(kmin: int, kmax: int) -> list[int]:
             out: list[int] = []
-            i2 = cut_i0
-            while i2 < cut_i1:
+            i2 = seg_i0
+            while i2 < seg_i1:
                 out.append(i2)
                 st = _step_from_score(_score_at(i2))
                 if st < kmin:
@@ -803,7 +926,7 @@ def build_stream_sync_filter(
                 if st < 1:
                     st = 1
                 i2 += st
-            out.append(cut_i1)
+            out.append(seg_i1)
             return out
 
         idxs = _build_idxs(k_min, k_max)
@@ -824,16 +947,75 @@ def build_stream_sync_filter(
                 f"[sync6] segments=dynamic k_base={k_base} k_min={k_min} k_max={k_max} score_low={score_low:.2f} score_high={score_high:.2f} segs={segs}"
             )
 
-    seg_fast_labels: list[str] = []
+    # Chunks: Fast-Warp ab Rasterstart wie im Gesamt-Render bauen und die Vorlauf-Frames erst nach der
+    # CFR-Wandlung verwerfen. concat reiht die Segmente nach Frame-Dauer aneinander, nicht exakt auf dem
+    # Raster; ein erst bei cut_i0 beginnender Warp liegt deshalb bis zu einen Frame daneben.
+    skip_frames = 0
+    if sync_range:
+        b1 = min([i for i in idxs if i >= int(cut_i1)], default=int(cut_i1))
+        idxs = [i for i in idxs if i < b1] + [b1]
+        skip_frames = max(0, int(cut_i0) - int(idxs[0]))
+
     parts: list[str] = []
 
-    # Input-Index verschiebt sich um 1, wenn HUD als Input 0 existiert.
-    v_slow_in = "1:v" if hud_input_label else "0:v"
-    v_fast_in = "2:v" if hud_input_label else "1:v"
+    v_slow_in = f"{int(in_offset)}:v"
+    v_fast_in = f"{int(in_offset) + 1}:v"
 
     parts.append(f"[{v_slow_in}]trim=start={ts0}:end={ts1},setpts=PTS-STARTPTS[slowcut]")
 
     # Fast Video als Segmente + Warp
+    parts += _build_warp_segments(
+        v_fast_in, fast_time_s, idxs, r, seg_prefix="fseg", out_label="fastsync", skip_frames=skip_frames
+    )
+    # Weitere Runden: gleiches Keyframe-Raster, nur die eigene Zeit-Map
+    for k, x_time_s in enumerate(extra_time_s):
+        parts += _build_warp_segments(
+            f"{int(in_offset) + 2 + k}:v",
+            x_time_s,
+            idxs,
+            r,
+            seg_prefix=f"x{k}seg",
+            out_label=f"extrasync{k}",
+            skip_frames=skip_frames,
+        )
+
+    audio_parts: list[str] = []
+    audio_map = None
+
+    # Audio-Input-Index haengt davon ab, wie viele HUD-Inputs davor liegen
+    a_slow_in = f"{int(in_offset)}:a"
+    a_fast_in = f"{int(in_offset) + 1}:a"
+
+    if audio_source == "slow":
+        audio_parts.append(f"[{a_slow_in}]atrim=start={ts0}:end={ts1},asetpts=PTS-STARTPTS[aout]")
+        audio_map = "[aout]"
+    elif audio_source == "fast":
+        audio_parts.append(
+            f"[{a_fast_in}]atrim=start={float(fast_time_s[cut_i0])}:end={float(fast_time_s[cut_i1])},asetpts=PTS-STARTPTS[aout]"
+        )
+        audio_map = "[aout]"
+    else:
+        audio_map = None
+
+    return parts, audio_parts, audio_map
+
+
+def _build_warp_segments(
+    v_in: str,
+    time_s: Any,
+    idxs: list[int],
+    r: int,
+    *,
+    seg_prefix: str,
+    out_label: str,
+    skip_frames: int = 0,
+) -> list[str]:
+    """
+    Trim/setpts segments of one input along the slow keyframe grid, concatenated to [out_label].
+    skip_frames drops leading output frames after the fps conversion (chunk start inside the first segment).
+    """
+    parts: list[str] = []
+    seg_labels: list[str] = []
     eps_t = 1e-6
     for si in range(len(idxs) - 1):
         a = idxs[si]
@@ -845,8 +1027,8 @@ def build_stream_sync_filter(
         seg_ts1 = float(b) / float(r)
         slow_dur = max(eps_t, seg_ts1 - seg_ts0)
 
-        tf0 = float(fast_time_s[a])
-        tf1 = float(fast_time_s[b])
+        tf0 = float(time_s[a])
+        tf1 = float(time_s[b])
 
         # Sicherstellen, dass Fast-Zeit steigt
         if tf1 <= tf0 + eps_t:
@@ -855,67 +1037,176 @@ def build_stream_sync_filter(
         fast_dur = max(eps_t, tf1 - tf0)
         factor = slow_dur / fast_dur
 
-        lab = f"fseg{si}"
-        seg_fast_labels.append(f"[{lab}]")
+        lab = f"{seg_prefix}{si}"
+        seg_labels.append(f"[{lab}]")
 
         parts.append(
-            f"[{v_fast_in}]trim=start={tf0}:end={tf1},setpts=PTS-STARTPTS,setpts=PTS*{factor}[{lab}]"
+            f"[{v_in}]trim=start={tf0}:end={tf1},setpts=PTS-STARTPTS,setpts=PTS*{factor}[{lab}]"
         )
-    if not seg_fast_labels:
+    if not seg_labels:
         raise RuntimeError("sync: keine Fast-Segmente gebaut.")
 
-    parts.append(f"{''.join(seg_fast_labels)}concat=n={len(seg_fast_labels)}:v=1:a=0[fastsync]")
+    if skip_frames > 0:
+        parts.append(f"{''.join(seg_labels)}concat=n={len(seg_labels)}:v=1:a=0[{out_label}raw]")
+        parts.append(f"[{out_label}raw]fps={r},trim=start_frame={int(skip_frames)},setpts=PTS-STARTPTS[{out_label}]")
+    else:
+        parts.append(f"{''.join(seg_labels)}concat=n={len(seg_labels)}:v=1:a=0[{out_label}]")
+    return parts
+
+
+def _split_video_rect(rect: tuple[int, int, int, int], stacked: bool) -> tuple[tuple[int, int, int, int], tuple[int, int, int, int]]:
+    """Split a video rect in two tiles (stacked: top/bottom, else left/right), first tile even-sized."""
+    x, y, w, h = rect
+    if stacked:
+        h0 = max(2, (int(h) // 4) * 2)
+        return (x, y, w, h0), (x, y + h0, w, max(2, int(h) - h0))
+    w0 = max(2, (int(w) // 4) * 2)
+    return (x, y, w0, h), (x + w0, y, max(2, int(w) - w0), h)
+
+
+def _build_stream_sync_composite(
+    *,
+    geom: Any,
+    fps: float,
+    view_L: dict[str, Any] | None,
+    view_R: dict[str, Any] | None,
+    hud_enabled: Any | None,
+    hud_boxes: Any | None,
+    hud_input_label: str | None,
+    slow_label: str,
+    fast_label: str,
+    suffix: str = "",
+    extra_labels: Sequence[str] = (),
+) -> list[str]:
+    """
+    Geometry-dependent part: side chains, background, overlays and HUD -> [vout<suffix>].
+    Extra laps turn the video area into a grid: the first shares the fast rect, the second the slow rect.
+    """
+    W = int(getattr(geom, "W"))
+    H = int(getattr(geom, "H"))
+    r = int(round(fps)) if fps and fps > 0.1 else 30
+
+    vL = _view_get(view_L)
+    vR = _view_get(view_R)
+    video_layout = str(getattr(geom, "video_layout", "LR") or "LR").strip().upper()
+    fit_to_height = video_layout != "TB"
+    vL["fit_to_height"] = fit_to_height
+    vR["fit_to_height"] = fit_to_height
+    slow_rect = _geom_video_rect(geom, "video_slow_rect")
+    fast_rect = _geom_video_rect(geom, "video_fast_rect")
+    # Multi-Lap-Raster: LR-Spalten werden oben/unten, TB-Zeilen links/rechts geteilt.
+    extra_rects: list[tuple[int, int, int, int]] = []
+    if len(extra_labels) >= 1:
+        fast_rect, extra_rect0 = _split_video_rect(fast_rect, stacked=fit_to_height)
+        extra_rects.append(extra_rect0)
+    if len(extra_labels) >= 2:
+        slow_rect, extra_rect1 = _split_video_rect(slow_rect, stacked=fit_to_height)
+        extra_rects.append(extra_rect1)
+    slow_x, slow_y, slow_w, slow_h = slow_rect
+    fast_x, fast_y, fast_w, fast_h = fast_rect
+    sx = str(suffix or "")
+    parts: list[str] = []
 
     # Side-Chains auf Basis der geschnittenen Streams
-    left_chain = _build_side_chain_from_label("slowcut", slow_w, slow_h, r, vL, "vslow")
-    right_chain = _build_side_chain_from_label("fastsync", fast_w, fast_h, r, vR, "vfast")
+    left_chain = _build_side_chain_from_label(slow_label, slow_w, slow_h, r, vL, f"vslow{sx}")
+    right_chain = _build_side_chain_from_label(fast_label, fast_w, fast_h, r, vR, f"vfast{sx}")
 
     parts.append(f"{left_chain}")
     parts.append(f"{right_chain}")
+    for k, (x_label, x_rect) in enumerate(zip(extra_labels, extra_rects)):
+        parts.append(_build_side_chain_from_label(x_label, x_rect[2], x_rect[3], r, dict(vR), f"vextra{k}{sx}"))
 
-    parts.append(f"color=c=black:s={W}x{H}:r={r}[base]")
+    parts.append(f"color=c=black:s={W}x{H}:r={r}[base{sx}]")
 
     hud_chain = _hud_drawboxes_chain(geom=geom, hud_enabled=hud_enabled, hud_boxes=hud_boxes)
 
-    parts.append(f"[base][vslow]overlay={slow_x}:{slow_y}:shortest=1[tmp0]")
+    base_label = f"base{sx}"
+    for k, x_rect in enumerate(extra_rects):
+        parts.append(f"[{base_label}][vextra{k}{sx}]overlay={x_rect[0]}:{x_rect[1]}:shortest=1[xbase{k}{sx}]")
+        base_label = f"xbase{k}{sx}"
+    parts.append(f"[{base_label}][vslow{sx}]overlay={slow_x}:{slow_y}:shortest=1[tmp0{sx}]")
     hud_mode = str(getattr(geom, "hud_mode", "frame") or "frame").strip().lower()
 
     if hud_input_label and hud_mode == "free":
-        parts.append(f"[tmp0][vfast]overlay={fast_x}:{fast_y}:shortest=1[tmp1]")
-        parts.append(f"{hud_input_label}format=rgba[hudrgba]")
-        parts.append(f"[tmp1][hudrgba]overlay=0:0:shortest=1[hudtmp]")
-        parts.append(f"[hudtmp]copy{hud_chain}[vpre]")
+        parts.append(f"[tmp0{sx}][vfast{sx}]overlay={fast_x}:{fast_y}:shortest=1[tmp1{sx}]")
+        parts.append(f"{hud_input_label}format=rgba[hudrgba{sx}]")
+        parts.append(f"[tmp1{sx}][hudrgba{sx}]overlay=0:0:shortest=1[hudtmp{sx}]")
+        parts.append(f"[hudtmp{sx}]copy{hud_chain}[vpre{sx}]")
     else:
         # HUD (Python rawvideo/rgba Stream) als Overlay in die Mitte
         if hud_input_label:
             # HUD-Input ist geom.hud x geom.H mit Alpha.
             hud_x, hud_y = _geom_hud_anchor(geom)
-            parts.append(f"{hud_input_label}format=rgba[hudrgba]")
-            parts.append(f"[tmp0][hudrgba]overlay={hud_x}:{hud_y}:shortest=1[tmp]")
+            parts.append(f"{hud_input_label}format=rgba[hudrgba{sx}]")
+            parts.append(f"[tmp0{sx}][hudrgba{sx}]overlay={hud_x}:{hud_y}:shortest=1[tmp{sx}]")
         else:
-            parts.append(f"[tmp0]copy[tmp]")
+            parts.append(f"[tmp0{sx}]copy[tmp{sx}]")
 
         # Danach Fast overlay + danach die HUD-Rahmen (Story 1) als drawbox
-        parts.append(f"[tmp][vfast]overlay={fast_x}:{fast_y}:shortest=1{hud_chain}[vpre]")
-
-    parts.append(f"[vpre]fps={r}[vout]")
+        parts.append(f"[tmp{sx}][vfast{sx}]overlay={fast_x}:{fast_y}:shortest=1{hud_chain}[vpre{sx}]")
 
-    audio_map = None
+    parts.append(f"[vpre{sx}]fps={r}[vout{sx}]")
+    return parts
 
-    # Audio-Input-Index haengt davon ab, ob HUD als Input 0 existiert
-    a_slow_in = "1:a" if hud_input_label else "0:a"
-    a_fast_in = "2:a" if hud_input_label else "1:a"
 
-    if audio_source == "slow":
-        parts.append(f"[{a_slow_in}]atrim=start={ts0}:end={ts1},asetpts=PTS-STARTPTS[aout]")
-        audio_map = "[aout]"
-    elif audio_source == "fast":
-        parts.append(
-            f"[{a_fast_in}]atrim=start={float(fast_time_s[cut_i0])}:end={float(fast_time_s[cut_i1])},asetpts=PTS-STARTPTS[aout]"
+@dataclass(frozen=True)
+class StreamSyncTarget:
+    """One output of a multi-output stream-sync render."""
+    geom: Any
+    view_L: dict[str, Any] | None = None
+    view_R: dict[str, Any] | None = None
+    hud_enabled: Any | None = None
+    hud_boxes: Any | None = None
+    hud_input_label: str | None = None
+
+
+def build_multi_stream_sync_filter(
+    targets: list[StreamSyncTarget],
+    fps: float,
+    fast_time_s: Any,
+    speed_diff: Any | None,
+    cut_i0: int,
+    cut_i1: int,
+    audio_source: str,
+    in_offset: int,
+) -> tuple[str, list[str], list[str | None]]:
+    """
+    Ein Decode + ein Fast-Warp, danach split auf mehrere Ziel-Geometrien.
+    Liefert (filter_complex, video_maps, audio_maps) in Reihenfolge der targets.
+    """
+    if not targets:
+        raise RuntimeError("multi-output: keine Ziele.")
+    video_parts, audio_parts, audio_map = _build_stream_sync_sources(
+        fps=fps,
+        fast_time_s=fast_time_s,
+        speed_diff=speed_diff,
+        cut_i0=cut_i0,
+        cut_i1=cut_i1,
+        audio_source=audio_source,
+        in_offset=in_offset,
+    )
+    n = len(targets)
+    parts = list(video_parts)
+    parts.append("[slowcut]split=" + str(n) + "".join(f"[slowcut_t{k}]" for k in range(n)))
+    parts.append("[fastsync]split=" + str(n) + "".join(f"[fastsync_t{k}]" for k in range(n)))
+    video_maps: list[str] = []
+    for k, t in enumerate(targets):
+        parts += _build_stream_sync_composite(
+            geom=t.geom,
+            fps=fps,
+            view_L=t.view_L,
+            view_R=t.view_R,
+            hud_enabled=t.hud_enabled,
+            hud_boxes=t.hud_boxes,
+            hud_input_label=t.hud_input_label,
+            slow_label=f"slowcut_t{k}",
+            fast_label=f"fastsync_t{k}",
+            suffix=f"_t{k}",
         )
-        audio_map = "[aout]"
-    else:
-        audio_map = None
-
-    return ";".join(parts), audio_map
-
+        video_maps.append(f"[vout_t{k}]")
+    audio_maps: list[str | None] = [None] * n
+    if audio_map:
+        parts += audio_parts
+        parts.append("[aout]asplit=" + str(n) + "".join(f"[aout_t{k}]" for k in range(n)))
+        audio_maps = [f"[aout_t{k}]" for k in range(n)]
+    return ";".join(parts), video_maps, audio_maps
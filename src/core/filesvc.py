@@ -5,6 +5,8 @@ import shutil
 from pathlib import Path
 from typing import Callable, Sequence
 
+from core.fswatch import EVENT_ADDED, EVENT_REMOVED, EVENT_RESCAN, FolderWatcher, FsEvent
+
 
 FolderScanSignature = tuple[tuple[str, ...], tuple[str, ...]]
 VIDEO_EXTS = {".mp4", ".mkv", ".mov", ".avi"}
@@ -51,9 +53,11 @@ def sync_from_folders_if_needed(
     input_csv_dir: Path,
     refresh_display: Callable[[], None],
     force: bool = False,
+    sig: FolderScanSignature | None = None,
 ) -> tuple[list[Path], list[Path], FolderScanSignature | None]:
-    """Synchronize from folders if needed."""
-    sig = scan_folders_signature(input_video_dir, input_csv_dir)
+    """Synchronize from folders if needed (sig: signature already known from InputFolderWatch)."""
+    if sig is None or force:
+        sig = scan_folders_signature(input_video_dir, input_csv_dir)
     if (not force) and (sig == last_scan_sig):
         return videos, csvs, last_scan_sig
     last_scan_sig = sig
@@ -84,6 +88,71 @@ def periodic_folder_watch(sync_callback: Callable[[], None], schedule_callback:
     schedule_callback()
 
 
+class InputFolderWatch:
+    """Keeps the input folder signature current from watcher events instead of re-listing the folders."""
+
+    def __init__(self, input_video_dir: Path, input_csv_dir: Path, *, debounce_s: float = 0.3) -> None:
+        """Implement init logic."""
+        self.input_video_dir = Path(input_video_dir)
+        self.input_csv_dir = Path(input_csv_dir)
+        self._videos: set[str] = set()
+        self._csvs: set[str] = set()
+        self.last_events: list[FsEvent] = []
+        self._watcher = FolderWatcher([self.input_video_dir, self.input_csv_dir], debounce_s=debounce_s)
+        self._watcher.start()
+        self.resync()
+
+    @property
+    def backend_name(self) -> str:
+        """Return the active watcher backend ("inotify" or "poll")."""
+        return self._watcher.backend_name
+
+    def signature(self) -> FolderScanSignature:
+        """Return the current signature (same shape as scan_folders_signature)."""
+        return tuple(sorted(self._videos)), tuple(sorted(self._csvs))
+
+    def resync(self, sig: FolderScanSignature | None = None) -> FolderScanSignature:
+        """Reset the name sets from a full scan (or a signature the caller just scanned)."""
+        if sig is None:
+            try:
+                sig = scan_folders_signature(self.input_video_dir, self.input_csv_dir)
+            except Exception:
+                sig = ((), ())
+        self._videos = set(sig[0])
+        self._csvs = set(sig[1])
+        return self.signature()
+
+    def poll(self) -> FolderScanSignature | None:
+        """Apply pending events; return the new signature if the set of names changed, else None."""
+        events = self._watcher.drain()
+        if not events:
+            return None
+        self.last_events = events
+        before = self.signature()
+        for ev in events:
+            if ev.kind == EVENT_RESCAN:
+                self.resync()
+                break
+            folder = ev.path.parent
+            if folder == self.input_video_dir and ev.path.suffix.lower() in VIDEO_EXTS:
+                names = self._videos
+            elif folder == self.input_csv_dir and ev.path.suffix.lower() == ".csv":
+                names = self._csvs
+            else:
+                continue
+            if ev.kind == EVENT_REMOVED:
+                names.discard(ev.path.name)
+            elif ev.kind == EVENT_ADDED or ev.path.name not in names:
+                if ev.path.is_file():
+                    names.add(ev.path.name)
+        after = self.signature()
+        return after if after != before else None
+
+    def close(self) -> None:
+        """Stop the watcher."""
+        self._watcher.stop()
+
+
 def select_files(paths: Sequence[str], input_video_dir: Path, input_csv_dir: Path) -> tuple[str, list[Path], list[Path]]:
     """Select files."""
     if not paths:
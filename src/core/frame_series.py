@@ -0,0 +1,78 @@
+"""Compact per-frame series: typed array.array storage with list semantics and zero-copy NumPy views."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+import numpy as np
+
+# array.array typecode -> NumPy dtype (fixed widths, independent of the C compiler's int size).
+_TYPECODE_DTYPES: dict[str, Any] = {
+    "b": np.int8,
+    "i": np.int32,
+    "f": np.float32,
+    "d": np.float64,
+}
+
+
+def is_frame_series(values: Any) -> bool:
+    """Return whether values is a per-frame series (list or compact array)."""
+    return isinstance(values, (list, array))
+
+
+def compact_frames(values: Any, typecode: str) -> Any:
+    """Return values as a read-only-by-convention typed array; unconvertible input is returned unchanged."""
+    if values is None:
+        return None
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    dtype = _TYPECODE_DTYPES[typecode]
+    if array(typecode).itemsize != np.dtype(dtype).itemsize:
+        return values
+    try:
+        arr = np.asarray(values)
+        if arr.ndim != 1 or arr.dtype.kind not in "biuf":
+            return values
+        if np.dtype(dtype).kind in "iu":
+            if arr.dtype.kind == "f" and not bool(np.all(np.isfinite(arr))):
+                return values
+            info = np.iinfo(dtype)
+            if arr.size and (arr.min() < info.min or arr.max() > info.max):
+                return values
+        out = array(typecode)
+        out.frombytes(np.ascontiguousarray(arr, dtype=dtype).tobytes())
+        return out
+    except Exception:
+        return values
+
+
+def frames_view(values: Any) -> np.ndarray:
+    """Return a NumPy view of a compact series (zero-copy) or an array copy of a list."""
+    if isinstance(values, array):
+        dtype = _TYPECODE_DTYPES.get(values.typecode)
+        if dtype is not None:
+            view = np.frombuffer(values, dtype=dtype)
+            view.flags.writeable = False
+            return view
+    return np.asarray(values if values is not None else [])
+
+
+def frames_from_numpy(arr: np.ndarray, typecode: str) -> array:
+    """Wrap a NumPy result as a compact series."""
+    out = array(typecode)
+    out.frombytes(np.ascontiguousarray(arr, dtype=_TYPECODE_DTYPES[typecode]).tobytes())
+    return out
+
+
+def series_nbytes(values: Any) -> int:
+    """Approximate payload size of a series (for memory logging)."""
+    if values is None:
+        return 0
+    if isinstance(values, array):
+        return int(values.itemsize) * len(values)
+    try:
+        # Liste: 8 Byte Zeiger + 24 Byte float-Objekt pro Eintrag.
+        return 32 * len(values)
+    except Exception:
+        return 0
@@ -0,0 +1,328 @@
+"""Filesystem watcher: inotify on Linux, polling fallback elsewhere; debounced add/remove/modify events."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Iterable
+
+FS_WATCH_ENV = "IRVC_FS_WATCH"
+
+EVENT_ADDED = "added"
+EVENT_REMOVED = "removed"
+EVENT_MODIFIED = "modified"
+# Backend hat Events verloren (inotify-Queue voll, Root weg): Verbraucher muessen neu scannen.
+EVENT_RESCAN = "rescan"
+
+
+@dataclass(frozen=True)
+class FsEvent:
+    """One debounced change below a watched root."""
+    kind: str
+    path: Path
+    root: Path
+    is_dir: bool = False
+
+
+EmitFn = Callable[[str, Path, Path, bool], None]
+
+
+class PollingBackend:
+    """Stat-based snapshot diff; used where no native backend is available."""
+
+    name = "poll"
+
+    def __init__(self, roots: list[Path], *, recursive: bool, interval_s: float = 1.0, max_depth: int = 2) -> None:
+        """Implement init logic."""
+        self.roots = roots
+        self.recursive = bool(recursive)
+        self.interval_s = max(0.05, float(interval_s))
+        self.max_depth = max(1, int(max_depth)) if recursive else 1
+        # Ausgangszustand sofort erfassen, damit Aenderungen direkt nach start() nicht verloren gehen.
+        self._snaps = {root: self._snapshot(root) for root in roots}
+
+    def _snapshot(self, root: Path) -> dict[Path, tuple[int, int, bool]]:
+        """Return {path: (mtime_ns, size, is_dir)} below root."""
+        out: dict[Path, tuple[int, int, bool]] = {}
+        stack: list[tuple[Path, int]] = [(root, 1)]
+        while stack:
+            folder, depth = stack.pop()
+            try:
+                it = os.scandir(folder)
+            except Exception:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                        is_dir = entry.is_dir()
+                    except Exception:
+                        continue
+                    p = Path(entry.path)
+                    out[p] = (int(st.st_mtime_ns), int(st.st_size), bool(is_dir))
+                    if is_dir and depth < self.max_depth:
+                        stack.append((p, depth + 1))
+        return out
+
+    def run(self, emit: EmitFn, stop: threading.Event) -> None:
+        """Poll until stop is set."""
+        snaps = self._snaps
+        while not stop.wait(self.interval_s):
+            for root in self.roots:
+                old = snaps.get(root, {})
+                new = self._snapshot(root)
+                for p, info in new.items():
+                    prev = old.get(p)
+                    if prev is None:
+                        emit(EVENT_ADDED, p, root, info[2])
+                    elif prev != info and not info[2]:
+                        emit(EVENT_MODIFIED, p, root, False)
+                for p, info in old.items():
+                    if p not in new:
+                        emit(EVENT_REMOVED, p, root, info[2])
+                snaps[root] = new
+
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0x00000800
+_IN_CLOEXEC = 0x00080000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """Implement load libc logic."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _ = libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+        return libc
+    except Exception:
+        return None
+
+
+class InotifyBackend:
+    """Linux inotify via ctypes (no extra dependency); recursive mode adds watches for new subfolders."""
+
+    name = "inotify"
+
+    def __init__(self, roots: list[Path], *, recursive: bool, max_depth: int = 2) -> None:
+        """Implement init logic."""
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify unavailable")
+        self._libc = libc
+        self.roots = roots
+        self.recursive = bool(recursive)
+        self.max_depth = max(1, int(max_depth)) if recursive else 1
+        fd = int(libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC))
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._wd: dict[int, tuple[Path, Path, int]] = {}  # wd -> (folder, root, depth)
+        for root in roots:
+            if not self._add_tree(root, root, 1):
+                os.close(fd)
+                raise OSError(f"inotify_add_watch failed: {root}")
+
+    def _add_watch(self, folder: Path, root: Path, depth: int) -> bool:
+        """Implement add watch logic."""
+        wd = int(self._libc.inotify_add_watch(self._fd, os.fsencode(str(folder)), _WATCH_MASK))
+        if wd < 0:
+            return False
+        self._wd[wd] = (folder, root, depth)
+        return True
+
+    def _add_tree(self, folder: Path, root: Path, depth: int) -> bool:
+        """Watch folder and (recursive mode) its subfolders up to max_depth."""
+        if not self._add_watch(folder, root, depth):
+            return False
+        if depth < self.max_depth:
+            try:
+                subdirs = [Path(e.path) for e in os.scandir(folder) if e.is_dir()]
+            except Exception:
+                subdirs = []
+            for sub in subdirs:
+                self._add_tree(sub, root, depth + 1)
+        return True
+
+    def run(self, emit: EmitFn, stop: threading.Event) -> None:
+        """Read inotify events until stop is set."""
+        try:
+            while not stop.is_set():
+                try:
+                    ready, _, _ = select.select([self._fd], [], [], 0.25)
+                except Exception:
+                    break
+                if not ready:
+                    continue
+                try:
+                    buf = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                except Exception:
+                    break
+                self._dispatch(buf, emit)
+        finally:
+            try:
+                os.close(self._fd)
+            except Exception:
+                pass
+
+    def _dispatch(self, buf: bytes, emit: EmitFn) -> None:
+        """Decode a read() buffer of inotify_event records."""
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                for root in self.roots:
+                    emit(EVENT_RESCAN, root, root, True)
+                continue
+            watched = self._wd.get(wd)
+            if watched is None:
+                continue
+            folder, root, depth = watched
+            if mask & _IN_IGNORED:
+                self._wd.pop(wd, None)
+                continue
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                if folder == root:
+                    emit(EVENT_RESCAN, root, root, True)
+                continue
+            if not raw_name:
+                continue
+            path = folder / os.fsdecode(raw_name)
+            is_dir = bool(mask & _IN_ISDIR)
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                if is_dir and depth < self.max_depth:
+                    self._add_tree(path, root, depth + 1)
+                emit(EVENT_ADDED, path, root, is_dir)
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                emit(EVENT_REMOVED, path, root, is_dir)
+            elif mask & (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_ATTRIB):
+                emit(EVENT_MODIFIED, path, root, is_dir)
+
+
+def _merge_kind(prev: str, new: str) -> str | None:
+    """Collapse two events for the same path inside one debounce window (None = no net change)."""
+    if new == EVENT_RESCAN or prev == EVENT_RESCAN:
+        return EVENT_RESCAN
+    if prev == EVENT_ADDED:
+        return None if new == EVENT_REMOVED else EVENT_ADDED
+    if prev == EVENT_REMOVED:
+        return EVENT_MODIFIED if new == EVENT_ADDED else EVENT_REMOVED
+    return new if new == EVENT_REMOVED else EVENT_MODIFIED
+
+
+class FolderWatcher:
+    """Watch folders on a background thread and hand out debounced events via drain()."""
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        *,
+        recursive: bool = False,
+        max_depth: int = 2,
+        debounce_s: float = 0.3,
+        poll_interval_s: float = 1.0,
+    ) -> None:
+        """Implement init logic."""
+        self.roots = [Path(r) for r in roots]
+        self.recursive = bool(recursive)
+        self.max_depth = int(max_depth)
+        self.debounce_s = max(0.0, float(debounce_s))
+        self.poll_interval_s = float(poll_interval_s)
+        self._lock = threading.Lock()
+        self._pending: dict[Path, FsEvent] = {}
+        self._last_event_ts = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.backend_name = ""
+
+    def _make_backend(self) -> PollingBackend | InotifyBackend:
+        """Pick inotify when possible (IRVC_FS_WATCH=poll forces polling)."""
+        mode = str(os.environ.get(FS_WATCH_ENV) or "").strip().lower()
+        if mode != "poll":
+            try:
+                return InotifyBackend(self.roots, recursive=self.recursive, max_depth=self.max_depth)
+            except Exception:
+                pass
+        return PollingBackend(
+            self.roots,
+            recursive=self.recursive,
+            interval_s=self.poll_interval_s,
+            max_depth=self.max_depth,
+        )
+
+    def start(self) -> "FolderWatcher":
+        """Start the watcher thread (no-op if already running)."""
+        if self._thread is not None:
+            return self
+        self.roots = [r for r in self.roots if r.is_dir()]
+        backend = self._make_backend()
+        self.backend_name = backend.name
+        self._thread = threading.Thread(
+            target=backend.run,
+            args=(self._emit, self._stop),
+            name=f"fswatch-{backend.name}",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None:
+            thread.join(timeout=2.0)
+
+    def _emit(self, kind: str, path: Path, root: Path, is_dir: bool) -> None:
+        """Collect a raw backend event (watcher thread)."""
+        with self._lock:
+            prev = self._pending.get(path)
+            merged = kind if prev is None else _merge_kind(prev.kind, kind)
+            if merged is None:
+                self._pending.pop(path, None)
+            else:
+                self._pending[path] = FsEvent(kind=merged, path=path, root=root, is_dir=bool(is_dir))
+            self._last_event_ts = time.monotonic()
+
+    def drain(self) -> list[FsEvent]:
+        """Return settled events (no new event for debounce_s); cheap enough to call from a UI timer."""
+        with self._lock:
+            if not self._pending:
+                return []
+            if time.monotonic() - self._last_event_ts < self.debounce_s:
+                return []
+            events = list(self._pending.values())
+            self._pending.clear()
+        return events
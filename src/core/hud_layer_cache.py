@@ -0,0 +1,297 @@
+"""Cached lossless HUD layer tracks (FFV1/BGRA in MKV) so re-encodes can skip the Python HUD stream."""
+
+from __future__ import annotations
+
+from array import array
+import hashlib
+import json
+import os
+from pathlib import Path
+import subprocess
+import threading
+import time
+from typing import Any
+
+from core import persistence
+from core.ffmpeg_tools import resolve_ffmpeg_bin
+from core.subprocess_utils import windows_no_window_subprocess_kwargs
+
+HUD_LAYER_CACHE_ENV = "IRVC_HUD_LAYER_CACHE"
+HUD_LAYER_CACHE_DIR_ENV = "IRVC_HUD_LAYER_CACHE_DIR"
+HUD_LAYER_CACHE_MAX_MB_ENV = "IRVC_HUD_LAYER_CACHE_MAX_MB"
+HUD_LAYER_VERSION = 1
+
+_DEFAULT_MAX_MB = 8 * 1024
+
+
+def hud_layer_cache_enabled() -> bool:
+    """Return whether HUD layers are cached (opt-in: IRVC_HUD_LAYER_CACHE=1)."""
+    raw = str(os.environ.get(HUD_LAYER_CACHE_ENV) or "").strip().lower()
+    return raw in ("1", "true", "yes", "on")
+
+
+def hud_layer_cache_dir() -> Path:
+    """Return the cache directory (IRVC_HUD_LAYER_CACHE_DIR or <project>/cache/hud_layers)."""
+    raw = str(os.environ.get(HUD_LAYER_CACHE_DIR_ENV) or "").strip()
+    if raw:
+        return Path(raw)
+    return persistence.cache_dir / "hud_layers"
+
+
+def _max_bytes() -> int:
+    """Implement max bytes logic."""
+    raw = str(os.environ.get(HUD_LAYER_CACHE_MAX_MB_ENV) or "").strip()
+    try:
+        mb = float(raw) if raw else float(_DEFAULT_MAX_MB)
+    except Exception:
+        mb = float(_DEFAULT_MAX_MB)
+    return int(max(0.0, mb) * 1024 * 1024)
+
+
+class HudLayerFingerprint:
+    """Incremental sha1 over the inputs that determine the HUD pixels."""
+
+    def __init__(self) -> None:
+        """Implement init logic."""
+        self._h = hashlib.sha1(f"hud-layer-v{HUD_LAYER_VERSION}".encode("ascii"))
+
+    def add(self, name: str, value: Any) -> None:
+        """Add a named value; typed arrays are hashed by their raw bytes."""
+        self._h.update(b"\0" + str(name).encode("utf-8", errors="replace") + b"=")
+        if isinstance(value, array):
+            self._h.update(value.typecode.encode("ascii"))
+            self._h.update(value.tobytes())
+            return
+        try:
+            raw = json.dumps(value, sort_keys=True, default=repr)
+        except Exception:
+            raw = repr(value)
+        self._h.update(raw.encode("utf-8", errors="replace"))
+
+    def hexdigest(self) -> str:
+        """Return the cache key."""
+        return self._h.hexdigest()
+
+
+class HudLayerWriter:
+    """Second ffmpeg process that receives the same RGBA frames as the main encode and stores them losslessly."""
+
+    def __init__(self, cache: "HudLayerCache", key: str, size: tuple[int, int], fps: float) -> None:
+        """Implement init logic."""
+        self.cache = cache
+        self.key = key
+        self.size = (int(size[0]), int(size[1]))
+        self.fps = float(fps)
+        self.frames = 0
+        self.failed = False
+        self._tmp = cache.layer_path(key).with_name(f"{key}.{os.getpid()}.tmp.mkv")
+        self._proc: subprocess.Popen | None = None
+
+    def start(self) -> bool:
+        """Spawn the ffmpeg writer; False (and no caching) if that fails."""
+        try:
+            self._tmp.parent.mkdir(parents=True, exist_ok=True)
+            cmd = [
+                resolve_ffmpeg_bin(),
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-y",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgba",
+                "-s",
+                f"{self.size[0]}x{self.size[1]}",
+                "-r",
+                f"{self.fps}",
+                "-i",
+                "-",
+                "-c:v",
+                "ffv1",
+                "-level",
+                "3",
+                "-slices",
+                "4",
+                "-g",
+                "1",
+                "-pix_fmt",
+                "bgra",
+                str(self._tmp),
+            ]
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **windows_no_window_subprocess_kwargs(),
+            )
+            return True
+        except Exception:
+            self.failed = True
+            self._proc = None
+            return False
+
+    def write(self, frame_bytes: bytes) -> None:
+        """Forward one frame; a failing writer only disables caching, never the render."""
+        if self.failed or self._proc is None or self._proc.stdin is None:
+            return
+        try:
+            self._proc.stdin.write(frame_bytes)
+            self.frames += 1
+        except Exception:
+            self.failed = True
+
+    def finish(self, *, complete: bool) -> Path | None:
+        """Close the writer; publish the layer when the full HUD stream was written."""
+        proc = self._proc
+        self._proc = None
+        rc = -1
+        if proc is not None:
+            try:
+                if proc.stdin is not None:
+                    proc.stdin.close()
+            except Exception:
+                self.failed = True
+            try:
+                rc = int(proc.wait(timeout=120.0))
+            except Exception:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+        if complete and not self.failed and rc == 0 and self.frames > 0:
+            path = self.cache.publish(self.key, self._tmp, frames=self.frames, size=self.size, fps=self.fps)
+            if path is not None:
+                return path
+        try:
+            self._tmp.unlink()
+        except Exception:
+            pass
+        return None
+
+
+class HudLayerCache:
+    """One <key>.mkv plus <key>.json per HUD stream; size-capped by least recently used."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """Implement init logic."""
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Return the cache directory."""
+        return self._cache_dir if self._cache_dir is not None else hud_layer_cache_dir()
+
+    def layer_path(self, key: str) -> Path:
+        """Implement layer path logic."""
+        return self.cache_dir / f"{key}.mkv"
+
+    def _meta_path(self, key: str) -> Path:
+        """Implement meta path logic."""
+        return self.cache_dir / f"{key}.json"
+
+    def lookup(self, key: str, *, size: tuple[int, int], frames: int) -> Path | None:
+        """Return the cached layer for key if it is complete and matches size/frame count."""
+        path = self.layer_path(key)
+        try:
+            meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+            ok = (
+                path.is_file()
+                and int(meta.get("version") or 0) == HUD_LAYER_VERSION
+                and [int(v) for v in meta.get("size") or ()] == [int(size[0]), int(size[1])]
+                and int(meta.get("frames") or 0) == int(frames)
+                and int(meta.get("bytes") or -1) == int(path.stat().st_size)
+            )
+        except Exception:
+            ok = False
+        if not ok:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            os.utime(self._meta_path(key))
+        except Exception:
+            pass
+        return path
+
+    def writer(self, key: str, *, size: tuple[int, int], fps: float) -> HudLayerWriter | None:
+        """Return a started writer for key, or None if ffmpeg could not be spawned."""
+        writer = HudLayerWriter(self, key, size, fps)
+        return writer if writer.start() else None
+
+    def publish(self, key: str, tmp: Path, *, frames: int, size: tuple[int, int], fps: float) -> Path | None:
+        """Move a finished layer into place (file first, then meta) and prune the cache."""
+        path = self.layer_path(key)
+        try:
+            os.replace(tmp, path)
+            meta = {
+                "version": HUD_LAYER_VERSION,
+                "frames": int(frames),
+                "size": [int(size[0]), int(size[1])],
+                "fps": float(fps),
+                "bytes": int(path.stat().st_size),
+                "created": time.time(),
+            }
+            meta_tmp = self._meta_path(key).with_suffix(f".{os.getpid()}.tmp")
+            meta_tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            os.replace(meta_tmp, self._meta_path(key))
+        except Exception:
+            return None
+        self.prune(keep=key)
+        return path
+
+    def prune(self, *, keep: str | None = None) -> None:
+        """Drop least recently used layers above IRVC_HUD_LAYER_CACHE_MAX_MB."""
+        limit = _max_bytes()
+        with self._lock:
+            entries: list[tuple[float, int, str]] = []
+            try:
+                metas = list(self.cache_dir.glob("*.json"))
+            except Exception:
+                return
+            for meta in metas:
+                key = meta.stem
+                try:
+                    size = int(self.layer_path(key).stat().st_size)
+                    used = float(meta.stat().st_mtime)
+                except Exception:
+                    continue
+                entries.append((used, size, key))
+            total = sum(size for _used, size, _key in entries)
+            # Reste abgebrochener Renders (tmp-Dateien aelter als ein Tag) mit aufraeumen.
+            try:
+                for tmp in self.cache_dir.glob("*.tmp.mkv"):
+                    if time.time() - float(tmp.stat().st_mtime) > 86400.0:
+                        tmp.unlink()
+            except Exception:
+                pass
+            for _used, size, key in sorted(entries):
+                if total <= limit:
+                    break
+                if key == keep:
+                    continue
+                for p in (self._meta_path(key), self.layer_path(key)):
+                    try:
+                        p.unlink()
+                    except Exception:
+                        pass
+                total -= size
+
+
+_CACHE: HudLayerCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_hud_layer_cache() -> HudLayerCache:
+    """Return the process-wide HUD layer cache."""
+    global _CACHE
+    if _CACHE is not None:
+        return _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = HudLayerCache()
+    return _CACHE
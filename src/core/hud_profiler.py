@@ -0,0 +1,270 @@
+"""Per-HUD / per-phase timing for the Python HUD render loop (opt-in, no cost when disabled)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable
+
+HUD_PROFILE_ENV = "IRVC_HUD_PROFILE"
+HUD_PROFILE_FRAMES_ENV = "IRVC_HUD_PROFILE_FRAMES"
+
+PHASE_STATIC = "static_rebuild"
+PHASE_FULL_REDRAW = "full_redraw"
+PHASE_INCREMENTAL = "incremental"
+PHASE_VALUES = "value_overlay"
+PHASE_COMPOSITE = "composite"
+PHASE_PREP = "prep"
+PHASE_FRAME_SETUP = "frame_setup"
+PHASE_FRAME_WRITE = "frame_write"
+
+PHASES = (
+    PHASE_STATIC,
+    PHASE_FULL_REDRAW,
+    PHASE_INCREMENTAL,
+    PHASE_VALUES,
+    PHASE_COMPOSITE,
+    PHASE_PREP,
+    PHASE_FRAME_SETUP,
+    PHASE_FRAME_WRITE,
+)
+
+# Schluessel fuer Zeit ausserhalb einzelner HUDs (Frame-Setup, Konvertierung, Pipe).
+FRAME_KEY = "<frame>"
+
+
+def hud_profile_enabled() -> bool:
+    """Return whether the HUD loop is profiled (opt-in: IRVC_HUD_PROFILE=1)."""
+    raw = str(os.environ.get(HUD_PROFILE_ENV) or "").strip().lower()
+    return raw in ("1", "true", "yes", "on")
+
+
+def _parse_frame_range(raw: str) -> tuple[int, int] | None:
+    """Parse "a-b" (stream frame indices, b exclusive)."""
+    try:
+        a_raw, b_raw = str(raw or "").strip().split("-", 1)
+        a, b = int(a_raw), int(b_raw)
+    except Exception:
+        return None
+    return (a, b) if b > a >= 0 else None
+
+
+class HudRenderProfiler:
+    """
+    Accumulates wall time per HUD key and phase. Phases nest: a timed call inside another timed call
+    is subtracted from its parent, the rest of a HUD's time goes to its current fallback phase.
+    """
+
+    def __init__(self, *, enabled: bool, sample_range: tuple[int, int] | None = None) -> None:
+        """Implement init logic."""
+        self.enabled = bool(enabled)
+        self.sample_range = sample_range if self.enabled else None
+        self.totals: dict[str, dict[str, float]] = {}
+        self.calls: dict[str, dict[str, int]] = {}
+        self.frame_times: list[float] = []
+        self._key = FRAME_KEY
+        self._rest_phase = PHASE_FRAME_SETUP
+        self._seg_t = 0.0
+        self._seg_child = 0.0
+        self._stack: list[float] = []
+        self._frame_t = 0.0
+        self._frame_j = -1
+        self._cprof: Any = None
+        self._sampled = False
+        self._cprof_result: Any = None
+        self._t0 = time.perf_counter()
+
+    @classmethod
+    def from_env(cls) -> "HudRenderProfiler":
+        """Build a profiler from IRVC_HUD_PROFILE / IRVC_HUD_PROFILE_FRAMES."""
+        if not hud_profile_enabled():
+            return cls(enabled=False)
+        return cls(enabled=True, sample_range=_parse_frame_range(os.environ.get(HUD_PROFILE_FRAMES_ENV) or ""))
+
+    def _add(self, key: str, phase: str, dt: float) -> None:
+        """Implement add logic."""
+        per_key = self.totals.setdefault(key, {})
+        per_key[phase] = per_key.get(phase, 0.0) + float(dt)
+        calls = self.calls.setdefault(key, {})
+        calls[phase] = calls.get(phase, 0) + 1
+
+    def _close_segment(self, now: float) -> None:
+        """Attribute the untimed rest of the current segment to its fallback phase."""
+        rest = (now - self._seg_t) - self._seg_child
+        if rest > 0.0:
+            self._add(self._key, self._rest_phase, rest)
+        self._seg_t = now
+        self._seg_child = 0.0
+
+    def begin_frame(self, j: int) -> None:
+        """Start frame j (also starts/stops the cProfile sampling window)."""
+        now = time.perf_counter()
+        if self._frame_j >= 0:
+            self.end_frame()
+            now = time.perf_counter()
+        self._frame_j = int(j)
+        self._frame_t = now
+        self._key = FRAME_KEY
+        self._rest_phase = PHASE_FRAME_SETUP
+        self._seg_t = now
+        self._seg_child = 0.0
+        if self.sample_range is not None:
+            a, b = self.sample_range
+            if int(j) == a and self._cprof is None and not self._sampled:
+                try:
+                    import cProfile
+
+                    self._cprof = cProfile.Profile()
+                    self._cprof.enable()
+                except Exception:
+                    self._cprof = None
+            elif int(j) >= b and self._cprof is not None:
+                self._stop_sampling()
+
+    def end_frame(self) -> None:
+        """Close the current frame."""
+        if self._frame_j < 0:
+            return
+        now = time.perf_counter()
+        self._close_segment(now)
+        self.frame_times.append(now - self._frame_t)
+        self._frame_j = -1
+
+    def hud(self, key: str | None, rest_phase: str = PHASE_PREP) -> None:
+        """Switch attribution to HUD key (None = back to frame-level work)."""
+        self._close_segment(time.perf_counter())
+        self._key = str(key) if key is not None else FRAME_KEY
+        self._rest_phase = rest_phase if key is not None else PHASE_FRAME_WRITE
+
+    def rest_as(self, phase: str) -> None:
+        """Attribute the remaining untimed work of the current HUD to phase from now on."""
+        self._close_segment(time.perf_counter())
+        self._rest_phase = str(phase)
+
+    def timed(self, phase: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return fn wrapped so its self time counts as phase of the current HUD (fn itself when disabled)."""
+        if not self.enabled or fn is None:
+            return fn
+
+        def _wrapped(*args: Any, **kwargs: Any) -> Any:
+            t0 = time.perf_counter()
+            self._stack.append(0.0)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                dt = time.perf_counter() - t0
+                child = self._stack.pop()
+                self._add(self._key, phase, max(0.0, dt - child))
+                if self._stack:
+                    self._stack[-1] += dt
+                else:
+                    self._seg_child += dt
+
+        return _wrapped
+
+    def call(self, phase: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call fn, timed as phase when enabled."""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        return self.timed(phase, fn)(*args, **kwargs)
+
+    def _stop_sampling(self) -> None:
+        """Implement stop sampling logic."""
+        prof = self._cprof
+        self._cprof = None
+        self._sampled = True
+        if prof is not None:
+            try:
+                prof.disable()
+            except Exception:
+                pass
+            self._cprof_result = prof
+
+    def finish(self) -> None:
+        """Close the last frame and the sampling window."""
+        self.end_frame()
+        if self._cprof is not None:
+            self._stop_sampling()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON profile."""
+        ft = sorted(self.frame_times)
+        n = len(ft)
+        frames: dict[str, Any] = {"count": n}
+        if n:
+            frames.update(
+                {
+                    "total_s": round(sum(ft), 6),
+                    "mean_ms": round(1000.0 * sum(ft) / n, 3),
+                    "p50_ms": round(1000.0 * ft[n // 2], 3),
+                    "p95_ms": round(1000.0 * ft[min(n - 1, int(n * 0.95))], 3),
+                    "max_ms": round(1000.0 * ft[-1], 3),
+                }
+            )
+        huds: dict[str, Any] = {}
+        for key, phases in self.totals.items():
+            huds[key] = {
+                "total_s": round(sum(phases.values()), 6),
+                "phases": {p: {"s": round(v, 6), "calls": int(self.calls.get(key, {}).get(p, 0))} for p, v in phases.items()},
+            }
+        return {
+            "version": 1,
+            "wall_s": round(time.perf_counter() - self._t0, 6),
+            "frames": frames,
+            "huds": huds,
+            "sample_range": list(self.sample_range) if self.sample_range else None,
+        }
+
+    def summary_lines(self) -> list[str]:
+        """Return a fixed-width table: one row per HUD, one column per phase (ms per frame)."""
+        n = max(1, len(self.frame_times))
+        used = [p for p in PHASES if any(p in v for v in self.totals.values())]
+        head = f"{'hud':<18}" + "".join(f"{p[:13]:>14}" for p in used) + f"{'total':>10}{'share':>8}"
+        grand = sum(sum(v.values()) for v in self.totals.values()) or 1e-9
+        lines = [f"[hud-prof] frames={len(self.frame_times)} (ms/frame)", "[hud-prof] " + head]
+        rows = sorted(self.totals.items(), key=lambda kv: -sum(kv[1].values()))
+        for key, phases in rows:
+            total = sum(phases.values())
+            cells = "".join(f"{1000.0 * phases.get(p, 0.0) / n:>14.3f}" for p in used)
+            lines.append(f"[hud-prof] {key[:18]:<18}{cells}{1000.0 * total / n:>10.3f}{100.0 * total / grand:>7.1f}%")
+        d = self.to_dict()["frames"]
+        if d.get("count"):
+            lines.append(
+                f"[hud-prof] frame mean={d['mean_ms']}ms p50={d['p50_ms']}ms p95={d['p95_ms']}ms max={d['max_ms']}ms"
+            )
+        return lines
+
+    def write(self, json_path: Path | None, log_fn: Callable[[str], None] | None = None) -> None:
+        """Log the summary, write the JSON profile and (if sampled) the cProfile stats next to it."""
+        if not self.enabled:
+            return
+        self.finish()
+        if log_fn is not None:
+            for line in self.summary_lines():
+                log_fn(line)
+        prof = self._cprof_result
+        if json_path is None:
+            return
+        try:
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            json_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+            if log_fn is not None:
+                log_fn(f"[hud-prof] json={json_path}")
+        except Exception:
+            return
+        if prof is not None:
+            try:
+                import io
+                import pstats
+
+                prof_path = json_path.with_suffix(".prof")
+                prof.dump_stats(str(prof_path))
+                buf = io.StringIO()
+                pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(25)
+                json_path.with_suffix(".prof.txt").write_text(buf.getvalue(), encoding="utf-8")
+                if log_fn is not None:
+                    log_fn(f"[hud-prof] cprofile frames={self.sample_range} -> {prof_path}")
+            except Exception:
+                pass
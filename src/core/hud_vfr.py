@@ -0,0 +1,148 @@
+"""HUD stdin transport: raw CFR frames or a timestamped Matroska stream that only carries changed frames."""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+from typing import Any
+
+HUD_VFR_ENV = "IRVC_HUD_VFR"
+
+# Zeitbasis der Matroska-Bloecke: 1 us (TimestampScale in ns).
+_TIMESTAMP_SCALE_NS = 1000
+_UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+
+
+def hud_vfr_enabled() -> bool:
+    """Return whether the HUD stream only sends changed frames (opt-in: IRVC_HUD_VFR=1)."""
+    raw = str(os.environ.get(HUD_VFR_ENV) or "").strip().lower()
+    return raw in ("1", "true", "yes", "on")
+
+
+def _ebml_size(n: int) -> bytes:
+    """Encode an element size as an 8-byte EBML vint."""
+    return bytes([0x01]) + int(n).to_bytes(7, "big")
+
+
+def _ebml_uint(value: int) -> bytes:
+    """Implement ebml uint logic."""
+    v = int(value)
+    return v.to_bytes(max(1, (v.bit_length() + 7) // 8), "big")
+
+
+def _el(el_id: int, payload: bytes) -> bytes:
+    """Encode one EBML element (id bytes as written in the Matroska spec)."""
+    return el_id.to_bytes((el_id.bit_length() + 7) // 8, "big") + _ebml_size(len(payload)) + payload
+
+
+def _header(size: tuple[int, int], pix_fmt: str) -> bytes:
+    """EBML header, open-ended Segment, Info and a single V_UNCOMPRESSED track."""
+    ebml = _el(
+        0x1A45DFA3,
+        _el(0x4286, _ebml_uint(1))
+        + _el(0x42F7, _ebml_uint(1))
+        + _el(0x42F2, _ebml_uint(4))
+        + _el(0x42F3, _ebml_uint(8))
+        + _el(0x4282, b"matroska")
+        + _el(0x4287, _ebml_uint(4))
+        + _el(0x4285, _ebml_uint(2)),
+    )
+    info = _el(
+        0x1549A966,
+        _el(0x2AD7B1, _ebml_uint(_TIMESTAMP_SCALE_NS)) + _el(0x4D80, b"irvc") + _el(0x5741, b"irvc"),
+    )
+    # ColourSpace = FourCC des Rohformats (ffmpeg: RGBA/BGRA).
+    fourcc = str(pix_fmt or "rgba").upper().encode("ascii")[:4]
+    video = _el(
+        0xE0,
+        _el(0xB0, _ebml_uint(int(size[0]))) + _el(0xBA, _ebml_uint(int(size[1]))) + _el(0x2EB524, fourcc),
+    )
+    track = _el(
+        0xAE,
+        _el(0xD7, _ebml_uint(1))
+        + _el(0x73C5, _ebml_uint(1))
+        + _el(0x83, _ebml_uint(1))
+        + _el(0x9C, _ebml_uint(0))
+        + _el(0x86, b"V_UNCOMPRESSED")
+        + video,
+    )
+    return ebml + (0x18538067).to_bytes(4, "big") + _UNKNOWN_SIZE + info + _el(0x1654AE6B, track)
+
+
+class HudStdinTransport:
+    """
+    Writes HUD frames to ffmpeg stdin. CFR: every frame as rawvideo.
+    VFR: one Matroska cluster per changed frame with its output timestamp; ffmpeg (overlay) holds the last one.
+    """
+
+    def __init__(
+        self,
+        pipe: Any,
+        *,
+        size: tuple[int, int],
+        fps: float,
+        vfr: bool,
+        expected_frames: int = 0,
+        pix_fmt: str = "rgba",
+    ) -> None:
+        """Implement init logic."""
+        self.pipe = pipe
+        self.size = (int(size[0]), int(size[1]))
+        self.fps = float(fps) if fps and float(fps) > 0.1 else 30.0
+        self.vfr = bool(vfr)
+        self.pix_fmt = str(pix_fmt or "rgba")
+        self.expected_frames = max(0, int(expected_frames))
+        self.frames = 0
+        self.sent = 0
+        self._prev: bytes | None = None
+        self._prev_sent_index = -1
+        self._header_written = False
+
+    def _ts_us(self, index: int) -> int:
+        """Frame start in us, abgerundet: der HUD-Frame liegt nie hinter dem zugehoerigen Video-Frame."""
+        if float(self.fps).is_integer():
+            return int(index) * 1_000_000 // int(self.fps)
+        return int(math.floor(float(index) * 1_000_000.0 / self.fps))
+
+    def _send(self, frame_bytes: bytes, index: int) -> None:
+        """Implement send logic."""
+        if not self._header_written:
+            self.pipe.write(_header(self.size, self.pix_fmt))
+            self._header_written = True
+        # SimpleBlock: Track 1 (vint 0x81), relativer Timestamp 0, Keyframe-Flag.
+        block = b"\x81" + struct.pack(">h", 0) + b"\x80"
+        cluster_head = _el(0xE7, _ebml_uint(self._ts_us(index)))
+        simple_block = (0xA3).to_bytes(1, "big") + _ebml_size(len(block) + len(frame_bytes))
+        cluster_len = len(cluster_head) + len(simple_block) + len(block) + len(frame_bytes)
+        self.pipe.write((0x1F43B675).to_bytes(4, "big") + _ebml_size(cluster_len) + cluster_head + simple_block + block)
+        self.pipe.write(frame_bytes)
+        self._prev_sent_index = int(index)
+        self.sent += 1
+
+    def write(self, frame_bytes: bytes) -> None:
+        """Forward the next output frame (skipped in VFR mode if identical to the previous one)."""
+        index = self.frames
+        self.frames += 1
+        if not self.vfr:
+            self.pipe.write(frame_bytes)
+            self.sent += 1
+            return
+        if self._prev is not None and frame_bytes == self._prev:
+            return
+        self._send(frame_bytes, index)
+        self._prev = frame_bytes
+
+    def finish(self) -> None:
+        """VFR: repeat the held frame at the last index so the HUD input does not end before the video."""
+        if not self.vfr:
+            return
+        if self._prev is not None and self._prev_sent_index < self.frames - 1:
+            self._send(self._prev, self.frames - 1)
+        elif self._prev is None and self.expected_frames > 0:
+            # Kein HUD-Frame gerendert: leeres rawvideo liess das Video durch, Matroska braucht mindestens
+            # einen Frame -> transparent ueber die ganze Laenge.
+            empty = bytes(int(self.size[0]) * int(self.size[1]) * 4)
+            self._send(empty, 0)
+            if self.expected_frames > 1:
+                self._send(empty, self.expected_frames - 1)
@@ -1259,9 +1259,10 @@ class RecorderService:
             self._active_run_last_sample_ts = sample_now_ts
             writer = self._active_run_writer
 
+        lap_events: list[dict[str, Any]] = []
         if segmenter is not None:
             try:
-                segmenter.update(sample, sample_index, sample_now_ts)
+                lap_events = list(segmenter.update(sample, sample_index, sample_now_ts) or [])
             except Exception as exc:
                 _LOG.warning("irsdk lap segmenter update failed for run_id=%s (%s)", active_run_id, exc)
 
@@ -1269,6 +1270,21 @@ class RecorderService:
             return
 
         try:
+            for lap_event in lap_events:
+                if str(lap_event.get("type") or "") != "LAP_END":
+                    continue
+                end_row = self._coerce_optional_int(lap_event.get("end_sample_index"))
+                if end_row is None:
+                    continue
+                # Lap-Grenze vor dem Append der neuen Runde: Row-Group hier schliessen.
+                if writer.mark_lap_end(
+                    end_row,
+                    segmenter_lap_no=self._coerce_optional_int(lap_event.get("lap_index")),
+                    reason=str(lap_event.get("reason") or "") or None,
+                ):
+                    lap_flush_summary = writer.consume_last_flush_summary()
+                    if isinstance(lap_flush_summary, dict):
+                        self._record_chunk_io_summary(active_run_id=active_run_id, summary=lap_flush_summary)
             flushed = writer.append(sample, now_ts=self._coerce_optional_float(sample.get("timestamp_monotonic")))
             if flushed:
                 flush_summary = writer.consume_last_flush_summary()
@@ -1334,6 +1350,7 @@ class RecorderService:
             dtype_decisions=dtype_decisions,
             chunk_seconds=1.0,
             sample_hz=sample_hz,
+            lap_aligned=True,
         )
         self._debug_log_line(
             f"run_storage_started run_id={run_id} file={run_path.name} recorded_channels={len(recorded_channels)}"
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from core.render_log import append_log_line_if_open
+
 
 @dataclass
 class Logger:
@@ -24,6 +26,9 @@ class Logger:
 
     def _write(self, line: str) -> None:
         """Write."""
+        # Laeuft schon ein Render-Sink auf dieselbe Datei, dort einreihen (Reihenfolge bleibt erhalten).
+        if append_log_line_if_open(self.log_file, line):
+            return
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         with self.log_file.open("a", encoding="utf-8") as f:
             f.write(line.rstrip("\n") + "\n")
@@ -0,0 +1,230 @@
+"""Persistent media probe cache (ffprobe stream metadata + frame pts / keyframe index)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import subprocess
+import threading
+from typing import Any, Callable
+
+from core import persistence
+from core.ffmpeg_tools import resolve_ffprobe_bin
+from core.subprocess_utils import windows_no_window_subprocess_kwargs
+
+MEDIA_INDEX_DIR_ENV = "IRVC_MEDIA_INDEX_DIR"
+MEDIA_INDEX_ENV = "IRVC_MEDIA_INDEX"
+MEDIA_INDEX_VERSION = 1
+
+_MEM_MAX = 32
+
+
+class MediaIndexError(RuntimeError):
+    """ffprobe could not deliver the requested media information."""
+
+
+def media_index_enabled() -> bool:
+    """Return whether the on-disk cache is used (IRVC_MEDIA_INDEX=0 disables it)."""
+    raw = str(os.environ.get(MEDIA_INDEX_ENV) or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def media_index_dir() -> Path:
+    """Return the cache directory (IRVC_MEDIA_INDEX_DIR or <project>/cache/media_index)."""
+    raw = str(os.environ.get(MEDIA_INDEX_DIR_ENV) or "").strip()
+    if raw:
+        return Path(raw)
+    return persistence.cache_dir / "media_index"
+
+
+def media_key(path: Path | str) -> str | None:
+    """Return the cache key for path+size+mtime, or None if the file cannot be stat'ed."""
+    try:
+        p = Path(path).resolve()
+        st = p.stat()
+    except Exception:
+        return None
+    raw = f"{os.path.normcase(str(p))}|{int(st.st_size)}|{int(st.st_mtime_ns)}|v{MEDIA_INDEX_VERSION}"
+    return hashlib.sha1(raw.encode("utf-8", errors="replace")).hexdigest()
+
+
+class MediaIndex:
+    """Lazily populated cache: one .npz per media file with a JSON meta blob and NumPy arrays."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        """Implement init logic."""
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._mem: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Return the cache directory."""
+        return self._cache_dir if self._cache_dir is not None else media_index_dir()
+
+    def _entry_path(self, key: str) -> Path:
+        """Implement entry path logic."""
+        return self.cache_dir / f"{key}.npz"
+
+    def _load(self, key: str) -> dict[str, Any]:
+        """Return the cached entry (memory first, then disk); {} if none."""
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                return entry
+        entry = {}
+        if media_index_enabled():
+            path = self._entry_path(key)
+            if path.exists():
+                try:
+                    import numpy as np
+
+                    with np.load(path, allow_pickle=False) as data:
+                        entry = {name: data[name] for name in data.files}
+                    meta_raw = entry.pop("meta_json", None)
+                    entry["meta"] = json.loads(str(meta_raw)) if meta_raw is not None else {}
+                except Exception:
+                    entry = {}
+        with self._lock:
+            self._mem[key] = entry
+            while len(self._mem) > _MEM_MAX:
+                self._mem.pop(next(iter(self._mem)))
+        return entry
+
+    def _store(self, key: str, entry: dict[str, Any]) -> None:
+        """Write the entry atomically (tmp + replace); failures only cost a re-probe."""
+        with self._lock:
+            self._mem[key] = entry
+        if not media_index_enabled():
+            return
+        path = self._entry_path(key)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        try:
+            import numpy as np
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            arrays = {name: value for name, value in entry.items() if name != "meta"}
+            arrays["meta_json"] = np.array(json.dumps(entry.get("meta") or {}, sort_keys=True))
+            np.savez(tmp, **arrays)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                tmp.unlink()
+            except Exception:
+                pass
+
+    def stream_info(self, path: Path | str) -> dict[str, Any]:
+        """Return cached ffprobe stream/format info (first video + first audio stream)."""
+        key = media_key(path)
+        if key is not None:
+            entry = self._load(key)
+            info = (entry.get("meta") or {}).get("streams")
+            if isinstance(info, dict):
+                self.hits += 1
+                return dict(info)
+        self.misses += 1
+        info = _probe_stream_info(Path(path))
+        if key is not None:
+            entry = dict(self._load(key))
+            meta = dict(entry.get("meta") or {})
+            meta["streams"] = info
+            meta["path"] = str(path)
+            entry["meta"] = meta
+            self._store(key, entry)
+        return dict(info)
+
+    def frame_index(
+        self,
+        path: Path | str,
+        build_fn: Callable[[], tuple[list[float], list[int]]],
+    ) -> tuple[list[float], list[int]]:
+        """Return (frame pts seconds, keyframe indices); build_fn runs the probe on a cache miss."""
+        key = media_key(path)
+        if key is not None:
+            entry = self._load(key)
+            pts = entry.get("frame_pts")
+            keyframes = entry.get("keyframes")
+            if pts is not None and keyframes is not None and len(pts) > 0:
+                self.hits += 1
+                return [float(v) for v in pts.tolist()], [int(v) for v in keyframes.tolist()]
+        self.misses += 1
+        frame_times, keyframes_list = build_fn()
+        if key is not None and frame_times:
+            import numpy as np
+
+            entry = dict(self._load(key))
+            entry["frame_pts"] = np.asarray(frame_times, dtype=np.float64)
+            entry["keyframes"] = np.asarray(keyframes_list, dtype=np.int32)
+            meta = dict(entry.get("meta") or {})
+            meta["path"] = str(path)
+            entry["meta"] = meta
+            self._store(key, entry)
+        return frame_times, keyframes_list
+
+
+def _probe_stream_info(path: Path) -> dict[str, Any]:
+    """Run one ffprobe for stream + format metadata."""
+    cmd = [
+        resolve_ffprobe_bin(),
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=index,codec_type,codec_name,width,height,avg_frame_rate,r_frame_rate,nb_frames:format=duration",
+        "-of",
+        "json",
+        str(path),
+    ]
+    try:
+        p = subprocess.run(cmd, capture_output=True, text=True, **windows_no_window_subprocess_kwargs())
+    except Exception as e:
+        raise MediaIndexError(f"ffprobe start failed: {e}") from e
+    if p.returncode != 0 or not (p.stdout or "").strip():
+        raise MediaIndexError(f"ffprobe failed: {path}")
+    try:
+        data = json.loads(p.stdout)
+    except Exception as e:
+        raise MediaIndexError(f"ffprobe JSON parse failed: {e}") from e
+
+    streams = data.get("streams") if isinstance(data, dict) else None
+    video: dict[str, Any] | None = None
+    audio: dict[str, Any] | None = None
+    for st in streams if isinstance(streams, list) else []:
+        if not isinstance(st, dict):
+            continue
+        kind = str(st.get("codec_type") or "")
+        if kind == "video" and video is None:
+            video = {
+                "codec_name": str(st.get("codec_name") or ""),
+                "width": int(st.get("width") or 0),
+                "height": int(st.get("height") or 0),
+                "avg_frame_rate": str(st.get("avg_frame_rate") or ""),
+                "r_frame_rate": str(st.get("r_frame_rate") or ""),
+                "nb_frames": str(st.get("nb_frames") or ""),
+            }
+        elif kind == "audio" and audio is None:
+            audio = {"codec_name": str(st.get("codec_name") or "")}
+    fmt = data.get("format", {}) if isinstance(data.get("format", {}), dict) else {}
+    return {
+        "video": video,
+        "audio": audio,
+        "duration": str(fmt.get("duration") or ""),
+    }
+
+
+_INDEX: MediaIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_media_index() -> MediaIndex:
+    """Return the process-wide media index."""
+    global _INDEX
+    if _INDEX is not None:
+        return _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = MediaIndex()
+    return _INDEX
@@ -6,6 +6,7 @@ import logging
 import math
 from pathlib import Path
 
+from core.render_log import append_log_line_if_open
 from core.resources import get_resource_path
 
 _LOG = logging.getLogger(__name__)
@@ -25,6 +26,8 @@ def _find_project_root(script_path: Path) -> Path:
 
 project_root = _find_project_root(Path(__file__))
 config_dir = project_root / "config"
+# Persistente Caches (Media-Index, Encoder-Health, HUD-Layer, Telemetry-Library) liegen hier, wie cache/proxy der UI.
+cache_dir = project_root / "cache"
 startframes_file = config_dir / "startframes.json"
 endframes_file = config_dir / "endframes.json"
 defaults_ini = config_dir / "defaults.ini"
@@ -526,6 +529,8 @@ def _append_log_line(log_file: Path | None, line: str) -> None:
     """Implement append log line logic."""
     if log_file is None:
         return
+    if append_log_line_if_open(log_file, line):
+        return
     try:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         with log_file.open("a", encoding="utf-8") as f:
@@ -0,0 +1,334 @@
+"""Structured render progress/event channel (JSON lines over a loopback socket)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Any, Iterator
+
+RENDER_EVENTS_PORT_ENV = "IRVC_RENDER_EVENTS_PORT"
+
+STAGE_CSV_LOAD = "csv_load"
+STAGE_PROBE = "probe"
+STAGE_SYNC_BUILD = "sync_build"
+STAGE_SIGNAL_PREP = "signal_prep"
+STAGE_HUD_RENDER = "hud_render"
+STAGE_ENCODE = "encode"
+STAGE_ENCODER_PREFLIGHT = "encoder_preflight"
+STAGE_CONCAT = "concat"
+
+EVENT_STAGE_START = "stage_start"
+EVENT_STAGE_END = "stage_end"
+EVENT_RENDER_PLAN = "render_plan"
+EVENT_HUD_PROGRESS = "hud_progress"
+EVENT_ENCODE_PROGRESS = "encode_progress"
+EVENT_RENDER_DONE = "render_done"
+
+
+class RenderEventEmitter:
+    """Client side of the event channel, used inside the render process."""
+
+    def __init__(self, sock: socket.socket | None = None) -> None:
+        """Implement init logic."""
+        self._sock = sock
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._open_stages: dict[str, float] = {}
+        self.stage_durations: dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether events are delivered to a listener."""
+        return self._sock is not None
+
+    @classmethod
+    def from_env(cls) -> "RenderEventEmitter":
+        """Connect to the listener announced via environment, or return a disabled emitter."""
+        raw = str(os.environ.get(RENDER_EVENTS_PORT_ENV) or "").strip()
+        if not raw:
+            return cls(None)
+        try:
+            port = int(raw)
+        except Exception:
+            return cls(None)
+        if port <= 0 or port > 65535:
+            return cls(None)
+        try:
+            sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+            sock.settimeout(None)
+        except Exception:
+            return cls(None)
+        return cls(sock)
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        """Send one event; failures disable the channel silently."""
+        if self._sock is None:
+            return
+        payload = {"ev": str(kind), "t": round(time.perf_counter() - self._t0, 6)}
+        payload.update(fields)
+        try:
+            data = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+        except Exception:
+            return
+        with self._lock:
+            if self._sock is None:
+                return
+            try:
+                self._sock.sendall(data)
+            except Exception:
+                self._close_locked()
+
+    def stage_start(self, name: str, **fields: Any) -> None:
+        """Mark the start of a render stage."""
+        self._open_stages[str(name)] = time.perf_counter()
+        self.emit(EVENT_STAGE_START, stage=str(name), **fields)
+
+    def stage_end(self, name: str, **fields: Any) -> float:
+        """Mark the end of a render stage and return its duration in seconds."""
+        started = self._open_stages.pop(str(name), None)
+        dur_s = 0.0 if started is None else max(0.0, time.perf_counter() - started)
+        self.stage_durations[str(name)] = float(self.stage_durations.get(str(name), 0.0)) + float(dur_s)
+        self.emit(EVENT_STAGE_END, stage=str(name), dur_s=round(dur_s, 6), **fields)
+        return float(dur_s)
+
+    @contextmanager
+    def stage(self, name: str, **fields: Any) -> Iterator[None]:
+        """Context manager wrapping stage_start/stage_end."""
+        self.stage_start(name, **fields)
+        try:
+            yield
+        finally:
+            self.stage_end(name)
+
+    def close(self) -> None:
+        """Close the channel."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        """Close socket while holding the lock."""
+        sock = self._sock
+        self._sock = None
+        if sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        try:
+            sock.close()
+        except Exception:
+            pass
+
+
+_EMITTER: RenderEventEmitter | None = None
+_EMITTER_LOCK = threading.Lock()
+
+
+def get_render_events() -> RenderEventEmitter:
+    """Return the process-wide emitter (connected lazily from environment)."""
+    global _EMITTER
+    if _EMITTER is not None:
+        return _EMITTER
+    with _EMITTER_LOCK:
+        if _EMITTER is None:
+            _EMITTER = RenderEventEmitter.from_env()
+    return _EMITTER
+
+
+class RenderEventListener:
+    """Server side of the event channel, used by the UI process that spawns the renderer."""
+
+    def __init__(self) -> None:
+        """Implement init logic."""
+        self._server: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._events: "queue.Queue[dict[str, Any]]" = queue.Queue()
+        self._closed = False
+        self.port = 0
+
+    def start(self) -> bool:
+        """Bind a loopback port and start accepting the render process."""
+        try:
+            srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            srv.bind(("127.0.0.1", 0))
+            srv.listen(1)
+            srv.settimeout(0.5)
+        except Exception:
+            return False
+        self._server = srv
+        self.port = int(srv.getsockname()[1])
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return True
+
+    def env(self) -> dict[str, str]:
+        """Environment entries that let the child process connect."""
+        if self.port <= 0:
+            return {}
+        return {RENDER_EVENTS_PORT_ENV: str(int(self.port))}
+
+    def _serve(self) -> None:
+        """Accept one connection and parse JSON lines into the queue."""
+        srv = self._server
+        if srv is None:
+            return
+        conn: socket.socket | None = None
+        while not self._closed:
+            try:
+                conn, _addr = srv.accept()
+                break
+            except socket.timeout:
+                continue
+            except Exception:
+                return
+        if conn is None:
+            return
+        try:
+            conn.settimeout(0.5)
+            buf = b""
+            while not self._closed:
+                try:
+                    chunk = conn.recv(65536)
+                except socket.timeout:
+                    continue
+                except Exception:
+                    break
+                if not chunk:
+                    break
+                buf += chunk
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    if not line.strip():
+                        continue
+                    try:
+                        ev = json.loads(line.decode("utf-8", errors="replace"))
+                    except Exception:
+                        continue
+                    if isinstance(ev, dict):
+                        self._events.put(ev)
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Return all events received since the last call."""
+        out: list[dict[str, Any]] = []
+        while True:
+            try:
+                out.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+        return out
+
+    def close(self) -> None:
+        """Stop the listener."""
+        self._closed = True
+        srv = self._server
+        self._server = None
+        if srv is not None:
+            try:
+                srv.close()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+
+class RenderProfile:
+    """Accumulates stage timings and throughput from received events."""
+
+    def __init__(self) -> None:
+        """Implement init logic."""
+        self.stages: dict[str, float] = {}
+        self.expected_frames = 0
+        self.hud_frames = 0
+        self.hud_elapsed_s = 0.0
+        self.encoder_fps = 0.0
+        self.encoder_speed = 0.0
+        self.encoder_frames = 0
+        self.event_count = 0
+        self.log_stats: dict[str, Any] = {}
+
+    def consume(self, ev: dict[str, Any]) -> None:
+        """Update the profile from one event."""
+        self.event_count += 1
+        kind = str(ev.get("ev") or "")
+        if kind == EVENT_STAGE_END:
+            name = str(ev.get("stage") or "")
+            if name:
+                self.stages[name] = float(self.stages.get(name, 0.0)) + _to_float(ev.get("dur_s"))
+        elif kind == EVENT_RENDER_DONE:
+            log_stats = ev.get("log")
+            if isinstance(log_stats, dict):
+                self.log_stats = dict(log_stats)
+        elif kind == EVENT_RENDER_PLAN:
+            frames = int(_to_float(ev.get("frames")))
+            if frames > 0:
+                self.expected_frames = frames
+        elif kind == EVENT_HUD_PROGRESS:
+            self.hud_frames = max(self.hud_frames, int(_to_float(ev.get("written"))))
+            self.hud_elapsed_s = max(self.hud_elapsed_s, _to_float(ev.get("elapsed_s")))
+        elif kind == EVENT_ENCODE_PROGRESS:
+            fps = _to_float(ev.get("fps"))
+            if fps > 0.0:
+                self.encoder_fps = fps
+            speed = _to_float(ev.get("speed"))
+            if speed > 0.0:
+                self.encoder_speed = speed
+            self.encoder_frames = max(self.encoder_frames, int(_to_float(ev.get("frame"))))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert value to dict."""
+        hud_fps = 0.0
+        hud_ms_per_frame = 0.0
+        if self.hud_frames > 0 and self.hud_elapsed_s > 0.0:
+            hud_fps = float(self.hud_frames) / float(self.hud_elapsed_s)
+            hud_ms_per_frame = 1000.0 * float(self.hud_elapsed_s) / float(self.hud_frames)
+        return {
+            "stages": {k: round(float(v), 6) for k, v in self.stages.items()},
+            "expected_frames": int(self.expected_frames),
+            "hud_frames": int(self.hud_frames),
+            "hud_fps": round(hud_fps, 3),
+            "hud_ms_per_frame": round(hud_ms_per_frame, 3),
+            "encoder_frames": int(self.encoder_frames),
+            "encoder_fps": round(float(self.encoder_fps), 3),
+            "encoder_speed": round(float(self.encoder_speed), 3),
+            "event_count": int(self.event_count),
+            "log": dict(self.log_stats),
+        }
+
+
+def parse_ffmpeg_progress_value(key: str, value: str) -> tuple[str, float] | None:
+    """Map one ffmpeg `-progress` key=value pair to a numeric field."""
+    k = str(key or "").strip()
+    v = str(value or "").strip()
+    if k == "frame":
+        return "frame", _to_float(v)
+    if k == "fps":
+        return "fps", _to_float(v)
+    if k in ("out_time_us", "out_time_ms"):
+        # ffmpeg reports microseconds for both keys.
+        return "out_time_s", _to_float(v) / 1_000_000.0
+    if k == "speed":
+        return "speed", _to_float(v.rstrip("x"))
+    return None
+
+
+def _to_float(v: Any) -> float:
+    """Implement to float logic."""
+    try:
+        f = float(v)
+    except Exception:
+        return 0.0
+    if f != f or f in (float("inf"), float("-inf")):
+        return 0.0
+    return f
@@ -0,0 +1,283 @@
+"""Buffered render log sink: one file handle per log file, disk I/O on a background thread."""
+
+from __future__ import annotations
+
+import atexit
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from typing import Any
+
+FLUSH_INTERVAL_ENV = "IRVC_LOG_FLUSH_MS"
+LOG_SYNC_ENV = "IRVC_LOG_SYNC"
+
+_DEFAULT_FLUSH_INTERVAL_S = 0.25
+_FLUSH_BYTES = 64 * 1024
+
+# Zeilen mit diesen Markern werden sofort auf Platte geschrieben (Fehler sollen einen Absturz ueberleben).
+_URGENT_MARKERS = ("error", "fehler", "failed", "traceback", "exception", "[ffmpeg-tail]")
+
+_STOP = object()
+
+
+def is_urgent_line(line: str) -> bool:
+    """Return whether a log line should be flushed immediately."""
+    s = str(line or "").lower()
+    return any(marker in s for marker in _URGENT_MARKERS)
+
+
+def _flush_interval_s() -> float:
+    """Implement flush interval s logic."""
+    raw = str(os.environ.get(FLUSH_INTERVAL_ENV) or "").strip()
+    if not raw:
+        return _DEFAULT_FLUSH_INTERVAL_S
+    try:
+        return max(0.0, float(raw) / 1000.0)
+    except Exception:
+        return _DEFAULT_FLUSH_INTERVAL_S
+
+
+def _sync_mode() -> bool:
+    """Implement sync mode logic."""
+    return str(os.environ.get(LOG_SYNC_ENV) or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class RenderLogSink:
+    """Append-only log file fed through a queue; a writer thread owns the single file handle."""
+
+    def __init__(self, path: Path, *, flush_interval_s: float | None = None) -> None:
+        """Implement init logic."""
+        self.path = Path(path)
+        self.flush_interval_s = _flush_interval_s() if flush_interval_s is None else max(0.0, float(flush_interval_s))
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.lines = 0
+        self.bytes = 0
+        self.flushes = 0
+        self.write_s = 0.0
+        self.max_queue = 0
+        self.errors = 0
+
+    def write(self, line: str, *, urgent: bool | None = None) -> None:
+        """Queue one line (never blocks on disk I/O)."""
+        if self._closed:
+            return
+        text = str(line).rstrip("\n") + "\n"
+        if urgent is None:
+            urgent = is_urgent_line(text)
+        self._ensure_thread()
+        self._queue.put((text, bool(urgent)))
+        try:
+            depth = self._queue.qsize()
+        except Exception:
+            depth = 0
+        if depth > self.max_queue:
+            self.max_queue = depth
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far is on disk."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout=max(0.0, float(timeout)))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush, stop the writer thread and close the file handle."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout=max(0.0, float(timeout)))
+
+    def stats(self) -> dict[str, Any]:
+        """Return log volume and time spent in file writes."""
+        return {
+            "path": str(self.path),
+            "lines": int(self.lines),
+            "bytes": int(self.bytes),
+            "flushes": int(self.flushes),
+            "write_ms": round(float(self.write_s) * 1000.0, 3),
+            "max_queue": int(self.max_queue),
+            "errors": int(self.errors),
+        }
+
+    def _ensure_thread(self) -> None:
+        """Start the writer thread on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(target=self._run, name="render-log-writer", daemon=True)
+            self._thread.start()
+
+    def _open(self) -> Any | None:
+        """Open the log file for appending (once)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return open(self.path, "a", encoding="utf-8", buffering=_FLUSH_BYTES)
+        except Exception:
+            self.errors += 1
+            return None
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue, flush on interval, urgent line or size threshold."""
+        fh = self._open()
+        pending = 0
+        last_flush = time.perf_counter()
+        stop = False
+        while not stop:
+            timeout = None
+            if pending > 0:
+                timeout = max(0.0, self.flush_interval_s - (time.perf_counter() - last_flush))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            waiters: list[threading.Event] = []
+            urgent = False
+            batch: list[str] = []
+            while item is not None:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    text, is_urgent = item
+                    batch.append(text)
+                    urgent = urgent or is_urgent
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if batch:
+                data = "".join(batch)
+                t0 = time.perf_counter()
+                if fh is not None:
+                    try:
+                        fh.write(data)
+                    except Exception:
+                        self.errors += 1
+                self.write_s += time.perf_counter() - t0
+                self.lines += len(batch)
+                self.bytes += len(data.encode("utf-8", errors="replace"))
+                pending += len(data)
+            due = (time.perf_counter() - last_flush) >= self.flush_interval_s
+            if pending > 0 and (urgent or stop or waiters or due or pending >= _FLUSH_BYTES):
+                t0 = time.perf_counter()
+                if fh is not None:
+                    try:
+                        fh.flush()
+                    except Exception:
+                        self.errors += 1
+                self.write_s += time.perf_counter() - t0
+                self.flushes += 1
+                pending = 0
+                last_flush = time.perf_counter()
+            for ev in waiters:
+                ev.set()
+        if fh is not None:
+            try:
+                fh.close()
+            except Exception:
+                pass
+
+
+_SINKS: dict[str, RenderLogSink] = {}
+_SINKS_LOCK = threading.Lock()
+
+
+def _key(path: Path | str) -> str:
+    """Implement key logic."""
+    try:
+        return os.path.normcase(str(Path(path).resolve()))
+    except Exception:
+        return str(path)
+
+
+def get_render_log(path: Path | str) -> RenderLogSink:
+    """Return the process-wide sink for a log file (created on first use)."""
+    key = _key(path)
+    sink = _SINKS.get(key)
+    if sink is not None:
+        return sink
+    with _SINKS_LOCK:
+        sink = _SINKS.get(key)
+        if sink is None:
+            sink = RenderLogSink(Path(path))
+            _SINKS[key] = sink
+    return sink
+
+
+def append_log_line(path: Path | str | None, line: str, *, urgent: bool | None = None) -> None:
+    """Append one line to a log file through its sink (IRVC_LOG_SYNC=1: direct synchronous append)."""
+    if path is None:
+        return
+    if _sync_mode():
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(str(line).rstrip("\n") + "\n")
+        except Exception:
+            pass
+        return
+    get_render_log(path).write(line, urgent=urgent)
+
+
+def append_log_line_if_open(path: Path | str | None, line: str) -> bool:
+    """Route a line through an existing sink so ordering is kept; False if none is open for path."""
+    if path is None or _sync_mode():
+        return False
+    sink = _SINKS.get(_key(path))
+    if sink is None or sink._closed:
+        return False
+    sink.write(line)
+    return True
+
+
+def flush_render_logs(timeout: float = 5.0) -> None:
+    """Flush all open sinks."""
+    for sink in list(_SINKS.values()):
+        try:
+            sink.flush(timeout=timeout)
+        except Exception:
+            pass
+
+
+def render_log_stats(path: Path | str | None = None) -> dict[str, Any]:
+    """Return stats of one sink (or summed over all sinks when path is None)."""
+    if path is not None:
+        sink = _SINKS.get(_key(path))
+        return sink.stats() if sink is not None else {}
+    total = {"lines": 0, "bytes": 0, "flushes": 0, "write_ms": 0.0, "max_queue": 0, "errors": 0}
+    for sink in list(_SINKS.values()):
+        st = sink.stats()
+        for k in ("lines", "bytes", "flushes", "errors"):
+            total[k] += int(st[k])
+        total["write_ms"] = round(float(total["write_ms"]) + float(st["write_ms"]), 3)
+        total["max_queue"] = max(int(total["max_queue"]), int(st["max_queue"]))
+    return total
+
+
+def close_render_logs() -> None:
+    """Flush and close all sinks (registered atexit)."""
+    with _SINKS_LOCK:
+        sinks = list(_SINKS.values())
+        _SINKS.clear()
+    for sink in sinks:
+        try:
+            sink.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_render_logs)
@@ -12,8 +12,16 @@ from pathlib import Path
 from typing import Any, Callable
 
 from core import persistence
+from core.cfg import APP_VERSION
 from core.log import build_log_file_path
 from core.models import AppModel, RenderPayload
+from core.render_events import (
+    EVENT_ENCODE_PROGRESS,
+    EVENT_HUD_PROGRESS,
+    EVENT_RENDER_PLAN,
+    RenderEventListener,
+    RenderProfile,
+)
 
 
 TIME_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{3})")
@@ -97,6 +105,7 @@ class _HudPreparingMonitor:
         self._last_step = 0
         self._last_check = 0.0
         self._sync_cache_mtime = 0.0
+        self._expected_from_events = False
         self._done = False
 
     def _to_int(self, value: Any) -> int:
@@ -105,8 +114,19 @@ class _HudPreparingMonitor:
         except Exception:
             return 0
 
+    def set_expected_frames(self, frames: int) -> None:
+        # Event-Kanal liefert die Frame-Anzahl direkt -> kein sync_cache.json-Polling mehr noetig.
+        n = self._to_int(frames)
+        if n <= 0:
+            return
+        self._expected_from_events = True
+        if n != self._expected_frames:
+            self._expected_frames = n
+            self._last_pct = 0.0
+            self._last_step = 0
+
     def _refresh_expected_frames(self) -> None:
-        if self._target_pct <= 0.0 or self._done:
+        if self._target_pct <= 0.0 or self._done or self._expected_from_events:
             return
         try:
             stat = self._sync_cache_path.stat()
@@ -203,6 +223,7 @@ def _log_stage_durations(
     render_start: float | None,
     render_end: float | None,
     final_end: float,
+    stage_profile: dict[str, Any] | None = None,
 ) -> None:
     if log_file is None:
         return
@@ -216,30 +237,30 @@ def _log_stage_durations(
         _write_duration_line(log_file, "Total", max(0.0, final_end - start))
     except Exception:
         pass
+    if not stage_profile:
+        return
+    # Echte Stage-Zeiten aus dem Render-Prozess (Event-Kanal), versionsuebergreifend vergleichbar.
+    try:
+        stages = stage_profile.get("stages") if isinstance(stage_profile.get("stages"), dict) else {}
+        for name, seconds in stages.items():
+            _write_duration_line(log_file, f"stage:{name}", max(0.0, float(seconds)))
+        profile = {"app_version": APP_VERSION, "total_s": round(max(0.0, final_end - start), 6)}
+        profile.update(stage_profile)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with log_file.open("a", encoding="utf-8") as f:
+            f.write(
+                "[Throughput] "
+                f"hud_fps={float(stage_profile.get('hud_fps', 0.0)):.2f} "
+                f"hud_ms_per_frame={float(stage_profile.get('hud_ms_per_frame', 0.0)):.2f} "
+                f"encoder_fps={float(stage_profile.get('encoder_fps', 0.0)):.2f}\n"
+            )
+            f.write("[Profile] " + json.dumps(profile, sort_keys=True) + "\n")
+    except Exception:
+        pass
 
 
-def build_payload(
-    *,
-    videos: list[Path],
-    csvs: list[Path],
-    slow_p: Path,
-    fast_p: Path,
-    out_path: Path,
-    out_aspect: str,
-    out_preset: str,
-    out_quality: str,
-    hud_w: int,
-    hud_enabled: dict[str, bool],
-    app_model: AppModel,
-    log_file: Path | None,
-    get_hud_boxes_for_current: Callable[[], list[dict]],
-    png_save_state_for_current: Callable[[], None],
-    png_view_key: Callable[[], str],
-    png_state: dict[str, dict[str, Any]],
-) -> dict[str, Any]:
-    vnames = [p.name for p in videos[:2]]
-    cnames = [p.name for p in csvs[:2]]
-
+def load_hud_render_settings() -> dict[str, Any]:
+    """HUD-Einstellungen aus der INI (gleiche Werte fuer Render-Payload und Layout-Vorschau)."""
     gear_rpm_update_hz = persistence._cfg_int("video_compare", "gear_rpm_update_hz", 60)
     if gear_rpm_update_hz < 1:
         gear_rpm_update_hz = 1
@@ -305,6 +326,86 @@ def build_payload(
     _add_pts_override("Line Delta", "line_delta")
     _add_pts_override("Under-/Oversteer", "under_oversteer")
 
+    return {
+        "gear_rpm_update_hz": int(gear_rpm_update_hz),
+        "speed_units": str(speed_units),
+        "speed_update_hz": int(speed_update_hz),
+        "pedals_sample_mode": str(pedals_sample_mode),
+        "pedals_abs_debounce_ms": int(pedals_abs_debounce_ms),
+        "max_brake_delay_distance": float(max_brake_delay_distance),
+        "max_brake_delay_pressure": float(max_brake_delay_pressure),
+        "window_before_s": float(hud_win_default_before),
+        "window_after_s": float(hud_win_default_after),
+        "window_overrides": hud_win_overrides,
+        "curve_points_default": int(hud_pts_default),
+        "curve_points_overrides": hud_pts_overrides,
+        "under_oversteer_curve_center": float(under_oversteer_curve_center),
+    }
+
+
+def resolve_curve_points_overrides(overrides: dict[str, int], boxes_map: dict[str, Any]) -> dict[str, int]:
+    """Override 0 = Punkte pro Pixel der Box-Breite; ohne Box faellt das Override weg."""
+    out = dict(overrides)
+    for hud_name, v in list(out.items()):
+        try:
+            vv = int(v)
+        except Exception:
+            continue
+
+        if vv == 0:
+            box = boxes_map.get(hud_name) or {}
+            try:
+                w = int(box.get("w") or 0)
+            except Exception:
+                w = 0
+
+            if w > 0:
+                out[hud_name] = int(w)
+            else:
+                try:
+                    del out[hud_name]
+                except Exception:
+                    pass
+    return out
+
+
+def build_payload(
+    *,
+    videos: list[Path],
+    csvs: list[Path],
+    slow_p: Path,
+    fast_p: Path,
+    out_path: Path,
+    out_aspect: str,
+    out_preset: str,
+    out_quality: str,
+    hud_w: int,
+    hud_enabled: dict[str, bool],
+    app_model: AppModel,
+    log_file: Path | None,
+    get_hud_boxes_for_current: Callable[[], list[dict]],
+    png_save_state_for_current: Callable[[], None],
+    png_view_key: Callable[[], str],
+    png_state: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    vnames = [p.name for p in videos[:2]]
+    cnames = [p.name for p in csvs[:2]]
+
+    hud_settings = load_hud_render_settings()
+    gear_rpm_update_hz = hud_settings["gear_rpm_update_hz"]
+    speed_units = hud_settings["speed_units"]
+    speed_update_hz = hud_settings["speed_update_hz"]
+    pedals_sample_mode = hud_settings["pedals_sample_mode"]
+    pedals_abs_debounce_ms = hud_settings["pedals_abs_debounce_ms"]
+    max_brake_delay_distance = hud_settings["max_brake_delay_distance"]
+    max_brake_delay_pressure = hud_settings["max_brake_delay_pressure"]
+    hud_win_default_before = hud_settings["window_before_s"]
+    hud_win_default_after = hud_settings["window_after_s"]
+    hud_win_overrides = hud_settings["window_overrides"]
+    hud_pts_default = hud_settings["curve_points_default"]
+    hud_pts_overrides = hud_settings["curve_points_overrides"]
+    under_oversteer_curve_center = hud_settings["under_oversteer_curve_center"]
+
     video_mode = str(getattr(app_model, "video_mode", "full") or "full").strip().lower()
     if video_mode not in ("full", "cut"):
         video_mode = "full"
@@ -380,26 +481,7 @@ def build_payload(
     try:
         hb = payload.get("hud_boxes") or {}
         if isinstance(hb, dict):
-            for hud_name, v in list(hud_pts_overrides.items()):
-                try:
-                    vv = int(v)
-                except Exception:
-                    continue
-
-                if vv == 0:
-                    box = hb.get(hud_name) or {}
-                    try:
-                        w = int(box.get("w") or 0)
-                    except Exception:
-                        w = 0
-
-                    if w > 0:
-                        hud_pts_overrides[hud_name] = int(w)
-                    else:
-                        try:
-                            del hud_pts_overrides[hud_name]
-                        except Exception:
-                            pass
+            hud_pts_overrides = resolve_curve_points_overrides(hud_pts_overrides, hb)
     except Exception:
         pass
 
@@ -517,6 +599,11 @@ def start_render(
     if log_file_path is not None:
         env["IRVC_LOG_FILE"] = str(log_file_path)
 
+    event_listener = RenderEventListener()
+    if event_listener.start():
+        env.update(event_listener.env())
+    render_profile = RenderProfile()
+
     p = None
     try:
         cancelled = False
@@ -594,6 +681,21 @@ def start_render(
             except Exception:
                 line = ""
 
+            for ev in event_listener.drain():
+                render_profile.consume(ev)
+                kind = str(ev.get("ev") or "")
+                if kind == EVENT_RENDER_PLAN:
+                    hud_monitor.set_expected_frames(ev.get("frames", 0))
+                elif kind == EVENT_HUD_PROGRESS:
+                    hud_monitor.update_stream_written(ev.get("written", 0), ev.get("total"))
+                elif kind == EVENT_ENCODE_PROGRESS:
+                    try:
+                        sec = float(ev.get("out_time_s") or 0.0)
+                    except Exception:
+                        sec = 0.0
+                    if sec > last_sec:
+                        last_sec = sec
+
             if line:
                 try:
                     sline = str(line).rstrip("\r\n")
@@ -650,7 +752,7 @@ def start_render(
                     except Exception:
                         pass
 
-                m4 = hud_stream_re.search(line)
+                m4 = hud_stream_re.search(line) if render_profile.event_count <= 0 else None
                 if m4:
                     try:
                         written = int(m4.group(1))
@@ -761,8 +863,19 @@ def start_render(
                 p.kill()
         except Exception:
             pass
+        for ev in event_listener.drain():
+            render_profile.consume(ev)
+        event_listener.close()
         final_end = final_end or time.time()
         if render_end is None:
             render_end = final_end
-        _log_stage_durations(log_file_path, start_time, prep_end, render_start, render_end, final_end)
+        _log_stage_durations(
+            log_file_path,
+            start_time,
+            prep_end,
+            render_start,
+            render_end,
+            final_end,
+            stage_profile=render_profile.to_dict() if render_profile.event_count > 0 else None,
+        )
 
@@ -0,0 +1,152 @@
+"""Startup timing for the desktop app: import times and time-to-first-window (opt-in, no cost when disabled)."""
+
+from __future__ import annotations
+
+import builtins
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any, Callable
+
+STARTUP_PROFILE_ENV = "IRVC_STARTUP_PROFILE"
+
+_ACTIVE: "StartupProfiler | None" = None
+
+
+def startup_profile_enabled() -> bool:
+    """Return whether startup is profiled (opt-in: IRVC_STARTUP_PROFILE=1)."""
+    raw = str(os.environ.get(STARTUP_PROFILE_ENV) or "").strip().lower()
+    return raw in ("1", "true", "yes", "on")
+
+
+class StartupProfiler:
+    """
+    Times every first-time import (inclusive and self time, nested imports are subtracted from their parent)
+    on the starting thread, and named marks relative to begin().
+    """
+
+    def __init__(self) -> None:
+        """Implement init logic."""
+        self.t0 = time.perf_counter()
+        self.marks: list[tuple[str, float]] = []
+        self.imports: dict[str, list[float]] = {}
+        self._stack: list[float] = []
+        self._orig_import: Any = None
+        self._modules_at_start = len(sys.modules)
+        self._thread_id = threading.get_ident()
+        self.finished = False
+
+    def install(self) -> None:
+        """Hook builtins.__import__."""
+        if self._orig_import is not None:
+            return
+        orig = builtins.__import__
+        self._orig_import = orig
+
+        def _timed_import(name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+            # Nur der Start-Thread wird gemessen (Stack ist nicht thread-sicher).
+            if threading.get_ident() != self._thread_id:
+                return orig(name, globals, locals, fromlist, level)
+            if level:
+                try:
+                    import importlib.util
+
+                    key = importlib.util.resolve_name("." * int(level) + name, (globals or {}).get("__package__"))
+                except Exception:
+                    key = name
+            else:
+                key = name
+            if not key or key in sys.modules:
+                return orig(name, globals, locals, fromlist, level)
+            t0 = time.perf_counter()
+            self._stack.append(0.0)
+            try:
+                return orig(name, globals, locals, fromlist, level)
+            finally:
+                dt = time.perf_counter() - t0
+                child = self._stack.pop()
+                entry = self.imports.setdefault(key, [0.0, 0.0])
+                entry[0] += dt
+                entry[1] += max(0.0, dt - child)
+                if self._stack:
+                    self._stack[-1] += dt
+
+        builtins.__import__ = _timed_import
+
+    def uninstall(self) -> None:
+        """Restore builtins.__import__."""
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def mark(self, name: str) -> None:
+        """Record a named point in time."""
+        self.marks.append((str(name), time.perf_counter() - self.t0))
+
+    def to_dict(self, top: int = 40) -> dict[str, Any]:
+        """Return the JSON profile."""
+        by_total = sorted(self.imports.items(), key=lambda kv: -kv[1][0])
+        by_self = sorted(self.imports.items(), key=lambda kv: -kv[1][1])
+        return {
+            "version": 1,
+            "marks": {name: round(t, 6) for name, t in self.marks},
+            "modules_loaded": max(0, len(sys.modules) - self._modules_at_start),
+            "imports_top_total": [{"module": k, "total_s": round(v[0], 6), "self_s": round(v[1], 6)} for k, v in by_total[:top]],
+            "imports_top_self": [{"module": k, "total_s": round(v[0], 6), "self_s": round(v[1], 6)} for k, v in by_self[:top]],
+        }
+
+    def summary_lines(self, top: int = 12) -> list[str]:
+        """Return marks (absolute and delta) and the imports with the highest self time."""
+        lines = [f"[startup] modules loaded={max(0, len(sys.modules) - self._modules_at_start)}"]
+        prev = 0.0
+        for name, t in self.marks:
+            lines.append(f"[startup] {name:<24}{1000.0 * t:>9.1f}ms  (+{1000.0 * (t - prev):.1f}ms)")
+            prev = t
+        rows = sorted(self.imports.items(), key=lambda kv: -kv[1][1])[:top]
+        for key, (total, self_t) in rows:
+            lines.append(f"[startup] import {key[:40]:<40} self={1000.0 * self_t:>8.1f}ms  total={1000.0 * total:.1f}ms")
+        return lines
+
+
+def begin() -> None:
+    """Start the startup profiler when IRVC_STARTUP_PROFILE=1 (idempotent)."""
+    global _ACTIVE
+    if _ACTIVE is not None or not startup_profile_enabled():
+        return
+    prof = StartupProfiler()
+    prof.install()
+    _ACTIVE = prof
+
+
+def mark(name: str) -> None:
+    """Record a startup mark (no-op when disabled)."""
+    prof = _ACTIVE
+    if prof is not None and not prof.finished:
+        prof.mark(name)
+
+
+def finish(json_path: Path | None, log_fn: Callable[[str], None] | None = None) -> None:
+    """Stop the import hook, log the summary and write the JSON profile (no-op when disabled)."""
+    prof = _ACTIVE
+    if prof is None or prof.finished:
+        return
+    prof.finished = True
+    prof.uninstall()
+    if log_fn is not None:
+        for line in prof.summary_lines():
+            try:
+                log_fn(line)
+            except Exception:
+                pass
+    if json_path is None:
+        return
+    try:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(prof.to_dict(), indent=2), encoding="utf-8")
+        if log_fn is not None:
+            log_fn(f"[startup] json={json_path}")
+    except Exception:
+        pass
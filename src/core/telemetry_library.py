@@ -0,0 +1,301 @@
+"""Telemetry library: SQLite index of CSV file names per folder for fast CSV auto-matching."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import Iterable
+
+from core import persistence
+
+TELEMETRY_LIBRARY_ENV = "IRVC_TELEMETRY_LIBRARY"
+TELEMETRY_LIBRARY_DB_ENV = "IRVC_TELEMETRY_LIBRARY_DB"
+SCHEMA_VERSION = 2
+
+_G61_PREFIX = "Garage 61 - "
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS csv_files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    stem_lower TEXT NOT NULL,
+    stem_compact TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_csv_files_folder ON csv_files(folder);
+CREATE TABLE IF NOT EXISTS folders (
+    folder TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+
+def parse_g61_csv_basename(path: Path) -> tuple[str, str, str, str] | None:
+    """Return (driver, car, track, lap_time) from a "Garage 61 - driver - car - track - mm.ss.mmm - id.csv" name."""
+    name = str(path.name or "")
+    if not name.lower().endswith(".csv"):
+        return None
+
+    stem = name[:-4]
+    if not stem.startswith(_G61_PREFIX):
+        return None
+
+    rest = stem[len(_G61_PREFIX):]
+    try:
+        left, track, lap_time, _run_id = rest.rsplit(" - ", 3)
+        driver, car = left.split(" - ", 1)
+    except ValueError:
+        return None
+
+    driver = driver.strip()
+    car = car.strip()
+    track = track.strip()
+    lap_time = lap_time.strip()
+    if not driver or not car or not track:
+        return None
+    if re.fullmatch(r"\d{2}\.\d{2}\.\d{3}", lap_time) is None:
+        return None
+    return driver, car, track, lap_time
+
+
+def compact_stem(stem: str) -> str:
+    """Return the lower-case stem reduced to [a-z0-9] (same rule as the CSV auto-matching)."""
+    return re.sub(r"[^a-z0-9]+", "", str(stem or "").strip().lower())
+
+
+def choose_best_csv_match(video_path: Path, csv_candidates: list[Path]) -> tuple[Path | None, str]:
+    """Best CSV for a video by stem (exact > contains > compact contains); shared by render and UI preview."""
+    target_stem = str(video_path.stem or "").strip().lower()
+    if not target_stem:
+        return None, "none"
+
+    target_compact = compact_stem(target_stem)
+    best: tuple[int, int, int, str, Path, str] | None = None
+
+    for c in csv_candidates:
+        try:
+            cp = Path(c).resolve()
+        except Exception:
+            continue
+        if cp.suffix.lower() != ".csv":
+            continue
+        stem = str(cp.stem or "").strip().lower()
+        if not stem:
+            continue
+
+        mode = "none"
+        score = -1
+        if stem == target_stem:
+            score = 300
+            mode = "exact"
+        elif target_stem in stem:
+            score = 200
+            mode = "contains"
+        else:
+            stem_compact = compact_stem(stem)
+            if target_compact and stem_compact and target_compact in stem_compact:
+                score = 100
+                mode = "contains_compact"
+
+        if score < 0:
+            continue
+
+        rank = (
+            -score,
+            abs(len(stem) - len(target_stem)),
+            len(stem),
+            cp.name.lower(),
+            cp,
+            mode,
+        )
+        if best is None or rank < best:
+            best = rank
+
+    if best is None:
+        return None, "none"
+    return best[4], best[5]
+
+
+def library_enabled() -> bool:
+    """Return whether the SQLite index is used (IRVC_TELEMETRY_LIBRARY=0 disables it)."""
+    raw = str(os.environ.get(TELEMETRY_LIBRARY_ENV) or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def library_db_path() -> Path:
+    """Return the index database path (IRVC_TELEMETRY_LIBRARY_DB or <project>/cache/telemetry_library.sqlite)."""
+    raw = str(os.environ.get(TELEMETRY_LIBRARY_DB_ENV) or "").strip()
+    if raw:
+        return Path(raw)
+    return persistence.cache_dir / "telemetry_library.sqlite"
+
+
+def _resolve(path: Path) -> Path:
+    """Implement resolve logic."""
+    try:
+        return Path(path).resolve()
+    except Exception:
+        return Path(path)
+
+
+def _folder_key(folder: Path) -> str:
+    """Return the case-normalized folder key used for lookups."""
+    return os.path.normcase(str(_resolve(folder)))
+
+
+@dataclass
+class RefreshStats:
+    """Result of one incremental folder refresh."""
+    folders: int = 0
+    skipped: int = 0
+    seen: int = 0
+    added: int = 0
+    removed: int = 0
+    errors: int = 0
+    elapsed_ms: float = 0.0
+
+
+class TelemetryLibrary:
+    """SQLite-backed CSV name index; refresh() only re-lists folders whose directory mtime changed."""
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """Implement init logic."""
+        self.db_path = Path(db_path) if db_path is not None else library_db_path()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database once (schema mismatch: rebuild)."""
+        if self._conn is not None:
+            return self._conn
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except Exception:
+            pass
+        version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS csv_files")
+            conn.execute("DROP TABLE IF EXISTS folders")
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            conn = self._conn
+            self._conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def refresh(self, folders: Iterable[Path]) -> RefreshStats:
+        """Bring the index for folders (non-recursive) in line with the file system."""
+        t0 = time.perf_counter()
+        stats = RefreshStats()
+        with self._lock:
+            conn = self._connect()
+            for folder in folders:
+                folder_path = Path(folder)
+                try:
+                    # mtime vor dem Listen lesen: spaetere Aenderungen erzwingen beim naechsten Mal neu listen.
+                    dir_mtime_ns = int(os.stat(folder_path).st_mtime_ns)
+                except Exception:
+                    continue
+                if not folder_path.is_dir():
+                    continue
+                stats.folders += 1
+                key = _folder_key(folder_path)
+                row = conn.execute("SELECT mtime_ns FROM folders WHERE folder = ?", (key,)).fetchone()
+                if row is not None and int(row[0]) == dir_mtime_ns:
+                    stats.skipped += 1
+                    continue
+                if self._refresh_folder(conn, folder_path, key, stats):
+                    conn.execute("INSERT OR REPLACE INTO folders (folder, mtime_ns) VALUES (?, ?)", (key, dir_mtime_ns))
+            conn.commit()
+        stats.elapsed_ms = round((time.perf_counter() - t0) * 1000.0, 3)
+        return stats
+
+    def _refresh_folder(self, conn: sqlite3.Connection, folder: Path, key: str, stats: RefreshStats) -> bool:
+        """Sync the CSV names of one folder (names only, no file stat or read); False if it cannot be listed."""
+        known = {str(r[0]) for r in conn.execute("SELECT path FROM csv_files WHERE folder = ?", (key,))}
+        try:
+            entries = list(os.scandir(folder))
+        except Exception:
+            stats.errors += 1
+            return False
+        resolved_folder = _resolve(folder)
+        live: set[str] = set()
+        added: list[tuple[str, str, str, str, str]] = []
+        for entry in entries:
+            if not entry.name.lower().endswith(".csv"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except Exception:
+                continue
+            path_key = str(resolved_folder / entry.name)
+            live.add(path_key)
+            stats.seen += 1
+            if path_key in known:
+                continue
+            stem = entry.name[:-4]
+            added.append((path_key, key, entry.name, stem.strip().lower(), compact_stem(stem)))
+        if added:
+            conn.executemany(
+                "INSERT OR REPLACE INTO csv_files (path, folder, name, stem_lower, stem_compact) VALUES (?, ?, ?, ?, ?)",
+                added,
+            )
+            stats.added += len(added)
+        gone = [p for p in known if p not in live]
+        if gone:
+            conn.executemany("DELETE FROM csv_files WHERE path = ?", [(p,) for p in gone])
+            stats.removed += len(gone)
+        return True
+
+    def match_candidates(self, video_path: Path, folders: Iterable[Path]) -> list[Path]:
+        """Return CSVs in folders whose stem matches the video stem (exact, contains or compact contains)."""
+        target_stem = str(Path(video_path).stem or "").strip().lower()
+        if not target_stem:
+            return []
+        target_compact = compact_stem(target_stem)
+        keys = [_folder_key(Path(f)) for f in folders]
+        if not keys:
+            return []
+        marks = ",".join("?" for _ in keys)
+        sql = (
+            f"SELECT path FROM csv_files WHERE folder IN ({marks}) AND "
+            "(stem_lower = ? OR instr(stem_lower, ?) > 0 OR (? <> '' AND instr(stem_compact, ?) > 0))"
+        )
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(sql, (*keys, target_stem, target_stem, target_compact, target_compact)).fetchall()
+        return [Path(r[0]) for r in rows]
+
+
+_LIBRARY: TelemetryLibrary | None = None
+_LIBRARY_LOCK = threading.Lock()
+
+
+def get_telemetry_library() -> TelemetryLibrary:
+    """Return the process-wide telemetry library."""
+    global _LIBRARY
+    if _LIBRARY is not None:
+        return _LIBRARY
+    with _LIBRARY_LOCK:
+        if _LIBRARY is None:
+            _LIBRARY = TelemetryLibrary()
+    return _LIBRARY
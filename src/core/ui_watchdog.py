@@ -0,0 +1,261 @@
+"""Tk main-thread stall detector: heartbeat latency histogram and stack samples of stalls (for diagnostics)."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Callable
+
+UI_WATCHDOG_ENV = "IRVC_UI_WATCHDOG"
+UI_STALL_MS_ENV = "IRVC_UI_STALL_MS"
+
+_LOG = logging.getLogger(__name__)
+
+_SRC_ROOT = Path(__file__).resolve().parents[1]
+
+# Obergrenzen der Latenz-Buckets in ms (letzter Bucket offen).
+LATENCY_BUCKETS_MS = (16, 33, 50, 100, 250, 500, 1000, 2000, 5000)
+
+# Stacks in diesen tkinter-Dateien sind modale Dialoge (Benutzer wartet, kein Haenger).
+_MODAL_FILES = ("commondialog.py", "messagebox.py", "filedialog.py", "simpledialog.py", "dialog.py")
+
+CULPRIT_EVENT_LOOP = "<tk event loop>"
+
+_STALL_LOG_MAX_BYTES = 512 * 1024
+
+_ACTIVE: "UiStallMonitor | None" = None
+
+
+def ui_watchdog_enabled() -> bool:
+    """Return whether the stall detector runs (default on, IRVC_UI_WATCHDOG=0 disables)."""
+    raw = str(os.environ.get(UI_WATCHDOG_ENV) or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def _stall_threshold_ms() -> int:
+    """Implement stall threshold ms logic."""
+    try:
+        return max(50, int(str(os.environ.get(UI_STALL_MS_ENV) or "250").strip()))
+    except Exception:
+        return 250
+
+
+def _is_own_frame(filename: str) -> bool:
+    """Return whether filename belongs to this source tree."""
+    try:
+        return Path(filename).resolve().is_relative_to(_SRC_ROOT)
+    except Exception:
+        return False
+
+
+def _classify_stack(frames: traceback.StackSummary) -> tuple[str, bool]:
+    """Return (culprit, modal): innermost own frame that is not the watchdog itself."""
+    modal = any(Path(f.filename).name in _MODAL_FILES and "tkinter" in f.filename for f in frames)
+    for f in reversed(frames):
+        if _is_own_frame(f.filename) and not f.filename.endswith("ui_watchdog.py"):
+            # Steht der Haupt-Thread nur in mainloop() (Fenster ziehen, Resize), ist es die Ereignisschleife.
+            if f.name == "main" and f.line and "mainloop" in f.line:
+                return CULPRIT_EVENT_LOOP, modal
+            try:
+                rel = Path(f.filename).resolve().relative_to(_SRC_ROOT).as_posix()
+            except Exception:
+                rel = Path(f.filename).name
+            return f"{rel}:{f.lineno} {f.name}", modal
+    if frames and frames[-1].name != "mainloop":
+        f = frames[-1]
+        return f"{Path(f.filename).name}:{f.lineno} {f.name}", modal
+    return CULPRIT_EVENT_LOOP, modal
+
+
+class UiStallMonitor:
+    """
+    A heartbeat after() on the Tk thread measures event-loop latency; a watchdog thread samples the main
+    thread's stack while the heartbeat is overdue. The heartbeat that ends a stall records it with the most
+    frequent culprit.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        *,
+        stall_ms: int = 250,
+        heartbeat_ms: int = 50,
+        max_stalls: int = 50,
+        log_path: Path | None = None,
+    ) -> None:
+        """Implement init logic."""
+        self._schedule = schedule
+        self._log_path = log_path
+        self.stall_ms = max(50, int(stall_ms))
+        self.heartbeat_ms = max(10, int(heartbeat_ms))
+        self._lock = threading.Lock()
+        self._main_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._expected = time.monotonic() + self.heartbeat_ms / 1000.0
+        self._samples: Counter[str] = Counter()
+        self._sample_stack: list[str] = []
+        self._sample_modal = False
+        self._next_sample = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.beats = 0
+        self.max_latency_ms = 0.0
+        self.stalls: deque[dict[str, Any]] = deque(maxlen=max(1, int(max_stalls)))
+        self.by_culprit: dict[str, dict[str, float]] = {}
+        self.stall_count = 0
+        self._t0 = time.time()
+
+    def start(self) -> "UiStallMonitor":
+        """Start heartbeat and watchdog (call on the Tk thread)."""
+        self._main_id = threading.get_ident()
+        self._expected = time.monotonic() + self.heartbeat_ms / 1000.0
+        self._schedule(self.heartbeat_ms, self._beat)
+        threading.Thread(target=self._watch, name="ui-watchdog", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watchdog thread (the heartbeat ends with the Tk loop)."""
+        self._stop.set()
+
+    def _beat(self) -> None:
+        """Heartbeat on the Tk thread."""
+        now = time.monotonic()
+        latency_ms = max(0.0, 1000.0 * (now - self._expected))
+        with self._lock:
+            self.beats += 1
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            idx = next((i for i, b in enumerate(LATENCY_BUCKETS_MS) if latency_ms <= b), len(LATENCY_BUCKETS_MS))
+            self.buckets[idx] += 1
+            stall = None
+            if latency_ms >= self.stall_ms and self._samples:
+                culprit, n = self._samples.most_common(1)[0]
+                stall = {
+                    "at_epoch": round(time.time() - latency_ms / 1000.0, 3),
+                    "duration_ms": round(latency_ms, 1),
+                    "culprit": culprit,
+                    "modal": bool(self._sample_modal),
+                    "samples": int(sum(self._samples.values())),
+                    "culprit_samples": int(n),
+                    "stack": list(self._sample_stack),
+                }
+                self.stall_count += 1
+                self.stalls.append(stall)
+                agg = self.by_culprit.setdefault(culprit, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                agg["count"] += 1
+                agg["total_ms"] += latency_ms
+                agg["max_ms"] = max(agg["max_ms"], latency_ms)
+            self._samples.clear()
+            self._sample_stack = []
+            self._sample_modal = False
+            self._expected = now + self.heartbeat_ms / 1000.0
+        if stall is not None and not stall["modal"] and stall["culprit"] != CULPRIT_EVENT_LOOP:
+            _LOG.warning("[ui-stall] %.0fms in %s", stall["duration_ms"], stall["culprit"])
+            self._append_stall_log(stall)
+        if self._stop.is_set():
+            return
+        try:
+            self._schedule(self.heartbeat_ms, self._beat)
+        except Exception:
+            # Tk ist weg: Watchdog mitbeenden.
+            self._stop.set()
+
+    def _append_stall_log(self, stall: dict[str, Any]) -> None:
+        """Append one JSON line per stall (survives restarts, picked up by the diagnostics bundle)."""
+        path = self._log_path
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists() and path.stat().st_size > _STALL_LOG_MAX_BYTES:
+                path.replace(path.with_name(path.stem + ".old" + path.suffix))
+            entry = dict(stall)
+            entry["stack"] = entry.get("stack", [])[-12:]
+            with path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except Exception:
+            pass
+
+    def _watch(self) -> None:
+        """Watchdog thread: sample the main thread's stack while the heartbeat is overdue."""
+        poll_s = min(self.heartbeat_ms, self.stall_ms) / 2000.0
+        while not self._stop.wait(poll_s):
+            now = time.monotonic()
+            with self._lock:
+                overdue_ms = 1000.0 * (now - self._expected)
+                due = overdue_ms >= self.stall_ms and now >= self._next_sample
+            if not due:
+                continue
+            frame = sys._current_frames().get(self._main_id)
+            if frame is None:
+                continue
+            try:
+                frames = traceback.extract_stack(frame, limit=40)
+            except Exception:
+                continue
+            culprit, modal = _classify_stack(frames)
+            with self._lock:
+                # Heartbeat kam waehrend des Samplings: kein Haenger mehr.
+                if 1000.0 * (time.monotonic() - self._expected) < self.stall_ms:
+                    continue
+                if not self._samples:
+                    self._sample_stack = [f"{f.filename}:{f.lineno} {f.name}: {str(f.line or '').strip()}" for f in frames]
+                self._samples[culprit] += 1
+                self._sample_modal = self._sample_modal or modal
+                self._next_sample = now + self.stall_ms / 2000.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return latency histogram, per-culprit totals and the most recent stalls (thread-safe)."""
+        with self._lock:
+            labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            return {
+                "version": 1,
+                "started_epoch": round(self._t0, 3),
+                "stall_threshold_ms": self.stall_ms,
+                "heartbeat_ms": self.heartbeat_ms,
+                "beats": self.beats,
+                "max_latency_ms": round(self.max_latency_ms, 1),
+                "latency_histogram": dict(zip(labels, self.buckets)),
+                "stall_count": self.stall_count,
+                "stalls_by_culprit": {
+                    k: {"count": int(v["count"]), "total_ms": round(v["total_ms"], 1), "max_ms": round(v["max_ms"], 1)}
+                    for k, v in sorted(self.by_culprit.items(), key=lambda kv: -kv[1]["total_ms"])
+                },
+                "recent_stalls": list(self.stalls),
+            }
+
+
+def start(schedule: Callable[[int, Callable[[], None]], Any], *, log_path: Path | None = None) -> UiStallMonitor | None:
+    """Start the process-wide monitor on the Tk thread (None when disabled)."""
+    global _ACTIVE
+    if not ui_watchdog_enabled():
+        return None
+    if _ACTIVE is not None:
+        _ACTIVE.stop()
+    _ACTIVE = UiStallMonitor(schedule, stall_ms=_stall_threshold_ms(), log_path=log_path).start()
+    return _ACTIVE
+
+
+def stop() -> None:
+    """Stop the process-wide monitor."""
+    global _ACTIVE
+    mon = _ACTIVE
+    _ACTIVE = None
+    if mon is not None:
+        mon.stop()
+
+
+def snapshot() -> dict[str, Any] | None:
+    """Return the active monitor's snapshot (None when not running)."""
+    mon = _ACTIVE
+    if mon is None:
+        return None
+    try:
+        return mon.snapshot()
+    except Exception:
+        return None
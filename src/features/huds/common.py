@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import math
+import os
+import threading
 import weakref
 from typing import Any, Callable
 
+import numpy as np
+
 # Shared HUD colors (RGBA). Keep exact values to preserve output.
 COL_SLOW_DARKRED = (234, 0, 0, 255)
 COL_SLOW_BRIGHTRED = (255, 137, 117, 255)
@@ -13,6 +18,8 @@ COL_FAST_DARKBLUE = (36, 0, 250, 255)
 COL_FAST_BRIGHTBLUE = (1, 253, 255, 255)
 COL_SLOW_TEXT_RED = (255, 120, 102, 255)
 COL_FAST_TEXT_BLUE = (104, 176, 255, 255)
+# Multi-lap renders: one curve color per extra reference lap.
+COL_EXTRA_LAPS = ((0, 200, 83, 255), (255, 171, 0, 255))
 COL_WHITE = (255, 255, 255, 255)
 COL_HUD_BG = (18, 18, 18, 96)
 
@@ -55,6 +62,21 @@ TABLE_HUD_NAMES: set[str] = {
 }
 
 
+def window_column(frame_window_mapping: Any, name: str) -> np.ndarray:
+    """Return one column of a frame window mapping as an ndarray (the slice view itself, no copy)."""
+    col = getattr(frame_window_mapping, name, None)
+    if col is None:
+        return np.zeros(0, dtype=np.int64)
+    return np.asarray(col)
+
+
+def window_sample_positions(idxs: np.ndarray, offsets: np.ndarray, *, i_lo: int, i_hi: int, stride: int) -> np.ndarray:
+    """Window positions a curve HUD plots: inside [i_lo, i_hi], both ends and every stride-th offset."""
+    inside = (idxs >= int(i_lo)) & (idxs <= int(i_hi))
+    pick = (idxs == int(i_lo)) | (idxs == int(i_hi)) | ((offsets % int(stride)) == 0)
+    return np.flatnonzero(inside & pick)
+
+
 def _coerce_rgba(col: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
     """Coerce rgba."""
     r, g, b, a = col
@@ -191,6 +213,255 @@ def _brighten_text_rgba(fill: tuple[int, int, int, int], enabled: bool) -> tuple
     return _coerce_rgba((nr, ng, nb, int(a)))
 
 
+TEXT_CACHE_ENV = "IRVC_HUD_TEXT_CACHE"
+_TEXT_SPRITE_MAX = 4096
+# Zeichen, die ein Zahlen-Atlas aus Einzel-Glyphen zusammensetzen darf.
+_ATLAS_CHARSET = "0123456789+-.,:% "
+
+
+def _text_cache_enabled() -> bool:
+    """Return whether text sprites are cached (IRVC_HUD_TEXT_CACHE=0 draws every string directly)."""
+    raw = str(os.environ.get(TEXT_CACHE_ENV) or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def _font_cache_key(font: Any) -> tuple[Any, ...] | None:
+    """Return a stable key for a FreeType font (None: not cacheable)."""
+    path = getattr(font, "path", None)
+    size = getattr(font, "size", None)
+    if not isinstance(path, (str, bytes)) or size is None:
+        return None
+    return (path, float(size), int(getattr(font, "index", 0) or 0), str(getattr(font, "layout_engine", "")))
+
+
+class _TextSprite:
+    """Coverage mask (mode L) of one string; the text origin sits at (ox, oy) inside the mask."""
+
+    __slots__ = ("mask", "ox", "oy")
+
+    def __init__(self, mask: Any, ox: int, oy: int) -> None:
+        """Implement init logic."""
+        self.mask = mask
+        self.ox = int(ox)
+        self.oy = int(oy)
+
+
+def _render_text_sprite(text: str, font: Any, fontmode: str) -> _TextSprite | None:
+    """Rasterize text once into an L mask (same FreeType path as ImageDraw.text)."""
+    from PIL import Image, ImageDraw
+
+    l, t, r, b = font.getbbox(text, mode=fontmode)
+    ox = max(0, -int(math.floor(l)))
+    oy = max(0, -int(math.floor(t)))
+    w = int(math.ceil(r)) + ox
+    h = int(math.ceil(b)) + oy
+    if w <= 0 or h <= 0:
+        return None
+    mask = Image.new("L", (w, h), 0)
+    mdr = ImageDraw.Draw(mask)
+    mdr.fontmode = fontmode
+    mdr.text((ox, oy), text, fill=255, font=font)
+    return _TextSprite(mask, ox, oy)
+
+
+class _DigitAtlas:
+    """Per-font glyph masks for numeric readouts; strings are assembled without FreeType.
+
+    Only used if assembling "0123456789" reproduces the directly rendered string bit for bit
+    (hinted advances, no kerning) - otherwise the font falls back to whole-string sprites.
+    """
+
+    def __init__(self, font: Any, fontmode: str) -> None:
+        """Implement init logic."""
+        self.font = font
+        self.fontmode = fontmode
+        self.glyphs: dict[str, _TextSprite | None] = {}
+        self.advances: dict[str, int] = {}
+        self.ok = False
+        try:
+            self.ok = self._build()
+        except Exception:
+            self.ok = False
+
+    def _build(self) -> bool:
+        """Implement build logic."""
+        from PIL import ImageChops
+
+        for ch in _ATLAS_CHARSET:
+            adv = float(self.font.getlength(ch, mode=self.fontmode))
+            if abs(adv - round(adv)) > 1e-6:
+                return False
+            self.advances[ch] = int(round(adv))
+            self.glyphs[ch] = _render_text_sprite(ch, self.font, self.fontmode) if ch != " " else None
+        probe = "0123456789"
+        direct = _render_text_sprite(probe, self.font, self.fontmode)
+        built = self.assemble(probe)
+        if direct is None or built is None:
+            return False
+        if (direct.ox, direct.oy) != (built.ox, built.oy) or direct.mask.size != built.mask.size:
+            return False
+        return ImageChops.difference(direct.mask, built.mask).getbbox() is None
+
+    def can_assemble(self, text: str) -> bool:
+        """Return whether every character of text is in the atlas."""
+        return all(ch in self.advances for ch in text)
+
+    def assemble(self, text: str) -> _TextSprite | None:
+        """Compose text from glyph masks (max-combined like the FreeType renderer)."""
+        from PIL import Image, ImageChops
+
+        l, t, r, b = self.font.getbbox(text, mode=self.fontmode)
+        ox = max(0, -int(math.floor(l)))
+        oy = max(0, -int(math.floor(t)))
+        w = int(math.ceil(r)) + ox
+        h = int(math.ceil(b)) + oy
+        if w <= 0 or h <= 0:
+            return None
+        mask = Image.new("L", (w, h), 0)
+        pen = 0
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is not None:
+                layer = Image.new("L", (w, h), 0)
+                layer.paste(glyph.mask, (ox + pen - glyph.ox, oy - glyph.oy))
+                mask = ImageChops.lighter(mask, layer)
+            pen += self.advances[ch]
+        return _TextSprite(mask, ox, oy)
+
+
+class TextSpriteCache:
+    """LRU of rasterized text masks keyed by (font, text); colors and shadow are applied at blit time."""
+
+    def __init__(self, max_entries: int = _TEXT_SPRITE_MAX) -> None:
+        """Implement init logic."""
+        self.max_entries = int(max_entries)
+        self._lock = threading.Lock()
+        self._sprites: OrderedDict[tuple[Any, ...], _TextSprite | None] = OrderedDict()
+        self._bboxes: OrderedDict[tuple[Any, ...], tuple[int, int, int, int]] = OrderedDict()
+        self._atlases: dict[tuple[Any, ...], _DigitAtlas] = {}
+        self.hits = 0
+        self.misses = 0
+        self.atlas_builds = 0
+        self.evictions = 0
+        self.bbox_hits = 0
+        self.bbox_misses = 0
+
+    def sprite(self, text: str, font: Any, font_key: tuple[Any, ...], fontmode: str) -> _TextSprite | None:
+        """Return the cached sprite for text, rasterizing (or assembling from the digit atlas) on a miss."""
+        key = (font_key, fontmode, text)
+        with self._lock:
+            if key in self._sprites:
+                self._sprites.move_to_end(key)
+                self.hits += 1
+                return self._sprites[key]
+            atlas = self._atlases.get((font_key, fontmode))
+        self.misses += 1
+        if atlas is None and all(ch in _ATLAS_CHARSET for ch in text):
+            atlas = _DigitAtlas(font, fontmode)
+            with self._lock:
+                self._atlases[(font_key, fontmode)] = atlas
+        if atlas is not None and atlas.ok and atlas.can_assemble(text):
+            sprite = atlas.assemble(text)
+            self.atlas_builds += 1
+        else:
+            sprite = _render_text_sprite(text, font, fontmode)
+        with self._lock:
+            self._sprites[key] = sprite
+            while len(self._sprites) > self.max_entries:
+                self._sprites.popitem(last=False)
+                self.evictions += 1
+        return sprite
+
+    def bbox(self, dr: Any, text: str, font: Any) -> tuple[int, int, int, int]:
+        """Return dr.textbbox((0, 0), text, font=font), memoized per font."""
+        font_key = _font_cache_key(font)
+        if font_key is None or not _text_cache_enabled():
+            return tuple(dr.textbbox((0, 0), text, font=font))  # type: ignore[return-value]
+        key = (font_key, str(getattr(dr, "fontmode", "L")), text)
+        with self._lock:
+            bb = self._bboxes.get(key)
+            if bb is not None:
+                self._bboxes.move_to_end(key)
+                self.bbox_hits += 1
+                return bb
+        bb = tuple(dr.textbbox((0, 0), text, font=font))
+        self.bbox_misses += 1
+        with self._lock:
+            self._bboxes[key] = bb  # type: ignore[assignment]
+            while len(self._bboxes) > self.max_entries:
+                self._bboxes.popitem(last=False)
+        return bb  # type: ignore[return-value]
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for the HUD debug log."""
+        with self._lock:
+            entries = len(self._sprites)
+            atlases_ok = sum(1 for a in self._atlases.values() if a.ok)
+            atlases = len(self._atlases)
+        total = self.hits + self.misses
+        return {
+            "hits": int(self.hits),
+            "misses": int(self.misses),
+            "hit_rate": round(float(self.hits) / float(total), 4) if total > 0 else 0.0,
+            "atlas_builds": int(self.atlas_builds),
+            "atlases": f"{atlases_ok}/{atlases}",
+            "entries": int(entries),
+            "evictions": int(self.evictions),
+            "bbox_hits": int(self.bbox_hits),
+            "bbox_misses": int(self.bbox_misses),
+        }
+
+
+_TEXT_SPRITES = TextSpriteCache()
+
+
+def get_text_sprite_cache() -> TextSpriteCache:
+    """Return the process-wide text sprite cache."""
+    return _TEXT_SPRITES
+
+
+def text_bbox(dr: Any, text: str, font: Any = None) -> tuple[int, int, int, int]:
+    """Cached replacement for dr.textbbox((0, 0), text, font=font)."""
+    return _TEXT_SPRITES.bbox(dr, str(text), font)
+
+
+def _blit_text(dr: Any, xy: tuple[int, int], txt: str, font: Any, fill: Any) -> bool:
+    """Draw txt from the sprite cache; False if the caller has to fall back to dr.text."""
+    if font is None or "\n" in txt or not _text_cache_enabled():
+        return False
+    font_key = _font_cache_key(font)
+    if font_key is None:
+        return False
+    core_draw = getattr(dr, "draw", None)
+    getink = getattr(dr, "_getink", None)
+    if core_draw is None or getink is None:
+        return False
+    fontmode = str(getattr(dr, "fontmode", "L"))
+    sprite = _TEXT_SPRITES.sprite(txt, font, font_key, fontmode)
+    if sprite is None:
+        return True
+    ink, fill_ink = getink(fill)
+    if ink is None:
+        ink = fill_ink
+    if ink is None:
+        return True
+    core_draw.draw_bitmap((int(xy[0]) - sprite.ox, int(xy[1]) - sprite.oy), sprite.mask.im, ink)
+    return True
+
+
+def _draw_text(dr: Any, xy: tuple[int, int], txt: str, font: Any, fill: Any) -> None:
+    """Implement draw text logic."""
+    try:
+        if _blit_text(dr, xy, txt, font, fill):
+            return
+    except Exception:
+        pass
+    try:
+        dr.text(xy, txt, fill=fill, font=font)
+    except Exception:
+        pass
+
+
 def draw_text_with_shadow(
     dr: Any,
     xy: tuple[int | float, int | float],
@@ -236,14 +507,8 @@ def draw_text_with_shadow(
         sh_col = (int(sh_rgb[0]), int(sh_rgb[1]), int(sh_rgb[2]), int(use_alpha))
 
     if bool(use_shadow) and int(use_alpha) > 0:
-        try:
-            dr.text((int(x + dx), int(y + dy)), txt, fill=sh_col, font=font)
-        except Exception:
-            pass
-    try:
-        dr.text((int(x), int(y)), txt, fill=fill_rgba, font=font)
-    except Exception:
-        pass
+        _draw_text(dr, (int(x + dx), int(y + dy)), txt, font, sh_col)
+    _draw_text(dr, (int(x), int(y)), txt, font, fill_rgba)
 
 
 def _darken_rgba(
@@ -13,6 +13,8 @@ from features.huds.common import (
     format_value_for_step,
     should_suppress_boundary_label,
     value_boundaries_to_y,
+    window_column,
+    window_sample_positions,
 )
 
 
@@ -24,10 +26,10 @@ def render_delta(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any) -
     iL = int(ctx["iL"])
     iR = int(ctx["iR"])
     frame_window_mapping = ctx.get("frame_window_mapping")
-    map_idxs_all = list(getattr(frame_window_mapping, "idxs", []) or [])
-    map_offsets_all = list(getattr(frame_window_mapping, "offsets", []) or [])
-    map_t_slow_all = list(getattr(frame_window_mapping, "t_slow", []) or [])
-    map_t_fast_all = list(getattr(frame_window_mapping, "t_fast", []) or [])
+    map_idxs_all = window_column(frame_window_mapping, "idxs")
+    map_offsets_all = window_column(frame_window_mapping, "offsets")
+    map_t_slow_all = window_column(frame_window_mapping, "t_slow")
+    map_t_fast_all = window_column(frame_window_mapping, "t_fast")
     mx = int(ctx["mx"])
     _idx_to_x = ctx["_idx_to_x"]
     slow_frame_to_fast_time_s = ctx["slow_frame_to_fast_time_s"]
@@ -85,23 +87,24 @@ def render_delta(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any) -
                 plot_y0 = int(y0) + 2
                 plot_y1 = int(y0 + h - 2)
 
-            map_idx_to_tslow: dict[int, float] = {}
-            map_idx_to_tfast: dict[int, float] = {}
+            # Fenster-Mapping ist ein zusammenhaengender Frame-Bereich: Position = idx - erster idx.
+            map_n = 0
+            map_i0 = 0
             if (
-                map_idxs_all
+                len(map_idxs_all)
                 and len(map_idxs_all) == len(map_t_slow_all)
                 and len(map_idxs_all) == len(map_t_fast_all)
             ):
-                for idx_m, ts_m, tf_m in zip(map_idxs_all, map_t_slow_all, map_t_fast_all):
-                    map_idx_to_tslow[int(idx_m)] = float(ts_m)
-                    map_idx_to_tfast[int(idx_m)] = float(tf_m)
+                map_n = int(len(map_idxs_all))
+                map_i0 = int(map_idxs_all[0])
 
             # Delta-Funktion (aus Sync-Map)
             def _delta_at_slow_frame(idx0: int) -> float:
                 fps_safe = float(fps) if float(fps) > 0.1 else 30.0
                 ii = int(idx0)
-                if ii in map_idx_to_tslow and ii in map_idx_to_tfast:
-                    return float(map_idx_to_tslow[ii] - map_idx_to_tfast[ii])
+                k_map = ii - map_i0
+                if 0 <= k_map < map_n and int(map_idxs_all[k_map]) == ii:
+                    return float(map_t_slow_all[k_map]) - float(map_t_fast_all[k_map])
                 if not slow_frame_to_fast_time_s:
                     return 0.0
                 if idx0 < 0:
@@ -261,14 +264,9 @@ def render_delta(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any) -
                         pass
 
             sample_rows: list[tuple[int, int]] = []
-            if map_idxs_all and len(map_idxs_all) == len(map_offsets_all):
-                for idx_m, off_m in zip(map_idxs_all, map_offsets_all):
-                    idx_i = int(idx_m)
-                    if idx_i < int(iL) or idx_i > int(iR):
-                        continue
-                    use_point = (idx_i == int(iL)) or (idx_i == int(iR)) or ((int(off_m) % int(stride)) == 0)
-                    if use_point:
-                        sample_rows.append((idx_i, int(off_m)))
+            if len(map_idxs_all) and len(map_idxs_all) == len(map_offsets_all):
+                sel = window_sample_positions(map_idxs_all, map_offsets_all, i_lo=int(iL), i_hi=int(iR), stride=int(stride))
+                sample_rows = list(zip(map_idxs_all[sel].tolist(), map_offsets_all[sel].tolist()))
 
             if not sample_rows:
                 idxs_fallback: list[int] = []
@@ -1,9 +1,10 @@
 ﻿from __future__ import annotations
 
+from functools import lru_cache
 import math
 from typing import Any
 
-from features.huds.common import COL_HUD_BG, draw_hud_background, draw_text_with_shadow
+from features.huds.common import COL_HUD_BG, draw_hud_background, draw_text_with_shadow, text_bbox
 
 
 def _safe_int(arr: Any, idx: int) -> int:
@@ -18,6 +19,7 @@ def _safe_int(arr: Any, idx: int) -> int:
     return int(v)
 
 
+@lru_cache(maxsize=128)
 def _load_table_font(sz: int) -> Any:
     try:
         from PIL import ImageFont
@@ -41,7 +43,7 @@ def _load_table_font(sz: int) -> Any:
 
 def _text_wh(dr: Any, text: str, font_obj: Any) -> tuple[int, int]:
     try:
-        bb = dr.textbbox((0, 0), str(text), font=font_obj)
+        bb = text_bbox(dr, str(text), font_obj)
         return int(bb[2] - bb[0]), int(bb[3] - bb[1])
     except Exception:
         return int(max(1, len(str(text))) * 7), 12
@@ -60,7 +62,7 @@ def _draw_centered_text(
 ) -> None:
     txt = str(text)
     try:
-        bb = dr.textbbox((0, 0), txt, font=font_obj)
+        bb = text_bbox(dr, txt, font_obj)
         tw = float(bb[2] - bb[0])
         th = float(bb[3] - bb[1])
         bx0 = float(bb[0])
@@ -468,7 +470,7 @@ def render_gear_rpm(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any
 
         def _text_wh(text: str, font_obj: Any) -> tuple[int, int]:
             try:
-                bb = dr.textbbox((0, 0), str(text), font=font_obj)
+                bb = text_bbox(dr, str(text), font_obj)
                 return int(bb[2] - bb[0]), int(bb[3] - bb[1])
             except Exception:
                 return int(max(1, len(str(text))) * 7), 12
@@ -485,7 +487,7 @@ def render_gear_rpm(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any
         ) -> None:
             txt = str(text)
             try:
-                bb = dr.textbbox((0, 0), txt, font=font_obj)
+                bb = text_bbox(dr, txt, font_obj)
                 tw = float(bb[2] - bb[0])
                 th = float(bb[3] - bb[1])
                 bx0 = float(bb[0])
@@ -3,6 +3,7 @@
 import math
 from typing import Any
 
+from core.frame_series import is_frame_series
 from features.huds.common import (
     COL_HUD_BG,
     build_value_boundaries,
@@ -14,6 +15,7 @@ from features.huds.common import (
     format_value_for_step,
     should_suppress_boundary_label,
     value_boundaries_to_y,
+    window_column,
 )
 
 
@@ -27,8 +29,8 @@ def render_line_delta(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: A
     before_f = max(1, int(ctx.get("before_f", 1)))
     after_f = max(1, int(ctx.get("after_f", 1)))
     frame_window_mapping = ctx.get("frame_window_mapping")
-    map_idxs_all = list(getattr(frame_window_mapping, "idxs", []) or [])
-    map_offsets_all = list(getattr(frame_window_mapping, "offsets", []) or [])
+    map_idxs_all = window_column(frame_window_mapping, "idxs")
+    map_offsets_all = window_column(frame_window_mapping, "offsets")
     line_delta_m_frames = ctx.get("line_delta_m_frames")
     line_delta_y_abs_m = ctx.get("line_delta_y_abs_m")
     COL_WHITE = ctx.get("COL_WHITE", (255, 255, 255, 255))
@@ -82,7 +84,7 @@ def render_line_delta(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: A
     marker_xf = float(x0) + (float(w) / 2.0)
     marker_x = int(round(marker_xf))
 
-    vals = line_delta_m_frames if isinstance(line_delta_m_frames, list) else []
+    vals = line_delta_m_frames if is_frame_series(line_delta_m_frames) else []
     n_vals = len(vals)
 
     cur_idx = int(i)
@@ -92,11 +94,9 @@ def render_line_delta(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: A
         cur_idx = n_vals - 1
 
     window: list[tuple[int, float]] = []
-    if map_idxs_all and len(map_idxs_all) == len(map_offsets_all):
-        for idx_m, ofs_m in zip(map_idxs_all, map_offsets_all):
-            ofs = int(ofs_m)
-            if ofs < -int(before_f) or ofs > int(after_f):
-                continue
+    if len(map_idxs_all) and len(map_idxs_all) == len(map_offsets_all):
+        in_window = (map_offsets_all >= -int(before_f)) & (map_offsets_all <= int(after_f))
+        for idx_m, ofs in zip(map_idxs_all[in_window].tolist(), map_offsets_all[in_window].tolist()):
             idx = int(idx_m)
             if idx < 0:
                 idx = 0
@@ -1,10 +1,11 @@
 ﻿from __future__ import annotations
 
+from functools import lru_cache
 import math
 import os
 from typing import Any
 
-from features.huds.common import COL_HUD_BG, draw_hud_background, draw_text_with_shadow
+from features.huds.common import COL_HUD_BG, draw_hud_background, draw_text_with_shadow, text_bbox
 
 
 def build_confirmed_max_speed_display(
@@ -78,6 +79,8 @@ def build_confirmed_max_speed_display(
     return out
 
 
+# Schriften pro Groesse einmal laden (Tabellen-Fitting probiert viele Groessen, die Vorschau rendert oft neu).
+@lru_cache(maxsize=128)
 def _load_table_font(sz: int) -> Any:
     try:
         from PIL import ImageFont
@@ -101,7 +104,7 @@ def _load_table_font(sz: int) -> Any:
 
 def _text_wh(dr: Any, text: str, font_obj: Any) -> tuple[int, int]:
     try:
-        bb = dr.textbbox((0, 0), str(text), font=font_obj)
+        bb = text_bbox(dr, str(text), font_obj)
         return int(bb[2] - bb[0]), int(bb[3] - bb[1])
     except Exception:
         return int(max(1, len(str(text))) * 7), 12
@@ -120,7 +123,7 @@ def _draw_centered_text(
 ) -> None:
     txt = str(text)
     try:
-        bb = dr.textbbox((0, 0), txt, font=font_obj)
+        bb = text_bbox(dr, txt, font_obj)
         tw = int(bb[2] - bb[0])
         th = int(bb[3] - bb[1])
         bx0 = float(bb[0])
@@ -620,7 +623,7 @@ def render_speed(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any) -
 
         def _text_wh(text: str, font_obj: Any) -> tuple[int, int]:
             try:
-                bb = dr.textbbox((0, 0), str(text), font=font_obj)
+                bb = text_bbox(dr, str(text), font_obj)
                 return int(bb[2] - bb[0]), int(bb[3] - bb[1])
             except Exception:
                 return int(max(1, len(str(text))) * 7), 12
@@ -637,7 +640,7 @@ def render_speed(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any) -
         ) -> None:
             txt = str(text)
             try:
-                bb = dr.textbbox((0, 0), txt, font=font_obj)
+                bb = text_bbox(dr, txt, font_obj)
                 tw = int(bb[2] - bb[0])
                 th = int(bb[3] - bb[1])
                 bx0 = float(bb[0])
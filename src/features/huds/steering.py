@@ -16,6 +16,8 @@ from features.huds.common import (
     should_suppress_boundary_label,
     value_boundaries_to_y,
     _text_size,
+    window_column,
+    window_sample_positions,
 )
 
 
@@ -26,9 +28,9 @@ def render_steering(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any
     iL = int(ctx["iL"])
     iR = int(ctx["iR"])
     frame_window_mapping = ctx.get("frame_window_mapping")
-    map_idxs_all = list(getattr(frame_window_mapping, "idxs", []) or [])
-    map_offsets_all = list(getattr(frame_window_mapping, "offsets", []) or [])
-    map_fast_idx_all = list(getattr(frame_window_mapping, "fast_idx", []) or [])
+    map_idxs_all = window_column(frame_window_mapping, "idxs")
+    map_offsets_all = window_column(frame_window_mapping, "offsets")
+    map_fast_idx_all = window_column(frame_window_mapping, "fast_idx")
     slow_to_fast_frame = ctx["slow_to_fast_frame"]
     slow_steer_frames = ctx["slow_steer_frames"]
     fast_steer_frames = ctx["fast_steer_frames"]
@@ -336,14 +338,11 @@ def render_steering(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any
 
             # Story 2.1: gemeinsames Fenster-Mapping nutzen (einmal pro Frame berechnet).
             sample_rows: list[tuple[int, int, int]] = []
-            if map_idxs_all and len(map_idxs_all) == len(map_offsets_all) and len(map_idxs_all) == len(map_fast_idx_all):
-                for idx_m, off_m, fi_m in zip(map_idxs_all, map_offsets_all, map_fast_idx_all):
-                    idx_i = int(idx_m)
-                    if idx_i < int(iL) or idx_i > int(iR):
-                        continue
-                    use_point = (idx_i == int(iL)) or (idx_i == int(iR)) or ((int(off_m) % int(stride)) == 0)
-                    if use_point:
-                        sample_rows.append((idx_i, int(off_m), int(fi_m)))
+            if len(map_idxs_all) and len(map_idxs_all) == len(map_offsets_all) == len(map_fast_idx_all):
+                sel = window_sample_positions(map_idxs_all, map_offsets_all, i_lo=int(iL), i_hi=int(iR), stride=int(stride))
+                sample_rows = list(
+                    zip(map_idxs_all[sel].tolist(), map_offsets_all[sel].tolist(), map_fast_idx_all[sel].tolist())
+                )
 
             if not sample_rows:
                 idxs_fallback: list[int] = []
@@ -378,7 +377,7 @@ def render_steering(ctx: dict[str, Any], box: tuple[int, int, int, int], dr: Any
                 fi2 = int(fi2_map)
                 if fi2 < 0:
                     fi2 = 0
-                if not map_fast_idx_all:
+                if not len(map_fast_idx_all):
                     if slow_to_fast_frame and fi2 < len(slow_to_fast_frame):
                         fi2 = int(slow_to_fast_frame[fi2])
                         if fi2 < 0:
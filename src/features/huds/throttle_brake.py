@@ -10,6 +10,8 @@ from features.huds.common import (
     draw_left_axis_labels,
     draw_stripe_grid,
     value_boundaries_to_y,
+    window_column,
+    window_sample_positions,
 )
 
 
@@ -258,11 +260,11 @@ def render_throttle_brake(ctx: dict[str, Any], box: tuple[int, int, int, int], d
     iL = int(ctx["iL"])
     iR = int(ctx["iR"])
     frame_window_mapping = ctx.get("frame_window_mapping")
-    map_idxs_all = list(getattr(frame_window_mapping, "idxs", []) or [])
-    map_offsets_all = list(getattr(frame_window_mapping, "offsets", []) or [])
-    map_t_slow_all = list(getattr(frame_window_mapping, "t_slow", []) or [])
-    map_fast_idx_all = list(getattr(frame_window_mapping, "fast_idx", []) or [])
-    map_t_fast_all = list(getattr(frame_window_mapping, "t_fast", []) or [])
+    map_idxs_all = window_column(frame_window_mapping, "idxs")
+    map_offsets_all = window_column(frame_window_mapping, "offsets")
+    map_t_slow_all = window_column(frame_window_mapping, "t_slow")
+    map_fast_idx_all = window_column(frame_window_mapping, "fast_idx")
+    map_t_fast_all = window_column(frame_window_mapping, "t_fast")
     fps = float(ctx.get("fps", 30.0) or 30.0)
     _idx_to_x = ctx["_idx_to_x"]
     _clamp = ctx["_clamp"]
@@ -566,25 +568,22 @@ def render_throttle_brake(ctx: dict[str, Any], box: tuple[int, int, int, int], d
             # Story 2.1: gemeinsames Fenster-Mapping nutzen (einmal pro Frame berechnet).
             sample_rows: list[tuple[int, int, float, int, float]] = []
             if (
-                map_idxs_all
+                len(map_idxs_all)
                 and len(map_idxs_all) == len(map_offsets_all)
                 and len(map_idxs_all) == len(map_t_slow_all)
                 and len(map_idxs_all) == len(map_fast_idx_all)
                 and len(map_idxs_all) == len(map_t_fast_all)
             ):
-                for idx_m, off_m, ts_m, fi_m, tf_m in zip(
-                    map_idxs_all,
-                    map_offsets_all,
-                    map_t_slow_all,
-                    map_fast_idx_all,
-                    map_t_fast_all,
-                ):
-                    idx_i = int(idx_m)
-                    if idx_i < int(iL) or idx_i > int(iR):
-                        continue
-                    use_point = (idx_i == int(iL)) or (idx_i == int(iR)) or ((int(off_m) % int(stride)) == 0)
-                    if use_point:
-                        sample_rows.append((idx_i, int(off_m), float(ts_m), int(fi_m), float(tf_m)))
+                sel = window_sample_positions(map_idxs_all, map_offsets_all, i_lo=int(iL), i_hi=int(iR), stride=int(stride))
+                sample_rows = list(
+                    zip(
+                        map_idxs_all[sel].tolist(),
+                        map_offsets_all[sel].tolist(),
+                        map_t_slow_all[sel].tolist(),
+                        map_fast_idx_all[sel].tolist(),
+                        map_t_fast_all[sel].tolist(),
+                    )
+                )
 
             if not sample_rows:
                 # Fallback (kompatibel), falls kein globales Mapping vorhanden ist.
@@ -4,6 +4,7 @@ import math
 import os
 from typing import Any
 
+from core.frame_series import is_frame_series
 from features.huds.common import (
     COL_HUD_BG,
     build_value_boundaries,
@@ -15,6 +16,7 @@ from features.huds.common import (
     format_value_for_step,
     should_suppress_boundary_label,
     value_boundaries_to_y,
+    window_column,
 )
 
 _UO_HUD_DEBUG_LOGGED = False
@@ -49,8 +51,8 @@ def render_under_oversteer(ctx: dict[str, Any], box: tuple[int, int, int, int],
     before_f = max(1, int(ctx.get("before_f", 1)))
     after_f = max(1, int(ctx.get("after_f", 1)))
     frame_window_mapping = ctx.get("frame_window_mapping")
-    map_idxs_all = list(getattr(frame_window_mapping, "idxs", []) or [])
-    map_offsets_all = list(getattr(frame_window_mapping, "offsets", []) or [])
+    map_idxs_all = window_column(frame_window_mapping, "idxs")
+    map_offsets_all = window_column(frame_window_mapping, "offsets")
     slow_vals = ctx.get("under_oversteer_slow_frames")
     fast_vals = ctx.get("under_oversteer_fast_frames")
     y_abs_in = ctx.get("under_oversteer_y_abs")
@@ -176,8 +178,8 @@ def render_under_oversteer(ctx: dict[str, Any], box: tuple[int, int, int, int],
     marker_xf = float(x0) + (float(w) / 2.0)
     half_w = float(w) / 2.0
 
-    slow_series = slow_vals if isinstance(slow_vals, list) else []
-    fast_series = fast_vals if isinstance(fast_vals, list) else []
+    slow_series = slow_vals if is_frame_series(slow_vals) else []
+    fast_series = fast_vals if is_frame_series(fast_vals) else []
     n_s = len(slow_series)
     n_f = len(fast_series)
 
@@ -229,8 +231,9 @@ def render_under_oversteer(ctx: dict[str, Any], box: tuple[int, int, int, int],
     pts_slow: list[tuple[int, int]] = []
     pts_fast: list[tuple[int, int]] = []
 
-    if map_idxs_all and len(map_idxs_all) == len(map_offsets_all):
-        iter_rows = [(int(idx_m), int(ofs_m)) for idx_m, ofs_m in zip(map_idxs_all, map_offsets_all)]
+    if len(map_idxs_all) and len(map_idxs_all) == len(map_offsets_all):
+        in_window = (map_offsets_all >= -int(before_f)) & (map_offsets_all <= int(after_f))
+        iter_rows = list(zip(map_idxs_all[in_window].tolist(), map_offsets_all[in_window].tolist()))
     else:
         iter_rows = [
             (int(i - before_f), int(-before_f)),
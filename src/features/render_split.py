@@ -1,16 +1,36 @@
 ﻿from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
 import logging
 import math
+import multiprocessing
 import os
 import subprocess
+import sys
+import time
 from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from core.ffmpeg_tools import resolve_ffmpeg_bin, resolve_ffprobe_bin
+from typing import Any, Sequence
+
+import numpy as np
+
+from core.ffmpeg_tools import resolve_ffmpeg_bin
+from core.frame_series import compact_frames, frames_from_numpy, frames_view, is_frame_series, series_nbytes
+from core.hud_layer_cache import HudLayerCache, HudLayerFingerprint, get_hud_layer_cache, hud_layer_cache_enabled
+from core.hud_profiler import (
+    PHASE_COMPOSITE,
+    PHASE_FULL_REDRAW,
+    PHASE_INCREMENTAL,
+    PHASE_PREP,
+    PHASE_STATIC,
+    PHASE_VALUES,
+    HudRenderProfiler,
+)
+from core.hud_vfr import HudStdinTransport, hud_vfr_enabled
+from core.media_index import MediaIndexError, get_media_index, media_key
 from core.models import LayoutConfig
-from core.subprocess_utils import windows_no_window_subprocess_kwargs
 from core.output_geometry import (
     OutputGeometry,
     build_output_geometry_for_size,
@@ -18,26 +38,53 @@ from core.output_geometry import (
     geometry_signature,
 )
 from core.encoders import (
+    build_draft_encode_specs,
     build_encode_specs,
     detect_available_encoders,
     run_encode_with_fallback,
 )
+from core.encoder_health import is_encoder_failure, preflight_encode_specs, record_encoder_fallback
 from core.ffmpeg_plan import (
     DecodeSpec,
+    EncodeSpec,
     FilterSpec,
+    OutputSpec,
     Plan,
+    StreamSyncTarget,
+    build_multi_stream_sync_filter,
     build_plan,
     build_split_filter_from_geometry,
+    build_stream_sync_audio_filter,
     build_stream_sync_filter,
     run_ffmpeg,
 )
+from core.csv_g61 import RunData
 from core.cut_events import detect_curve_segments_with_stats, map_time_segments_to_frames_with_stats
+from core.render_events import (
+    EVENT_ENCODE_PROGRESS,
+    EVENT_HUD_PROGRESS,
+    EVENT_RENDER_DONE,
+    EVENT_RENDER_PLAN,
+    RENDER_EVENTS_PORT_ENV,
+    STAGE_CONCAT,
+    STAGE_CSV_LOAD,
+    STAGE_ENCODE,
+    STAGE_ENCODER_PREFLIGHT,
+    STAGE_HUD_RENDER,
+    STAGE_PROBE,
+    STAGE_SIGNAL_PREP,
+    STAGE_SYNC_BUILD,
+    get_render_events,
+)
+from core.render_log import append_log_line, get_render_log, is_urgent_line
+from core.subprocess_utils import windows_no_window_subprocess_kwargs
 from features.huds.common import (
     COL_FAST_BRIGHTBLUE,
     COL_FAST_DARKBLUE,
     COL_HUD_BG,
     COL_SLOW_BRIGHTRED,
     COL_SLOW_DARKRED,
+    COL_EXTRA_LAPS,
     COL_WHITE,
     SCROLL_HUD_NAMES as _SCROLL_HUD_NAMES,
     TABLE_HUD_NAMES as _TABLE_HUD_NAMES,
@@ -178,28 +225,14 @@ def _build_render_video_views(
 
 
 def probe_video_meta(video_path: Path) -> VideoMeta:
-    # Stream-Meta + Format-Duration in einem Call
-    cmd = [
-        resolve_ffprobe_bin(),
-        "-v",
-        "error",
-        "-show_entries",
-        "stream=width,height,avg_frame_rate,r_frame_rate:format=duration",
-        "-select_streams",
-        "v:0",
-        "-of",
-        "json",
-        str(video_path),
-    ]
-    p = subprocess.run(cmd, capture_output=True, text=True, **windows_no_window_subprocess_kwargs())
-    if p.returncode != 0 or not p.stdout.strip():
-        raise RuntimeError(f"ffprobe failed: {video_path}")
-
-    data = json.loads(p.stdout)
-    streams = data.get("streams", [])
-    if not streams:
+    # Stream-Meta + Format-Duration aus dem Media-Index (ein ffprobe-Call pro Datei+Groesse+mtime)
+    try:
+        info = get_media_index().stream_info(video_path)
+    except MediaIndexError as e:
+        raise RuntimeError(f"ffprobe failed: {video_path}") from e
+    s0 = info.get("video")
+    if not isinstance(s0, dict):
         raise RuntimeError(f"ffprobe no streams: {video_path}")
-    s0 = streams[0]
 
     w = int(s0.get("width") or 0)
     h = int(s0.get("height") or 0)
@@ -207,8 +240,7 @@ def probe_video_meta(video_path: Path) -> VideoMeta:
     rfr = str(s0.get("r_frame_rate") or "")
     fps = _fraction_to_float(afr) or _fraction_to_float(rfr)
 
-    fmt = data.get("format", {}) if isinstance(data.get("format", {}), dict) else {}
-    dur = _to_float_safe(fmt.get("duration"), 0.0)
+    dur = _to_float_safe(info.get("duration"), 0.0)
 
     if w <= 0 or h <= 0 or fps <= 0.1:
         raise RuntimeError(f"invalid meta: {video_path}")
@@ -221,55 +253,118 @@ def probe_video_meta(video_path: Path) -> VideoMeta:
 
 def probe_has_audio(video_path: Path) -> bool:
     try:
-        cmd = [
-            resolve_ffprobe_bin(),
-            "-v",
-            "error",
-            "-select_streams",
-            "a:0",
-            "-show_entries",
-            "stream=index",
-            "-of",
-            "csv=p=0",
-            str(video_path),
-        ]
-        p = subprocess.run(cmd, capture_output=True, text=True, **windows_no_window_subprocess_kwargs())
-        return p.returncode == 0 and (p.stdout or "").strip() != ""
+        return get_media_index().stream_info(video_path).get("audio") is not None
     except Exception:
         return False
 
 
+# Typecodes der kompakten Frame-Reihen: "d" fuer Zeit/Distanz und als Zahl angezeigte Werte
+# (int()/round() darf nicht kippen), float32 nur fuer rein geplottete Kurven.
+_SYNC_TYPECODES = {
+    "slow_frame_to_lapdist": "d",
+    "slow_to_fast_frame": "i",
+    "slow_frame_to_fast_time_s": "d",
+}
+_SIGNAL_TYPECODES = {
+    "slow_speed_frames": "d",
+    "fast_speed_frames": "d",
+    "slow_min_speed_frames": "d",
+    "fast_min_speed_frames": "d",
+    "slow_gear_frames": "b",
+    "fast_gear_frames": "b",
+    "slow_rpm_frames": "d",
+    "fast_rpm_frames": "d",
+    "slow_steer_frames": "f",
+    "fast_steer_frames": "f",
+    "slow_throttle_frames": "d",
+    "fast_throttle_frames": "d",
+    "slow_brake_frames": "d",
+    "fast_brake_frames": "d",
+    "slow_abs_frames": "f",
+    "fast_abs_frames": "f",
+    "fast_lapdist_frames": "d",
+    "line_delta_m_frames": "f",
+    "under_oversteer_slow_frames": "f",
+    "under_oversteer_fast_frames": "f",
+}
+_EXTRA_LAP_TYPECODES = {
+    "slow_frame_to_time_s": "d",
+    "steer_frames": "f",
+    "throttle_frames": "f",
+    "brake_frames": "f",
+}
+
+
+def _compact_fields(obj: Any, typecodes: dict[str, str]) -> None:
+    """Replace list fields of a frozen dataclass by typed arrays (shared read-only by all cut segments)."""
+    for name, typecode in typecodes.items():
+        object.__setattr__(obj, name, compact_frames(getattr(obj, name), typecode))
+
+
 @dataclass(frozen=True)
 class HudSyncMapping:
-    slow_frame_to_lapdist: list[float]
-    slow_to_fast_frame: list[int] | None = None
-    slow_frame_to_fast_time_s: list[float] | None = None
+    slow_frame_to_lapdist: Sequence[float]
+    slow_to_fast_frame: Sequence[int] | None = None
+    slow_frame_to_fast_time_s: Sequence[float] | None = None
+
+    def __post_init__(self) -> None:
+        _compact_fields(self, _SYNC_TYPECODES)
+
+
+@dataclass(frozen=True)
+class HudExtraLap:
+    """Additional reference lap of a multi-lap render: own time map (via LapDistPct) and plotted series."""
+    name: str
+    slow_frame_to_time_s: Sequence[float]
+    steer_frames: Sequence[float] | None = None
+    throttle_frames: Sequence[float] | None = None
+    brake_frames: Sequence[float] | None = None
+
+    def __post_init__(self) -> None:
+        _compact_fields(self, _EXTRA_LAP_TYPECODES)
+
+    def nbytes(self) -> int:
+        """Return the payload size of all per-frame series."""
+        return sum(series_nbytes(getattr(self, name)) for name in _EXTRA_LAP_TYPECODES)
 
 
 @dataclass(frozen=True)
 class HudSignals:
-    slow_speed_frames: list[float] | None = None
-    fast_speed_frames: list[float] | None = None
-    slow_min_speed_frames: list[float] | None = None
-    fast_min_speed_frames: list[float] | None = None
-    slow_gear_frames: list[int] | None = None
-    fast_gear_frames: list[int] | None = None
-    slow_rpm_frames: list[float] | None = None
-    fast_rpm_frames: list[float] | None = None
-    slow_steer_frames: list[float] | None = None
-    fast_steer_frames: list[float] | None = None
-    slow_throttle_frames: list[float] | None = None
-    fast_throttle_frames: list[float] | None = None
-    slow_brake_frames: list[float] | None = None
-    fast_brake_frames: list[float] | None = None
-    slow_abs_frames: list[int] | None = None
-    fast_abs_frames: list[int] | None = None
-    fast_lapdist_frames: list[float] | None = None
-    line_delta_m_frames: list[float] | None = None
+    slow_speed_frames: Sequence[float] | None = None
+    fast_speed_frames: Sequence[float] | None = None
+    slow_min_speed_frames: Sequence[float] | None = None
+    fast_min_speed_frames: Sequence[float] | None = None
+    slow_gear_frames: Sequence[int] | None = None
+    fast_gear_frames: Sequence[int] | None = None
+    slow_rpm_frames: Sequence[float] | None = None
+    fast_rpm_frames: Sequence[float] | None = None
+    slow_steer_frames: Sequence[float] | None = None
+    fast_steer_frames: Sequence[float] | None = None
+    slow_throttle_frames: Sequence[float] | None = None
+    fast_throttle_frames: Sequence[float] | None = None
+    slow_brake_frames: Sequence[float] | None = None
+    fast_brake_frames: Sequence[float] | None = None
+    slow_abs_frames: Sequence[float] | None = None
+    fast_abs_frames: Sequence[float] | None = None
+    fast_lapdist_frames: Sequence[float] | None = None
+    line_delta_m_frames: Sequence[float] | None = None
     line_delta_y_abs_m: float | None = None
-    under_oversteer_slow_frames: list[float] | None = None
-    under_oversteer_fast_frames: list[float] | None = None
+    under_oversteer_slow_frames: Sequence[float] | None = None
+    under_oversteer_fast_frames: Sequence[float] | None = None
     under_oversteer_y_abs: float | None = None
+    # Multi-Lap: weitere Referenzrunden (Kurven in Steering und Throttle / Brake).
+    extra_laps: tuple[HudExtraLap, ...] = ()
+    # Abgeleitete Reihen (Einheiten, Halten alle N Frames) einmal pro Render statt pro Cut-Segment.
+    derived: dict[tuple[Any, ...], Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        _compact_fields(self, _SIGNAL_TYPECODES)
+
+    def nbytes(self) -> int:
+        """Return the payload size of all per-frame series."""
+        return sum(series_nbytes(getattr(self, name)) for name in _SIGNAL_TYPECODES) + sum(
+            lap.nbytes() for lap in self.extra_laps
+        )
 
 
 @dataclass(frozen=True)
@@ -307,6 +402,11 @@ class HudContext:
     window: HudWindowParams
     settings: HudRenderSettings
     log_file: Path | None = None
+    # Bereich fuer bereichsabhaengige Skalierungen (Delta-Y); None = cut_i0..cut_i1.
+    scale_range: tuple[int, int] | None = None
+    # Chunk eines durchgehenden Renders: Scroll-HUDs ab einem Vorlauf vor cut_i0 aufwaermen (ab scale_range-Start),
+    # damit der Chunk dieselben Pixel wie der durchgehende Render liefert.
+    warm_start: bool = False
 
 
 @dataclass(frozen=True)
@@ -359,6 +459,24 @@ def _write_ffconcat_file(path: Path, segment_files: list[Path]) -> None:
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
+def _count_video_frames(path: Path) -> int | None:
+    """Count the video packets of path (stream copy to framecrc, no decode); None if ffmpeg fails."""
+    try:
+        proc = subprocess.run(
+            [resolve_ffmpeg_bin(), "-v", "error", "-nostdin", "-i", str(path), "-map", "0:v:0", "-c", "copy", "-f", "framecrc", "-"],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            **windows_no_window_subprocess_kwargs(),
+        )
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+    return sum(1 for line in proc.stdout.splitlines() if line and not line.startswith("#"))
+
+
 @dataclass(frozen=True)
 class FrameWindowMapping:
     i: int
@@ -366,11 +484,57 @@ class FrameWindowMapping:
     after_f: int
     iL: int
     iR: int
-    idxs: list[int]
-    offsets: list[int]
-    t_slow: list[float]
-    fast_idx: list[int]
-    t_fast: list[float]
+    # Listen (Referenz-Builder) oder ndarray-Views aus FrameMappingArrays.window().
+    idxs: Sequence[int]
+    offsets: Sequence[int]
+    t_slow: Sequence[float]
+    fast_idx: Sequence[int]
+    t_fast: Sequence[float]
+
+
+@dataclass(frozen=True)
+class FrameMappingArrays:
+    """Slow frame -> fast frame/time mapping for every slow frame, computed once per render."""
+    fps: float
+    idxs: np.ndarray
+    t_slow: np.ndarray
+    fast_idx: np.ndarray
+    tb_fast_idx: np.ndarray
+    t_fast: np.ndarray
+
+    @property
+    def n(self) -> int:
+        return int(self.idxs.shape[0])
+
+    def window(self, i: int, before_f: int, after_f: int) -> FrameWindowMapping:
+        """Return the before/after window around slow frame i as slice views (same values as _build_frame_window_mapping)."""
+        i0 = int(i)
+        b = max(1, int(before_f))
+        a = max(1, int(after_f))
+        n_slow = self.n
+        if n_slow <= 0:
+            iL = 0
+            iR = 0
+            sl = slice(0, 0)
+        else:
+            iL = max(0, i0 - b)
+            iR = min(n_slow - 1, i0 + a)
+            if iR < iL:
+                iR = iL
+            sl = slice(int(iL), int(iR) + 1)
+        idxs = self.idxs[sl]
+        return FrameWindowMapping(
+            i=i0,
+            before_f=b,
+            after_f=a,
+            iL=int(iL),
+            iR=int(iR),
+            idxs=idxs,
+            offsets=idxs - i0,
+            t_slow=self.t_slow[sl],
+            fast_idx=self.fast_idx[sl],
+            t_fast=self.t_fast[sl],
+        )
 
 
 @dataclass
@@ -388,6 +552,7 @@ class HudRendererState:
     helpers: dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=128)
 def _load_hud_font(sz: int) -> Any:
     try:
         from PIL import ImageFont
@@ -484,6 +649,8 @@ def _log_print(msg: str, log_file: Path | None) -> None:
         pass
 
     # Immer in die Konsole UND wenn möglich ins Log schreiben.
+    # Konsole immer sofort flushen (UI/Pipe liest live mit); nur die Datei geht ueber den gepufferten Render-Sink.
+    urgent = is_urgent_line(msg_s)
     try:
         print(msg_s, flush=True)
     except Exception:
@@ -491,13 +658,29 @@ def _log_print(msg: str, log_file: Path | None) -> None:
     if log_file is None:
         return
     try:
-        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(msg_s.rstrip("\n") + "\n")
+        append_log_line(log_file, msg_s, urgent=urgent)
     except Exception:
         pass
 
 
+def _report_render_log(log_file: Path | None) -> dict[str, Any]:
+    """Log render log volume / write time and return the stats for the render_done event."""
+    if log_file is None:
+        return {}
+    try:
+        sink = get_render_log(log_file)
+        sink.flush(timeout=2.0)
+        st = sink.stats()
+        _log_print(
+            f"[log] lines={st['lines']} bytes={st['bytes']} flushes={st['flushes']} "
+            f"write_ms={float(st['write_ms']):.1f} max_queue={st['max_queue']}",
+            log_file,
+        )
+        return {k: v for k, v in st.items() if k != "path"}
+    except Exception:
+        return {}
+
+
 def _force_strictly_increasing(xs: list[float], eps: float = 1e-9) -> list[float]:
     out: list[float] = []
     prev = None
@@ -1972,6 +2155,83 @@ def _compute_common_cut_by_fast_time(
     return int(i0), int(i1)
 
 
+def _int_mapping_prefix(values: Sequence[Any], count: int, fallback: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """int() of the first count entries plus a validity mask; entries int() rejects keep the fallback value."""
+    raw = np.asarray(values[:count])
+    if raw.dtype.kind in "iub":
+        return raw.astype(np.int64), np.ones(count, dtype=bool)
+    if raw.dtype.kind != "f":
+        out = fallback[:count].copy()
+        valid = np.zeros(count, dtype=bool)
+        for k, v in enumerate(values[:count]):
+            try:
+                out[k] = int(v)
+                valid[k] = True
+            except Exception:
+                pass
+        return out, valid
+    finite = np.isfinite(raw)
+    return np.where(finite, np.trunc(np.where(finite, raw, 0.0)), fallback[:count]).astype(np.int64), finite
+
+
+def _float_mapping_prefix(values: Sequence[Any], count: int, fallback: np.ndarray) -> np.ndarray:
+    """float() of the first count entries; entries float() rejects keep the fallback value."""
+    raw = np.asarray(values[:count])
+    if raw.dtype.kind in "iubf":
+        return raw.astype(np.float64)
+    out = fallback[:count].copy()
+    for k, v in enumerate(values[:count]):
+        try:
+            out[k] = float(v)
+        except Exception:
+            pass
+    return out
+
+
+def _precompute_frame_mapping(
+    *,
+    fps: float,
+    slow_frame_count: int,
+    fast_frame_count: int,
+    slow_to_fast_frame: list[int] | None,
+    slow_frame_to_fast_time_s: list[float] | None,
+) -> FrameMappingArrays:
+    """Vectorized form of the per-index mapping rules used by the scroll HUDs."""
+    fps_safe = float(fps) if float(fps) > 1e-6 else 30.0
+    n_slow = max(0, int(slow_frame_count))
+    idxs = np.arange(n_slow, dtype=np.int64)
+
+    raw_fast = idxs.copy()
+    n_map = min(n_slow, len(slow_to_fast_frame)) if slow_to_fast_frame else 0
+    map_valid = np.zeros(0, dtype=bool)
+    if n_map > 0:
+        raw_fast[:n_map], map_valid = _int_mapping_prefix(slow_to_fast_frame, n_map, idxs)
+    fast_idx = np.maximum(raw_fast, 0)
+    if int(fast_frame_count) > 0:
+        fast_idx = np.minimum(fast_idx, int(fast_frame_count) - 1)
+    # Throttle/Brake-Variante: gueltig gemappte Indizes nur nach unten begrenzen.
+    tb_fast_idx = fast_idx.copy()
+    if n_map > 0:
+        tb_fast_idx[:n_map] = np.where(map_valid, np.maximum(raw_fast[:n_map], 0), fast_idx[:n_map])
+
+    t_slow = idxs.astype(np.float64) / float(fps_safe)
+    t_fast = fast_idx.astype(np.float64) / float(fps_safe)
+    n_tf = min(n_slow, len(slow_frame_to_fast_time_s)) if slow_frame_to_fast_time_s else 0
+    if n_tf > 0:
+        t_fast[:n_tf] = _float_mapping_prefix(slow_frame_to_fast_time_s, n_tf, t_fast)
+
+    for arr in (idxs, t_slow, fast_idx, tb_fast_idx, t_fast):
+        arr.flags.writeable = False
+    return FrameMappingArrays(
+        fps=float(fps_safe),
+        idxs=idxs,
+        t_slow=t_slow,
+        fast_idx=fast_idx,
+        tb_fast_idx=tb_fast_idx,
+        t_fast=t_fast,
+    )
+
+
 def _build_frame_window_mapping(
     *,
     i: int,
@@ -2056,6 +2316,77 @@ def _build_frame_window_mapping(
     )
 
 
+def _extra_lap_values(lap_series: Sequence[float] | None, time_s: np.ndarray, fps: float) -> np.ndarray | None:
+    """Sample a per-frame series of an extra lap at the given lap times (linear, clamped to the series)."""
+    if not lap_series or len(lap_series) < 1:
+        return None
+    vals = np.asarray(lap_series, dtype=np.float64)
+    pos = np.clip(time_s * float(fps), 0.0, float(len(vals) - 1))
+    return np.interp(pos, np.arange(len(vals), dtype=np.float64), vals)
+
+
+def _draw_extra_lap_traces(
+    dr: Any,
+    *,
+    hud_key: str,
+    x0: int,
+    y0: int,
+    w: int,
+    layout: dict[str, Any],
+    helpers: dict[str, Any],
+    i: int,
+    before_f: int,
+    after_f: int,
+    i_lo: int,
+    i_hi: int,
+    laps: Sequence[HudExtraLap],
+    fps: float,
+    steer_abs_max: float,
+) -> None:
+    """Draw the curves of the extra laps of a multi-lap render over a Steering or Throttle / Brake HUD."""
+    try:
+        marker_xf = float(layout["marker_xf"])
+        half_w = max(1.0, float(layout["half_w"]))
+    except Exception:
+        return
+    # Jede zweite Spalte reicht fuer die Zusatzkurven (dieselbe Fenster-Abbildung wie die Slow/Fast-Spalten).
+    xs = np.unique(np.append(np.arange(0, int(w), 2), int(w) - 1))
+    frac = np.clip((xs.astype(np.float64) - marker_xf) / half_w, -1.0, 1.0)
+    off_f = np.where(frac <= 0.0, frac * float(before_f), frac * float(after_f))
+    idx = np.clip(np.rint(float(i) + off_f), int(i_lo), int(i_hi)).astype(np.int64)
+    px = xs + int(x0)
+    for k, lap in enumerate(laps):
+        tmap = lap.slow_frame_to_time_s
+        if not tmap:
+            continue
+        t = np.asarray(tmap, dtype=np.float64)[np.clip(idx, 0, len(tmap) - 1)]
+        col = COL_EXTRA_LAPS[k % len(COL_EXTRA_LAPS)]
+        curves: list[tuple[np.ndarray, int]] = []
+        if hud_key == "Steering":
+            v = _extra_lap_values(lap.steer_frames, t, fps)
+            if v is None:
+                continue
+            sn = np.clip(v / max(1e-6, float(steer_abs_max)), -1.0, 1.0)
+            mid_y = float(helpers.get("st_mid_y", 0.0))
+            amp = np.where(sn >= 0.0, float(helpers.get("st_amp_pos", 0.0)), float(helpers.get("st_amp_neg", 0.0)))
+            curves.append((np.rint(mid_y - sn * amp), 2))
+        else:
+            y_from_01 = layout.get("y_from_01")
+            if not callable(y_from_01):
+                return
+            for series, width in ((lap.throttle_frames, 2), (lap.brake_frames, 1)):
+                v = _extra_lap_values(series, t, fps)
+                if v is not None:
+                    curves.append((np.asarray([float(y_from_01(float(vv))) for vv in v]), width))
+        for ys, width in curves:
+            pts = list(zip(px.tolist(), (ys + int(y0)).astype(np.int64).tolist()))
+            if len(pts) >= 2:
+                try:
+                    dr.line(pts, fill=col, width=int(width))
+                except Exception:
+                    pass
+
+
 def _build_hud_context(
     *,
     fps: float,
@@ -2085,6 +2416,164 @@ def _build_hud_context(
     )
 
 
+_HUD_RENDERER_FINGERPRINT: str | None = None
+
+
+def _hud_renderer_fingerprint() -> str:
+    """Size+mtime of the HUD renderer sources, so code changes invalidate cached HUD layers."""
+    global _HUD_RENDERER_FINGERPRINT
+    if _HUD_RENDERER_FINGERPRINT is not None:
+        return _HUD_RENDERER_FINGERPRINT
+    parts: list[str] = []
+    try:
+        here = Path(__file__).resolve()
+        for src in [here, *sorted((here.parent / "huds").glob("*.py"))]:
+            st = src.stat()
+            parts.append(f"{src.name}:{int(st.st_size)}:{int(st.st_mtime_ns)}")
+    except Exception:
+        pass
+    _HUD_RENDERER_FINGERPRINT = "|".join(parts)
+    return _HUD_RENDERER_FINGERPRINT
+
+
+def _hud_layer_key(ctx: HudContext, hud_size: tuple[int, int], *, full_redraw: bool) -> str:
+    """Fingerprint of everything that determines the HUD pixels (inputs, layout, signals, renderer)."""
+    fp = HudLayerFingerprint()
+    fp.add("renderer", _hud_renderer_fingerprint())
+    fp.add("frame", [float(ctx.fps), int(ctx.cut_i0), int(ctx.cut_i1), int(hud_size[0]), int(hud_size[1]), bool(full_redraw)])
+    if ctx.scale_range is not None:
+        fp.add("scale_range", [int(v) for v in ctx.scale_range])
+    if ctx.warm_start:
+        fp.add("warm_start", True)
+    fp.add("geom", repr(ctx.geom))
+    fp.add("hud_enabled", ctx.hud_enabled)
+    fp.add("hud_boxes", ctx.hud_boxes)
+    fp.add("window", [ctx.window.before_s, ctx.window.after_s, ctx.window.hud_name, ctx.window.hud_windows])
+    fp.add("settings", repr(ctx.settings))
+    for name in _SYNC_TYPECODES:
+        fp.add(name, getattr(ctx.sync, name))
+    for name in _SIGNAL_TYPECODES:
+        fp.add(name, getattr(ctx.signals, name))
+    fp.add("y_abs", [ctx.signals.line_delta_y_abs_m, ctx.signals.under_oversteer_y_abs])
+    for k, lap in enumerate(ctx.signals.extra_laps):
+        fp.add(f"extra_lap{k}", lap.name)
+        for name in _EXTRA_LAP_TYPECODES:
+            fp.add(f"extra_lap{k}.{name}", getattr(lap, name))
+    # HUD-Debug-/Tuning-Variablen beeinflussen die Pixel ebenfalls.
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if (k.startswith("IRVC_HUD") or k.startswith("RVA_HUD")) and not k.startswith("IRVC_HUD_LAYER_CACHE")
+    }
+    fp.add("env", env)
+    return fp.hexdigest()
+
+
+class _HudLayerSession:
+    """HUD layer cache state for one HUD stream (full render or one cut segment)."""
+
+    def __init__(self, ctx: HudContext | None, hud_size: tuple[int, int], *, full_redraw: bool = False) -> None:
+        self.ctx = ctx
+        self.size = (int(hud_size[0]), int(hud_size[1]))
+        self.key: str | None = None
+        self.cached_path: Path | None = None
+        self.writer: Any | None = None
+        self.frames = max(0, int(ctx.cut_i1) - int(ctx.cut_i0)) if ctx is not None else 0
+        if ctx is None or not hud_layer_cache_enabled():
+            return
+        try:
+            self.key = _hud_layer_key(ctx, self.size, full_redraw=bool(full_redraw))
+            self.cached_path = get_hud_layer_cache().lookup(self.key, size=self.size, frames=self.frames)
+        except Exception as e:
+            self.key = None
+            self.cached_path = None
+            _log_print(f"[hudpy] layer-cache disabled: {type(e).__name__}: {e}", ctx.log_file)
+            return
+        if self.cached_path is not None:
+            _log_print(f"[hudpy] layer-cache hit key={self.key[:12]} frames={self.frames} -> {self.cached_path.name}", ctx.log_file)
+        else:
+            _log_print(f"[hudpy] layer-cache miss key={self.key[:12]} frames={self.frames}", ctx.log_file)
+
+    @property
+    def needs_stream(self) -> bool:
+        """Return whether the HUD has to be rendered in Python and streamed via stdin."""
+        return self.ctx is not None and self.cached_path is None
+
+    def start(self) -> None:
+        """Start recording the streamed HUD frames into the cache (miss only)."""
+        if self.key is None or self.cached_path is not None or self.ctx is None:
+            return
+        self.writer = get_hud_layer_cache().writer(self.key, size=self.size, fps=float(self.ctx.fps))
+
+    def write(self, frame_bytes: bytes) -> None:
+        if self.writer is not None:
+            self.writer.write(frame_bytes)
+
+    def finish(self, frames_written: int) -> None:
+        """Publish the recorded layer if the stream was complete."""
+        writer = self.writer
+        self.writer = None
+        if writer is None or self.ctx is None:
+            return
+        path = writer.finish(complete=int(frames_written) >= int(self.frames) > 0)
+        if path is not None:
+            _log_print(f"[hudpy] layer-cache stored frames={writer.frames} -> {path.name}", self.ctx.log_file)
+
+
+def _prerender_hud_layer(ctx: HudContext, hud_size: tuple[int, int], *, tmp_dir: Path) -> tuple[Path, bool]:
+    """
+    Rendert den HUD-Stream eines weiteren Multi-Output-Ziels vorab als FFV1-Layer.
+    Liefert (Pfad, temporaer); ohne aktiven Layer-Cache landet die Datei in tmp_dir.
+    """
+    session = _HudLayerSession(ctx, hud_size)
+    if session.cached_path is not None:
+        return session.cached_path, False
+    if session.key is not None:
+        cache = get_hud_layer_cache()
+        key = session.key
+    else:
+        cache = HudLayerCache(tmp_dir)
+        key = _hud_layer_key(ctx, session.size, full_redraw=False)
+    writer = cache.writer(key, size=session.size, fps=float(ctx.fps))
+    if writer is None:
+        raise RuntimeError("multi-output: HUD layer writer could not be started.")
+    expected_bytes = int(session.size[0]) * int(session.size[1]) * 4
+    written = {"n": 0}
+
+    def _write_frame_rgba(frame_bytes: bytes) -> None:
+        if len(frame_bytes) != expected_bytes:
+            raise RuntimeError(
+                f"HUD stream frame size mismatch: expected {expected_bytes} bytes, got {len(frame_bytes)}"
+            )
+        writer.write(frame_bytes)
+
+    def _on_frame_written(n: int, _total: int) -> None:
+        written["n"] = int(n)
+
+    path: Path | None = None
+    try:
+        _render_hud_scroll_frames_png(ctx, frame_writer=_write_frame_rgba, frame_written_cb=_on_frame_written)
+    finally:
+        path = writer.finish(complete=int(written["n"]) >= int(session.frames) > 0)
+    if path is None:
+        raise RuntimeError("multi-output: HUD layer could not be written.")
+    _log_print(
+        f"[hudpy] multi-output layer {session.size[0]}x{session.size[1]} frames={written['n']} -> {path.name}",
+        ctx.log_file,
+    )
+    return path, session.key is None
+
+
+def _scroll_phase_after(shift_px_per_frame: float, steps: int) -> float:
+    """Subpixel scroll phase after steps incremental frames from a full redraw (same arithmetic as the render loop)."""
+    pos = 0.0
+    for _ in range(max(0, int(steps))):
+        pos += float(shift_px_per_frame)
+        if pos >= 1.0:
+            pos -= float(int(math.floor(pos)))
+    return pos
+
+
 def _render_hud_scroll_frames_png(
     ctx: HudContext,
     *,
@@ -2098,6 +2587,7 @@ def _render_hud_scroll_frames_png(
     fps = float(ctx.fps)
     cut_i0 = int(ctx.cut_i0)
     cut_i1 = int(ctx.cut_i1)
+    scale_i0, scale_i1 = ctx.scale_range if ctx.scale_range is not None else (cut_i0, cut_i1)
     geom = ctx.geom
     hud_enabled = ctx.hud_enabled
     hud_boxes = ctx.hud_boxes
@@ -2128,6 +2618,7 @@ def _render_hud_scroll_frames_png(
     under_oversteer_slow_frames = ctx.signals.under_oversteer_slow_frames
     under_oversteer_fast_frames = ctx.signals.under_oversteer_fast_frames
     under_oversteer_y_abs = ctx.signals.under_oversteer_y_abs
+    extra_laps = tuple(ctx.signals.extra_laps or ())
 
     before_s = float(ctx.window.before_s)
     after_s = float(ctx.window.after_s)
@@ -2288,53 +2779,63 @@ def _render_hud_scroll_frames_png(
     if every_n < 1:
         every_n = 1
 
-    def _speed_to_units(frames_ms: list[float] | None) -> list[float]:
-        if not frames_ms:
-            return []
-        out: list[float] = []
-        for v in frames_ms:
-            try:
-                out.append(float(v) * float(speed_factor))
-            except Exception:
-                out.append(0.0)
-        return out
+    derived = ctx.signals.derived
 
-    def _hold_every_n(frames_u: list[float] | None) -> list[float]:
-        if not frames_u:
+    def _speed_hold_units(frames_ms: Sequence[float] | None) -> Sequence[float]:
+        # Einheiten umrechnen + alle N Frames halten, vektorisiert auf der kompakten Reihe.
+        if not frames_ms:
             return []
-        out: list[float] = []
-        last = float(frames_u[0])
-        for idx, v in enumerate(frames_u):
-            if idx % every_n == 0:
+        try:
+            vals = frames_view(frames_ms).astype(np.float64) * float(speed_factor)
+        except Exception:
+            raw: list[float] = []
+            for v in frames_ms:
                 try:
-                    last = float(v)
+                    raw.append(float(v) * float(speed_factor))
                 except Exception:
-                    pass
-            out.append(float(last))
+                    raw.append(0.0)
+            vals = np.asarray(raw, dtype=np.float64)
+        held = vals[(np.arange(vals.size) // every_n) * every_n]
+        return frames_from_numpy(held, "d")
+
+    def _derived_speed(name: str, frames_ms: Sequence[float] | None) -> Sequence[float]:
+        key = ("speed_u", name, float(speed_factor), int(every_n))
+        out = derived.get(key)
+        if out is None:
+            out = _speed_hold_units(frames_ms)
+            derived[key] = out
         return out
 
-    slow_speed_u = _hold_every_n(_speed_to_units(slow_speed_frames))
-    fast_speed_u = _hold_every_n(_speed_to_units(fast_speed_frames))
-    slow_min_u = _hold_every_n(_speed_to_units(slow_min_speed_frames))
-    fast_min_u = _hold_every_n(_speed_to_units(fast_min_speed_frames))
+    slow_speed_u = _derived_speed("slow", slow_speed_frames)
+    fast_speed_u = _derived_speed("fast", fast_speed_frames)
+    slow_min_u = _derived_speed("slow_min", slow_min_speed_frames)
+    fast_min_u = _derived_speed("fast_min", fast_min_speed_frames)
     speed_max_peak_threshold_u = 5.0
-    slow_max_u = build_confirmed_max_speed_display(slow_speed_u, threshold=float(speed_max_peak_threshold_u))
-    fast_max_u = build_confirmed_max_speed_display(fast_speed_u, threshold=float(speed_max_peak_threshold_u))
+    max_key = ("speed_max_u", float(speed_factor), int(every_n), float(speed_max_peak_threshold_u))
+    if max_key not in derived:
+        derived[max_key] = (
+            build_confirmed_max_speed_display(slow_speed_u, threshold=float(speed_max_peak_threshold_u)),
+            build_confirmed_max_speed_display(fast_speed_u, threshold=float(speed_max_peak_threshold_u)),
+        )
+    slow_max_u, fast_max_u = derived[max_key]
     speed_axis_min_u = 0.0
     speed_axis_max_u = 1.0
     try:
         vmax = 0.0
-        for arr in (slow_speed_u, fast_speed_u, slow_min_u, fast_min_u, slow_max_u, fast_max_u):
+        for arr in (slow_speed_u, fast_speed_u, slow_min_u, fast_min_u):
             if not arr:
                 continue
-            for vv in arr:
+            av = frames_view(arr)
+            av = av[np.isfinite(av)]
+            if av.size:
+                vmax = max(vmax, float(av.max()))
+        for arr in (slow_max_u, fast_max_u):
+            for vv in arr or []:
                 try:
                     fv = float(vv)
                 except Exception:
                     continue
-                if not math.isfinite(fv):
-                    continue
-                if fv > vmax:
+                if math.isfinite(fv) and fv > vmax:
                     vmax = fv
         speed_axis_max_u = max(1.0, float(vmax))
     except Exception:
@@ -2353,27 +2854,47 @@ def _render_hud_scroll_frames_png(
     if gr_every_n < 1:
         gr_every_n = 1
 
-    def _hold_every_n_int(frames_any: list[Any] | None, every_n_local: int) -> list[int]:
+    def _hold_every_n_int(frames_any: Sequence[Any] | None, every_n_local: int) -> Sequence[int]:
         if not frames_any:
             return []
-        out_i: list[int] = []
-        last_i = 0
-        for idx, v in enumerate(frames_any):
-            if idx % every_n_local == 0:
-                try:
-                    last_i = int(v)
-                except Exception:
+        try:
+            vals = frames_view(frames_any).astype(np.float64)
+        except Exception:
+            vals = None
+        if vals is None or vals.ndim != 1:
+            out_i: list[int] = []
+            last_i = 0
+            for idx, v in enumerate(frames_any):
+                if idx % every_n_local == 0:
                     try:
-                        last_i = int(round(float(v)))
+                        last_i = int(v)
                     except Exception:
-                        pass
-            out_i.append(int(last_i))
-        return out_i
+                        try:
+                            last_i = int(round(float(v)))
+                        except Exception:
+                            pass
+                out_i.append(int(last_i))
+            return out_i
+        # Nur jeder N-te Frame ist ein Stuetzwert; nicht-endliche Stuetzwerte halten den letzten gueltigen (Start 0).
+        samples = vals[::every_n_local]
+        finite = np.isfinite(samples)
+        pos = np.where(finite, np.arange(samples.size), -1)
+        np.maximum.accumulate(pos, out=pos)
+        held = np.where(pos >= 0, np.trunc(np.where(finite, samples, 0.0))[np.maximum(pos, 0)], 0.0)
+        return frames_from_numpy(np.repeat(held, every_n_local)[: vals.size], "i")
+
+    def _derived_hold_int(name: str, frames_any: Sequence[Any] | None) -> Sequence[int]:
+        key = ("hold_int", name, int(gr_every_n))
+        out = derived.get(key)
+        if out is None:
+            out = _hold_every_n_int(frames_any, gr_every_n)
+            derived[key] = out
+        return out
 
-    slow_gear_h = _hold_every_n_int(slow_gear_frames, gr_every_n)
-    fast_gear_h = _hold_every_n_int(fast_gear_frames, gr_every_n)
-    slow_rpm_h = _hold_every_n_int(slow_rpm_frames, gr_every_n)
-    fast_rpm_h = _hold_every_n_int(fast_rpm_frames, gr_every_n)
+    slow_gear_h = _derived_hold_int("slow_gear", slow_gear_frames)
+    fast_gear_h = _derived_hold_int("fast_gear", fast_gear_frames)
+    slow_rpm_h = _derived_hold_int("slow_rpm", slow_rpm_frames)
+    fast_rpm_h = _derived_hold_int("fast_rpm", fast_rpm_frames)
 
     # Scroll-HUDs + Table-HUDs getrennt behandeln
     scroll_boxes_abs = [(n, b) for (n, b) in boxes_abs if n in _SCROLL_HUD_NAMES]
@@ -2471,6 +2992,15 @@ def _render_hud_scroll_frames_png(
     if frames <= 0:
         _log_print("[hudpy] frames <= 0", log_file)
         return None
+    # Vorlauf fuer Chunks: ein Scroll-Fenster plus 1 s (ABS-Entprellung, Max-Brake), nur gerendert, nicht ausgegeben.
+    # Nach dem Vorlauf stammt jede sichtbare Spalte aus inkrementellen Updates wie im durchgehenden Render.
+    warmup_frames = 0
+    if bool(ctx.warm_start):
+        warm_window_f = max(
+            1, int(round(max(float(effective_before_s), float(effective_after_s), 1e-6) * r))
+        )
+        warmup_frames = max(0, min(int(cut_i0) - int(scale_i0), 2 * int(warm_window_f) + 1 + int(round(r))))
+        _log_print(f"[hudpy] warm start: {warmup_frames} frames vor {int(cut_i0)}", log_file)
 
     fast_frame_count = 0
     try:
@@ -2547,6 +3077,11 @@ def _render_hud_scroll_frames_png(
                         m = ax
                 except Exception:
                     pass
+        for lap in extra_laps:
+            for x in lap.steer_frames or ():
+                v = float(x)
+                if v == v and abs(v) > m:
+                    m = abs(v)
 
         steer_abs_raw = float(m)
 
@@ -2569,8 +3104,8 @@ def _render_hud_scroll_frames_png(
     delta_max_s = 0.0
     try:
         fps_safe = float(fps) if float(fps) > 0.1 else 30.0
-        i0 = max(0, int(cut_i0))
-        i1 = min(len(slow_frame_to_lapdist), int(cut_i1))
+        i0 = max(0, int(scale_i0))
+        i1 = min(len(slow_frame_to_lapdist), int(scale_i1))
 
         # bevorzugt: glatte Fast-Zeit (interp aus Sync-Map)
         if slow_frame_to_fast_time_s:
@@ -2649,8 +3184,8 @@ def _render_hud_scroll_frames_png(
     try:
         fps_safe = float(r) if float(r) > 0.1 else 30.0
         if slow_frame_to_fast_time_s:
-            i0 = max(0, int(cut_i0))
-            i1 = min(len(slow_frame_to_fast_time_s), int(cut_i1))
+            i0 = max(0, int(scale_i0))
+            i1 = min(len(slow_frame_to_fast_time_s), int(scale_i1))
             for ii in range(i0, i1):
                 slow_t = float(ii) / fps_safe
                 fast_t = float(slow_frame_to_fast_time_s[ii])
@@ -2820,6 +3355,8 @@ def _render_hud_scroll_frames_png(
             try:
                 # PERF: composite (no separate value_layer allocation)
                 value_dr_local = ImageDraw.Draw(composed_local)
+                if prof_on:
+                    draw_values_fn_local = hud_prof.timed(PHASE_VALUES, draw_values_fn_local)
                 draw_values_fn_local(value_dr_local, 0, 0)
             except Exception:
                 pass
@@ -2885,8 +3422,24 @@ def _render_hud_scroll_frames_png(
             return int(hi)
         return int(v)
 
+    # Mapping einmal pro Render vorberechnen; Skalarzugriffe pro Spalte laufen ueber Listen (schneller als ndarray-Items).
+    frame_map = _precompute_frame_mapping(
+        fps=float(r),
+        slow_frame_count=int(slow_frame_count_total),
+        fast_frame_count=int(fast_frame_count),
+        slow_to_fast_frame=slow_to_fast_frame,
+        slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+    )
+    frame_map_n = int(frame_map.n)
+    frame_map_fast_idx = frame_map.fast_idx.tolist()
+    frame_map_tb_fast_idx = frame_map.tb_fast_idx.tolist()
+    frame_map_t_slow = frame_map.t_slow.tolist()
+    frame_map_t_fast = frame_map.t_fast.tolist()
+
     def _mapped_fast_idx_for_slow_idx(idx0: int) -> int:
         ii = int(idx0)
+        if 0 <= ii < frame_map_n:
+            return frame_map_fast_idx[ii]
         fi = int(ii)
         if slow_to_fast_frame and 0 <= int(ii) < int(slow_to_fast_len):
             try:
@@ -2900,10 +3453,15 @@ def _render_hud_scroll_frames_png(
         return int(fi)
 
     def _mapped_t_slow_for_slow_idx(idx0: int) -> float:
-        return float(int(idx0)) / float(fps_mapping_safe)
+        ii = int(idx0)
+        if 0 <= ii < frame_map_n:
+            return frame_map_t_slow[ii]
+        return float(ii) / float(fps_mapping_safe)
 
     def _mapped_t_fast_for_slow_idx(idx0: int) -> float:
         ii = int(idx0)
+        if 0 <= ii < frame_map_n:
+            return frame_map_t_fast[ii]
         fi = _mapped_fast_idx_for_slow_idx(int(ii))
         if slow_to_fast_time_len > 0 and 0 <= int(ii) < int(slow_to_fast_time_len):
             try:
@@ -2914,6 +3472,8 @@ def _render_hud_scroll_frames_png(
 
     def _tb_fast_idx_for_slow_idx(idx0: int) -> int:
         ii = int(idx0)
+        if 0 <= ii < frame_map_n:
+            return frame_map_tb_fast_idx[ii]
         fi = _mapped_fast_idx_for_slow_idx(int(ii))
         if slow_to_fast_frame and 0 <= int(ii) < int(slow_to_fast_len):
             try:
@@ -2924,6 +3484,13 @@ def _render_hud_scroll_frames_png(
                 pass
         return int(fi)
 
+    # IRVC_HUD_PROFILE=1: Zeit pro HUD und Phase; ausgeschaltet bleibt es bei ein paar bool-Abfragen pro Frame.
+    hud_prof = HudRenderProfiler.from_env()
+    prof_on = bool(hud_prof.enabled)
+    if prof_on:
+        _compose_hud_layers_local = hud_prof.timed(PHASE_COMPOSITE, _compose_hud_layers_local)
+        _composite_hud_into_frame_local = hud_prof.timed(PHASE_COMPOSITE, _composite_hud_into_frame_local)
+
     verify_frame_map = (os.environ.get("IRVC_VERIFY_FRAME_MAP") or "0").strip().lower() in ("1", "true", "yes", "on")
     verify_js: set[int] = set()
     if verify_frame_map and int(frames) > 0:
@@ -2935,19 +3502,21 @@ def _render_hud_scroll_frames_png(
         verify_js.add(int(frames) // 2)
         verify_js.add(int(frames) - 1)
 
-    for j in range(frames):
+    for j in range(-int(warmup_frames), frames):
+        if prof_on and j >= 0:
+            hud_prof.begin_frame(j)
 
-        
         i = int(cut_i0) + j
         if i < 0 or i >= len(slow_frame_to_lapdist):
             continue
 
-        force_full_redraw = bool(force_full_redraw_requested and int(j) == 0)
+        force_full_redraw = bool(force_full_redraw_requested and int(j) == -int(warmup_frames))
         if force_full_redraw:
             _log_print("[cut] HUD full redraw at segment start", log_file)
 
         img = Image.new("RGBA", (int(hud_stream_w), int(hud_stream_h)), (0, 0, 0, 0))
         dr = ImageDraw.Draw(img)
+        extra_trace_jobs: list[dict[str, Any]] = []
 
         ld = float(slow_frame_to_lapdist[i]) % 1.0
         ld_mod = ld % step
@@ -2969,6 +3538,10 @@ def _render_hud_scroll_frames_png(
             n_dbg = int(len(idxs_dbg))
             if not (int(len(ts_dbg)) == n_dbg and int(len(fi_dbg)) == n_dbg and int(len(tf_dbg)) == n_dbg):
                 raise AssertionError(f"[verify-map] inconsistent old mapping lengths at j={int(j)} i={int(i)}")
+            win_dbg = frame_map.window(int(i), int(global_before_f), int(global_after_f))
+            for field_dbg in ("idxs", "offsets", "t_slow", "fast_idx", "t_fast"):
+                if list(getattr(old_map_dbg, field_dbg)) != getattr(win_dbg, field_dbg).tolist():
+                    raise AssertionError(f"[verify-map] window array mismatch field={field_dbg} j={int(j)} i={int(i)}")
             for k_dbg in range(n_dbg):
                 idx_dbg = int(idxs_dbg[k_dbg])
                 fi_old = int(fi_dbg[k_dbg])
@@ -2996,6 +3569,8 @@ def _render_hud_scroll_frames_png(
                 fi = 0
 
             for hud_key, x0, y0, w, h in active_table_items:
+                if prof_on:
+                    hud_prof.hud(hud_key, PHASE_VALUES)
                 try:
                     hud_state_key = f"{str(hud_key)}|{int(x0)}|{int(y0)}|{int(w)}|{int(h)}"
                     renderer_state = renderer_state_by_hud.get(hud_state_key)
@@ -3073,7 +3648,9 @@ def _render_hud_scroll_frames_png(
                                 speed_state = None
                             speed_static = None
                             if speed_state is not None:
-                                speed_static = render_speed_table_static(speed_state, COL_SLOW_DARKRED, COL_FAST_DARKBLUE)
+                                speed_static = hud_prof.call(
+                                    PHASE_STATIC, render_speed_table_static, speed_state, COL_SLOW_DARKRED, COL_FAST_DARKBLUE
+                                )
                                 table_cache["table_state"] = speed_state
                                 table_cache["static_image"] = speed_static
                                 if table_cache_dbg:
@@ -3126,7 +3703,9 @@ def _render_hud_scroll_frames_png(
                                 gear_state = None
                             gear_static = None
                             if gear_state is not None:
-                                gear_static = render_gear_rpm_table_static(gear_state, COL_SLOW_DARKRED, COL_FAST_DARKBLUE)
+                                gear_static = hud_prof.call(
+                                    PHASE_STATIC, render_gear_rpm_table_static, gear_state, COL_SLOW_DARKRED, COL_FAST_DARKBLUE
+                                )
                                 table_cache["table_state"] = gear_state
                                 table_cache["static_image"] = gear_static
                                 if table_cache_dbg:
@@ -3156,6 +3735,8 @@ def _render_hud_scroll_frames_png(
 
         # Wir zeichnen alle Scroll-HUDs in dieses eine Bild.
         for hud_key, x0, y0, w, h in active_scroll_items:
+            if prof_on:
+                hud_prof.hud(hud_key, PHASE_PREP)
             try:
                 before_s_h, after_s_h = _resolve_hud_window_seconds(str(hud_key))
                 before_f = max(1, int(round(before_s_h * r)))
@@ -3207,6 +3788,21 @@ def _render_hud_scroll_frames_png(
                 is_delta = str(hud_key) == "Delta"
                 is_line_delta = str(hud_key) == "Line Delta"
                 is_under_oversteer = str(hud_key) == "Under-/Oversteer"
+                if extra_laps and (is_steering or is_throttle_brake):
+                    # Zusatzrunden werden nach allen Scroll-HUDs gezeichnet (Layout steht dann fest).
+                    extra_trace_jobs.append(
+                        {
+                            "hud_key": str(hud_key),
+                            "x0": int(x0),
+                            "y0": int(y0),
+                            "w": int(w),
+                            "renderer_state": renderer_state,
+                            "before_f": int(before_f),
+                            "after_f": int(after_f),
+                            "i_lo": int(iL),
+                            "i_hi": int(iR),
+                        }
+                    )
                 tb_layout: dict[str, Any] = {}
                 tb_seconds_per_col = 0.0
                 tb_abs_window_s = 0.0
@@ -4745,7 +5341,7 @@ def _render_hud_scroll_frames_png(
                     else:
                         ld_layout = dict(renderer_state.layout.get("ld") or {})
 
-                    ld_vals = line_delta_m_frames if isinstance(line_delta_m_frames, list) else []
+                    ld_vals = line_delta_m_frames if is_frame_series(line_delta_m_frames) else []
                     ld_n_vals = len(ld_vals)
 
                     ld_y_abs = 0.0
@@ -5022,8 +5618,8 @@ def _render_hud_scroll_frames_png(
                     else:
                         uo_layout = dict(renderer_state.layout.get("uo") or {})
 
-                    uo_slow_vals = under_oversteer_slow_frames if isinstance(under_oversteer_slow_frames, list) else []
-                    uo_fast_vals = under_oversteer_fast_frames if isinstance(under_oversteer_fast_frames, list) else []
+                    uo_slow_vals = under_oversteer_slow_frames if is_frame_series(under_oversteer_slow_frames) else []
+                    uo_fast_vals = under_oversteer_fast_frames if is_frame_series(under_oversteer_fast_frames) else []
                     uo_n_slow = len(uo_slow_vals)
                     uo_n_fast = len(uo_fast_vals)
 
@@ -5303,7 +5899,7 @@ def _render_hud_scroll_frames_png(
                             "scroll_pos_px": scroll_pos_px_local,
                             "scroll_shift_int": shift_int_local,
                             "right_edge_cols": right_edge_cols_local,
-                            "frame_window_mapping": None,
+                            "frame_window_mapping": frame_map.window(int(i), int(before_f), int(after_f)),
                             "fps": fps,
                             "_idx_to_x": _idx_to_x_local,
                             "_clamp": _clamp,
@@ -5340,7 +5936,7 @@ def _render_hud_scroll_frames_png(
                             "scroll_pos_px": scroll_pos_px_local,
                             "scroll_shift_int": shift_int_local,
                             "right_edge_cols": right_edge_cols_local,
-                            "frame_window_mapping": None,
+                            "frame_window_mapping": frame_map.window(int(i), int(before_f), int(after_f)),
                             "mx": mx_local,
                             "_idx_to_x": _idx_to_x_local,
                             "slow_frame_to_fast_time_s": slow_frame_to_fast_time_s,
@@ -5369,7 +5965,7 @@ def _render_hud_scroll_frames_png(
                             "scroll_pos_px": scroll_pos_px_local,
                             "scroll_shift_int": shift_int_local,
                             "right_edge_cols": right_edge_cols_local,
-                            "frame_window_mapping": None,
+                            "frame_window_mapping": frame_map.window(int(i), int(before_f), int(after_f)),
                             "slow_to_fast_frame": slow_to_fast_frame,
                             "slow_steer_frames": slow_steer_frames,
                             "fast_steer_frames": fast_steer_frames,
@@ -5413,7 +6009,7 @@ def _render_hud_scroll_frames_png(
                             "scroll_pos_px": scroll_pos_px_local,
                             "scroll_shift_int": shift_int_local,
                             "right_edge_cols": right_edge_cols_local,
-                            "frame_window_mapping": None,
+                            "frame_window_mapping": frame_map.window(int(i), int(before_f), int(after_f)),
                             "line_delta_m_frames": line_delta_m_frames,
                             "line_delta_y_abs_m": line_delta_y_abs_m,
                             "COL_WHITE": COL_WHITE,
@@ -5432,7 +6028,7 @@ def _render_hud_scroll_frames_png(
                             "scroll_pos_px": scroll_pos_px_local,
                             "scroll_shift_int": shift_int_local,
                             "right_edge_cols": right_edge_cols_local,
-                            "frame_window_mapping": None,
+                            "frame_window_mapping": frame_map.window(int(i), int(before_f), int(after_f)),
                             "under_oversteer_slow_frames": under_oversteer_slow_frames,
                             "under_oversteer_fast_frames": under_oversteer_fast_frames,
                             "under_oversteer_y_abs": under_oversteer_y_abs,
@@ -5512,8 +6108,8 @@ def _render_hud_scroll_frames_png(
                     if is_throttle_brake:
                         renderer_state.helpers.pop("tb_max_brake_states", None)
                         renderer_state.helpers.pop("tb_max_brake_last_idx", None)
-                        static_layer = _tb_render_static_layer()
-                        dynamic_layer, tb_cols_fill, tb_abs_state_fill = _tb_render_dynamic_full()
+                        static_layer = hud_prof.call(PHASE_STATIC, _tb_render_static_layer)
+                        dynamic_layer, tb_cols_fill, tb_abs_state_fill = hud_prof.call(PHASE_FULL_REDRAW, _tb_render_dynamic_full)
                         tb_last_col_fill = tb_cols_fill[-1] if tb_cols_fill else _tb_sample_column(int(w) - 1)
                         right_sample_now = int(tb_last_col_fill["slow_idx"]) if tb_last_col_fill is not None else _right_edge_sample_idx()
                         scroll_state_by_hud[hud_state_key] = {
@@ -5540,8 +6136,8 @@ def _render_hud_scroll_frames_png(
                         hud_layer = _compose_hud_layers_local(int(w), int(h), static_layer, dynamic_layer, _tb_draw_values_overlay)
                         _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
                     elif is_steering:
-                        static_layer = _st_render_static_layer()
-                        dynamic_layer, st_cols_fill = _st_render_dynamic_full()
+                        static_layer = hud_prof.call(PHASE_STATIC, _st_render_static_layer)
+                        dynamic_layer, st_cols_fill = hud_prof.call(PHASE_FULL_REDRAW, _st_render_dynamic_full)
                         st_last_col_fill = st_cols_fill[-1] if st_cols_fill else _st_sample_column(int(w) - 1)
                         right_sample_now = int(st_last_col_fill["slow_idx"]) if st_last_col_fill is not None else _right_edge_sample_idx()
                         scroll_state_by_hud[hud_state_key] = {
@@ -5557,8 +6153,8 @@ def _render_hud_scroll_frames_png(
                         hud_layer = _compose_hud_layers_local(int(w), int(h), static_layer, dynamic_layer, _st_draw_values_overlay)
                         _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
                     elif is_delta:
-                        static_layer = _d_render_static_layer()
-                        dynamic_layer, d_cols_fill = _d_render_dynamic_full()
+                        static_layer = hud_prof.call(PHASE_STATIC, _d_render_static_layer)
+                        dynamic_layer, d_cols_fill = hud_prof.call(PHASE_FULL_REDRAW, _d_render_dynamic_full)
                         d_last_col_fill = d_cols_fill[-1] if d_cols_fill else _d_sample_column(int(w) - 1)
                         right_sample_now = int(d_last_col_fill["slow_idx"]) if d_last_col_fill is not None else _right_edge_sample_idx()
                         d_last_delta = float(d_last_col_fill["delta"]) if d_last_col_fill is not None else 0.0
@@ -5576,8 +6172,8 @@ def _render_hud_scroll_frames_png(
                         hud_layer = _compose_hud_layers_local(int(w), int(h), static_layer, dynamic_layer, _d_draw_values_overlay)
                         _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
                     elif is_line_delta:
-                        static_layer = _ld_render_static_layer()
-                        dynamic_layer, ld_cols_fill = _ld_render_dynamic_full()
+                        static_layer = hud_prof.call(PHASE_STATIC, _ld_render_static_layer)
+                        dynamic_layer, ld_cols_fill = hud_prof.call(PHASE_FULL_REDRAW, _ld_render_dynamic_full)
                         ld_last_col_fill = ld_cols_fill[-1] if ld_cols_fill else _ld_sample_column(int(w) - 1)
                         right_sample_now = int(ld_last_col_fill["slow_idx"]) if ld_last_col_fill is not None else _right_edge_sample_idx()
                         scroll_state_by_hud[hud_state_key] = {
@@ -5592,8 +6188,8 @@ def _render_hud_scroll_frames_png(
                         hud_layer = _compose_hud_layers_local(int(w), int(h), static_layer, dynamic_layer, _ld_draw_values_overlay)
                         _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
                     elif is_under_oversteer:
-                        static_layer = _uo_render_static_layer()
-                        dynamic_layer, uo_cols_fill = _uo_render_dynamic_full()
+                        static_layer = hud_prof.call(PHASE_STATIC, _uo_render_static_layer)
+                        dynamic_layer, uo_cols_fill = hud_prof.call(PHASE_FULL_REDRAW, _uo_render_dynamic_full)
                         uo_last_col_fill = uo_cols_fill[-1] if uo_cols_fill else _uo_sample_column(int(w) - 1)
                         right_sample_now = int(uo_last_col_fill["slow_idx"]) if uo_last_col_fill is not None else _right_edge_sample_idx()
                         scroll_state_by_hud[hud_state_key] = {
@@ -5610,7 +6206,9 @@ def _render_hud_scroll_frames_png(
                         _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
                     else:
                         static_layer = Image.new("RGBA", (int(w), int(h)), (0, 0, 0, 0))
-                        dynamic_layer = _render_scroll_hud_full(
+                        dynamic_layer = hud_prof.call(
+                            PHASE_FULL_REDRAW,
+                            _render_scroll_hud_full,
                             scroll_pos_px_local=0.0,
                             shift_int_local=0,
                             right_edge_cols_local=max(1, int(w)),
@@ -5626,10 +6224,17 @@ def _render_hud_scroll_frames_png(
                         }
                         hud_layer = _compose_hud_layers_local(int(w), int(h), static_layer, dynamic_layer, None)
                         _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
+                    if force_full_redraw and warmup_frames > 0:
+                        # Subpixel-Phase des durchgehenden Renders uebernehmen (dort ab scale_i0 inkrementell).
+                        scroll_state_by_hud[hud_state_key]["scroll_pos_px"] = _scroll_phase_after(
+                            shift_px_per_frame, int(i) - int(scale_i0)
+                        )
                     renderer_state.first_frame = False
                     continue
 
                 renderer_state.first_frame = False
+                if prof_on:
+                    hud_prof.rest_as(PHASE_INCREMENTAL)
                 scroll_pos_px = float(state.get("scroll_pos_px", 0.0))
                 scroll_pos_px += float(shift_px_per_frame)
                 shift_int = 0
@@ -6096,7 +6701,9 @@ def _render_hud_scroll_frames_png(
                     hud_layer = _compose_hud_layers_local(int(w), int(h), static_now, dynamic_next, None)
                     _composite_hud_into_frame_local(img, hud_layer, int(x0), int(y0))
                 else:
-                    hud_full_now = _render_scroll_hud_full(
+                    hud_full_now = hud_prof.call(
+                        PHASE_FULL_REDRAW,
+                        _render_scroll_hud_full,
                         scroll_pos_px_local=scroll_pos_px,
                         shift_int_local=int(shift_int),
                         right_edge_cols_local=int(right_edge_cols),
@@ -6120,7 +6727,23 @@ def _render_hud_scroll_frames_png(
             except Exception:
                 continue
 
+        for job in extra_trace_jobs:
+            job_state = job.pop("renderer_state")
+            _draw_extra_lap_traces(
+                dr,
+                layout=dict(job_state.layout.get("st" if job["hud_key"] == "Steering" else "tb") or {}),
+                helpers=job_state.helpers,
+                i=int(i),
+                laps=extra_laps,
+                fps=float(fps),
+                steer_abs_max=float(steer_abs_max),
+                **job,
+            )
 
+        if prof_on:
+            hud_prof.hud(None)
+        if j < 0:
+            continue
         src_rgba = img if getattr(img, "mode", "") == "RGBA" else img.convert("RGBA")
         if hud_free_mode or preserve_alpha_in_frame_mode:
             rgba_bytes = src_rgba.tobytes()
@@ -6138,6 +6761,23 @@ def _render_hud_scroll_frames_png(
         if hud_dbg and j < 2:
             _log_print(f"[hudpy] sample j={j} ld={ld:.6f} ld_mod={ld_mod:.6f} -> stream rgba", log_file)
     _log_print(f"[hudpy] geschrieben: {frames} frames -> ffmpeg stdin (rgba)", log_file)
+    if prof_on:
+        prof_json = None
+        if log_file is not None:
+            prof_json = Path(log_file).with_name(f"{Path(log_file).stem}_hud_profile_{int(cut_i0)}_{int(cut_i1)}.json")
+        hud_prof.write(prof_json, lambda line: _log_print(line, log_file))
+    try:
+        from features.huds.common import get_text_sprite_cache
+
+        ts = get_text_sprite_cache().stats()
+        _log_print(
+            f"[hudpy] text-cache hits={ts['hits']} misses={ts['misses']} hit_rate={ts['hit_rate']} "
+            f"atlas_builds={ts['atlas_builds']} atlases={ts['atlases']} entries={ts['entries']} "
+            f"evictions={ts['evictions']} bbox_hits={ts['bbox_hits']} bbox_misses={ts['bbox_misses']}",
+            log_file,
+        )
+    except Exception:
+        pass
     return None
     
 def _wrap_delta_05(a: float, b: float) -> float:
@@ -6305,10 +6945,15 @@ def render_split_screen(
     )
 
     available_encoders = detect_available_encoders(resolve_ffmpeg_bin())
-    encode_candidates = build_encode_specs(
+    encode_candidates = preflight_encode_specs(
+        build_encode_specs(
+            W=geom.W,
+            fps=float(fps_int),
+            available=available_encoders,
+        ),
         W=geom.W,
-        fps=float(fps_int),
-        available=available_encoders,
+        H=geom.H,
+        log_fn=print,
     )
 
     has_nvenc = ("h264_nvenc" in available_encoders) or ("hevc_nvenc" in available_encoders)
@@ -6318,6 +6963,7 @@ def render_split_screen(
 
     # 5) FFmpeg Run
     specs_by_vcodec = {enc.vcodec: enc for enc in encode_candidates}
+    encoder_failures: set[str] = set()
 
     def _run_one_encoder(vcodec: str) -> tuple[int, bool]:
         enc = specs_by_vcodec[vcodec]
@@ -6339,7 +6985,10 @@ def render_split_screen(
         )
 
         live = (os.environ.get("IRVC_FFMPEG_LIVE") or "").strip() == "1"
-        rc = run_ffmpeg(plan, tail_n=20, log_file=log_file, live_stdout=live)
+        tail: list[str] = []
+        rc = run_ffmpeg(plan, tail_n=20, log_file=log_file, live_stdout=live, tail_out=tail)
+        if is_encoder_failure(rc, tail):
+            encoder_failures.add(vcodec)
         return rc, (rc == 0 and outp.exists())
 
     selected_vcodec, last_rc = run_encode_with_fallback(
@@ -6348,102 +6997,770 @@ def render_split_screen(
         log_fn=print,
     )
     if selected_vcodec != "":
+        record_encoder_fallback(
+            encode_candidates, selected_vcodec, W=geom.W, H=geom.H, encoder_failures=encoder_failures
+        )
         return
 
     raise RuntimeError(f"ffmpeg failed (rc={last_rc})")
 
 
-def render_split_screen_sync(
-    slow: Path,
-    fast: Path,
-    slow_csv: Path,
-    fast_csv: Path,
-    outp: Path,
-    start_s: float,
-    duration_s: float,
-    preset_w: int,
-    preset_h: int,
-    hud_width_px: int,
-    view_L: dict[str, Any] | None = None,
-    view_R: dict[str, Any] | None = None,
-    audio_source: str = "none",
-    hud_enabled: Any | None = None,
-    hud_boxes: Any | None = None,
-    hud_window_default_before_s: float = 10.0,
-    hud_window_default_after_s: float = 10.0,
-    hud_window_overrides: Any | None = None,
-    hud_curve_points_default: int = 180,
-    hud_curve_points_overrides: Any | None = None,
-    hud_speed_units: str = "kmh",
-    hud_speed_update_hz: int = 60,
-    hud_gear_rpm_update_hz: int = 60,
-    hud_pedals_sample_mode: str = "time",
-    hud_pedals_abs_debounce_ms: int = 60,
-    hud_max_brake_delay_distance: float = 0.003,
-    hud_max_brake_delay_pressure: float = 35.0,
-    under_oversteer_curve_center: float = 0.0,
-    video_mode: str = "full",
-    video_cut_before_brake_s: float = 1.0,
-    video_cut_after_full_throttle_s: float = 1.0,
-    video_cut_minimum_between_two_curves_s: float = 2.0,
-    layout_config: LayoutConfig | None = None,
-    log_file: "Path | None" = None,
-) -> None:
-    # Story 6: Stream-Sync (ohne PNG, ohne fast_sync.mp4, ein ffmpeg-Run)
-    # 1) Config reading
-    slow = Path(slow).resolve()
-    fast = Path(fast).resolve()
-    scsv = Path(slow_csv).resolve()
-    fcsv = Path(fast_csv).resolve()
-    outp = Path(outp).resolve()
-    outp.parent.mkdir(parents=True, exist_ok=True)
-
-    from core.csv_g61 import load_g61_csv
-    csv_load_debug = (os.environ.get("IRVC_DEBUG_CSV_LOADS") or "").strip().lower() in ("1", "true", "yes", "on")
-    csv_load_counts: dict[str, int] = {}
-
-    def _load_run_once(label: str, path: Path):
-        run = load_g61_csv(path)
-        k = str(path)
-        csv_load_counts[k] = int(csv_load_counts.get(k, 0)) + 1
-        if csv_load_debug:
-            _log_print(f"[csv] load label={label} count={csv_load_counts[k]} path={k}", log_file)
-        return run
+FULL_CHUNK_S_ENV = "IRVC_FULL_CHUNK_S"
+FULL_CHUNK_WORKERS_ENV = "IRVC_FULL_CHUNK_WORKERS"
+_FULL_CHUNK_MANIFEST_VERSION = 1
 
-    run_slow = _load_run_once("slow", scsv)
-    run_fast = _load_run_once("fast", fcsv)
 
-    ms = probe_video_meta(slow)
-    mf = probe_video_meta(fast)
+def _full_chunk_settings(fps: int) -> tuple[int, int, int]:
+    """
+    Chunk-Modus fuer video_mode=full: (chunk_frames, gop, workers); chunk_frames=0 = aus.
+    IRVC_FULL_CHUNK_S = Chunk-Laenge in Sekunden (auf ganze GOPs gerundet), IRVC_FULL_CHUNK_WORKERS = Prozesse.
+    Bild und HUD jedes Chunks sind pixelgleich zum durchgehenden Render; dafuer rendert jeder Chunk die
+    Scroll-HUDs ab einem Vorlauf von etwa einem HUD-Fenster plus 1 s. Chunks deutlich laenger als das Fenster
+    waehlen, sonst frisst der Vorlauf den Parallelgewinn. Abweichungen bleiben nur durch Encoder-Entscheidungen
+    an den Chunkgrenzen (GOP-Start).
+    """
+    try:
+        chunk_s = float((os.environ.get(FULL_CHUNK_S_ENV) or "").strip() or "0")
+    except Exception:
+        chunk_s = 0.0
+    if chunk_s <= 0.0:
+        return 0, 0, 0
+    r = max(1, int(fps))
+    gop = 2 * r
+    chunk_frames = max(gop, int(round(chunk_s * float(r) / float(gop))) * gop)
+    try:
+        workers = int((os.environ.get(FULL_CHUNK_WORKERS_ENV) or "").strip() or "0")
+    except Exception:
+        workers = 0
+    if workers <= 0:
+        workers = max(1, min(4, int(os.cpu_count() or 2) // 2))
+    return int(chunk_frames), int(gop), int(workers)
 
-    if abs(ms.fps - mf.fps) > 0.01:
-        raise RuntimeError("slow/fast haben nicht die gleiche FPS.")
 
-    fps_int = int(round(ms.fps))
-    if fps_int <= 0:
-        fps_int = 30
+def _build_full_chunk_jobs(*, start_frame: int, end_frame_exclusive: int, chunk_frames: int, out_dir: Path) -> list[CutRenderJob]:
+    """Split [start, end) into GOP-aligned chunks (Grenzen relativ zum Ausgabe-Start)."""
+    jobs: list[CutRenderJob] = []
+    i0 = int(start_frame)
+    step = max(1, int(chunk_frames))
+    while i0 < int(end_frame_exclusive):
+        i1 = min(int(end_frame_exclusive), i0 + step)
+        jobs.append(CutRenderJob(index=len(jobs), start_frame=i0, end_frame=i1, out_path=out_dir / f"chunk_{len(jobs):04d}.mp4"))
+        i0 = i1
+    return jobs
 
-    if audio_source not in ("slow", "fast", "none"):
-        audio_source = "slow"
 
+def _load_full_chunk_manifest(path: Path, key: str) -> dict[str, Any]:
+    """Return {index: entry} of finished chunks for key; a different key starts from scratch."""
     try:
-        under_oversteer_curve_center = float(under_oversteer_curve_center)
+        raw = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
-        under_oversteer_curve_center = 0.0
-    under_oversteer_curve_center = float(_clamp(float(under_oversteer_curve_center), -50.0, 50.0))
+        return {}
+    if not isinstance(raw, dict) or int(raw.get("version") or 0) != _FULL_CHUNK_MANIFEST_VERSION:
+        return {}
+    if str(raw.get("key") or "") != key:
+        return {}
+    done = raw.get("done")
+    return dict(done) if isinstance(done, dict) else {}
 
-    hud_pedals_sample_mode = str(hud_pedals_sample_mode or "time").strip().lower()
-    if hud_pedals_sample_mode not in ("time", "legacy"):
-        hud_pedals_sample_mode = "time"
+
+def _save_full_chunk_manifest(path: Path, key: str, done: dict[str, Any]) -> None:
+    """Implement save full chunk manifest logic."""
     try:
-        hud_pedals_abs_debounce_ms = int(hud_pedals_abs_debounce_ms)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": _FULL_CHUNK_MANIFEST_VERSION, "key": key, "done": done}, indent=2),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
     except Exception:
-        hud_pedals_abs_debounce_ms = 60
-    if hud_pedals_abs_debounce_ms < 0:
-        hud_pedals_abs_debounce_ms = 0
-    if hud_pedals_abs_debounce_ms > 500:
-        hud_pedals_abs_debounce_ms = 500
-    try:
+        pass
+
+
+@dataclass(frozen=True)
+class FullChunkTask:
+    """Everything a worker process needs to render one full-mode chunk (must stay picklable)."""
+    job: CutRenderJob
+    slow: Path
+    fast: Path
+    geom: OutputGeometry
+    fps: int
+    view_L: dict[str, Any] | None
+    view_R: dict[str, Any] | None
+    fast_time_s: Any
+    speed_diff: Any
+    hud_enabled: Any | None
+    hud_boxes: Any | None
+    hud_ctx: HudContext | None
+    enc: EncodeSpec
+    # Exklusives Ende fuer Filter/HUD: innere Chunks rendern etwas Ueberlappung, weil overlay=shortest
+    # sonst am Chunkende 1-2 Frames verliert; -frames:v schneidet exakt auf den Chunk.
+    render_end_frame: int = 0
+    # Gesamtbereich fuer das Sync-Segment-Raster (identische Fast-Warp-Stuetzstellen wie ohne Chunks).
+    sync_i0: int = 0
+    sync_i1: int = 0
+    log_file: Path | None = None
+
+
+def _full_chunk_worker_init() -> None:
+    """Worker-Prozesse: keine eigenen Events/Progress-Zeilen, das macht der Hauptprozess pro Chunk."""
+    os.environ.pop(RENDER_EVENTS_PORT_ENV, None)
+    try:
+        sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    except Exception:
+        pass
+
+
+def _render_full_chunk(task: FullChunkTask) -> tuple[int, int, bool]:
+    """
+    Render one chunk (video only) into job.out_path; returns (index, rc, encoder_failed).
+    The HUD is warmed up before job.start_frame (HudContext.warm_start), so it matches the full render.
+    """
+    job = task.job
+    render_end = max(int(job.end_frame), int(task.render_end_frame))
+    chunk_frames = int(job.end_frame) - int(job.start_frame)
+    ctx = (
+        replace(
+            task.hud_ctx,
+            cut_i0=int(job.start_frame),
+            cut_i1=render_end,
+            log_file=task.log_file,
+            scale_range=(int(task.sync_i0), int(task.sync_i1)) if task.sync_i1 > task.sync_i0 else None,
+            warm_start=task.sync_i1 > task.sync_i0,
+        )
+        if task.hud_ctx is not None
+        else None
+    )
+    hud_w, hud_h, _hud_x0, _hud_y0 = _hud_stream_rect(task.geom)
+    hud_layer = _HudLayerSession(ctx, (int(hud_w), int(hud_h)), full_redraw=True)
+    filt, _audio_map = build_stream_sync_filter(
+        geom=task.geom,
+        fps=float(task.fps),
+        view_L=task.view_L,
+        view_R=task.view_R,
+        fast_time_s=task.fast_time_s,
+        speed_diff=task.speed_diff,
+        cut_i0=int(job.start_frame),
+        cut_i1=render_end,
+        audio_source="none",
+        hud_enabled=task.hud_enabled,
+        hud_boxes=task.hud_boxes,
+        hud_cmd_file=None,
+        log_file=task.log_file,
+        hud_input_label="[0:v]" if ctx is not None else None,
+        sync_range=(int(task.sync_i0), int(task.sync_i1)) if task.sync_i1 > task.sync_i0 else None,
+    )
+    video_map = "[vout]"
+    if render_end <= int(job.end_frame):
+        # Letzter Chunk: keine Ueberlappung moeglich, overlay=shortest verliert den Schluss-Frame.
+        # Mit geklontem Ende liefert -frames:v exakt chunk_frames.
+        filt += ";[vout]tpad=stop=2:stop_mode=clone[voutpad]"
+        video_map = "[voutpad]"
+    part_path = job.out_path.with_name(f"{job.out_path.stem}.part{job.out_path.suffix}")
+    plan = build_plan(
+        decode=DecodeSpec(
+            slow=task.slow,
+            fast=task.fast,
+            hud_fps=float(task.fps),
+            hud_stdin_raw=bool(hud_layer.needs_stream),
+            hud_size=(int(hud_w), int(hud_h)),
+            hud_pix_fmt="rgba",
+            hud_stdin_vfr=hud_vfr_enabled(),
+            hud_file=hud_layer.cached_path,
+        ),
+        flt=FilterSpec(filter_complex=filt, video_map=video_map, audio_map=None),
+        enc=replace(task.enc, extra=[*task.enc.extra, "-frames:v", str(chunk_frames)]),
+        audio_source="none",
+        outp=part_path,
+    )
+    tail: list[str] = []
+    if hud_layer.needs_stream:
+        expected_bytes = int(hud_w) * int(hud_h) * 4
+
+        def _stdin_writer(stdin_pipe: Any) -> None:
+            frames = {"n": 0, "piped": 0, "closed": False}
+            transport = HudStdinTransport(
+                stdin_pipe,
+                size=(int(hud_w), int(hud_h)),
+                fps=float(task.fps),
+                vfr=hud_vfr_enabled(),
+                expected_frames=int(render_end) - int(job.start_frame),
+            )
+
+            def _write_frame_rgba(frame_bytes: bytes) -> None:
+                if len(frame_bytes) != expected_bytes:
+                    raise RuntimeError(
+                        f"HUD stream frame size mismatch: expected {expected_bytes} bytes, got {len(frame_bytes)}"
+                    )
+                if not frames["closed"]:
+                    try:
+                        transport.write(frame_bytes)
+                        frames["piped"] = int(frames["piped"]) + 1
+                    except OSError as e:
+                        # Nach -frames:v schliesst ffmpeg stdin; Ueberlappungs-Frames sind dann egal.
+                        if int(frames["piped"]) < chunk_frames:
+                            raise RuntimeError("ffmpeg stdin pipe closed while streaming HUD frames.") from e
+                        frames["closed"] = True
+                hud_layer.write(frame_bytes)
+
+            def _on_frame_written(written: int, _total: int) -> None:
+                frames["n"] = int(written)
+
+            hud_layer.start()
+            try:
+                _render_hud_scroll_frames_png(
+                    ctx,
+                    frame_writer=_write_frame_rgba,
+                    frame_written_cb=_on_frame_written,
+                    force_full_redraw=True,
+                )
+            finally:
+                hud_layer.finish(int(frames["n"]))
+            try:
+                if not frames["closed"]:
+                    transport.finish()
+                stdin_pipe.flush()
+            except Exception:
+                pass
+
+        rc = run_ffmpeg(plan, tail_n=20, log_file=task.log_file, stdin_write_fn=_stdin_writer, tail_out=tail)
+    else:
+        rc = run_ffmpeg(plan, tail_n=20, log_file=task.log_file, tail_out=tail)
+    if int(rc) == 0 and part_path.exists():
+        os.replace(part_path, job.out_path)
+    return int(job.index), int(rc), is_encoder_failure(rc, tail)
+
+
+@dataclass(frozen=True)
+class RenderTarget:
+    """Additional output of render_split_screen_sync (own geometry, encoder and file)."""
+    outp: Path
+    geom: OutputGeometry
+    encoder: EncodeSpec | None = None
+    hud_boxes: Any | None = None
+
+
+# Multi-Lap: slow + fast + bis zu zwei weitere Runden (2x2-Raster).
+MAX_EXTRA_LAPS = 2
+
+
+@dataclass(frozen=True)
+class ExtraLap:
+    """Additional reference lap of render_split_screen_sync (video + CSV), synced to the slow lap via LapDistPct."""
+    video: Path
+    csv: Path | RunData
+
+
+def _lap_time_map_from_lapdist(slow_frame_to_lapdist: Sequence[float], run: Any, duration_s: float) -> list[float]:
+    """Lap time per slow frame for one more lap, reusing the slow LapDistPct per frame of the main sync map."""
+    from core.csv_g61 import get_float_col
+
+    t_x = _force_strictly_increasing(_csv_time_axis_or_fallback(run, duration_s))
+    ld_xu = _force_strictly_increasing(_unwrap_lapdist(get_float_col(run, "LapDistPct")))
+    n = min(len(t_x), len(ld_xu))
+    if n < 2:
+        raise RuntimeError("CSV hat zu wenige Samples fuer Sync.")
+    return np.interp(
+        np.asarray(slow_frame_to_lapdist, dtype=np.float64),
+        np.asarray(ld_xu[:n], dtype=np.float64),
+        np.asarray(t_x[:n], dtype=np.float64),
+    ).tolist()
+
+
+DRAFT_ENV = "IRVC_DRAFT"
+DRAFT_HEIGHT_ENV = "IRVC_DRAFT_HEIGHT"
+DRAFT_FPS_ENV = "IRVC_DRAFT_FPS"
+DRAFT_LAPDIST_ENV = "IRVC_DRAFT_LAPDIST"
+
+
+@dataclass(frozen=True)
+class DraftSettings:
+    """Schnellvorschau: gleiche Pipeline, kleinere Geometrie, optional weniger fps und nur ein LapDistPct-Bereich."""
+    height: int = 480
+    fps: int = 0
+    lapdist_range: tuple[float, float] | None = None
+
+
+def draft_settings_from_env() -> DraftSettings | None:
+    """
+    IRVC_DRAFT=1 aktiviert den Draft-Modus; IRVC_DRAFT_HEIGHT (Default 480), IRVC_DRAFT_FPS (0 = Quell-fps),
+    IRVC_DRAFT_LAPDIST = "von-bis" als LapDistPct (z. B. "0.20-0.35").
+    """
+    raw = str(os.environ.get(DRAFT_ENV) or "").strip().lower()
+    if raw not in ("1", "true", "yes", "on"):
+        return None
+    try:
+        height = int(float((os.environ.get(DRAFT_HEIGHT_ENV) or "").strip() or "480"))
+    except Exception:
+        height = 480
+    try:
+        fps = int(float((os.environ.get(DRAFT_FPS_ENV) or "").strip() or "0"))
+    except Exception:
+        fps = 0
+    lapdist_range: tuple[float, float] | None = None
+    try:
+        lo_raw, hi_raw = str(os.environ.get(DRAFT_LAPDIST_ENV) or "").strip().split("-", 1)
+        lo = _clamp(float(lo_raw), 0.0, 1.0)
+        hi = _clamp(float(hi_raw), 0.0, 1.0)
+        if hi > lo:
+            lapdist_range = (float(lo), float(hi))
+    except Exception:
+        lapdist_range = None
+    return DraftSettings(height=max(90, int(height)), fps=max(0, int(fps)), lapdist_range=lapdist_range)
+
+
+def _draft_scale_boxes(boxes: Any, s: float) -> Any:
+    """Scale x/y/w/h of HUD boxes (dict or list form) by s."""
+    def _box(b: Any) -> Any:
+        if not isinstance(b, dict):
+            return b
+        out = dict(b)
+        for k in ("x", "y", "w", "h"):
+            try:
+                if k in out:
+                    out[k] = int(round(float(out[k]) * s))
+            except Exception:
+                pass
+        return out
+
+    if isinstance(boxes, dict):
+        return {k: _box(v) for k, v in boxes.items()}
+    if isinstance(boxes, list):
+        return [_box(b) for b in boxes]
+    return boxes
+
+
+def _draft_scale_layout(layout_config: LayoutConfig | None, s: float) -> LayoutConfig | None:
+    """Scale the pixel values of a LayoutConfig (Rahmenbreite, Video-Shift, freie HUD-Boxen)."""
+    if not isinstance(layout_config, LayoutConfig):
+        return layout_config
+    frame = layout_config.hud_frame
+    thickness = frame.frame_thickness_px
+    vt = layout_config.video_transform
+    return replace(
+        layout_config,
+        hud_frame=replace(frame, frame_thickness_px=None if thickness is None else int(round(float(thickness) * s))),
+        video_transform=replace(
+            vt,
+            shift_x_px=int(round(float(vt.shift_x_px) * s)),
+            shift_y_px=int(round(float(vt.shift_y_px) * s)),
+        ),
+        hud_free=replace(layout_config.hud_free, boxes_abs_out=_draft_scale_boxes(dict(layout_config.hud_free.boxes_abs_out), s)),
+    )
+
+
+def _draft_scale_view(view: dict[str, Any] | None, s: float) -> dict[str, Any] | None:
+    """Scale the output-pixel shifts of a video view."""
+    if not isinstance(view, dict):
+        return view
+    out = dict(view)
+    for k in ("shift_x_px", "shift_y_px", "off_x", "off_y"):
+        try:
+            if out.get(k) is not None:
+                out[k] = int(round(float(out[k]) * s))
+        except Exception:
+            pass
+    return out
+
+
+def _draft_lapdist_cut(
+    slow_frame_to_lapdist: Any,
+    cut_i0: int,
+    cut_i1: int,
+    lapdist_range: tuple[float, float],
+) -> tuple[int, int]:
+    """Narrow [cut_i0, cut_i1) to the frames whose slow LapDistPct lies in lapdist_range."""
+    ld = frames_view(slow_frame_to_lapdist)
+    i0 = max(0, int(cut_i0))
+    i1 = min(int(cut_i1), int(ld.shape[0]))
+    if i1 <= i0:
+        return int(cut_i0), int(cut_i1)
+    lo, hi = float(lapdist_range[0]), float(lapdist_range[1])
+    inside = np.flatnonzero((ld[i0:i1] >= lo) & (ld[i0:i1] <= hi))
+    if inside.size == 0:
+        return int(cut_i0), int(cut_i1)
+    return i0 + int(inside[0]), i0 + int(inside[-1]) + 1
+
+
+@dataclass(frozen=True)
+class HudPreviewLayer:
+    """Ein gerendertes HUD fuer die Layout-Vorschau (RGBA in Vorschau-Pixeln, Box relativ zum Output)."""
+    name: str
+    image: Any
+    box: tuple[int, int, int, int]
+
+
+def build_hud_preview_context(
+    *,
+    slow: Path,
+    fast: Path,
+    slow_csv: Path,
+    fast_csv: Path,
+    hud_names: Sequence[str],
+    hud_window_default_before_s: float = 10.0,
+    hud_window_default_after_s: float = 10.0,
+    hud_curve_points_default: int = 180,
+    hud_curve_points_overrides: Any | None = None,
+    hud_speed_units: str = "kmh",
+    hud_speed_update_hz: int = 60,
+    hud_gear_rpm_update_hz: int = 60,
+    hud_pedals_sample_mode: str = "time",
+    hud_pedals_abs_debounce_ms: int = 60,
+    hud_max_brake_delay_distance: float = 0.003,
+    hud_max_brake_delay_pressure: float = 35.0,
+    under_oversteer_curve_center: float = 0.0,
+) -> HudContext:
+    """
+    HudContext fuer die Layout-Vorschau: gleiche Sync-Maps und Signale wie render_split_screen_sync,
+    aber ohne ffmpeg-Lauf. Einmal pro Rundenpaar bauen; Geometrie, Boxen und Hintergrund-Alpha setzt
+    render_hud_preview_layers pro Aufruf.
+    """
+    from core.csv_g61 import load_g61_csv
+
+    scsv = Path(slow_csv).resolve()
+    fcsv = Path(fast_csv).resolve()
+    run_slow = load_g61_csv(scsv)
+    run_fast = load_g61_csv(fcsv)
+    ms = probe_video_meta(Path(slow).resolve())
+    mf = probe_video_meta(Path(fast).resolve())
+    fps_int = int(round(ms.fps))
+    if fps_int <= 0:
+        fps_int = 30
+    fps = float(fps_int)
+
+    frame_map, slow_frame_to_lapdist, slow_frame_to_fast_time_s, _speed_diff = _build_sync_cache_maps_from_csv(
+        slow_csv=scsv,
+        fast_csv=fcsv,
+        fps=fps,
+        slow_duration_s=ms.duration_s,
+        fast_duration_s=mf.duration_s,
+        run_s=run_slow,
+        run_f=run_fast,
+    )
+    cut_i0, cut_i1 = _compute_common_cut_by_fast_time(
+        fast_time_s=slow_frame_to_fast_time_s,
+        fast_duration_s=mf.duration_s,
+        fps=fps,
+    )
+
+    def _f(run: Any, duration_s: float, col: str) -> list[float]:
+        return _sample_csv_col_to_frames_float(run, duration_s, fps, col)
+
+    slow_speed_frames = _f(run_slow, ms.duration_s, "Speed")
+    fast_speed_frames = _f(run_fast, mf.duration_s, "Speed")
+    names = [str(n) for n in hud_names]
+    line_delta_m_frames: list[float] = []
+    line_delta_y_abs_m = 0.0
+    uo_slow: list[float] = []
+    uo_fast: list[float] = []
+    uo_y_abs = 1.0
+    if "Line Delta" in names:
+        line_delta_m_frames = _build_line_delta_frames_from_csv(
+            slow_csv=scsv,
+            fast_csv=fcsv,
+            slow_duration_s=ms.duration_s,
+            fast_duration_s=mf.duration_s,
+            fps=fps,
+            slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+            frame_count_hint=len(slow_frame_to_lapdist),
+            run_s=run_slow,
+            run_f=run_fast,
+        )
+        finite = [abs(float(v)) for v in line_delta_m_frames if _is_finite_float(v)]
+        line_delta_y_abs_m = (max(finite) if finite else 0.0) * 2.0
+    if "Under-/Oversteer" in names:
+        uo_slow, uo_fast, uo_y_abs = _build_under_oversteer_proxy_frames_from_csv(
+            slow_csv=scsv,
+            fast_csv=fcsv,
+            slow_duration_s=ms.duration_s,
+            fast_duration_s=mf.duration_s,
+            fps=fps,
+            slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+            frame_count_hint=len(slow_frame_to_lapdist),
+            under_oversteer_curve_center=float(_clamp(float(under_oversteer_curve_center), -50.0, 50.0)),
+            log_file=None,
+            run_s=run_slow,
+            run_f=run_fast,
+        )
+
+    # Scroll-HUD Fenster wie im Render: global und symmetrisch.
+    sym_s = max(1e-6, float(hud_window_default_before_s or 10.0), float(hud_window_default_after_s or 10.0))
+    hud_windows = {n: {"before_s": sym_s, "after_s": sym_s} for n in names if n in _SCROLL_HUD_NAMES}
+
+    return _build_hud_context(
+        fps=fps,
+        cut_i0=int(cut_i0),
+        cut_i1=int(cut_i1),
+        geom=build_output_geometry(f"{ms.width}x{ms.height}", hud_width_px=0),
+        hud_enabled=None,
+        hud_boxes=None,
+        sync=HudSyncMapping(
+            slow_frame_to_lapdist=slow_frame_to_lapdist,
+            slow_to_fast_frame=frame_map,
+            slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+        ),
+        signals=HudSignals(
+            slow_speed_frames=slow_speed_frames,
+            fast_speed_frames=fast_speed_frames,
+            slow_min_speed_frames=_compute_min_speed_display(slow_speed_frames, fps, str(hud_speed_units)) if slow_speed_frames else [],
+            fast_min_speed_frames=_compute_min_speed_display(fast_speed_frames, fps, str(hud_speed_units)) if fast_speed_frames else [],
+            slow_gear_frames=_sample_csv_col_to_frames_int_nearest(run_slow, ms.duration_s, fps, "Gear"),
+            fast_gear_frames=_sample_csv_col_to_frames_int_nearest(run_fast, mf.duration_s, fps, "Gear"),
+            slow_rpm_frames=_f(run_slow, ms.duration_s, "RPM"),
+            fast_rpm_frames=_f(run_fast, mf.duration_s, "RPM"),
+            slow_steer_frames=_f(run_slow, ms.duration_s, "SteeringWheelAngle"),
+            fast_steer_frames=_f(run_fast, mf.duration_s, "SteeringWheelAngle"),
+            slow_throttle_frames=_f(run_slow, ms.duration_s, "Throttle"),
+            fast_throttle_frames=_f(run_fast, mf.duration_s, "Throttle"),
+            slow_brake_frames=_f(run_slow, ms.duration_s, "Brake"),
+            fast_brake_frames=_f(run_fast, mf.duration_s, "Brake"),
+            slow_abs_frames=_f(run_slow, ms.duration_s, "ABSActive"),
+            fast_abs_frames=_f(run_fast, mf.duration_s, "ABSActive"),
+            fast_lapdist_frames=_f(run_fast, mf.duration_s, "LapDistPct"),
+            line_delta_m_frames=line_delta_m_frames,
+            line_delta_y_abs_m=line_delta_y_abs_m,
+            under_oversteer_slow_frames=uo_slow,
+            under_oversteer_fast_frames=uo_fast,
+            under_oversteer_y_abs=uo_y_abs,
+        ),
+        window=HudWindowParams(
+            before_s=float(hud_window_default_before_s or 10.0),
+            after_s=float(hud_window_default_after_s or 10.0),
+            hud_name=None,
+            hud_windows=hud_windows,
+        ),
+        settings=HudRenderSettings(
+            speed_units=str(hud_speed_units),
+            speed_update_hz=int(hud_speed_update_hz),
+            gear_rpm_update_hz=int(hud_gear_rpm_update_hz),
+            curve_points_default=int(hud_curve_points_default),
+            curve_points_overrides=hud_curve_points_overrides,
+            pedals_sample_mode=str(hud_pedals_sample_mode),
+            pedals_abs_debounce_ms=int(hud_pedals_abs_debounce_ms),
+            max_brake_delay_distance=float(hud_max_brake_delay_distance),
+            max_brake_delay_pressure=float(hud_max_brake_delay_pressure),
+        ),
+    )
+
+
+# Traeger fuer Tabellen-HUDs in der Vorschau, guenstigste Scroll-HUDs zuerst.
+_PREVIEW_CARRIER_ORDER = ("Steering", "Line Delta", "Under-/Oversteer", "Delta", "Throttle / Brake")
+
+
+def hud_preview_groups(names: Sequence[str]) -> list[tuple[str, ...]]:
+    """
+    Render-Gruppen der Vorschau: jedes Scroll-HUD einzeln, Tabellen-HUDs gemeinsam mit einem Scroll-HUD als
+    Traeger (der HUD-Stream rendert Tabellen nur neben mindestens einer Scroll-Box, wie im Video).
+    """
+    scroll = [str(n) for n in names if str(n) in _SCROLL_HUD_NAMES]
+    table = [str(n) for n in names if str(n) in _TABLE_HUD_NAMES]
+    groups: list[tuple[str, ...]] = [(n,) for n in scroll]
+    if table and scroll:
+        carrier = next((n for n in _PREVIEW_CARRIER_ORDER if n in scroll), scroll[0])
+        groups.append(tuple(table) + (carrier,))
+    return groups
+
+
+def render_hud_preview_layers(
+    ctx: HudContext,
+    *,
+    frame: int,
+    group: Sequence[str],
+    out_w: int,
+    out_h: int,
+    hud_width_px: int,
+    layout_config: LayoutConfig | None,
+    hud_boxes: Any,
+    scale: float,
+    curve_points_overrides: Any | None = None,
+) -> list[HudPreviewLayer]:
+    """
+    Rendert ein Frame einer HUD-Gruppe mit dem echten HUD-Renderer in Vorschau-Aufloesung.
+    Das erste Scroll-HUD einer Tabellen-Gruppe ist nur Traeger und wird nicht zurueckgegeben.
+    """
+    from PIL import Image
+
+    s = max(0.05, min(4.0, float(scale)))
+    geom = build_output_geometry_for_size(
+        out_w=max(2, int(round(float(out_w) * s))),
+        out_h=max(2, int(round(float(out_h) * s))),
+        hud_width_px=int(round(float(hud_width_px) * s)),
+        layout_config=_draft_scale_layout(layout_config, s),
+    )
+    boxes_s = _draft_scale_boxes(hud_boxes, s)
+    names = [str(n) for n in group]
+    # Alle Boxen bleiben in hud_boxes (gleiche absolut/relativ-Erkennung wie im Render), aktiv ist nur die Gruppe.
+    boxes_abs = dict(_enabled_hud_boxes_abs(geom=geom, hud_enabled={n: True for n in names}, hud_boxes=boxes_s))
+    if not boxes_abs:
+        return []
+    i = max(int(ctx.cut_i0), min(int(frame), int(ctx.cut_i1) - 1))
+    settings = ctx.settings
+    try:
+        if isinstance(layout_config, LayoutConfig):
+            settings = replace(settings, bg_alpha=max(0, min(255, int(layout_config.hud_free.bg_alpha))))
+    except Exception:
+        pass
+    if curve_points_overrides is not None:
+        settings = replace(settings, curve_points_overrides=curve_points_overrides)
+    frame_ctx = replace(
+        ctx,
+        cut_i0=int(i),
+        cut_i1=int(i) + 1,
+        scale_range=(int(ctx.cut_i0), int(ctx.cut_i1)),
+        geom=geom,
+        hud_enabled={n: True for n in names},
+        hud_boxes=boxes_s,
+        settings=settings,
+        log_file=None,
+    )
+    captured: list[bytes] = []
+    # Frischer Zustand pro Aufruf: der erste Frame ist ohnehin ein Voll-Redraw.
+    _render_hud_scroll_frames_png(frame_ctx, frame_writer=captured.append)
+    if not captured:
+        return []
+    sw, sh, sx0, sy0 = _hud_stream_rect(geom)
+    img = Image.frombuffer("RGBA", (int(sw), int(sh)), captured[-1], "raw", "RGBA", 0, 1)
+    carrier = names[-1] if len(names) > 1 and names[-1] in _SCROLL_HUD_NAMES else None
+    layers: list[HudPreviewLayer] = []
+    for name in names:
+        if name == carrier or name not in boxes_abs:
+            continue
+        x, y, w, h = boxes_abs[name]
+        crop = img.crop((int(x) - int(sx0), int(y) - int(sy0), int(x) - int(sx0) + int(w), int(y) - int(sy0) + int(h)))
+        layers.append(HudPreviewLayer(name=name, image=crop, box=(int(x), int(y), int(w), int(h))))
+    return layers
+
+
+def render_split_screen_sync(
+    slow: Path,
+    fast: Path,
+    slow_csv: Path | RunData,
+    fast_csv: Path | RunData,
+    outp: Path,
+    start_s: float,
+    duration_s: float,
+    preset_w: int,
+    preset_h: int,
+    hud_width_px: int,
+    view_L: dict[str, Any] | None = None,
+    view_R: dict[str, Any] | None = None,
+    audio_source: str = "none",
+    hud_enabled: Any | None = None,
+    hud_boxes: Any | None = None,
+    hud_window_default_before_s: float = 10.0,
+    hud_window_default_after_s: float = 10.0,
+    hud_window_overrides: Any | None = None,
+    hud_curve_points_default: int = 180,
+    hud_curve_points_overrides: Any | None = None,
+    hud_speed_units: str = "kmh",
+    hud_speed_update_hz: int = 60,
+    hud_gear_rpm_update_hz: int = 60,
+    hud_pedals_sample_mode: str = "time",
+    hud_pedals_abs_debounce_ms: int = 60,
+    hud_max_brake_delay_distance: float = 0.003,
+    hud_max_brake_delay_pressure: float = 35.0,
+    under_oversteer_curve_center: float = 0.0,
+    video_mode: str = "full",
+    video_cut_before_brake_s: float = 1.0,
+    video_cut_after_full_throttle_s: float = 1.0,
+    video_cut_minimum_between_two_curves_s: float = 2.0,
+    layout_config: LayoutConfig | None = None,
+    log_file: "Path | None" = None,
+    extra_targets: Sequence[RenderTarget] | None = None,
+    draft: DraftSettings | None = None,
+    extra_laps: Sequence[ExtraLap] | None = None,
+) -> None:
+    # Story 6: Stream-Sync (ohne PNG, ohne fast_sync.mp4, ein ffmpeg-Run)
+    # 1) Config reading
+    slow = Path(slow).resolve()
+    fast = Path(fast).resolve()
+    # RunData (z.B. eine Runde aus einem Coaching-Parquet) ersetzt die CSV-Datei.
+    scsv = slow_csv if isinstance(slow_csv, RunData) else Path(slow_csv).resolve()
+    fcsv = fast_csv if isinstance(fast_csv, RunData) else Path(fast_csv).resolve()
+    outp = Path(outp).resolve()
+    outp.parent.mkdir(parents=True, exist_ok=True)
+    # Multi-Output: weitere Presets teilen Decode, Sync und Fast-Warp mit outp (nur video_mode=full).
+    extra_targets_l = [replace(t, outp=Path(t.outp).resolve()) for t in (extra_targets or ())]
+    if extra_targets_l and str(video_mode or "full").strip().lower() == "cut":
+        raise RuntimeError("multi-output render requires video_mode=full.")
+    for t in extra_targets_l:
+        t.outp.parent.mkdir(parents=True, exist_ok=True)
+    draft = draft if draft is not None else draft_settings_from_env()
+    if draft is not None and extra_targets_l:
+        _log_print("[draft] weitere Ausgabeziele werden im Draft-Modus ignoriert", log_file)
+        extra_targets_l = []
+    # Multi-Lap: weitere Runden teilen Sync-Raster und Fast-Warp, jedes Video wird einmal dekodiert.
+    extra_laps_l = [
+        ExtraLap(video=Path(x.video).resolve(), csv=x.csv if isinstance(x.csv, RunData) else Path(x.csv).resolve())
+        for x in (extra_laps or ())
+    ]
+    if len(extra_laps_l) > MAX_EXTRA_LAPS:
+        raise RuntimeError(f"multi-lap render supports at most {MAX_EXTRA_LAPS} extra laps.")
+    if extra_laps_l and extra_targets_l:
+        raise RuntimeError("multi-lap render cannot be combined with multi-output targets.")
+
+    from core.csv_g61 import load_g61_csv
+    csv_load_debug = (os.environ.get("IRVC_DEBUG_CSV_LOADS") or "").strip().lower() in ("1", "true", "yes", "on")
+    csv_load_counts: dict[str, int] = {}
+
+    def _load_run_once(label: str, path: Path | RunData):
+        if isinstance(path, RunData):
+            if csv_load_debug:
+                _log_print(f"[csv] preloaded label={label} rows={path.row_count} path={path.csv_path}", log_file)
+            return path
+        run = load_g61_csv(path)
+        k = str(path)
+        csv_load_counts[k] = int(csv_load_counts.get(k, 0)) + 1
+        if csv_load_debug:
+            _log_print(f"[csv] load label={label} count={csv_load_counts[k]} path={k}", log_file)
+        return run
+
+    events = get_render_events()
+    with events.stage(STAGE_CSV_LOAD):
+        run_slow = _load_run_once("slow", scsv)
+        run_fast = _load_run_once("fast", fcsv)
+        runs_extra = [_load_run_once(f"extra{k}", x.csv) for k, x in enumerate(extra_laps_l)]
+    scsv = Path(run_slow.csv_path)
+    fcsv = Path(run_fast.csv_path)
+
+    with events.stage(STAGE_PROBE):
+        ms = probe_video_meta(slow)
+        mf = probe_video_meta(fast)
+        metas_extra = [probe_video_meta(x.video) for x in extra_laps_l]
+
+    if abs(ms.fps - mf.fps) > 0.01:
+        raise RuntimeError("slow/fast haben nicht die gleiche FPS.")
+    for x, mx in zip(extra_laps_l, metas_extra):
+        if abs(ms.fps - mx.fps) > 0.01:
+            raise RuntimeError(f"slow/{x.video.name} haben nicht die gleiche FPS.")
+
+    fps_int = int(round(ms.fps))
+    if fps_int <= 0:
+        fps_int = 30
+    # Draft: Sync-Maps, HUD-Stream und Ausgabe laufen komplett mit der reduzierten Rate.
+    if draft is not None and 0 < int(draft.fps) < fps_int:
+        fps_int = int(draft.fps)
+
+    if audio_source not in ("slow", "fast", "none"):
+        audio_source = "slow"
+
+    try:
+        under_oversteer_curve_center = float(under_oversteer_curve_center)
+    except Exception:
+        under_oversteer_curve_center = 0.0
+    under_oversteer_curve_center = float(_clamp(float(under_oversteer_curve_center), -50.0, 50.0))
+
+    hud_pedals_sample_mode = str(hud_pedals_sample_mode or "time").strip().lower()
+    if hud_pedals_sample_mode not in ("time", "legacy"):
+        hud_pedals_sample_mode = "time"
+    try:
+        hud_pedals_abs_debounce_ms = int(hud_pedals_abs_debounce_ms)
+    except Exception:
+        hud_pedals_abs_debounce_ms = 60
+    if hud_pedals_abs_debounce_ms < 0:
+        hud_pedals_abs_debounce_ms = 0
+    if hud_pedals_abs_debounce_ms > 500:
+        hud_pedals_abs_debounce_ms = 500
+    try:
         hud_max_brake_delay_distance = float(hud_max_brake_delay_distance)
     except Exception:
         hud_max_brake_delay_distance = 0.003
@@ -6485,17 +7802,38 @@ def render_split_screen_sync(
     preset = f"{ms.width}x{ms.height}"
     if preset_w > 0 and preset_h > 0:
         preset = f"{int(preset_w)}x{int(preset_h)}"
+    if draft is not None:
+        # Draft: alle Pixelwerte der Ausgabe skalieren, Geometrie und HUDs laufen danach durch den normalen Pfad.
+        full_w, full_h = parse_output_preset(preset)
+        draft_s = min(1.0, float(draft.height) / float(max(1, full_h)))
+        draft_w = max(2, int(round(float(full_w) * draft_s / 2.0)) * 2)
+        draft_h = max(2, int(round(float(full_h) * draft_s / 2.0)) * 2)
+        preset = f"{draft_w}x{draft_h}"
+        hud_width_px = int(round(float(hud_width_px) * draft_s))
+        hud_boxes = _draft_scale_boxes(hud_boxes, draft_s)
+        layout_config = _draft_scale_layout(layout_config, draft_s)
+        view_L = _draft_scale_view(view_L, draft_s)
+        view_R = _draft_scale_view(view_R, draft_s)
+        _log_print(
+            f"[draft] {full_w}x{full_h} -> {preset} fps={fps_int} lapdist={draft.lapdist_range or 'full'}",
+            log_file,
+        )
 
     # 2) Sync/Mapping
-    frame_map, slow_frame_to_lapdist, slow_frame_to_fast_time_s, slow_frame_speed_diff = _build_sync_cache_maps_from_csv(
-        slow_csv=scsv,
-        fast_csv=fcsv,
-        fps=float(fps_int),
-        slow_duration_s=ms.duration_s,
-        fast_duration_s=mf.duration_s,
-        run_s=run_slow,
-        run_f=run_fast,
-    )
+    with events.stage(STAGE_SYNC_BUILD):
+        frame_map, slow_frame_to_lapdist, slow_frame_to_fast_time_s, slow_frame_speed_diff = _build_sync_cache_maps_from_csv(
+            slow_csv=scsv,
+            fast_csv=fcsv,
+            fps=float(fps_int),
+            slow_duration_s=ms.duration_s,
+            fast_duration_s=mf.duration_s,
+            run_s=run_slow,
+            run_f=run_fast,
+        )
+        extra_time_maps = [
+            _lap_time_map_from_lapdist(slow_frame_to_lapdist, run_x, mx.duration_s)
+            for run_x, mx in zip(runs_extra, metas_extra)
+        ]
     
     # Debug: Sync-Map / Delta-Grundlage prÃ¼fen (warum Delta ggf. ~0 ist)
     try:
@@ -6534,353 +7872,408 @@ def render_split_screen_sync(
     
     
     # Story 5/6: Table-HUD Daten pro Frame (ohne Fenster)
-    slow_speed_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "Speed")
-    fast_speed_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "Speed")
-    slow_gear_frames = _sample_csv_col_to_frames_int_nearest(run_slow, ms.duration_s, float(fps_int), "Gear")
-    fast_gear_frames = _sample_csv_col_to_frames_int_nearest(run_fast, mf.duration_s, float(fps_int), "Gear")
-    slow_rpm_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "RPM")
-    fast_rpm_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "RPM")
-    # Story 3: Steering pro Frame (Scroll-HUD)
-    slow_steer_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "SteeringWheelAngle")
-    fast_steer_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "SteeringWheelAngle")
-    # Story 4: Throttle / Brake / ABS pro Frame (Scroll-HUD)
-    slow_throttle_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "Throttle")
-    fast_throttle_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "Throttle")
-    slow_brake_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "Brake")
-    fast_brake_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "Brake")
-    slow_abs_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "ABSActive")
-    fast_abs_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "ABSActive")
-    fast_lapdist_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "LapDistPct")
-    line_delta_m_frames: list[float] = []
-    line_delta_y_abs_m = 0.0
-    under_oversteer_slow_frames: list[float] = []
-    under_oversteer_fast_frames: list[float] = []
-    under_oversteer_y_abs = 1.0
-    cut_frame_segments: list[Any] = []
-    cut_segments_time: list[tuple[float, float]] = []
-    cut_full_duration_s = 0.0
-    cut_duration_s = 0.0
-    cut_merge_count_total = 0
-
-
-    slow_min_speed_frames = _compute_min_speed_display(slow_speed_frames, float(fps_int), str(hud_speed_units)) if slow_speed_frames else []
-    fast_min_speed_frames = _compute_min_speed_display(fast_speed_frames, float(fps_int), str(hud_speed_units)) if fast_speed_frames else []
-
-    if requested_video_mode == "cut":
-        n_cut = min(len(slow_throttle_frames), len(slow_brake_frames))
-        cut_time_s = [float(i) / float(fps_int) for i in range(max(0, int(n_cut)))]
-        cut_segments, cut_detect_stats = detect_curve_segments_with_stats(
-            time_s=cut_time_s,
-            throttle=slow_throttle_frames[:n_cut],
-            brake=slow_brake_frames[:n_cut],
-            before_brake_s=float(video_cut_before_brake_s),
-            after_full_throttle_s=float(video_cut_after_full_throttle_s),
-            min_between_curves_s=float(video_cut_minimum_between_two_curves_s),
-            logger=None,
-        )
-        cut_segments_time = list(cut_segments)
-        if len(cut_time_s) >= 2:
-            cut_full_duration_s = max(0.0, float(cut_time_s[-1]) - float(cut_time_s[0]))
-        else:
-            cut_full_duration_s = 0.0
+    with events.stage(STAGE_SIGNAL_PREP):
+        slow_speed_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "Speed")
+        fast_speed_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "Speed")
+        slow_gear_frames = _sample_csv_col_to_frames_int_nearest(run_slow, ms.duration_s, float(fps_int), "Gear")
+        fast_gear_frames = _sample_csv_col_to_frames_int_nearest(run_fast, mf.duration_s, float(fps_int), "Gear")
+        slow_rpm_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "RPM")
+        fast_rpm_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "RPM")
+        # Story 3: Steering pro Frame (Scroll-HUD)
+        slow_steer_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "SteeringWheelAngle")
+        fast_steer_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "SteeringWheelAngle")
+        # Story 4: Throttle / Brake / ABS pro Frame (Scroll-HUD)
+        slow_throttle_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "Throttle")
+        fast_throttle_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "Throttle")
+        slow_brake_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "Brake")
+        fast_brake_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "Brake")
+        slow_abs_frames = _sample_csv_col_to_frames_float(run_slow, ms.duration_s, float(fps_int), "ABSActive")
+        fast_abs_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "ABSActive")
+        fast_lapdist_frames = _sample_csv_col_to_frames_float(run_fast, mf.duration_s, float(fps_int), "LapDistPct")
+        line_delta_m_frames: list[float] = []
+        line_delta_y_abs_m = 0.0
+        under_oversteer_slow_frames: list[float] = []
+        under_oversteer_fast_frames: list[float] = []
+        under_oversteer_y_abs = 1.0
+        cut_frame_segments: list[Any] = []
+        cut_segments_time: list[tuple[float, float]] = []
+        cut_full_duration_s = 0.0
         cut_duration_s = 0.0
-        for seg_start, seg_end in cut_segments_time:
-            cut_duration_s += max(0.0, float(seg_end) - float(seg_start))
-        if len(cut_segments) == 0:
-            _log_print("Cut found 0 segments → Full fallback", log_file)
-            effective_video_mode = "full"
-        else:
-            cut_frame_segments, cut_map_stats = map_time_segments_to_frames_with_stats(
-                cut_segments,
-                fps=float(fps_int),
-                num_frames=int(n_cut),
+        cut_merge_count_total = 0
+
+
+        slow_min_speed_frames = _compute_min_speed_display(slow_speed_frames, float(fps_int), str(hud_speed_units)) if slow_speed_frames else []
+        fast_min_speed_frames = _compute_min_speed_display(fast_speed_frames, float(fps_int), str(hud_speed_units)) if fast_speed_frames else []
+
+        if requested_video_mode == "cut":
+            n_cut = min(len(slow_throttle_frames), len(slow_brake_frames))
+            cut_time_s = [float(i) / float(fps_int) for i in range(max(0, int(n_cut)))]
+            cut_segments, cut_detect_stats = detect_curve_segments_with_stats(
+                time_s=cut_time_s,
+                throttle=slow_throttle_frames[:n_cut],
+                brake=slow_brake_frames[:n_cut],
+                before_brake_s=float(video_cut_before_brake_s),
+                after_full_throttle_s=float(video_cut_after_full_throttle_s),
+                min_between_curves_s=float(video_cut_minimum_between_two_curves_s),
                 logger=None,
             )
-            cut_merge_count_total = int(cut_detect_stats.merge_count) + int(cut_map_stats.merge_count)
-            if len(cut_frame_segments) == 0:
-                _log_print("Cut frame mapping found 0 segments → Full fallback", log_file)
+            cut_segments_time = list(cut_segments)
+            if len(cut_time_s) >= 2:
+                cut_full_duration_s = max(0.0, float(cut_time_s[-1]) - float(cut_time_s[0]))
+            else:
+                cut_full_duration_s = 0.0
+            cut_duration_s = 0.0
+            for seg_start, seg_end in cut_segments_time:
+                cut_duration_s += max(0.0, float(seg_end) - float(seg_start))
+            if len(cut_segments) == 0:
+                _log_print("Cut found 0 segments → Full fallback", log_file)
                 effective_video_mode = "full"
             else:
-                effective_video_mode = "cut"
-    else:
-        effective_video_mode = "full"
-
+                cut_frame_segments, cut_map_stats = map_time_segments_to_frames_with_stats(
+                    cut_segments,
+                    fps=float(fps_int),
+                    num_frames=int(n_cut),
+                    logger=None,
+                )
+                cut_merge_count_total = int(cut_detect_stats.merge_count) + int(cut_map_stats.merge_count)
+                if len(cut_frame_segments) == 0:
+                    _log_print("Cut frame mapping found 0 segments → Full fallback", log_file)
+                    effective_video_mode = "full"
+                else:
+                    effective_video_mode = "cut"
+        else:
+            effective_video_mode = "full"
 
-    cut_i0, cut_i1 = _compute_common_cut_by_fast_time(
-        fast_time_s=slow_frame_to_fast_time_s,
-        fast_duration_s=mf.duration_s,
-        fps=float(fps_int),
-    )
 
-    # 3) Layout
-    geom = build_output_geometry(preset, hud_width_px=hud_width_px, layout_config=layout_config)
-    _debug_dump_geometry_once(geom, log_file=log_file)
-    render_view_l, render_view_r = _build_render_video_views(view_L, view_R, layout_config)
-    
-    # Debug: Cut-Bereich auf die ersten N Sekunden begrenzen
-    try:
-        dbg_max_s = float((os.environ.get("IRVC_DEBUG_MAX_S") or "").strip() or "0")
-    except Exception:
-        dbg_max_s = 0.0
-    if dbg_max_s > 0.0:
-        max_frames = int(round(dbg_max_s * float(fps_int)))
-        cut_i1 = min(cut_i1, cut_i0 + max(1, max_frames))
-        print(f"[debug] IRVC_DEBUG_MAX_S={dbg_max_s} -> cut_i1 limited to {cut_i1}")    
-
-    cut_render_jobs: list[CutRenderJob] = []
-    cut_tmp_dir: Path | None = None
-    if effective_video_mode == "cut":
-        cut_tmp_dir = outp.parent.parent / "debug" / "_tmp_cut_segments" / str(outp.stem)
-        cut_render_jobs = _build_cut_render_jobs(
-            frame_segments=cut_frame_segments,
-            common_start_frame=int(cut_i0),
-            common_end_frame_exclusive=int(cut_i1),
-            out_dir=cut_tmp_dir,
+        cut_i0, cut_i1 = _compute_common_cut_by_fast_time(
+            fast_time_s=slow_frame_to_fast_time_s,
+            fast_duration_s=mf.duration_s,
+            fps=float(fps_int),
         )
-        if len(cut_render_jobs) == 0:
-            _log_print("Cut segments are outside common sync range → Full fallback", log_file)
-            effective_video_mode = "full"
-        else:
-            cut_ratio_pct = 0.0
-            if cut_full_duration_s > 0.0:
-                cut_ratio_pct = (cut_duration_s / cut_full_duration_s) * 100.0
+        # Multi-Lap: nur der Bereich, in dem alle Runden gueltige Zeiten haben.
+        for x, x_time_s, mx in zip(extra_laps_l, extra_time_maps, metas_extra):
+            x_i0, x_i1 = _compute_common_cut_by_fast_time(fast_time_s=x_time_s, fast_duration_s=mx.duration_s, fps=float(fps_int))
+            cut_i0, cut_i1 = max(int(cut_i0), int(x_i0)), min(int(cut_i1), int(x_i1))
+            if cut_i1 <= cut_i0:
+                raise RuntimeError(f"sync: kein gemeinsamer Bereich mit {x.video.name}.")
+        if extra_laps_l:
             _log_print(
-                (
-                    f"Cut segments: n={len(cut_frame_segments)} merges={int(cut_merge_count_total)} "
-                    f"full={cut_full_duration_s:.2f}s cut={cut_duration_s:.2f}s ({cut_ratio_pct:.1f}%)"
-                ),
+                f"[multilap] laps={2 + len(extra_laps_l)} extra=" + ",".join(x.video.name for x in extra_laps_l)
+                + f" cut_i0={cut_i0} cut_i1={cut_i1}",
                 log_file,
             )
-            cut_logger = logging.getLogger(__name__)
-            if cut_logger.isEnabledFor(logging.DEBUG):
-                preview_limit = min(3, len(cut_frame_segments))
-                for idx in range(preview_limit):
-                    seg = cut_frame_segments[idx]
-                    _log_print(
-                        (
-                            f"Cut seg[{idx}]: t={float(seg.start_time_s):.2f}..{float(seg.end_time_s):.2f}s "
-                            f"f={int(seg.start_frame)}..{int(seg.end_frame)}"
-                        ),
-                        log_file,
-                    )
-                remaining = len(cut_frame_segments) - preview_limit
-                if remaining > 0:
-                    _log_print(f"... +{remaining} more", log_file)
-
-    dbg_dir = outp.parent.parent / "debug"
-    dbg_dir.mkdir(parents=True, exist_ok=True)
-    sync_cache_path = dbg_dir / "sync_cache.json"
 
-    try:
-        k_frames = int((os.environ.get("SYNC6_K_FRAMES") or "").strip() or "30")
-    except Exception:
-        k_frames = 30
-
-    sync_cache = {
-        "mode": "stream",
-        "video_mode_requested": str(requested_video_mode),
-        "video_mode_effective": str(effective_video_mode),
-        "fps": fps_int,
-        "frame_count": len(frame_map),
-        "cut_i0": int(cut_i0),
-        "cut_i1": int(cut_i1),
-        "k_frames": int(k_frames),
-        "slow_frame_to_lapdist": slow_frame_to_lapdist,
-        "slow_frame_to_fast_frame": frame_map,
-        "slow_frame_to_fast_time_s": slow_frame_to_fast_time_s,
-        "paths": {
-            "fast_frames_dir": "",
-            "fast_sync_mp4": "",
-        },
-    }
-    sync_cache_path.write_text(json.dumps(sync_cache, indent=2), encoding="utf-8")
-
-    print(f"[sync6] mode=stream fps={fps_int}")
-    print(f"[sync6] cut_i0={cut_i0} cut_i1={cut_i1} (output wird gekuerzt)")
-    print(f"[sync6] k_frames={k_frames} (Segment-Schritt)")
-
-    if slow_frame_speed_diff is None:
-        print("[sync6] speed_diff: nicht verfÃ¼gbar (Speed fehlt in CSV)")
-
-    has_audio_slow = probe_has_audio(slow)
-    has_audio_fast = probe_has_audio(fast)
-
-    if audio_source == "slow" and not has_audio_slow:
-        print("[sync6] audio: slow hat keinen Audio-Stream -> audio=none")
-        audio_source = "none"
-    elif audio_source == "fast" and not has_audio_fast:
-        print("[sync6] audio: fast hat keinen Audio-Stream -> audio=none")
-        audio_source = "none"
-
-    # 4) HUD Render
-    # HUD pro Frame in Python rendern und als rawvideo/rgba an ffmpeg stdin streamen.
-    hud_stream_ctx: HudContext | None = None
-    # Legacy debug flag kept as an override:
-    # unset => HUD rendering ON (release/default behavior)
-    # explicit 0/false/no/off => HUD rendering OFF
-    hud_scroll_env = str(os.environ.get("IRVC_HUD_SCROLL") or "").strip().lower()
-    hud_scroll_on = hud_scroll_env not in ("0", "false", "no", "off")
-    if not hud_scroll_on:
-        _log_print(f"[hudpy] OFF via IRVC_HUD_SCROLL={hud_scroll_env or '<empty>'}", log_file)
-    if hud_scroll_on:
-        # Story 2: Zeitfenster pro HUD (nicht nur erstes HUD)
-        before_default_s = float(hud_window_default_before_s or 10.0)
-        after_default_s = float(hud_window_default_after_s or 10.0)
-
-        # aktive HUDs bestimmen (nur Namen)
-        boxes_abs = _enabled_hud_boxes_abs(geom=geom, hud_enabled=hud_enabled, hud_boxes=hud_boxes)
-        active_names = [n for (n, _b) in boxes_abs]
-        if "Line Delta" in active_names:
-            line_delta_m_frames = _build_line_delta_frames_from_csv(
-                slow_csv=scsv,
-                fast_csv=fcsv,
-                slow_duration_s=ms.duration_s,
-                fast_duration_s=mf.duration_s,
-                fps=float(fps_int),
-                slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
-                frame_count_hint=len(slow_frame_to_lapdist),
-                run_s=run_slow,
-                run_f=run_fast,
-            )
-            abs_global_max = 0.0
-            for dv in line_delta_m_frames:
-                try:
-                    av = abs(float(dv))
-                    if math.isfinite(av) and av > abs_global_max:
-                        abs_global_max = av
-                except Exception:
-                    pass
-            line_delta_y_abs_m = float(abs_global_max) * 2.0
-        if "Under-/Oversteer" in active_names:
-            (
-                under_oversteer_slow_frames,
-                under_oversteer_fast_frames,
-                under_oversteer_y_abs,
-            ) = _build_under_oversteer_proxy_frames_from_csv(
-                slow_csv=scsv,
-                fast_csv=fcsv,
-                slow_duration_s=ms.duration_s,
-                fast_duration_s=mf.duration_s,
-                fps=float(fps_int),
-                slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
-                frame_count_hint=len(slow_frame_to_lapdist),
-                under_oversteer_curve_center=float(under_oversteer_curve_center),
-                log_file=log_file,
-                run_s=run_slow,
-                run_f=run_fast,
+        # 3) Layout
+        geom = build_output_geometry(preset, hud_width_px=hud_width_px, layout_config=layout_config)
+        _debug_dump_geometry_once(geom, log_file=log_file)
+        render_view_l, render_view_r = _build_render_video_views(view_L, view_R, layout_config)
+    
+        # Debug: Cut-Bereich auf die ersten N Sekunden begrenzen
+        try:
+            dbg_max_s = float((os.environ.get("IRVC_DEBUG_MAX_S") or "").strip() or "0")
+        except Exception:
+            dbg_max_s = 0.0
+        if dbg_max_s > 0.0:
+            max_frames = int(round(dbg_max_s * float(fps_int)))
+            cut_i1 = min(cut_i1, cut_i0 + max(1, max_frames))
+            print(f"[debug] IRVC_DEBUG_MAX_S={dbg_max_s} -> cut_i1 limited to {cut_i1}")    
+        if draft is not None and draft.lapdist_range is not None:
+            cut_i0, cut_i1 = _draft_lapdist_cut(slow_frame_to_lapdist, cut_i0, cut_i1, draft.lapdist_range)
+            print(f"[draft] lapdist={draft.lapdist_range} -> cut_i0={cut_i0} cut_i1={cut_i1}")
+
+        cut_render_jobs: list[CutRenderJob] = []
+        cut_tmp_dir: Path | None = None
+        if effective_video_mode == "cut":
+            cut_tmp_dir = outp.parent.parent / "debug" / "_tmp_cut_segments" / str(outp.stem)
+            cut_render_jobs = _build_cut_render_jobs(
+                frame_segments=cut_frame_segments,
+                common_start_frame=int(cut_i0),
+                common_end_frame_exclusive=int(cut_i1),
+                out_dir=cut_tmp_dir,
             )
+            if len(cut_render_jobs) == 0:
+                _log_print("Cut segments are outside common sync range → Full fallback", log_file)
+                effective_video_mode = "full"
+            else:
+                cut_ratio_pct = 0.0
+                if cut_full_duration_s > 0.0:
+                    cut_ratio_pct = (cut_duration_s / cut_full_duration_s) * 100.0
+                _log_print(
+                    (
+                        f"Cut segments: n={len(cut_frame_segments)} merges={int(cut_merge_count_total)} "
+                        f"full={cut_full_duration_s:.2f}s cut={cut_duration_s:.2f}s ({cut_ratio_pct:.1f}%)"
+                    ),
+                    log_file,
+                )
+                cut_logger = logging.getLogger(__name__)
+                if cut_logger.isEnabledFor(logging.DEBUG):
+                    preview_limit = min(3, len(cut_frame_segments))
+                    for idx in range(preview_limit):
+                        seg = cut_frame_segments[idx]
+                        _log_print(
+                            (
+                                f"Cut seg[{idx}]: t={float(seg.start_time_s):.2f}..{float(seg.end_time_s):.2f}s "
+                                f"f={int(seg.start_frame)}..{int(seg.end_frame)}"
+                            ),
+                            log_file,
+                        )
+                    remaining = len(cut_frame_segments) - preview_limit
+                    if remaining > 0:
+                        _log_print(f"... +{remaining} more", log_file)
 
-        # Story 4.2: per-HUD Overrides sind inaktiv; alle Scroll-HUDs nutzen globales Fenster.
-        global_before_s = max(1e-6, float(before_default_s))
-        global_after_s = max(1e-6, float(after_default_s))
-        # Story 2.2: Scroll-HUD Fenster intern symmetrisch halten.
-        # Damit ist die Pixel-Scrollrate links/rechts eindeutig.
-        global_sym_s = max(float(global_before_s), float(global_after_s))
-        global_before_s = float(global_sym_s)
-        global_after_s = float(global_sym_s)
+        if effective_video_mode == "cut":
+            planned_frames = sum(max(0, int(job.end_frame) - int(job.start_frame)) for job in cut_render_jobs)
+        else:
+            planned_frames = max(0, int(cut_i1) - int(cut_i0))
+        events.emit(
+            EVENT_RENDER_PLAN,
+            frames=int(planned_frames),
+            fps=int(fps_int),
+            video_mode=str(effective_video_mode),
+            segments=int(len(cut_render_jobs)) if effective_video_mode == "cut" else 1,
+            out_w=int(geom.W),
+            out_h=int(geom.H),
+        )
 
-        # Fenster-Dict fÃ¼r Renderer: {hud_name: {"before_s": x, "after_s": y}}
-        hud_windows: dict[str, dict[str, float]] = {}
+        dbg_dir = outp.parent.parent / "debug"
+        dbg_dir.mkdir(parents=True, exist_ok=True)
+        sync_cache_path = dbg_dir / "sync_cache.json"
 
-        # Logging pro HUD (nur Scroll-HUDs)
         try:
-            r = max(1.0, float(fps_int))
+            k_frames = int((os.environ.get("SYNC6_K_FRAMES") or "").strip() or "30")
         except Exception:
-            r = 30.0
+            k_frames = 30
+
+        sync_cache = {
+            "mode": "stream",
+            "video_mode_requested": str(requested_video_mode),
+            "video_mode_effective": str(effective_video_mode),
+            "fps": fps_int,
+            "frame_count": len(frame_map),
+            "cut_i0": int(cut_i0),
+            "cut_i1": int(cut_i1),
+            "k_frames": int(k_frames),
+            "slow_frame_to_lapdist": slow_frame_to_lapdist,
+            "slow_frame_to_fast_frame": frame_map,
+            "slow_frame_to_fast_time_s": slow_frame_to_fast_time_s,
+            "paths": {
+                "fast_frames_dir": "",
+                "fast_sync_mp4": "",
+            },
+        }
+        sync_cache_path.write_text(json.dumps(sync_cache, indent=2), encoding="utf-8")
+
+        print(f"[sync6] mode=stream fps={fps_int}")
+        print(f"[sync6] cut_i0={cut_i0} cut_i1={cut_i1} (output wird gekuerzt)")
+        print(f"[sync6] k_frames={k_frames} (Segment-Schritt)")
+
+        if slow_frame_speed_diff is None:
+            print("[sync6] speed_diff: nicht verfÃ¼gbar (Speed fehlt in CSV)")
+
+        has_audio_slow = probe_has_audio(slow)
+        has_audio_fast = probe_has_audio(fast)
+
+        if audio_source == "slow" and not has_audio_slow:
+            print("[sync6] audio: slow hat keinen Audio-Stream -> audio=none")
+            audio_source = "none"
+        elif audio_source == "fast" and not has_audio_fast:
+            print("[sync6] audio: fast hat keinen Audio-Stream -> audio=none")
+            audio_source = "none"
+
+        # 4) HUD Render
+        # HUD pro Frame in Python rendern und als rawvideo/rgba an ffmpeg stdin streamen.
+        hud_stream_ctx: HudContext | None = None
+        # Legacy debug flag kept as an override:
+        # unset => HUD rendering ON (release/default behavior)
+        # explicit 0/false/no/off => HUD rendering OFF
+        hud_scroll_env = str(os.environ.get("IRVC_HUD_SCROLL") or "").strip().lower()
+        hud_scroll_on = hud_scroll_env not in ("0", "false", "no", "off")
+        if not hud_scroll_on:
+            _log_print(f"[hudpy] OFF via IRVC_HUD_SCROLL={hud_scroll_env or '<empty>'}", log_file)
+        if hud_scroll_on:
+            # Story 2: Zeitfenster pro HUD (nicht nur erstes HUD)
+            before_default_s = float(hud_window_default_before_s or 10.0)
+            after_default_s = float(hud_window_default_after_s or 10.0)
+
+            # aktive HUDs bestimmen (nur Namen)
+            boxes_abs = _enabled_hud_boxes_abs(geom=geom, hud_enabled=hud_enabled, hud_boxes=hud_boxes)
+            active_names = [n for (n, _b) in boxes_abs]
+            if "Line Delta" in active_names:
+                line_delta_m_frames = _build_line_delta_frames_from_csv(
+                    slow_csv=scsv,
+                    fast_csv=fcsv,
+                    slow_duration_s=ms.duration_s,
+                    fast_duration_s=mf.duration_s,
+                    fps=float(fps_int),
+                    slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+                    frame_count_hint=len(slow_frame_to_lapdist),
+                    run_s=run_slow,
+                    run_f=run_fast,
+                )
+                abs_global_max = 0.0
+                for dv in line_delta_m_frames:
+                    try:
+                        av = abs(float(dv))
+                        if math.isfinite(av) and av > abs_global_max:
+                            abs_global_max = av
+                    except Exception:
+                        pass
+                line_delta_y_abs_m = float(abs_global_max) * 2.0
+            if "Under-/Oversteer" in active_names:
+                (
+                    under_oversteer_slow_frames,
+                    under_oversteer_fast_frames,
+                    under_oversteer_y_abs,
+                ) = _build_under_oversteer_proxy_frames_from_csv(
+                    slow_csv=scsv,
+                    fast_csv=fcsv,
+                    slow_duration_s=ms.duration_s,
+                    fast_duration_s=mf.duration_s,
+                    fps=float(fps_int),
+                    slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+                    frame_count_hint=len(slow_frame_to_lapdist),
+                    under_oversteer_curve_center=float(under_oversteer_curve_center),
+                    log_file=log_file,
+                    run_s=run_slow,
+                    run_f=run_fast,
+                )
 
-        for hud_name in active_names:
-            if hud_name not in _SCROLL_HUD_NAMES:
-                continue
+            # Story 4.2: per-HUD Overrides sind inaktiv; alle Scroll-HUDs nutzen globales Fenster.
+            global_before_s = max(1e-6, float(before_default_s))
+            global_after_s = max(1e-6, float(after_default_s))
+            # Story 2.2: Scroll-HUD Fenster intern symmetrisch halten.
+            # Damit ist die Pixel-Scrollrate links/rechts eindeutig.
+            global_sym_s = max(float(global_before_s), float(global_after_s))
+            global_before_s = float(global_sym_s)
+            global_after_s = float(global_sym_s)
 
-            b = float(global_before_s)
-            a = float(global_after_s)
-            
-            # DEBUG: Zeigt, welche Sekundenwerte pro HUD wirklich verwendet werden
-            # (damit wir sehen, warum Steering bei dir auf 0.1/0.1 steht)
+            # Fenster-Dict fÃ¼r Renderer: {hud_name: {"before_s": x, "after_s": y}}
+            hud_windows: dict[str, dict[str, float]] = {}
+
+            # Logging pro HUD (nur Scroll-HUDs)
             try:
-                if (os.environ.get("RVA_HUD_STEER_DEBUG_FRAME") or "").strip() != "":
-                    _log_print(
-                        f"[hudpy][dbg-win] hud={hud_name} base_before={before_default_s} base_after={after_default_s} effective_before={global_before_s} effective_after={global_after_s}",
-                        log_file,
-                    )
+                r = max(1.0, float(fps_int))
             except Exception:
-                pass
+                r = 30.0
+
+            for hud_name in active_names:
+                if hud_name not in _SCROLL_HUD_NAMES:
+                    continue
+
+                b = float(global_before_s)
+                a = float(global_after_s)
+            
+                # DEBUG: Zeigt, welche Sekundenwerte pro HUD wirklich verwendet werden
+                # (damit wir sehen, warum Steering bei dir auf 0.1/0.1 steht)
+                try:
+                    if (os.environ.get("RVA_HUD_STEER_DEBUG_FRAME") or "").strip() != "":
+                        _log_print(
+                            f"[hudpy][dbg-win] hud={hud_name} base_before={before_default_s} base_after={after_default_s} effective_before={global_before_s} effective_after={global_after_s}",
+                            log_file,
+                        )
+                except Exception:
+                    pass
 
-            b = max(1e-6, float(b))
-            a = max(1e-6, float(a))
+                b = max(1e-6, float(b))
+                a = max(1e-6, float(a))
                  
-            # DEBUG: finaler Wert, der gleich in hud_windows geschrieben wird
-            try:
-                if (os.environ.get("RVA_HUD_STEER_DEBUG_FRAME") or "").strip() != "":
-                    if str(hud_name) == "Steering":
-                        _log_print(f"[hudpy][dbg-win] FINAL hud=Steering b={b} a={a}", log_file)
-            except Exception:
-                pass
+                # DEBUG: finaler Wert, der gleich in hud_windows geschrieben wird
+                try:
+                    if (os.environ.get("RVA_HUD_STEER_DEBUG_FRAME") or "").strip() != "":
+                        if str(hud_name) == "Steering":
+                            _log_print(f"[hudpy][dbg-win] FINAL hud=Steering b={b} a={a}", log_file)
+                except Exception:
+                    pass
 
-            hud_windows[str(hud_name)] = {"before_s": float(b), "after_s": float(a)}
+                hud_windows[str(hud_name)] = {"before_s": float(b), "after_s": float(a)}
 
-            bf = max(1, int(round(float(b) * r)))
-            af = max(1, int(round(float(a) * r)))
-            _log_print(f"[hudpy] hud={hud_name} before_s={b} after_s={a} frames={bf+af+1}", log_file)
+                bf = max(1, int(round(float(b) * r)))
+                af = max(1, int(round(float(a) * r)))
+                _log_print(f"[hudpy] hud={hud_name} before_s={b} after_s={a} frames={bf+af+1}", log_file)
 
-        hud_ctx = _build_hud_context(
-            fps=float(fps_int),
-            cut_i0=int(cut_i0),
-            cut_i1=int(cut_i1),
-            geom=geom,
-            hud_enabled=hud_enabled,
-            hud_boxes=hud_boxes,
-            sync=HudSyncMapping(
-                slow_frame_to_lapdist=slow_frame_to_lapdist,
-                slow_to_fast_frame=frame_map,
-                slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
-            ),
-            signals=HudSignals(
-                slow_speed_frames=slow_speed_frames,
-                fast_speed_frames=fast_speed_frames,
-                slow_min_speed_frames=slow_min_speed_frames,
-                fast_min_speed_frames=fast_min_speed_frames,
-                slow_gear_frames=slow_gear_frames,
-                fast_gear_frames=fast_gear_frames,
-                slow_rpm_frames=slow_rpm_frames,
-                fast_rpm_frames=fast_rpm_frames,
-                slow_steer_frames=slow_steer_frames,
-                fast_steer_frames=fast_steer_frames,
-                slow_throttle_frames=slow_throttle_frames,
-                fast_throttle_frames=fast_throttle_frames,
-                slow_brake_frames=slow_brake_frames,
-                fast_brake_frames=fast_brake_frames,
-                slow_abs_frames=slow_abs_frames,
-                fast_abs_frames=fast_abs_frames,
-                fast_lapdist_frames=fast_lapdist_frames,
-                line_delta_m_frames=line_delta_m_frames,
-                line_delta_y_abs_m=line_delta_y_abs_m,
-                under_oversteer_slow_frames=under_oversteer_slow_frames,
-                under_oversteer_fast_frames=under_oversteer_fast_frames,
-                under_oversteer_y_abs=under_oversteer_y_abs,
-            ),
-            window=HudWindowParams(
-                before_s=float(before_default_s),
-                after_s=float(after_default_s),
-                hud_name=None,
-                hud_windows=hud_windows,
-            ),
-            settings=HudRenderSettings(
-                speed_units=str(hud_speed_units),
-                speed_update_hz=int(hud_speed_update_hz),
-                gear_rpm_update_hz=int(hud_gear_rpm_update_hz),
-                curve_points_default=int(hud_curve_points_default),
-                curve_points_overrides=hud_curve_points_overrides,
-                pedals_sample_mode=str(hud_pedals_sample_mode),
-                pedals_abs_debounce_ms=int(hud_pedals_abs_debounce_ms),
-                max_brake_delay_distance=float(hud_max_brake_delay_distance),
-                max_brake_delay_pressure=float(hud_max_brake_delay_pressure),
-                bg_alpha=int(hud_bg_alpha),
-            ),
-            log_file=log_file,
-        )
-        hud_stream_ctx = hud_ctx
-        _log_print("[hudpy] ON -> ffmpeg stdin stream (rgba)", log_file)
+            hud_ctx = _build_hud_context(
+                fps=float(fps_int),
+                cut_i0=int(cut_i0),
+                cut_i1=int(cut_i1),
+                geom=geom,
+                hud_enabled=hud_enabled,
+                hud_boxes=hud_boxes,
+                sync=HudSyncMapping(
+                    slow_frame_to_lapdist=slow_frame_to_lapdist,
+                    slow_to_fast_frame=frame_map,
+                    slow_frame_to_fast_time_s=slow_frame_to_fast_time_s,
+                ),
+                signals=HudSignals(
+                    slow_speed_frames=slow_speed_frames,
+                    fast_speed_frames=fast_speed_frames,
+                    slow_min_speed_frames=slow_min_speed_frames,
+                    fast_min_speed_frames=fast_min_speed_frames,
+                    slow_gear_frames=slow_gear_frames,
+                    fast_gear_frames=fast_gear_frames,
+                    slow_rpm_frames=slow_rpm_frames,
+                    fast_rpm_frames=fast_rpm_frames,
+                    slow_steer_frames=slow_steer_frames,
+                    fast_steer_frames=fast_steer_frames,
+                    slow_throttle_frames=slow_throttle_frames,
+                    fast_throttle_frames=fast_throttle_frames,
+                    slow_brake_frames=slow_brake_frames,
+                    fast_brake_frames=fast_brake_frames,
+                    slow_abs_frames=slow_abs_frames,
+                    fast_abs_frames=fast_abs_frames,
+                    fast_lapdist_frames=fast_lapdist_frames,
+                    line_delta_m_frames=line_delta_m_frames,
+                    line_delta_y_abs_m=line_delta_y_abs_m,
+                    under_oversteer_slow_frames=under_oversteer_slow_frames,
+                    under_oversteer_fast_frames=under_oversteer_fast_frames,
+                    under_oversteer_y_abs=under_oversteer_y_abs,
+                    extra_laps=tuple(
+                        HudExtraLap(
+                            name=x.video.stem,
+                            slow_frame_to_time_s=x_time_s,
+                            steer_frames=_sample_csv_col_to_frames_float(run_x, mx.duration_s, float(fps_int), "SteeringWheelAngle"),
+                            throttle_frames=_sample_csv_col_to_frames_float(run_x, mx.duration_s, float(fps_int), "Throttle"),
+                            brake_frames=_sample_csv_col_to_frames_float(run_x, mx.duration_s, float(fps_int), "Brake"),
+                        )
+                        for x, x_time_s, run_x, mx in zip(extra_laps_l, extra_time_maps, runs_extra, metas_extra)
+                    ),
+                ),
+                window=HudWindowParams(
+                    before_s=float(before_default_s),
+                    after_s=float(after_default_s),
+                    hud_name=None,
+                    hud_windows=hud_windows,
+                ),
+                settings=HudRenderSettings(
+                    speed_units=str(hud_speed_units),
+                    speed_update_hz=int(hud_speed_update_hz),
+                    gear_rpm_update_hz=int(hud_gear_rpm_update_hz),
+                    curve_points_default=int(hud_curve_points_default),
+                    curve_points_overrides=hud_curve_points_overrides,
+                    pedals_sample_mode=str(hud_pedals_sample_mode),
+                    pedals_abs_debounce_ms=int(hud_pedals_abs_debounce_ms),
+                    max_brake_delay_distance=float(hud_max_brake_delay_distance),
+                    max_brake_delay_pressure=float(hud_max_brake_delay_pressure),
+                    bg_alpha=int(hud_bg_alpha),
+                ),
+                log_file=log_file,
+            )
+            hud_stream_ctx = hud_ctx
+            # Listen-Originale freigeben: Cut-Segmente teilen sich die kompakten Arrays aus hud_ctx.
+            frame_map = hud_ctx.sync.slow_to_fast_frame
+            slow_frame_to_lapdist = hud_ctx.sync.slow_frame_to_lapdist
+            slow_frame_to_fast_time_s = hud_ctx.sync.slow_frame_to_fast_time_s
+            sync_cache = {}
+            slow_speed_frames = fast_speed_frames = slow_min_speed_frames = fast_min_speed_frames = None
+            slow_gear_frames = fast_gear_frames = slow_rpm_frames = fast_rpm_frames = None
+            slow_steer_frames = fast_steer_frames = slow_throttle_frames = fast_throttle_frames = None
+            slow_brake_frames = fast_brake_frames = slow_abs_frames = fast_abs_frames = None
+            fast_lapdist_frames = line_delta_m_frames = under_oversteer_slow_frames = under_oversteer_fast_frames = None
+            sync_bytes = sum(series_nbytes(getattr(hud_ctx.sync, name)) for name in _SYNC_TYPECODES)
+            _log_print(
+                f"[hudpy] signals compact: signals={hud_ctx.signals.nbytes() // 1024}KiB sync={sync_bytes // 1024}KiB",
+                log_file,
+            )
+            _log_print("[hudpy] ON -> ffmpeg stdin stream (rgba)", log_file)
 
 
     # sendcmd-demo komplett aus (war instabil / unwirksam)
@@ -6911,14 +8304,88 @@ def render_split_screen_sync(
         hud_cmd_file=hud_cmd_file,
         log_file=log_file,
         hud_input_label=hud_label,
+        extra_time_s=extra_time_maps,
     )
 
     available_encoders = detect_available_encoders(resolve_ffmpeg_bin())
-    encode_candidates = build_encode_specs(
-        W=geom.W,
-        fps=float(fps_int),
-        available=available_encoders,
-    )
+    if draft is not None:
+        encode_candidates = build_draft_encode_specs(W=geom.W, fps=float(fps_int))
+    else:
+        # Preflight: kaputte HW-Encoder vor dem HUD-Stream aussortieren statt einen ganzen Render zu verlieren.
+        with events.stage(STAGE_ENCODER_PREFLIGHT):
+            encode_candidates = preflight_encode_specs(
+                build_encode_specs(
+                    W=geom.W,
+                    fps=float(fps_int),
+                    available=available_encoders,
+                ),
+                W=geom.W,
+                H=geom.H,
+                log_fn=lambda line: _log_print(line, log_file),
+            )
+
+    # Multi-Output: ein Filtergraph, split nach Decode/Sync, pro Ziel eigenes Compositing + Encoder.
+    # HUDs der weiteren Ziele werden vorab als FFV1-Layer gerendert (Input 1..N), das Haupt-HUD bleibt stdin.
+    multi_filt: str | None = None
+    multi_video_maps: list[str] = []
+    multi_audio_maps: list[str | None] = []
+    extra_hud_files: list[Path] = []
+    extra_hud_tmp: list[Path] = []
+    extra_specs_by_vcodec: list[dict[str, EncodeSpec]] = []
+    if extra_targets_l:
+        multi_tmp_dir = outp.parent.parent / "debug" / "_tmp_hud_layers" / str(outp.stem)
+        if hud_stream_ctx is not None:
+            with events.stage(STAGE_HUD_RENDER, targets=int(len(extra_targets_l))):
+                for t in extra_targets_l:
+                    t_ctx = replace(
+                        hud_stream_ctx,
+                        geom=t.geom,
+                        hud_boxes=t.hud_boxes if t.hud_boxes is not None else hud_boxes,
+                    )
+                    t_w, t_h, _t_x0, _t_y0 = _hud_stream_rect(t.geom)
+                    t_path, t_tmp = _prerender_hud_layer(t_ctx, (int(t_w), int(t_h)), tmp_dir=multi_tmp_dir)
+                    extra_hud_files.append(t_path)
+                    if t_tmp:
+                        extra_hud_tmp.append(t_path)
+        stream_targets = [
+            StreamSyncTarget(
+                geom=geom,
+                view_L=render_view_l,
+                view_R=render_view_r,
+                hud_enabled=hud_enabled,
+                hud_boxes=hud_boxes,
+                hud_input_label=hud_label,
+            )
+        ]
+        for k, t in enumerate(extra_targets_l):
+            stream_targets.append(
+                StreamSyncTarget(
+                    geom=t.geom,
+                    view_L=render_view_l,
+                    view_R=render_view_r,
+                    hud_enabled=hud_enabled,
+                    hud_boxes=t.hud_boxes if t.hud_boxes is not None else hud_boxes,
+                    hud_input_label=f"[{k + 1}:v]" if hud_input_active else None,
+                )
+            )
+        multi_filt, multi_video_maps, multi_audio_maps = build_multi_stream_sync_filter(
+            stream_targets,
+            fps=float(fps_int),
+            fast_time_s=slow_frame_to_fast_time_s,
+            speed_diff=slow_frame_speed_diff,
+            cut_i0=cut_i0,
+            cut_i1=cut_i1,
+            audio_source=audio_source,
+            in_offset=(1 + len(extra_hud_files)) if hud_input_active else 0,
+        )
+        for t in extra_targets_l:
+            t_specs = build_encode_specs(W=t.geom.W, fps=float(fps_int), available=available_encoders)
+            extra_specs_by_vcodec.append({spec.vcodec: spec for spec in t_specs})
+        _log_print(
+            f"[multi] outputs={1 + len(extra_targets_l)} "
+            + " ".join(f"{t.geom.W}x{t.geom.H}->{t.outp.name}" for t in extra_targets_l),
+            log_file,
+        )
 
     has_nvenc = ("h264_nvenc" in available_encoders) or ("hevc_nvenc" in available_encoders)
     has_qsv = ("h264_qsv" in available_encoders) or ("hevc_qsv" in available_encoders)
@@ -6939,6 +8406,27 @@ def render_split_screen_sync(
             _log_print("[csv] OK each_source_loaded_once", log_file)
 
     specs_by_vcodec = {enc.vcodec: enc for enc in encode_candidates}
+    encoder_failures: set[str] = set()
+    # HUD-Fortschritt ueber alle Segmente summiert (Event-Kanal), pro Encoder-Versuch zurueckgesetzt.
+    hud_progress_state = {"frames_done": 0, "elapsed_s": 0.0}
+
+    def _emit_hud_progress(written: int, total: int, seg_started: float) -> None:
+        elapsed_s = float(hud_progress_state["elapsed_s"]) + max(0.0, time.perf_counter() - seg_started)
+        done = int(hud_progress_state["frames_done"]) + int(written)
+        events.emit(
+            EVENT_HUD_PROGRESS,
+            written=int(done),
+            total=int(planned_frames),
+            segment_written=int(written),
+            segment_total=int(total),
+            elapsed_s=round(elapsed_s, 6),
+            fps=round(float(done) / elapsed_s, 3) if elapsed_s > 0.0 else 0.0,
+            ms_per_frame=round(1000.0 * elapsed_s / float(done), 3) if done > 0 else 0.0,
+        )
+
+    def _finish_hud_segment(frames: int, seg_started: float) -> None:
+        hud_progress_state["frames_done"] = int(hud_progress_state["frames_done"]) + int(frames)
+        hud_progress_state["elapsed_s"] = float(hud_progress_state["elapsed_s"]) + max(0.0, time.perf_counter() - seg_started)
 
     if effective_video_mode == "cut":
         if cut_tmp_dir is None or len(cut_render_jobs) == 0:
@@ -6952,6 +8440,8 @@ def render_split_screen_sync(
         def _run_one_cut_encoder(vcodec: str) -> tuple[int, bool]:
             enc = specs_by_vcodec[vcodec]
             live = (os.environ.get("IRVC_FFMPEG_LIVE") or "").strip() == "1"
+            hud_progress_state["frames_done"] = 0
+            hud_progress_state["elapsed_s"] = 0.0
             hud_stream_w, hud_stream_h, _hud_stream_x0, _hud_stream_y0 = _hud_stream_rect(geom)
 
             for job in cut_render_jobs:
@@ -6966,6 +8456,11 @@ def render_split_screen_sync(
                     else None
                 )
                 seg_hud_label = "[0:v]" if seg_hud_ctx is not None else None
+                seg_hud_layer = _HudLayerSession(
+                    seg_hud_ctx,
+                    (int(hud_stream_w), int(hud_stream_h)),
+                    full_redraw=True,
+                )
                 seg_filt, seg_audio_map = build_stream_sync_filter(
                     geom=geom,
                     fps=float(fps_int),
@@ -6981,6 +8476,7 @@ def render_split_screen_sync(
                     hud_cmd_file=hud_cmd_file,
                     log_file=log_file,
                     hud_input_label=seg_hud_label,
+                    extra_time_s=extra_time_maps,
                 )
                 seg_video_map = "[vout]"
                 seg_fade_ops: list[str] = []
@@ -7002,9 +8498,12 @@ def render_split_screen_sync(
                         slow=slow,
                         fast=fast,
                         hud_fps=float(fps_int),
-                        hud_stdin_raw=bool(seg_hud_ctx is not None),
+                        hud_stdin_raw=bool(seg_hud_layer.needs_stream),
                         hud_size=(int(hud_stream_w), int(hud_stream_h)),
                         hud_pix_fmt="rgba",
+                        hud_stdin_vfr=hud_vfr_enabled(),
+                        hud_file=seg_hud_layer.cached_path,
+                        extra_inputs=tuple(x.video for x in extra_laps_l),
                     ),
                     flt=FilterSpec(filter_complex=seg_filt, video_map=seg_video_map, audio_map=seg_audio_map),
                     enc=enc,
@@ -7019,117 +8518,145 @@ def render_split_screen_sync(
                     log_file,
                 )
 
-                if seg_hud_ctx is not None:
+                seg_tail: list[str] = []
+                if seg_hud_layer.needs_stream:
                     expected_bytes = int(hud_stream_w) * int(hud_stream_h) * 4
                     report_every = 5
                     report_state = {"last": 0}
 
                     def _stdin_writer(stdin_pipe: Any) -> None:
+                        seg_started = time.perf_counter()
+                        seg_frames = {"n": 0}
+                        transport = HudStdinTransport(
+                            stdin_pipe,
+                            size=(int(hud_stream_w), int(hud_stream_h)),
+                            fps=float(fps_int),
+                            vfr=hud_vfr_enabled(),
+                            expected_frames=int(job.end_frame) - int(job.start_frame),
+                        )
+
                         def _write_frame_rgba(frame_bytes: bytes) -> None:
                             if len(frame_bytes) != expected_bytes:
                                 raise RuntimeError(
                                     f"HUD stream frame size mismatch: expected {expected_bytes} bytes, got {len(frame_bytes)}"
                                 )
                             try:
-                                stdin_pipe.write(frame_bytes)
+                                transport.write(frame_bytes)
                             except BrokenPipeError as e:
                                 raise RuntimeError("ffmpeg stdin pipe closed while streaming HUD frames.") from e
+                            seg_hud_layer.write(frame_bytes)
 
                         def _on_frame_written(written: int, total: int) -> None:
+                            seg_frames["n"] = int(written)
                             if written == total or written == 1 or (written - int(report_state["last"])) >= report_every:
                                 print(f"hud_stream_frame={written}/{total}", flush=True)
+                                _emit_hud_progress(written, total, seg_started)
                                 report_state["last"] = int(written)
 
-                        _render_hud_scroll_frames_png(
-                            seg_hud_ctx,
-                            frame_writer=_write_frame_rgba,
-                            frame_written_cb=_on_frame_written,
-                            force_full_redraw=True,
-                        )
+                        events.stage_start(STAGE_HUD_RENDER, segment=int(job.index))
+                        seg_hud_layer.start()
+                        try:
+                            _render_hud_scroll_frames_png(
+                                seg_hud_ctx,
+                                frame_writer=_write_frame_rgba,
+                                frame_written_cb=_on_frame_written,
+                                force_full_redraw=True,
+                            )
+                        finally:
+                            seg_hud_layer.finish(int(seg_frames["n"]))
+                            events.stage_end(STAGE_HUD_RENDER, frames=int(seg_frames["n"]))
+                            _finish_hud_segment(int(seg_frames["n"]), seg_started)
                         try:
+                            transport.finish()
                             stdin_pipe.flush()
                         except Exception:
                             pass
 
-                    rc = run_ffmpeg(
-                        plan,
-                        tail_n=20,
-                        log_file=log_file,
-                        live_stdout=live,
-                        stdin_write_fn=_stdin_writer,
-                    )
+                    with events.stage(STAGE_ENCODE, vcodec=str(vcodec), segment=int(job.index)):
+                        rc = run_ffmpeg(
+                            plan,
+                            tail_n=20,
+                            log_file=log_file,
+                            live_stdout=live,
+                            stdin_write_fn=_stdin_writer,
+                            tail_out=seg_tail,
+                        )
                 else:
-                    rc = run_ffmpeg(plan, tail_n=20, log_file=log_file, live_stdout=live)
+                    with events.stage(STAGE_ENCODE, vcodec=str(vcodec), segment=int(job.index)):
+                        rc = run_ffmpeg(plan, tail_n=20, log_file=log_file, live_stdout=live, tail_out=seg_tail)
 
                 if rc != 0 or (not job.out_path.exists()):
+                    if is_encoder_failure(rc, seg_tail):
+                        encoder_failures.add(vcodec)
                     return int(rc), False
 
-            if len(cut_render_jobs) > 1:
-                try:
-                    if cut_black_hold_path.exists():
-                        cut_black_hold_path.unlink()
-                except Exception:
-                    pass
-                black_hold_s = 0.2
-                black_plan_cmd = [
-                    resolve_ffmpeg_bin(),
-                    "-hide_banner",
-                    "-y",
-                    "-nostats",
-                    "-progress",
-                    "pipe:1",
-                    "-f",
-                    "lavfi",
-                    "-i",
-                    f"color=c=black:s={int(geom.W)}x{int(geom.H)}:r={int(fps_int)}:d={black_hold_s:.6f}",
-                    "-map",
-                    "0:v",
-                    "-c:v",
-                    enc.vcodec,
-                    "-pix_fmt",
-                    enc.pix_fmt,
-                ]
-                black_plan_cmd += list(enc.extra)
-                if enc.fps and enc.fps > 0.1:
-                    black_plan_cmd += ["-r", f"{enc.fps}"]
-                black_plan_cmd += [str(cut_black_hold_path)]
-                black_plan = Plan(cmd=black_plan_cmd, filter_complex="", filter_script_path=None)
-                black_rc = run_ffmpeg(black_plan, tail_n=20, log_file=log_file, live_stdout=live)
-                if black_rc != 0 or (not cut_black_hold_path.exists()):
-                    return int(black_rc), False
-
-            concat_files: list[Path] = []
-            for idx, job in enumerate(cut_render_jobs):
-                concat_files.append(job.out_path)
-                if len(cut_render_jobs) > 1 and idx < (len(cut_render_jobs) - 1):
-                    concat_files.append(cut_black_hold_path)
-            _write_ffconcat_file(cut_concat_path, concat_files)
-            _log_print(
-                f"[cut] ffmpeg concat segments={len(cut_render_jobs)} transitions={max(0, len(cut_render_jobs) - 1)} -> {outp.name}",
-                log_file,
-            )
-            concat_plan = Plan(
-                cmd=[
-                    resolve_ffmpeg_bin(),
-                    "-hide_banner",
-                    "-y",
-                    "-nostats",
-                    "-progress",
-                    "pipe:1",
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(cut_concat_path),
-                    "-c",
-                    "copy",
-                    str(outp),
-                ],
-                filter_complex="",
-                filter_script_path=None,
-            )
-            concat_rc = run_ffmpeg(concat_plan, tail_n=20, log_file=log_file, live_stdout=live)
+            with events.stage(STAGE_CONCAT, segments=int(len(cut_render_jobs))):
+                if len(cut_render_jobs) > 1:
+                    try:
+                        if cut_black_hold_path.exists():
+                            cut_black_hold_path.unlink()
+                    except Exception:
+                        pass
+                    black_hold_s = 0.2
+                    black_plan_cmd = [
+                        resolve_ffmpeg_bin(),
+                        "-hide_banner",
+                        "-y",
+                        "-nostats",
+                        "-progress",
+                        "pipe:1",
+                        "-f",
+                        "lavfi",
+                        "-i",
+                        f"color=c=black:s={int(geom.W)}x{int(geom.H)}:r={int(fps_int)}:d={black_hold_s:.6f}",
+                        "-map",
+                        "0:v",
+                        "-c:v",
+                        enc.vcodec,
+                        "-pix_fmt",
+                        enc.pix_fmt,
+                    ]
+                    black_plan_cmd += list(enc.extra)
+                    if enc.fps and enc.fps > 0.1:
+                        black_plan_cmd += ["-r", f"{enc.fps}"]
+                    black_plan_cmd += [str(cut_black_hold_path)]
+                    black_plan = Plan(cmd=black_plan_cmd, filter_complex="", filter_script_path=None)
+                    black_rc = run_ffmpeg(black_plan, tail_n=20, log_file=log_file, live_stdout=live)
+                    if black_rc != 0 or (not cut_black_hold_path.exists()):
+                        return int(black_rc), False
+
+                concat_files: list[Path] = []
+                for idx, job in enumerate(cut_render_jobs):
+                    concat_files.append(job.out_path)
+                    if len(cut_render_jobs) > 1 and idx < (len(cut_render_jobs) - 1):
+                        concat_files.append(cut_black_hold_path)
+                _write_ffconcat_file(cut_concat_path, concat_files)
+                _log_print(
+                    f"[cut] ffmpeg concat segments={len(cut_render_jobs)} transitions={max(0, len(cut_render_jobs) - 1)} -> {outp.name}",
+                    log_file,
+                )
+                concat_plan = Plan(
+                    cmd=[
+                        resolve_ffmpeg_bin(),
+                        "-hide_banner",
+                        "-y",
+                        "-nostats",
+                        "-progress",
+                        "pipe:1",
+                        "-f",
+                        "concat",
+                        "-safe",
+                        "0",
+                        "-i",
+                        str(cut_concat_path),
+                        "-c",
+                        "copy",
+                        str(outp),
+                    ],
+                    filter_complex="",
+                    filter_script_path=None,
+                )
+                concat_rc = run_ffmpeg(concat_plan, tail_n=20, log_file=log_file, live_stdout=live)
             return int(concat_rc), (int(concat_rc) == 0 and outp.exists())
 
         selected_vcodec, last_rc = run_encode_with_fallback(
@@ -7138,6 +8665,9 @@ def render_split_screen_sync(
             log_fn=print,
         )
         if selected_vcodec != "":
+            record_encoder_fallback(
+                encode_candidates, selected_vcodec, W=geom.W, H=geom.H, encoder_failures=encoder_failures
+            )
             if not keep_cut_tmp:
                 for job in cut_render_jobs:
                     try:
@@ -7156,9 +8686,200 @@ def render_split_screen_sync(
                 except Exception:
                     pass
             print(f"[sync6] sync_cache_json={sync_cache_path}")
+            events.emit(
+                EVENT_RENDER_DONE,
+                vcodec=str(selected_vcodec),
+                stages=dict(events.stage_durations),
+                log=_report_render_log(log_file),
+            )
             return
         raise RuntimeError(f"ffmpeg failed (rc={last_rc})")
 
+    # Full-Modus optional in GOP-Chunks: parallel in Worker-Prozessen, fertige Chunks im Manifest (Resume),
+    # danach nahtloser Concat ohne Fades/Schwarzbilder; Audio wird beim Concat in einem Stueck angelegt.
+    full_chunk_frames, full_chunk_gop, full_chunk_workers = _full_chunk_settings(int(fps_int))
+    full_chunk_dir = outp.parent.parent / "debug" / "_tmp_full_chunks" / str(outp.stem)
+    full_chunk_jobs: list[CutRenderJob] = []
+    if full_chunk_frames > 0 and not extra_targets_l and not extra_laps_l:
+        full_chunk_jobs = _build_full_chunk_jobs(
+            start_frame=int(cut_i0),
+            end_frame_exclusive=int(cut_i1),
+            chunk_frames=int(full_chunk_frames),
+            out_dir=full_chunk_dir,
+        )
+        if len(full_chunk_jobs) < 2:
+            full_chunk_jobs = []
+
+    def _run_chunked_encoder(vcodec: str) -> tuple[int, bool]:
+        base_enc = specs_by_vcodec[vcodec]
+        enc = replace(base_enc, extra=[*base_enc.extra, "-g", str(int(full_chunk_gop))])
+        hud_stream_w, hud_stream_h, _hud_stream_x0, _hud_stream_y0 = _hud_stream_rect(geom)
+        fp = HudLayerFingerprint()
+        fp.add("filter", filt)
+        fp.add(
+            "hud",
+            _hud_layer_key(hud_stream_ctx, (int(hud_stream_w), int(hud_stream_h)), full_redraw=True)
+            if hud_stream_ctx is not None
+            else None,
+        )
+        fp.add("media", [media_key(slow), media_key(fast)])
+        fp.add("enc", [enc.vcodec, enc.pix_fmt, list(enc.extra), float(enc.fps)])
+        fp.add("chunks", [[int(job.start_frame), int(job.end_frame)] for job in full_chunk_jobs])
+        manifest_key = fp.hexdigest()
+        full_chunk_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = full_chunk_dir / "manifest.json"
+        done = _load_full_chunk_manifest(manifest_path, manifest_key)
+        pending: list[CutRenderJob] = []
+        done_frames = 0
+        for job in full_chunk_jobs:
+            entry = done.get(str(job.index))
+            try:
+                reuse = isinstance(entry, dict) and int(entry.get("bytes") or -1) == int(job.out_path.stat().st_size)
+            except Exception:
+                reuse = False
+            if reuse:
+                done_frames += int(job.end_frame) - int(job.start_frame)
+            else:
+                done.pop(str(job.index), None)
+                pending.append(job)
+        _save_full_chunk_manifest(manifest_path, manifest_key, done)
+        _log_print(
+            f"[chunks] full chunks={len(full_chunk_jobs)} frames_per_chunk={full_chunk_frames} gop={full_chunk_gop} "
+            f"workers={full_chunk_workers} resumed={len(full_chunk_jobs) - len(pending)}",
+            log_file,
+        )
+
+        chunks_started = time.perf_counter()
+        live = (os.environ.get("IRVC_FFMPEG_LIVE") or "").strip() == "1"
+
+        def _report_chunks(frames_done: int) -> None:
+            elapsed_s = max(1e-6, time.perf_counter() - chunks_started)
+            print(f"hud_stream_frame={frames_done}/{planned_frames}", flush=True)
+            events.emit(
+                EVENT_HUD_PROGRESS,
+                written=int(frames_done),
+                total=int(planned_frames),
+                elapsed_s=round(elapsed_s, 6),
+                fps=round(float(frames_done) / elapsed_s, 3),
+            )
+            events.emit(
+                EVENT_ENCODE_PROGRESS,
+                state="continue",
+                frame=float(frames_done),
+                out_time_s=float(frames_done) / float(max(1, int(fps_int))),
+            )
+
+        with events.stage(
+            STAGE_ENCODE,
+            vcodec=str(vcodec),
+            chunks=int(len(full_chunk_jobs)),
+            pending=int(len(pending)),
+        ):
+            if pending:
+                tasks = [
+                    FullChunkTask(
+                        job=job,
+                        slow=slow,
+                        fast=fast,
+                        geom=geom,
+                        fps=int(fps_int),
+                        view_L=render_view_l,
+                        view_R=render_view_r,
+                        fast_time_s=slow_frame_to_fast_time_s,
+                        speed_diff=slow_frame_speed_diff,
+                        hud_enabled=hud_enabled,
+                        hud_boxes=hud_boxes,
+                        hud_ctx=hud_stream_ctx,
+                        enc=enc,
+                        render_end_frame=min(int(cut_i1), int(job.end_frame) + max(2, int(fps_int) // 4)),
+                        sync_i0=int(cut_i0),
+                        sync_i1=int(cut_i1),
+                        log_file=job.out_path.with_suffix(".log"),
+                    )
+                    for job in pending
+                ]
+                pool = ProcessPoolExecutor(
+                    max_workers=max(1, min(int(full_chunk_workers), len(tasks))),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_full_chunk_worker_init,
+                )
+                try:
+                    futures = {pool.submit(_render_full_chunk, task): task.job for task in tasks}
+                    for fut in as_completed(futures):
+                        job = futures[fut]
+                        try:
+                            _idx, rc, chunk_encoder_failed = fut.result()
+                        except Exception as e:
+                            _log_print(f"[chunks] chunk {job.index} crashed: {type(e).__name__}: {e}", log_file)
+                            rc, chunk_encoder_failed = 1, False
+                        if chunk_encoder_failed:
+                            encoder_failures.add(vcodec)
+                        if rc != 0 or not job.out_path.exists():
+                            _log_print(
+                                f"[chunks] chunk {job.index} FAIL rc={rc} log={job.out_path.with_suffix('.log')}",
+                                log_file,
+                            )
+                            return int(rc or 1), False
+                        done[str(job.index)] = {
+                            "frames": [int(job.start_frame), int(job.end_frame)],
+                            "bytes": int(job.out_path.stat().st_size),
+                        }
+                        _save_full_chunk_manifest(manifest_path, manifest_key, done)
+                        done_frames += int(job.end_frame) - int(job.start_frame)
+                        _report_chunks(done_frames)
+                finally:
+                    pool.shutdown(wait=True, cancel_futures=True)
+
+        concat_path = full_chunk_dir / "concat.txt"
+        _write_ffconcat_file(concat_path, [job.out_path for job in full_chunk_jobs])
+        audio_filt, chunk_audio_map = build_stream_sync_audio_filter(
+            fps=float(fps_int),
+            fast_time_s=slow_frame_to_fast_time_s,
+            speed_diff=slow_frame_speed_diff,
+            cut_i0=cut_i0,
+            cut_i1=cut_i1,
+            audio_source=audio_source,
+            in_offset=1,
+        )
+        concat_cmd = [
+            resolve_ffmpeg_bin(),
+            "-hide_banner",
+            "-y",
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(concat_path),
+        ]
+        if chunk_audio_map:
+            concat_cmd += ["-i", str(slow), "-i", str(fast), "-filter_complex", audio_filt]
+        concat_cmd += ["-map", "0:v"]
+        if chunk_audio_map:
+            concat_cmd += ["-map", chunk_audio_map]
+        concat_cmd += ["-c:v", "copy", str(outp)]
+        _log_print(f"[chunks] ffmpeg concat chunks={len(full_chunk_jobs)} -> {outp.name}", log_file)
+        with events.stage(STAGE_CONCAT, segments=int(len(full_chunk_jobs))):
+            concat_rc = run_ffmpeg(
+                Plan(cmd=concat_cmd, filter_complex=audio_filt, filter_script_path=None),
+                tail_n=20,
+                log_file=log_file,
+                live_stdout=live,
+            )
+        if int(concat_rc) != 0 or not outp.exists():
+            return int(concat_rc), False
+        # Sanity: Chunk-Ausgabe muss exakt so viele Frames haben wie ein Gesamt-Render, sonst monolithisch.
+        expected_frames = int(cut_i1) - int(cut_i0)
+        got_frames = _count_video_frames(outp)
+        _log_print(f"[chunks] sanity frames expected={expected_frames} got={got_frames}", log_file)
+        if got_frames != expected_frames:
+            _log_print("[chunks] frame count mismatch -> fallback to monolithic encode", log_file)
+            return _run_one_encoder(vcodec)
+        return int(concat_rc), True
+
     def _run_one_encoder(vcodec: str) -> tuple[int, bool]:
         enc = specs_by_vcodec[vcodec]
         # Debug: nur die ersten N Sekunden rendern (spart Zeit)
@@ -7170,72 +8891,153 @@ def render_split_screen_sync(
             print(f"[debug] IRVC_DEBUG_MAX_S={dbg_max_s} -> input limited")
 
         hud_stream_w, hud_stream_h, _hud_stream_x0, _hud_stream_y0 = _hud_stream_rect(geom)
+        hud_layer = _HudLayerSession(hud_stream_ctx, (int(hud_stream_w), int(hud_stream_h)))
+        if multi_filt is not None:
+            flt = FilterSpec(filter_complex=multi_filt, video_map=multi_video_maps[0], audio_map=multi_audio_maps[0])
+            extra_outputs = tuple(
+                OutputSpec(
+                    outp=t.outp,
+                    video_map=multi_video_maps[k + 1],
+                    enc=t.encoder or extra_specs_by_vcodec[k].get(vcodec) or enc,
+                    audio_map=multi_audio_maps[k + 1],
+                )
+                for k, t in enumerate(extra_targets_l)
+            )
+        else:
+            flt = FilterSpec(filter_complex=filt, video_map="[vout]", audio_map=audio_map)
+            extra_outputs = ()
         plan = build_plan(
             decode=DecodeSpec(
                 slow=slow,
                 fast=fast,
                 hud_fps=float(fps_int),
-                hud_stdin_raw=bool(hud_stream_ctx is not None),
+                hud_stdin_raw=bool(hud_layer.needs_stream),
                 hud_size=(int(hud_stream_w), int(hud_stream_h)),
                 hud_pix_fmt="rgba",
+                hud_stdin_vfr=hud_vfr_enabled(),
+                hud_file=hud_layer.cached_path,
+                extra_hud_files=tuple(extra_hud_files),
+                extra_inputs=tuple(x.video for x in extra_laps_l),
             ),
-            flt=FilterSpec(filter_complex=filt, video_map="[vout]", audio_map=audio_map),
+            flt=flt,
             enc=enc,
             audio_source="none",
             outp=outp,
             debug_max_s=dbg_max_s,
+            extra_outputs=extra_outputs,
         )
 
         live = (os.environ.get("IRVC_FFMPEG_LIVE") or "").strip() == "1"
-        if hud_stream_ctx is not None:
+        tail: list[str] = []
+        if hud_layer.needs_stream:
             expected_bytes = int(hud_stream_w) * int(hud_stream_h) * 4
             report_every = 5
             report_state = {"last": 0}
 
             def _stdin_writer(stdin_pipe: Any) -> None:
+                hud_started = time.perf_counter()
+                hud_frames = {"n": 0}
+                transport = HudStdinTransport(
+                    stdin_pipe,
+                    size=(int(hud_stream_w), int(hud_stream_h)),
+                    fps=float(fps_int),
+                    vfr=hud_vfr_enabled(),
+                    expected_frames=int(hud_stream_ctx.cut_i1) - int(hud_stream_ctx.cut_i0),
+                )
+
                 def _write_frame_rgba(frame_bytes: bytes) -> None:
                     if len(frame_bytes) != expected_bytes:
                         raise RuntimeError(
                             f"HUD stream frame size mismatch: expected {expected_bytes} bytes, got {len(frame_bytes)}"
                         )
                     try:
-                        stdin_pipe.write(frame_bytes)
+                        transport.write(frame_bytes)
                     except BrokenPipeError as e:
                         raise RuntimeError("ffmpeg stdin pipe closed while streaming HUD frames.") from e
+                    hud_layer.write(frame_bytes)
 
                 def _on_frame_written(written: int, total: int) -> None:
+                    hud_frames["n"] = int(written)
                     if written == total or written == 1 or (written - int(report_state["last"])) >= report_every:
                         print(f"hud_stream_frame={written}/{total}", flush=True)
+                        _emit_hud_progress(written, total, hud_started)
                         report_state["last"] = int(written)
 
-                _render_hud_scroll_frames_png(
-                    hud_stream_ctx,
-                    frame_writer=_write_frame_rgba,
-                    frame_written_cb=_on_frame_written,
-                )
+                events.stage_start(STAGE_HUD_RENDER)
+                hud_layer.start()
+                try:
+                    _render_hud_scroll_frames_png(
+                        hud_stream_ctx,
+                        frame_writer=_write_frame_rgba,
+                        frame_written_cb=_on_frame_written,
+                    )
+                finally:
+                    hud_layer.finish(int(hud_frames["n"]))
+                    events.stage_end(STAGE_HUD_RENDER, frames=int(hud_frames["n"]))
                 try:
+                    transport.finish()
+                    if transport.vfr:
+                        _log_print(f"[hud-vfr] {transport.sent}/{transport.frames} frames gesendet", log_file)
                     stdin_pipe.flush()
                 except Exception:
                     pass
 
-            rc = run_ffmpeg(
-                plan,
-                tail_n=20,
-                log_file=log_file,
-                live_stdout=live,
-                stdin_write_fn=_stdin_writer,
-            )
+            with events.stage(STAGE_ENCODE, vcodec=str(vcodec)):
+                rc = run_ffmpeg(
+                    plan,
+                    tail_n=20,
+                    log_file=log_file,
+                    live_stdout=live,
+                    stdin_write_fn=_stdin_writer,
+                    tail_out=tail,
+                )
         else:
-            rc = run_ffmpeg(plan, tail_n=20, log_file=log_file, live_stdout=live)
-        return rc, (rc == 0 and outp.exists())
+            with events.stage(STAGE_ENCODE, vcodec=str(vcodec)):
+                rc = run_ffmpeg(plan, tail_n=20, log_file=log_file, live_stdout=live, tail_out=tail)
+        if is_encoder_failure(rc, tail):
+            encoder_failures.add(vcodec)
+        return rc, (rc == 0 and outp.exists() and all(t.outp.exists() for t in extra_targets_l))
 
-    selected_vcodec, last_rc = run_encode_with_fallback(
-        build_cmd_fn=_run_one_encoder,
-        encoder_order=[enc.vcodec for enc in encode_candidates],
-        log_fn=print,
-    )
+    try:
+        selected_vcodec, last_rc = run_encode_with_fallback(
+            build_cmd_fn=_run_chunked_encoder if full_chunk_jobs else _run_one_encoder,
+            encoder_order=[enc.vcodec for enc in encode_candidates],
+            log_fn=print,
+        )
+    finally:
+        for tmp_layer in extra_hud_tmp:
+            try:
+                tmp_layer.unlink()
+                tmp_layer.parent.rmdir()
+            except Exception:
+                pass
     if selected_vcodec != "":
+        record_encoder_fallback(
+            encode_candidates, selected_vcodec, W=geom.W, H=geom.H, encoder_failures=encoder_failures
+        )
+        # Chunks nur nach Erfolg wegraeumen; nach Abbruch/Fehler bleiben sie fuers Resume liegen.
+        keep_chunks = (os.environ.get("IRVC_KEEP_FULL_CHUNKS") or "").strip().lower() in ("1", "true", "yes", "on")
+        if full_chunk_jobs and not keep_chunks:
+            chunk_files = [job.out_path for job in full_chunk_jobs]
+            chunk_files += [job.out_path.with_suffix(".log") for job in full_chunk_jobs]
+            chunk_files += [full_chunk_dir / "manifest.json", full_chunk_dir / "concat.txt"]
+            for chunk_file in chunk_files:
+                try:
+                    if chunk_file.exists():
+                        chunk_file.unlink()
+                except Exception:
+                    pass
+            try:
+                full_chunk_dir.rmdir()
+            except Exception:
+                pass
         print(f"[sync6] sync_cache_json={sync_cache_path}")
+        events.emit(
+            EVENT_RENDER_DONE,
+            vcodec=str(selected_vcodec),
+            stages=dict(events.stage_durations),
+            log=_report_render_log(log_file),
+        )
         return
 
     raise RuntimeError(f"ffmpeg failed (rc={last_rc})")
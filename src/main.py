@@ -14,10 +14,11 @@ from core.log import make_logger
 from core.models import LayoutConfig, migrate_layout_contract_dict
 from core.resources import get_resource_path
 from features.huds.common import configure_hud_text_style
-from features.render_split import render_split_screen, render_split_screen_sync
-from core.csv_g61 import get_float_col, load_g61_csv
+from features.render_split import ExtraLap, render_split_screen, render_split_screen_sync
+from core.csv_g61 import RunData, get_float_col, load_g61_csv
 from core.resample_lapdist import build_lapdist_grid, resample_run_linear
 from core.sync_map import build_sync_map_by_lapdist
+from core.telemetry_library import choose_best_csv_match, get_telemetry_library, library_enabled
 
 
 TIME_RE = re.compile(r"(\d{2}\.\d{2}\.\d{3})")
@@ -121,56 +122,24 @@ def _resolve_csv_candidate(raw: str, csv_search_dirs: list[Path]) -> Path | None
     return None
 
 
-def _choose_best_csv_match(video_path: Path, csv_candidates: list[Path]) -> tuple[Path | None, str]:
-    target_stem = str(video_path.stem or "").strip().lower()
-    if not target_stem:
-        return None, "none"
-
-    target_compact = re.sub(r"[^a-z0-9]+", "", target_stem)
-    best: tuple[int, int, int, str, Path, str] | None = None
-
-    for c in csv_candidates:
-        try:
-            cp = Path(c).resolve()
-        except Exception:
-            continue
-        if cp.suffix.lower() != ".csv":
-            continue
-        stem = str(cp.stem or "").strip().lower()
-        if not stem:
-            continue
-
-        mode = "none"
-        score = -1
-        if stem == target_stem:
-            score = 300
-            mode = "exact"
-        elif target_stem in stem:
-            score = 200
-            mode = "contains"
-        else:
-            stem_compact = re.sub(r"[^a-z0-9]+", "", stem)
-            if target_compact and stem_compact and target_compact in stem_compact:
-                score = 100
-                mode = "contains_compact"
-
-        if score < 0:
-            continue
+def _load_ui_parquet_run(ui: dict, key: str) -> RunData | None:
+    # UI-Runde aus Coaching-Parquet: {"parquet": ..., "lap": {Segment-/Lap-Meta} oder "lap_index": n}
+    # Gesetzt, aber nicht ladbar -> RuntimeError (kein stiller Fallback auf CSV-Matching).
+    raw = ui.get(key)
+    if not isinstance(raw, dict) or not str(raw.get("parquet") or "").strip():
+        return None
+    from core.coaching.run_data import load_parquet_lap
 
-        rank = (
-            -score,
-            abs(len(stem) - len(target_stem)),
-            len(stem),
-            cp.name.lower(),
-            cp,
-            mode,
+    lap = raw.get("lap") if isinstance(raw.get("lap"), dict) else None
+    lap_index = raw.get("lap_index")
+    try:
+        return load_parquet_lap(
+            str(raw.get("parquet")).strip(),
+            lap=lap,
+            lap_index=int(lap_index) if lap_index is not None else None,
         )
-        if best is None or rank < best:
-            best = rank
-
-    if best is None:
-        return None, "none"
-    return best[4], best[5]
+    except Exception as e:
+        raise RuntimeError(f"{key} aus Parquet nicht ladbar: {e}") from e
 
 
 def _show_error_messagebox(title: str, text: str) -> None:
@@ -346,6 +315,8 @@ def main() -> None:
     fast_video = None
     slow_csv = None
     fast_csv = None
+    slow_run = None
+    fast_run = None
 
     try:
         sv = (ui.get("slow_video") or "").strip()
@@ -407,15 +378,27 @@ def main() -> None:
         log.kv("csv_search_dirs", ";".join(str(p) for p in csv_search_dirs))
     except Exception:
         pass
+    # 0) Runden direkt aus Coaching-Parquet (ohne CSV-Export), ersetzen die CSV-Zuordnung.
+    #    Explizit gewaehlte Runde, die nicht ladbar ist -> Abbruch statt stillem Fallback auf CSV.
+    if isinstance(ui, dict):
+        slow_run = _load_ui_parquet_run(ui, "slow_run")
+        fast_run = _load_ui_parquet_run(ui, "fast_run")
     try:
         csv_candidates: list[Path] = []
 
+        if slow_run is not None:
+            slow_csv = Path(slow_run.csv_path)
+            log.kv("slow_run_rows", str(slow_run.row_count))
+        if fast_run is not None:
+            fast_csv = Path(fast_run.csv_path)
+            log.kv("fast_run_rows", str(fast_run.row_count))
+
         # 1) Direkte Keys (falls vorhanden)
         sc = (ui.get("slow_csv") or "").strip() if isinstance(ui, dict) else ""
         fc = (ui.get("fast_csv") or "").strip() if isinstance(ui, dict) else ""
-        if sc:
+        if sc and slow_run is None:
             slow_csv = _resolve_csv_candidate(sc, csv_search_dirs)
-        if fc:
+        if fc and fast_run is None:
             fast_csv = _resolve_csv_candidate(fc, csv_search_dirs)
 
         # 2) Kandidaten aus ui["csvs"] (Dateinamen) auflösen
@@ -427,24 +410,53 @@ def main() -> None:
                         p = _resolve_csv_candidate(item, csv_search_dirs)
                         _add_unique_path(csv_candidates, p)
 
-        # 3) Kandidaten aus bekannten CSV-Ordnern einsammeln (_internal + portable + neben Videos)
-        for d in csv_search_dirs:
+        # 3) Kandidaten aus bekannten CSV-Ordnern einsammeln (_internal + portable + neben Videos).
+        #    Nur noetig, wenn noch ein Video ohne CSV uebrig ist (slow/fast oder Extra-Lap ohne csv).
+        #    Mit Telemetry-Library: nur Dateien, deren Name zum Video passt (SQLite-Lookup statt Glob ueber alles).
+        match_videos: list[Path] = []
+        if slow_csv is None and slow_video is not None:
+            match_videos.append(slow_video)
+        if fast_csv is None and fast_video is not None:
+            match_videos.append(fast_video)
+        raw_extra = ui.get("extra_laps") if isinstance(ui, dict) else None
+        if isinstance(raw_extra, list):
+            for item in raw_extra:
+                if isinstance(item, dict) and str(item.get("video") or "").strip() and not str(item.get("csv") or "").strip():
+                    match_videos.append(Path(str(item.get("video")).strip()))
+        library_ok = not match_videos
+        if match_videos and library_enabled():
             try:
-                if not d.exists():
+                lib = get_telemetry_library()
+                lib_stats = lib.refresh(csv_search_dirs)
+                log.kv(
+                    "telemetry_library",
+                    f"seen={lib_stats.seen} added={lib_stats.added} removed={lib_stats.removed} "
+                    f"skipped={lib_stats.skipped} ms={lib_stats.elapsed_ms}",
+                )
+                for v in match_videos:
+                    for p in sorted(lib.match_candidates(v, csv_search_dirs)):
+                        _add_unique_path(csv_candidates, p)
+                library_ok = True
+            except Exception as e:
+                log.kv("telemetry_library_error", str(e))
+        if not library_ok:
+            for d in csv_search_dirs:
+                try:
+                    if not d.exists():
+                        continue
+                    for p in sorted(d.glob("*.csv")):
+                        _add_unique_path(csv_candidates, p)
+                except Exception:
                     continue
-                for p in sorted(d.glob("*.csv")):
-                    _add_unique_path(csv_candidates, p)
-            except Exception:
-                continue
 
         # 4) Auto-Matching per Video-Dateiname (exakt bevorzugt, sonst contains)
         if slow_csv is None and slow_video is not None:
-            slow_csv, slow_mode = _choose_best_csv_match(slow_video, csv_candidates)
+            slow_csv, slow_mode = choose_best_csv_match(slow_video, csv_candidates)
             if slow_csv is not None:
                 log.kv("slow_csv_match_mode", slow_mode)
         if fast_csv is None and fast_video is not None:
             fast_pool = [p for p in csv_candidates if slow_csv is None or str(p).lower() != str(slow_csv).lower()]
-            fast_csv, fast_mode = _choose_best_csv_match(fast_video, fast_pool)
+            fast_csv, fast_mode = choose_best_csv_match(fast_video, fast_pool)
             if fast_csv is not None:
                 log.kv("fast_csv_match_mode", fast_mode)
     except Exception as e:
@@ -456,6 +468,31 @@ def main() -> None:
     if fast_csv is not None:
         log.kv("fast_csv", fast_csv.name)
 
+    # Multi-Lap: weitere Referenzrunden aus der UI (video + csv; ohne csv per Auto-Matching)
+    extra_laps: list[ExtraLap] = []
+    raw_extra_laps = ui.get("extra_laps") if isinstance(ui, dict) else None
+    if isinstance(raw_extra_laps, list):
+        used_csvs = {str(p).lower() for p in (slow_csv, fast_csv) if p is not None}
+        for item in raw_extra_laps:
+            try:
+                if not isinstance(item, dict) or not str(item.get("video") or "").strip():
+                    continue
+                xv = Path(str(item.get("video")).strip()).resolve()
+                xc_raw = str(item.get("csv") or "").strip()
+                xc = _resolve_csv_candidate(xc_raw, csv_search_dirs) if xc_raw else None
+                if xc is None:
+                    xc, _x_mode = choose_best_csv_match(
+                        xv, [p for p in csv_candidates if str(p).lower() not in used_csvs]
+                    )
+                if xc is None or not xv.exists():
+                    log.kv("extra_lap_skipped", xv.name)
+                    continue
+                used_csvs.add(str(xc).lower())
+                extra_laps.append(ExtraLap(video=xv, csv=xc))
+                log.kv("extra_lap", f"{xv.name} csv={xc.name}")
+            except Exception as e:
+                log.kv("extra_lap_error", str(e))
+
 # Story 4: CSV-basierte Vorbereitung (Resample + Sync-Map) als Debug
     try:
         if slow_csv is None or fast_csv is None:
@@ -465,8 +502,8 @@ def main() -> None:
         if not fast_csv.exists():
             raise RuntimeError(f"fast_csv Datei nicht gefunden: {fast_csv}")
 
-        run_s = load_g61_csv(slow_csv)
-        run_f = load_g61_csv(fast_csv)
+        run_s = slow_run if slow_run is not None else load_g61_csv(slow_csv)
+        run_f = fast_run if fast_run is not None else load_g61_csv(fast_csv)
         log.msg(f"HUD telemetry rows slow={int(getattr(run_s, 'row_count', 0))}, fast={int(getattr(run_f, 'row_count', 0))}")
 
         ld_s = get_float_col(run_s, "LapDistPct")
@@ -822,8 +859,8 @@ def main() -> None:
         render_split_screen_sync(
             slow=slow_video,
             fast=fast_video,
-            slow_csv=slow_csv,
-            fast_csv=fast_csv,
+            slow_csv=slow_run if slow_run is not None else slow_csv,
+            fast_csv=fast_run if fast_run is not None else fast_csv,
             outp=out_video,
             start_s=0.0,
             duration_s=0.0,
@@ -854,6 +891,7 @@ def main() -> None:
             video_cut_minimum_between_two_curves_s=float(video_cut_min_between_curves_s),
             layout_config=layout_config,
             log_file=log.log_file,
+            extra_laps=extra_laps,
         )
     else:
         render_split_screen(
@@ -888,5 +926,9 @@ def main() -> None:
     log.msg("render done")
 
 if __name__ == "__main__":
+    # Gefrorene Builds: Worker-Prozesse (Chunk-Render) starten ueber dieselbe exe.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
 
@@ -7,14 +7,13 @@ import math
 import queue
 import re
 from pathlib import Path
+import importlib
 import json
 import os
 import shutil
 import subprocess
 import threading
 import time
-import urllib.error
-import urllib.request
 import webbrowser
 from dataclasses import dataclass
 from typing import Callable, TYPE_CHECKING
@@ -33,8 +32,9 @@ from core.models import (
 )
 from core.cfg import APP_NAME, APP_VERSION
 from core.diagnostics import detect_onedrive_risky_paths, export_diagnostics_bundle
-from core import persistence, filesvc, profile_service, render_service
-from core.coaching.indexer import CoachingIndex, CoachingTreeNode, scan_storage
+from core.log import build_log_file_path
+from core import persistence, filesvc, profile_service, render_service, startup_profile, ui_watchdog
+from core.fswatch import EVENT_RESCAN, FolderWatcher
 from core.coaching.storage import (
     ACTIVE_SESSION_LOCK_FILENAME,
     SESSION_FINALIZED_FILENAME,
@@ -44,6 +44,7 @@ from core.ffmpeg_tools import ffprobe_exists as _ffprobe_exists_bundled, resolve
 from core.optional_deps import has_cv2, try_import_cv2
 from core.resources import get_resource_path
 from core.subprocess_utils import windows_no_window_subprocess_kwargs
+from core.telemetry_library import choose_best_csv_match
 from core.output_geometry import (
     Rect,
     build_output_geometry_for_size,
@@ -52,12 +53,12 @@ from core.output_geometry import (
     split_weighted_lengths,
     vertical_fit_weight_for_hud_key,
 )
-from ui.preview.layout_preview import LayoutPreviewController, OutputFormat as LayoutPreviewOutputFormat
-from ui.preview.png_preview import PngPreviewController
-from ui.coaching_browser import CoachingBrowser
 from ui.controller import Controller, UIContext
 
+# Schwere Module (NumPy/PyArrow ueber den Coaching-Index, PIL/cv2 ueber die Previews, urllib) werden erst
+# in der Ansicht importiert, die sie braucht: das Fenster steht vorher.
 if TYPE_CHECKING:
+    from core.coaching.indexer import CoachingIndex, CoachingTreeNode
     from ui.preview.video_preview import VideoPreviewController
 
 
@@ -136,6 +137,8 @@ def _parse_semver_triplet(version_text: str) -> tuple[int, int, int]:
 
 
 def _fetch_update_manifest() -> tuple[str, str, str]:
+    import urllib.request
+
     request = urllib.request.Request(
         UPDATE_VERSION_JSON_URL,
         headers={"User-Agent": f"IWAS/{APP_VERSION}"},
@@ -231,6 +234,8 @@ def _show_update_available_dialog(root: tk.Misc, online_version: str, release_ur
 
 def _run_update_check(root: tk.Misc, *, show_up_to_date: bool) -> None:
     def _worker() -> None:
+        import urllib.error
+
         try:
             online_version, release_url, notes = _fetch_update_manifest()
             is_newer = _parse_semver_triplet(online_version) > _parse_semver_triplet(APP_VERSION)
@@ -1640,6 +1645,13 @@ class CoachingView(ttk.Frame):
         self._status_vars: dict[str, tk.StringVar] = {}
         self._status_poll_after_id: str | None = None
         self._last_writer_error_seen: str | None = None
+        self._storage_watch: FolderWatcher | None = None
+        self._storage_changed: set[Path] = set()
+        # Aenderungen in Sessions mit aktivem Lock (Recorder schreibt) -> erst nach Session-Ende indexieren.
+        self._storage_deferred: dict[Path, set[Path]] = {}
+        self._storage_rescan_pending = False
+        self._storage_last_refresh = 0.0
+        self._scan_inflight = False
 
         layout = ttk.Frame(self, padding=12)
         layout.grid(row=0, column=0, sticky="nsew")
@@ -1686,6 +1698,8 @@ class CoachingView(ttk.Frame):
             self._status_vars[key] = var
             ttk.Label(status, textvariable=var).grid(row=row_idx, column=1, sticky="w", pady=1)
 
+        from ui.coaching_browser import CoachingBrowser
+
         self._browser_widget = CoachingBrowser(
             browser,
             on_refresh=self._refresh_coaching_index,
@@ -1694,7 +1708,8 @@ class CoachingView(ttk.Frame):
             on_select_node=self._show_coaching_node_details,
         )
         self._browser_widget.grid(row=0, column=0, sticky="nsew")
-        self._refresh_coaching_index()
+        self._start_initial_scan()
+        self._start_storage_watch()
         self.bind("<Destroy>", self._on_destroy, add="+")
         self.after(300, self._poll_recorder_status)
 
@@ -1704,12 +1719,158 @@ class CoachingView(ttk.Frame):
         except Exception:
             return Path.cwd()
 
-    def _refresh_coaching_index(self) -> CoachingIndex:
+    def _refresh_coaching_index(self) -> CoachingIndex | None:
+        if self._scan_inflight:
+            return self._coaching_index
+        from core.coaching.indexer import scan_storage
+
         index = scan_storage(self._coaching_root_dir())
+        self._apply_full_scan(index)
+        return index
+
+    def _apply_full_scan(self, index: CoachingIndex) -> None:
         self._coaching_index = index
+        self._storage_changed.clear()
+        self._storage_rescan_pending = False
+        self._storage_last_refresh = time.monotonic()
         self._browser_widget.set_index(index)
         self._browser_widget.set_message(f"Scanned: {index.root_dir}")
-        return index
+
+    def _start_initial_scan(self) -> None:
+        # Erster Scan im Hintergrund: die Ansicht steht sofort, der Baum folgt.
+        root_dir = self._coaching_root_dir()
+        result: dict[str, object] = {}
+
+        def _run() -> None:
+            try:
+                from core.coaching.indexer import scan_storage
+
+                result["index"] = scan_storage(root_dir)
+            except Exception as exc:
+                result["error"] = exc
+
+        self._scan_inflight = True
+        self._browser_widget.set_message(f"Scanning: {root_dir}")
+        thread = threading.Thread(target=_run, name="coaching-scan", daemon=True)
+        thread.start()
+        self.after(50, lambda: self._finish_initial_scan(thread, result))
+
+    def _finish_initial_scan(self, thread: threading.Thread, result: dict[str, object]) -> None:
+        try:
+            if not self.winfo_exists():
+                return
+        except Exception:
+            return
+        if thread.is_alive():
+            self.after(50, lambda: self._finish_initial_scan(thread, result))
+            return
+        self._scan_inflight = False
+        index = result.get("index")
+        if index is None:
+            self._browser_widget.set_message(f"Scan failed: {result.get('error')}")
+            return
+        self._apply_full_scan(index)  # type: ignore[arg-type]
+
+    def _start_storage_watch(self) -> None:
+        # Session-Ordner + deren Inhalt beobachten; ohne Watcher bleibt nur der Refresh-Button.
+        try:
+            self._storage_watch = FolderWatcher(
+                [self._coaching_root_dir()],
+                recursive=True,
+                max_depth=2,
+                debounce_s=1.0,
+            ).start()
+        except Exception:
+            self._storage_watch = None
+
+    def _poll_storage_watch(self) -> None:
+        watch = self._storage_watch
+        if watch is None or self._scan_inflight:
+            return
+        try:
+            events = watch.drain()
+        except Exception:
+            events = []
+        root_dir = self._coaching_root_dir()
+        active: dict[Path, bool] = {}
+        for ev in events:
+            if ev.kind == EVENT_RESCAN:
+                self._storage_rescan_pending = True
+                continue
+            session_dir = self._session_dir_of(root_dir, ev.path)
+            if session_dir is not None:
+                if session_dir not in active:
+                    active[session_dir] = self._is_session_recording(session_dir)
+                if active[session_dir]:
+                    self._storage_deferred.setdefault(session_dir, set()).add(ev.path)
+                    continue
+            self._storage_changed.add(ev.path)
+        for session_dir in list(self._storage_deferred):
+            if not active.get(session_dir, self._is_session_recording(session_dir)):
+                self._storage_changed |= self._storage_deferred.pop(session_dir)
+        if not self._storage_changed and not self._storage_rescan_pending:
+            return
+        # Nachzuegler nach Session-Ende buendeln: hoechstens alle 2 s neu indexieren.
+        if time.monotonic() - self._storage_last_refresh < 2.0:
+            return
+        if self._storage_rescan_pending:
+            self._start_storage_scan(root_dir, None)
+            return
+        changed = set(self._storage_changed)
+        self._storage_changed.clear()
+        self._start_storage_scan(root_dir, changed)
+
+    @staticmethod
+    def _session_dir_of(root_dir: Path, path: Path) -> Path | None:
+        try:
+            rel = Path(path).relative_to(root_dir)
+        except ValueError:
+            return None
+        return root_dir / rel.parts[0] if rel.parts else None
+
+    @staticmethod
+    def _is_session_recording(session_dir: Path) -> bool:
+        try:
+            return (session_dir / ACTIVE_SESSION_LOCK_FILENAME).exists()
+        except Exception:
+            return False
+
+    def _start_storage_scan(self, root_dir: Path, changed: set[Path] | None) -> None:
+        # Watcher-Rescan im Hintergrund; der Tk-Thread uebernimmt nur das Ergebnis.
+        result: dict[str, object] = {}
+
+        def _run() -> None:
+            try:
+                from core.coaching.indexer import scan_storage
+
+                result["index"] = scan_storage(root_dir, changed_paths=changed)
+            except Exception as exc:
+                result["error"] = exc
+
+        self._scan_inflight = True
+        self._storage_last_refresh = time.monotonic()
+        thread = threading.Thread(target=_run, name="coaching-watch-scan", daemon=True)
+        thread.start()
+        self.after(50, lambda: self._finish_storage_scan(thread, result, full=changed is None))
+
+    def _finish_storage_scan(self, thread: threading.Thread, result: dict[str, object], *, full: bool) -> None:
+        try:
+            if not self.winfo_exists():
+                return
+        except Exception:
+            return
+        if thread.is_alive():
+            self.after(50, lambda: self._finish_storage_scan(thread, result, full=full))
+            return
+        self._scan_inflight = False
+        index = result.get("index")
+        if index is None:
+            return
+        if full:
+            self._apply_full_scan(index)  # type: ignore[arg-type]
+            return
+        self._coaching_index = index  # type: ignore[assignment]
+        self._browser_widget.set_index(index)  # type: ignore[arg-type]
 
     def _show_coaching_node_details(self, node: CoachingTreeNode) -> None:
         lines: list[str] = [f"Type: {node.kind}", f"Name: {node.label}"]
@@ -1863,6 +2024,7 @@ class CoachingView(ttk.Frame):
             if not writer_error:
                 self._last_writer_error_seen = None
 
+        self._poll_storage_watch()
         try:
             self._status_poll_after_id = self.after(400, self._poll_recorder_status)
         except Exception:
@@ -1878,6 +2040,13 @@ class CoachingView(ttk.Frame):
                 self.after_cancel(after_id)
             except Exception:
                 pass
+        watch = self._storage_watch
+        self._storage_watch = None
+        if watch is not None:
+            try:
+                watch.stop()
+            except Exception:
+                pass
 
 
 ViewEntry = type[ttk.Frame] | Callable[[], type[ttk.Frame]]
@@ -1907,6 +2076,9 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
         ttk.Label(panel, text=msg, justify="left").grid(row=0, column=0, sticky="w")
         return
 
+    from ui.preview.hud_preview import HudPreviewRenderer
+    from ui.preview.layout_preview import LayoutPreviewController, OutputFormat as LayoutPreviewOutputFormat
+    from ui.preview.png_preview import PngPreviewController
     from ui.preview.video_preview import VideoPreviewController
 
     project_root = find_project_root(Path(__file__))
@@ -1957,7 +2129,7 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
     input_video_dir.mkdir(parents=True, exist_ok=True)
     input_csv_dir.mkdir(parents=True, exist_ok=True)
 
-    cache_dir = project_root / "cache"
+    cache_dir = persistence.cache_dir
     proxy_dir = cache_dir / "proxy"
     proxy_dir.mkdir(parents=True, exist_ok=True)
     
@@ -4522,7 +4694,14 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
 
     last_scan_sig: tuple[tuple[str, ...], tuple[str, ...]] | None = None
 
-    def sync_from_folders_if_needed_ui(force: bool = False) -> None:
+    # Watcher (inotify bzw. Polling-Fallback im Hintergrund) haelt die Signatur aktuell; der Tk-Timer liest nur Events.
+    folder_watch: filesvc.InputFolderWatch | None = None
+    try:
+        folder_watch = filesvc.InputFolderWatch(input_video_dir, input_csv_dir)
+    except Exception:
+        folder_watch = None
+
+    def sync_from_folders_if_needed_ui(force: bool = False, sig=None) -> None:
         nonlocal videos, csvs, last_scan_sig
         videos, csvs, last_scan_sig = filesvc.sync_from_folders_if_needed(
             videos=videos,
@@ -4532,12 +4711,25 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
             input_csv_dir=input_csv_dir,
             refresh_display=refresh_display,
             force=force,
+            sig=sig,
         )
+        if force and folder_watch is not None and last_scan_sig is not None:
+            folder_watch.resync(last_scan_sig)
+
+    def sync_from_folder_watch() -> None:
+        if folder_watch is None:
+            sync_from_folders_if_needed_ui(force=False)
+            return
+        sig = folder_watch.poll()
+        if sig is not None:
+            sync_from_folders_if_needed_ui(force=False, sig=sig)
 
     def run_periodic_folder_watch() -> None:
         filesvc.periodic_folder_watch(
-            sync_callback=lambda: sync_from_folders_if_needed_ui(force=False),
-            schedule_callback=lambda: _schedule_root_after(1000, run_periodic_folder_watch),
+            sync_callback=sync_from_folder_watch,
+            schedule_callback=lambda: _schedule_root_after(
+                250 if folder_watch is not None else 1000, run_periodic_folder_watch
+            ),
         )
 
     run_periodic_folder_watch()
@@ -4650,6 +4842,19 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
         except Exception:
             return 0
 
+    def choose_hud_preview_sources() -> tuple[Path, Path, Path, Path] | None:
+        slow_p, fast_p = choose_slow_fast_paths()
+        if slow_p is None or fast_p is None or len(csvs) < 2:
+            return None
+
+        # Gleiche Zuordnung wie der Render (main.py): fast waehlt aus den CSVs ohne die slow-CSV.
+        slow_c, _slow_mode = choose_best_csv_match(slow_p, list(csvs))
+        fast_pool = [c for c in csvs if slow_c is None or str(c).lower() != str(slow_c).lower()]
+        fast_c, _fast_mode = choose_best_csv_match(fast_p, fast_pool)
+        if slow_c is None or fast_c is None or slow_c == fast_c:
+            return None
+        return slow_p, fast_p, slow_c, fast_c
+
     video_preview_ctrl: VideoPreviewController | None = None
 
     def read_frame_as_pil(p: Path, frame_idx: int):
@@ -4705,6 +4910,13 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
             return cw, ch
         return int(preview_area.winfo_width()), int(preview_area.winfo_height())
 
+    hud_preview_renderer = HudPreviewRenderer(
+        get_sources=choose_hud_preview_sources,
+        get_settings=render_service.load_hud_render_settings,
+        schedule=preview_canvas.after,
+        request_redraw=lambda: render_png_preview(force_reload=False),
+    )
+
     png_preview_ctrl = PngPreviewController(
         canvas=preview_canvas,
         get_preview_area_size=_preview_draw_size,
@@ -4720,6 +4932,7 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
         get_enabled_types=lambda: enabled_types(),
         on_preview_geometry=on_preview_geometry,
         on_video_transform_changed=lambda: _sync_video_transform_vars_from_model(),
+        hud_preview=hud_preview_renderer,
     )
 
     def png_load_state_for_current() -> None:
@@ -5423,6 +5636,11 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
         if bool(_view_lifecycle["destroyed"]):
             return
         _view_lifecycle["destroyed"] = True
+        if folder_watch is not None:
+            try:
+                folder_watch.close()
+            except Exception:
+                pass
         for after_id in list(_scheduled_after_ids):
             try:
                 root.after_cancel(after_id)
@@ -5439,11 +5657,25 @@ def build_video_analysis_view(root: tk.Tk, host: ttk.Frame) -> None:
     host.bind("<Destroy>", _teardown_view, add="+")
 
 
+def _prewarm_deferred_modules() -> None:
+    # Module der noch nicht geoeffneten Ansichten im Hintergrund laden, damit der erste Wechsel nicht stockt.
+    def _run() -> None:
+        for name in ("core.coaching.indexer", "ui.coaching_browser"):
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass
+
+    threading.Thread(target=_run, name="startup-prewarm", daemon=True).start()
+
+
 def main() -> None:
     owned_recorder_service = _ensure_irsdk_recorder_service_hooks_bootstrapped()
     _enable_windows_dpi_awareness_best_effort()
     _set_windows_app_user_model_id_best_effort("iWAS")
+    startup_profile.begin()
     root = tk.Tk()
+    startup_profile.mark("tk_root")
     project_root = find_project_root(Path(__file__))
     icon_path = _resolve_icon_path(project_root)
     if icon_path is not None:
@@ -5585,6 +5817,7 @@ def main() -> None:
             except Exception:
                 pass
         view = _build_view(name)
+        startup_profile.mark(f"view:{name}")
         content.scroll_to_top()
         view.grid(row=0, column=0, sticky="nsew")
         content.scroll_to_top()
@@ -5613,14 +5846,32 @@ def main() -> None:
         btn.grid(row=0, column=index, sticky="w", padx=padx)
         buttons[label] = btn
 
+    # Fenster zuerst zeichnen, dann die (schwere) Start-Ansicht bauen.
+    placeholder = ttk.Label(content.content_frame, text=f"Loading {DEFAULT_VIEW_LABEL}...", padding=20)
+    placeholder.grid(row=0, column=0, sticky="nw")
+    current["widget"] = placeholder
+    try:
+        root.update()
+    except tk.TclError:
+        pass
+    startup_profile.mark("first_window")
     show_view(DEFAULT_VIEW_LABEL)
     try:
         _sync_irsdk_recorder_service_from_settings()
     except Exception:
         pass
+    root.after_idle(
+        lambda: startup_profile.finish(
+            build_log_file_path(project_root, "startup").with_suffix(".json"),
+            log_fn=print,
+        )
+    )
+    root.after(1500, _prewarm_deferred_modules)
+    ui_watchdog.start(root.after, log_path=project_root / "_logs" / "ui_stalls.jsonl")
     try:
         root.mainloop()
     finally:
+        ui_watchdog.stop()
         if owned_recorder_service is not None:
             try:
                 owned_recorder_service.stop()
@@ -8,13 +8,22 @@ from tkinter import ttk
 from datetime import datetime
 from typing import Callable
 
-from core.coaching.indexer import CoachingIndex, CoachingTreeNode, NodeSummary
+from core.coaching.indexer import (
+    CoachingIndex,
+    CoachingTreeNode,
+    NodeSummary,
+    lap_is_incomplete as _lap_is_incomplete,
+    lap_is_offtrack as _lap_is_offtrack,
+    node_lap_summary as _node_lap_summary,
+)
 
 
 RefreshCallback = Callable[[], CoachingIndex | None]
 NodeCallback = Callable[[CoachingTreeNode], None]
 
 _PURPLE = "#BF7FFF"
+# Platzhalter-Kind, damit Knoten ohne geladene Kinder aufklappbar bleiben.
+_LAZY_SUFFIX = "::__lazy__"
 
 
 class CoachingBrowser(ttk.Frame):
@@ -42,8 +51,10 @@ class CoachingBrowser(ttk.Frame):
         self._expanded_ids: set[str] = set()
         self._message_var = tk.StringVar(value="")
         self._stats_var = tk.StringVar(value="No sessions loaded.")
-        self._best_overlays: list[tk.Label] = []
+        self._best_overlays: list[tk.Label] = []  # label pool, reused across refreshes
         self._best_text: dict[str, str] = {}  # iid → purple time text
+        self._populated: set[str] = set()  # iids whose real children are inserted
+        self._row_values: dict[str, tuple[str, tuple[str, ...]]] = {}  # iid → (text, values) as inserted
         self._overlay_after_id: str | None = None
         self._overlay_font: tkfont.Font | None = None
         self._overlay_row_bg: str = "#FFFFFF"
@@ -93,7 +104,9 @@ class CoachingBrowser(ttk.Frame):
 
         self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         self.tree.bind("<Double-1>", self._on_double_click)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open)
         self.tree.bind("<<TreeviewOpen>>", lambda _: self._schedule_overlay_refresh(5), add="+")
+        self.tree.bind("<<TreeviewClose>>", self._on_tree_close)
         self.tree.bind("<<TreeviewClose>>", lambda _: self._schedule_overlay_refresh(5), add="+")
         self.tree.bind("<MouseWheel>", lambda _: self._schedule_overlay_refresh(30), add="+")
         self.tree.bind("<Configure>", lambda _: self._schedule_overlay_refresh(10), add="+")
@@ -136,20 +149,21 @@ class CoachingBrowser(ttk.Frame):
         return index.nodes_by_id.get(item_id)
 
     def _rebuild_tree(self, *, selected_id: str | None) -> None:
-        """Implement rebuild tree logic."""
-        self._clear_overlays()
+        """Sync the tree with the current index (diff against existing items, children lazily)."""
         self._best_text.clear()
-        self.tree.delete(*self.tree.get_children(""))
         index = self._index
         if index is None:
+            self._clear_overlays()
+            self.tree.delete(*self.tree.get_children(""))
+            self._populated.clear()
+            self._row_values.clear()
             self._stats_var.set("No sessions loaded.")
             self._update_action_buttons()
             return
-        for node in index.tracks:
-            self._insert_node("", node)
-        best_ids = _compute_best_ids(index)
-        self._build_best_text(index, best_ids)
-        self._restore_expanded_state()
+        self._sync_children("", index.tracks)
+        self._build_best_text(index, index.best_ids)
+        if selected_id and selected_id in index.nodes_by_id:
+            self._reveal(selected_id)
         if selected_id and self.tree.exists(selected_id):
             self.tree.selection_set(selected_id)
             self.tree.focus(selected_id)
@@ -160,17 +174,104 @@ class CoachingBrowser(ttk.Frame):
         self._update_action_buttons()
         self._schedule_overlay_refresh(10)
 
-    def _insert_node(self, parent_iid: str, node: CoachingTreeNode) -> None:
-        """Implement insert node logic."""
-        values = (
-            node.kind,
-            _format_time_col(node),
-            _format_lap_col(node),
-            _format_last_driven(node.summary.last_driven_ts),
-        )
-        self.tree.insert(parent_iid, "end", iid=node.id, text=node.label, values=values, open=(node.id in self._expanded_ids))
-        for child in node.children:
-            self._insert_node(node.id, child)
+    def _sync_children(self, parent_iid: str, nodes: list[CoachingTreeNode]) -> None:
+        """Bring the children of parent_iid in line with nodes: update, move, insert, delete."""
+        tree = self.tree
+        wanted = {node.id for node in nodes}
+        for iid in tree.get_children(parent_iid):
+            if iid not in wanted:
+                self._forget_subtree(iid)
+                tree.delete(iid)
+        for node in nodes:
+            text = node.label
+            values = (
+                node.kind,
+                _format_time_col(node),
+                _format_lap_col(node),
+                _format_last_driven(node.summary.last_driven_ts),
+            )
+            if tree.exists(node.id):
+                if self._row_values.get(node.id) != (text, values):
+                    tree.item(node.id, text=text, values=values)
+                    self._row_values[node.id] = (text, values)
+            else:
+                tree.insert(parent_iid, "end", iid=node.id, text=text, values=values)
+                self._row_values[node.id] = (text, values)
+            self._sync_node_children(node)
+        order = [node.id for node in nodes]
+        if list(tree.get_children(parent_iid)) != order:
+            for pos, iid in enumerate(order):
+                tree.move(iid, parent_iid, pos)
+
+    def _sync_node_children(self, node: CoachingTreeNode) -> None:
+        """Keep open nodes populated; collapsed ones fall back to a lazy placeholder."""
+        tree = self.tree
+        is_open = node.id in self._expanded_ids
+        if node.children and is_open:
+            lazy_iid = node.id + _LAZY_SUFFIX
+            if tree.exists(lazy_iid):
+                tree.delete(lazy_iid)
+            self._populated.add(node.id)
+            self._sync_children(node.id, node.children)
+            tree.item(node.id, open=True)
+            return
+        if node.id in self._populated:
+            for iid in tree.get_children(node.id):
+                self._forget_subtree(iid)
+            tree.delete(*tree.get_children(node.id))
+            self._populated.discard(node.id)
+        if tree.item(node.id, "open"):
+            tree.item(node.id, open=False)
+        lazy_iid = node.id + _LAZY_SUFFIX
+        if node.children and not tree.exists(lazy_iid):
+            tree.insert(node.id, "end", iid=lazy_iid, text="…")
+        elif not node.children and tree.exists(lazy_iid):
+            tree.delete(lazy_iid)
+
+    def _forget_subtree(self, iid: str) -> None:
+        """Drop bookkeeping for an item and its loaded descendants before deletion."""
+        self._row_values.pop(iid, None)
+        if iid in self._populated:
+            self._populated.discard(iid)
+            for child in self.tree.get_children(iid):
+                self._forget_subtree(child)
+
+    def _populate(self, iid: str) -> None:
+        """Insert the real children of iid on first expand."""
+        index = self._index
+        if index is None or iid in self._populated:
+            return
+        node = index.nodes_by_id.get(iid)
+        if node is None:
+            return
+        self._expanded_ids.add(iid)
+        self._sync_node_children(node)
+
+    def _reveal(self, iid: str) -> None:
+        """Populate and open all ancestors of iid so it can be selected."""
+        index = self._index
+        if index is None:
+            return
+        chain: list[str] = []
+        parent = index.parent_by_id.get(iid)
+        while parent:
+            chain.append(parent)
+            parent = index.parent_by_id.get(parent)
+        for ancestor in reversed(chain):
+            if self.tree.exists(ancestor):
+                self._populate(ancestor)
+
+    def _on_tree_open(self, _event=None) -> None:
+        """Load children of the item being expanded."""
+        iid = self.tree.focus()
+        if iid:
+            self._populate(str(iid))
+
+    def _on_tree_close(self, _event=None) -> None:
+        """Remember collapsed state (children stay loaded until the next sync)."""
+        iid = self.tree.focus()
+        if iid:
+            self._expanded_ids.discard(str(iid))
 
     def _capture_expanded_state(self) -> None:
         """Implement capture expanded state logic."""
@@ -179,6 +280,8 @@ class CoachingBrowser(ttk.Frame):
         def walk(parent: str) -> None:
             """Implement walk logic."""
             for iid in self.tree.get_children(parent):
+                if iid not in self._populated:
+                    continue
                 if self.tree.item(iid, "open"):
                     expanded.add(iid)
                 walk(iid)
@@ -186,12 +289,6 @@ class CoachingBrowser(ttk.Frame):
         walk("")
         self._expanded_ids = expanded
 
-    def _restore_expanded_state(self) -> None:
-        """Implement restore expanded state logic."""
-        for iid in list(self._expanded_ids):
-            if self.tree.exists(iid):
-                self.tree.item(iid, open=True)
-
     def _selected_id(self) -> str | None:
         """Implement selected id logic."""
         sel = self.tree.selection()
@@ -269,24 +366,40 @@ class CoachingBrowser(ttk.Frame):
         self._overlay_after_id = self.after(delay_ms, self._refresh_overlays)
 
     def _clear_overlays(self) -> None:
-        """Destroy all existing overlay labels."""
+        """Hide all overlay labels (the pool is kept for reuse)."""
         for lbl in self._best_overlays:
-            lbl.destroy()
-        self._best_overlays.clear()
+            lbl.place_forget()
+
+    def _overlay_label(self, slot: int) -> tk.Label:
+        """Return pooled overlay label number slot, creating it on demand."""
+        while len(self._best_overlays) <= slot:
+            self._best_overlays.append(
+                tk.Label(
+                    self.tree,
+                    fg=_PURPLE,
+                    bg=self._overlay_row_bg,
+                    font=self._overlay_font,
+                    anchor="w",
+                    borderwidth=0,
+                    padx=0,
+                    pady=0,
+                )
+            )
+        return self._best_overlays[slot]
 
     def _refresh_overlays(self) -> None:
-        """Recreate purple overlay labels over the best-time text in the Time column."""
+        """Place purple overlay labels over the best-time text of visible rows only."""
         self._overlay_after_id = None
-        self._clear_overlays()
         if not self._best_text:
+            self._clear_overlays()
             return
         font = self._overlay_font
         row_bg = self._overlay_row_bg
-        sel_bg = self._overlay_sel_bg
-        selected = set(self.tree.selection())
+        slot = 0
         for iid, purple_text in self._best_text.items():
             if not self.tree.exists(iid):
                 continue
+            # bbox ist leer fuer nicht sichtbare Zeilen (eingeklappt oder ausserhalb des Scrollbereichs).
             bbox = self.tree.bbox(iid, "time")
             if not bbox:
                 continue
@@ -295,20 +408,12 @@ class CoachingBrowser(ttk.Frame):
             purple_idx = cell_text.find(purple_text)
             prefix = cell_text[:purple_idx] if purple_idx >= 0 else ""
             lbl_x = x + 4 + font.measure(prefix)
-            lbl_bg = row_bg
-            lbl = tk.Label(
-                self.tree,
-                text=purple_text,
-                fg=_PURPLE,
-                bg=lbl_bg,
-                font=font,
-                anchor="w",
-                borderwidth=0,
-                padx=0,
-                pady=0,
-            )
+            lbl = self._overlay_label(slot)
+            slot += 1
+            lbl.configure(text=purple_text, bg=row_bg, font=font)
             lbl.place(x=lbl_x, y=y + 1, width=font.measure(purple_text) + 2, height=h - 2)
-            self._best_overlays.append(lbl)
+        for lbl in self._best_overlays[slot:]:
+            lbl.place_forget()
 
     def _update_action_buttons(self) -> None:
         """Update action buttons."""
@@ -327,73 +432,6 @@ class CoachingBrowser(ttk.Frame):
             self._btn_delete.state(["disabled"])
 
 
-def _best_time_for_node(node: CoachingTreeNode) -> float | None:
-    """Return comparison time for best-time highlighting (None or ≤0 means no valid time)."""
-    if node.kind == "lap":
-        return node.summary.total_time_s
-    return node.summary.fastest_lap_s
-
-
-def _find_best_id(nodes: list[CoachingTreeNode]) -> str | None:
-    """Return the id of the node with the smallest valid time among *nodes*, or None."""
-    best_id: str | None = None
-    best_t: float | None = None
-    for node in nodes:
-        t = _best_time_for_node(node)
-        if t is not None and t > 0 and (best_t is None or t < best_t):
-            best_t = t
-            best_id = node.id
-    return best_id
-
-
-def _compute_best_ids(index: CoachingIndex) -> set[str]:
-    """Return the set of node IDs that should be highlighted in purple.
-
-    Highlighting rules per level:
-      L1 – Track nodes: NO highlighting
-      L2 – one car node per track (fastest within track)
-      L3 – one session node per car (fastest within car)
-      L4 – one run node per car (fastest across ALL sessions of that car)
-      L5 – one lap node per car (fastest valid lap — not incomplete, not offtrack)
-    """
-    result: set[str] = set()
-
-    for track in index.tracks:
-        # Level 2: fastest car within this track
-        bid = _find_best_id(track.children)
-        if bid:
-            result.add(bid)
-
-        for car in track.children:
-            # Level 3: fastest session within this car
-            bid = _find_best_id(car.children)
-            if bid:
-                result.add(bid)
-
-            all_runs: list[CoachingTreeNode] = []
-            all_laps: list[CoachingTreeNode] = []
-            for session in car.children:
-                for run in session.children:
-                    all_runs.append(run)
-                    for lap in run.children:
-                        lap_sum = _node_lap_summary(lap)
-                        if not _lap_is_incomplete(lap.summary, lap_summary=lap_sum) \
-                                and not _lap_is_offtrack(lap.summary, lap_summary=lap_sum):
-                            all_laps.append(lap)
-
-            # Level 4: fastest run (one per car, across all sessions)
-            bid = _find_best_id(all_runs)
-            if bid:
-                result.add(bid)
-
-            # Level 5: fastest valid lap (not incomplete, not offtrack)
-            bid = _find_best_id(all_laps)
-            if bid:
-                result.add(bid)
-
-    return result
-
-
 def _format_summary(node: CoachingTreeNode) -> str:
     """Format summary."""
     summary = node.summary
@@ -471,46 +509,6 @@ def _lap_status(summary: NodeSummary, *, lap_summary: dict[str, object]) -> str
     return None
 
 
-def _node_lap_summary(node: CoachingTreeNode) -> dict[str, object]:
-    """Implement node lap summary logic."""
-    meta = getattr(node, "meta", {})
-    if isinstance(meta, dict):
-        summary = meta.get("lap_summary")
-        if isinstance(summary, dict):
-            return summary
-    return {}
-
-
-def _lap_is_incomplete(summary: NodeSummary, *, lap_summary: dict[str, object]) -> bool:
-    """Implement lap is incomplete logic."""
-    if bool(getattr(summary, "lap_incomplete", False)):
-        return True
-    if "incomplete" in lap_summary:
-        explicit = _coerce_optional_bool(lap_summary.get("incomplete"))
-        if explicit is not None:
-            return bool(explicit)
-    if "lap_incomplete" in lap_summary:
-        explicit = _coerce_optional_bool(lap_summary.get("lap_incomplete"))
-        if explicit is not None:
-            return bool(explicit)
-    lap_complete = _coerce_optional_bool(lap_summary.get("lap_complete"))
-    if lap_complete is not None:
-        return not bool(lap_complete)
-    return False
-
-
-def _lap_is_offtrack(summary: NodeSummary, *, lap_summary: dict[str, object]) -> bool:
-    """Implement lap is offtrack logic."""
-    if bool(getattr(summary, "lap_offtrack", False)):
-        return True
-    for key in ("offtrack_surface", "lap_offtrack", "offtrack"):
-        if key in lap_summary:
-            explicit = _coerce_optional_bool(lap_summary.get(key))
-            if explicit is not None:
-                return bool(explicit)
-    return False
-
-
 def _format_seconds(seconds: float) -> str:
     """Format seconds."""
     try:
@@ -559,23 +557,3 @@ def _coerce_optional_float(value: object) -> float | None:
         return float(value)
     except Exception:
         return None
-
-
-def _coerce_optional_bool(value: object) -> bool | None:
-    """Coerce optional bool."""
-    if isinstance(value, bool):
-        return value
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        if value == 0:
-            return False
-        if value == 1:
-            return True
-    if isinstance(value, str):
-        text = value.strip().lower()
-        if text in {"0", "false", "no", "n", "off"}:
-            return False
-        if text in {"1", "true", "yes", "y", "on"}:
-            return True
-    return None
@@ -10,6 +10,7 @@ import time
 from typing import Any, Callable, TYPE_CHECKING
 
 from core.models import AppModel
+from core.telemetry_library import parse_g61_csv_basename
 
 if TYPE_CHECKING:
     from ui.preview.layout_preview import LayoutPreviewController
@@ -129,31 +130,7 @@ class Controller:
 
     @staticmethod
     def _parse_g61_csv_basename(path: Path) -> tuple[str, str, str, str] | None:
-        name = str(path.name or "")
-        if not name.lower().endswith(".csv"):
-            return None
-
-        stem = name[:-4]
-        prefix = "Garage 61 - "
-        if not stem.startswith(prefix):
-            return None
-
-        rest = stem[len(prefix):]
-        try:
-            left, track, lap_time, _run_id = rest.rsplit(" - ", 3)
-            driver, car = left.split(" - ", 1)
-        except ValueError:
-            return None
-
-        driver = driver.strip()
-        car = car.strip()
-        track = track.strip()
-        lap_time = lap_time.strip()
-        if not driver or not car or not track:
-            return None
-        if re.fullmatch(r"\d{2}\.\d{2}\.\d{3}", lap_time) is None:
-            return None
-        return driver, car, track, lap_time
+        return parse_g61_csv_basename(path)
 
     @staticmethod
     def _sanitize_windows_filename_base(name: str) -> str:
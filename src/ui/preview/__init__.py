@@ -1,6 +1,7 @@
 """Runtime module for ui/preview/__init__.py."""
 
+from .hud_preview import HudPreviewRenderer
 from .layout_preview import LayoutPreviewController, OutputFormat
 from .png_preview import PngPreviewController
 
-__all__ = ["LayoutPreviewController", "OutputFormat", "PngPreviewController"]
+__all__ = ["HudPreviewRenderer", "LayoutPreviewController", "OutputFormat", "PngPreviewController"]
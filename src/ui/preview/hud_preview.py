@@ -0,0 +1,252 @@
+"""Runtime module for ui/preview/hud_preview.py."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable
+
+HUD_PREVIEW_ENV = "IRVC_PREVIEW_HUD"
+
+# HUDs mit teurer Vorberechnung (nur im Kontext, wenn aktiv).
+_CTX_HEAVY_HUDS = ("Line Delta", "Under-/Oversteer")
+
+
+def hud_preview_enabled() -> bool:
+    """Return whether the preview shows real HUD content (default on, IRVC_PREVIEW_HUD=0 disables)."""
+    raw = str(os.environ.get(HUD_PREVIEW_ENV) or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def _file_sig(p: Path) -> tuple[str, int, int]:
+    """Implement file sig logic."""
+    try:
+        st = Path(p).stat()
+        return str(p), int(st.st_size), int(st.st_mtime_ns)
+    except Exception:
+        return str(p), 0, 0
+
+
+class HudPreviewRenderer:
+    """
+    Real HUD content for the layout preview. The HudContext (CSV, sync maps, signals) is built once per lap pair
+    on a helper thread; single HUD groups are rendered on demand and cached by frame and box geometry, so
+    dragging one box only re-renders that box.
+    """
+
+    def __init__(
+        self,
+        get_sources: Callable[[], tuple[Path, Path, Path, Path] | None],
+        get_settings: Callable[[], dict[str, Any]],
+        schedule: Callable[[int, Callable[[], None]], Any],
+        request_redraw: Callable[[], None],
+        max_cached_groups: int = 96,
+    ) -> None:
+        """Implement init logic."""
+        self._get_sources = get_sources
+        self._get_settings = get_settings
+        self._schedule = schedule
+        self._request_redraw = request_redraw
+        self._max_cached_groups = max(8, int(max_cached_groups))
+
+        self._lock = threading.Lock()
+        self._ctx: Any | None = None
+        self._ctx_key: tuple[Any, ...] | None = None
+        self._building_key: tuple[Any, ...] | None = None
+        self._failed_key: tuple[Any, ...] | None = None
+        self._groups: OrderedDict[tuple[Any, ...], list[Any]] = OrderedDict()
+        self.last_render_ms = 0.0
+        self.last_rendered_groups = 0
+
+    def _context_key(self, sources: tuple[Path, Path, Path, Path], names: list[str], settings: dict[str, Any]) -> tuple[Any, ...]:
+        """Implement context key logic."""
+        slow, fast, slow_csv, fast_csv = sources
+        ctx_settings = {k: v for k, v in settings.items() if k != "curve_points_overrides"}
+        return (
+            str(slow),
+            str(fast),
+            _file_sig(slow_csv),
+            _file_sig(fast_csv),
+            tuple(n for n in _CTX_HEAVY_HUDS if n in names),
+            json.dumps(ctx_settings, sort_keys=True, default=str),
+        )
+
+    def _start_build(self, key: tuple[Any, ...], sources: tuple[Path, Path, Path, Path], names: list[str], settings: dict[str, Any]) -> None:
+        """Build the HudContext on a helper thread; the Tk thread polls for the result."""
+        self._building_key = key
+        slow, fast, slow_csv, fast_csv = sources
+
+        def _run() -> None:
+            """Implement run logic."""
+            ctx = None
+            try:
+                from features.render_split import build_hud_preview_context
+
+                ctx = build_hud_preview_context(
+                    slow=slow,
+                    fast=fast,
+                    slow_csv=slow_csv,
+                    fast_csv=fast_csv,
+                    hud_names=names,
+                    hud_window_default_before_s=float(settings.get("window_before_s", 10.0)),
+                    hud_window_default_after_s=float(settings.get("window_after_s", 10.0)),
+                    hud_curve_points_default=int(settings.get("curve_points_default", 180)),
+                    hud_curve_points_overrides=settings.get("curve_points_overrides"),
+                    hud_speed_units=str(settings.get("speed_units", "kmh")),
+                    hud_speed_update_hz=int(settings.get("speed_update_hz", 60)),
+                    hud_gear_rpm_update_hz=int(settings.get("gear_rpm_update_hz", 60)),
+                    hud_pedals_sample_mode=str(settings.get("pedals_sample_mode", "time")),
+                    hud_pedals_abs_debounce_ms=int(settings.get("pedals_abs_debounce_ms", 60)),
+                    hud_max_brake_delay_distance=float(settings.get("max_brake_delay_distance", 0.003)),
+                    hud_max_brake_delay_pressure=float(settings.get("max_brake_delay_pressure", 35.0)),
+                    under_oversteer_curve_center=float(settings.get("under_oversteer_curve_center", 0.0)),
+                )
+            except Exception as e:
+                try:
+                    print(f"[preview-hud] context failed: {type(e).__name__}: {e}")
+                except Exception:
+                    pass
+            with self._lock:
+                if self._building_key != key:
+                    return
+                self._building_key = None
+                if ctx is None:
+                    self._failed_key = key
+                    return
+                # Alte Gruppen tragen den alten Kontext-Schluessel und fallen aus dem LRU.
+                self._ctx = ctx
+                self._ctx_key = key
+
+        threading.Thread(target=_run, name="hud-preview-ctx", daemon=True).start()
+        self._schedule(100, lambda: self._poll(key))
+
+    def _poll(self, key: tuple[Any, ...]) -> None:
+        """Implement poll logic."""
+        with self._lock:
+            building = self._building_key == key
+            ready = self._ctx_key == key
+        if building:
+            self._schedule(100, lambda: self._poll(key))
+            return
+        if ready:
+            try:
+                self._request_redraw()
+            except Exception:
+                pass
+
+    def _ready_context(self, names: list[str]) -> tuple[Any | None, tuple[Any, ...] | None, dict[str, Any]]:
+        """Return the current context, starting a (re)build when the lap pair or settings changed."""
+        try:
+            sources = self._get_sources()
+        except Exception:
+            sources = None
+        if sources is None:
+            return None, None, {}
+        try:
+            settings = dict(self._get_settings() or {})
+        except Exception:
+            settings = {}
+        key = self._context_key(sources, names, settings)
+        with self._lock:
+            if self._ctx_key == key:
+                return self._ctx, key, settings
+            if self._building_key == key or self._failed_key == key:
+                return None, None, settings
+        self._start_build(key, sources, names, settings)
+        return None, None, settings
+
+    def layers(
+        self,
+        *,
+        frame: int,
+        names: set[str],
+        out_w: int,
+        out_h: int,
+        hud_w: int,
+        layout_config: Any | None,
+        geom: Any,
+        hud_boxes: list[dict],
+        scale: float,
+    ) -> list[Any]:
+        """Return HudPreviewLayer objects for the enabled HUDs (empty while the context is being built)."""
+        if not hud_preview_enabled() or not names:
+            return []
+        name_list = sorted(str(n) for n in names)
+        ctx, ctx_key, settings = self._ready_context(name_list)
+        if ctx is None:
+            return []
+
+        from core.render_service import resolve_curve_points_overrides
+        from features.render_split import hud_preview_groups, render_hud_preview_layers
+
+        boxes_map: dict[str, dict[str, int]] = {}
+        for b in hud_boxes:
+            try:
+                t = str(b.get("type") or "").strip()
+                if t:
+                    boxes_map[t] = {k: int(b.get(k) or 0) for k in ("x", "y", "w", "h")}
+            except Exception:
+                continue
+        overrides = resolve_curve_points_overrides(dict(settings.get("curve_points_overrides") or {}), boxes_map)
+        try:
+            bg_alpha = int(layout_config.hud_free.bg_alpha)
+        except Exception:
+            bg_alpha = 255
+        geo_sig = (
+            round(float(scale), 4),
+            int(out_w),
+            int(out_h),
+            int(hud_w),
+            str(getattr(geom, "hud_mode", "")),
+            repr(tuple(getattr(geom, "hud_rects", ()) or ())),
+            int(bg_alpha),
+        )
+
+        out: list[Any] = []
+        t0 = time.perf_counter()
+        rendered = 0
+        for group in hud_preview_groups(name_list):
+            # Der Traeger einer Tabellen-Gruppe wird nicht ausgeschnitten, seine Box gehoert nicht in den Schluessel.
+            members = group[:-1] if len(group) > 1 else group
+            group_key = (
+                ctx_key,
+                int(frame),
+                geo_sig,
+                tuple((n, tuple(sorted(boxes_map.get(n, {}).items())), overrides.get(n)) for n in members),
+            )
+            cached = self._groups.get(group_key)
+            if cached is None:
+                try:
+                    cached = render_hud_preview_layers(
+                        ctx,
+                        frame=int(frame),
+                        group=group,
+                        out_w=int(out_w),
+                        out_h=int(out_h),
+                        hud_width_px=int(hud_w),
+                        layout_config=layout_config,
+                        hud_boxes=boxes_map,
+                        scale=float(scale),
+                        curve_points_overrides=overrides,
+                    )
+                except Exception as e:
+                    cached = []
+                    try:
+                        print(f"[preview-hud] render failed group={group}: {type(e).__name__}: {e}")
+                    except Exception:
+                        pass
+                rendered += 1
+                self._groups[group_key] = cached
+                while len(self._groups) > self._max_cached_groups:
+                    self._groups.popitem(last=False)
+            else:
+                self._groups.move_to_end(group_key)
+            out.extend(cached)
+        if rendered:
+            self.last_render_ms = 1000.0 * (time.perf_counter() - t0)
+            self.last_rendered_groups = int(rendered)
+        return out
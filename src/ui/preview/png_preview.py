@@ -9,6 +9,7 @@ import tkinter as tk
 
 from PIL import Image, ImageTk
 
+from .hud_preview import HudPreviewRenderer
 from .layout_preview import OutputFormat
 from core.output_geometry import build_output_geometry_for_size
 
@@ -85,6 +86,7 @@ class PngPreviewController:
         get_enabled_types: Callable[[], set[str]] | None = None,
         on_preview_geometry: Callable[[Any, int, int, float, int, int, int], None] | None = None,
         on_video_transform_changed: Callable[[], None] | None = None,
+        hud_preview: HudPreviewRenderer | None = None,
     ) -> None:
         """Implement init logic."""
         self.canvas = canvas
@@ -101,6 +103,7 @@ class PngPreviewController:
         self._get_enabled_types = get_enabled_types
         self._on_preview_geometry = on_preview_geometry
         self._on_video_transform_changed = on_video_transform_changed
+        self._hud_preview = hud_preview
 
         self.PNG_DEBUG = False
 
@@ -640,6 +643,45 @@ class PngPreviewController:
         render_side("L", self.png_img_left, slow_region)
         render_side("R", self.png_img_right, fast_region)
 
+        hud_boxes: list[dict] = []
+        if self._get_hud_boxes is not None:
+            try:
+                boxes = self._get_hud_boxes()
+                if isinstance(boxes, list):
+                    hud_boxes = boxes
+            except Exception:
+                hud_boxes = []
+        enabled_types: set[str] = set()
+        if self._get_enabled_types is not None:
+            try:
+                enabled_types = set(self._get_enabled_types())
+            except Exception:
+                enabled_types = set()
+
+        # Echte HUD-Inhalte fuer das Vorschau-Frame (Slow-Startframe), gecacht pro Box-Geometrie.
+        hud_layer_types: set[str] = set()
+        if self._hud_preview is not None:
+            try:
+                layers = self._hud_preview.layers(
+                    frame=int(self.png_left_start),
+                    names=enabled_types,
+                    out_w=int(out_w),
+                    out_h=int(out_h),
+                    hud_w=int(hud_w),
+                    layout_config=layout_config,
+                    geom=geom,
+                    hud_boxes=hud_boxes,
+                    scale=float(scale),
+                )
+            except Exception:
+                layers = []
+            for layer in layers:
+                try:
+                    bg.paste(layer.image, (int(layer.box[0]), int(layer.box[1])), layer.image)
+                    hud_layer_types.add(str(layer.name))
+                except Exception:
+                    continue
+
         # Rahmen / Trenner zeichnen wir im Canvas (nicht im Bild)
         tk_img = ImageTk.PhotoImage(bg)
 
@@ -666,21 +708,6 @@ class PngPreviewController:
                 text=f"HUD {idx + 1}",
             )
 
-        hud_boxes: list[dict] = []
-        if self._get_hud_boxes is not None:
-            try:
-                boxes = self._get_hud_boxes()
-                if isinstance(boxes, list):
-                    hud_boxes = boxes
-            except Exception:
-                hud_boxes = []
-        enabled_types: set[str] = set()
-        if self._get_enabled_types is not None:
-            try:
-                enabled_types = set(self._get_enabled_types())
-            except Exception:
-                enabled_types = set()
-
         for b in hud_boxes:
             t = str(b.get("type") or "")
             if t not in enabled_types:
@@ -694,12 +721,13 @@ class PngPreviewController:
                 continue
             cx0, cy0, cx1, cy1 = out_rect_to_frame(bx, by, bw, bh)
             tag = f"hud_{t.replace(' ', '_').replace('/', '_')}"
+            has_layer = t in hud_layer_types
             self.canvas.create_rectangle(
                 x0 + cx0,
                 y0 + cy0,
                 x0 + cx1,
                 y0 + cy1,
-                fill="white",
+                fill="" if has_layer else "white",
                 outline="black",
                 tags=("hud_box", tag),
             )
@@ -714,6 +742,8 @@ class PngPreviewController:
                 outline="black",
                 tags=("hud_handle", tag),
             )
+            if has_layer:
+                continue
             self.canvas.create_text(
                 int(x0 + (cx0 + cx1) / 2),
                 int(y0 + (cy0 + cy1) / 2),
@@ -18,6 +18,7 @@ from PIL import Image, ImageTk
 from core.encoders import detect_available_encoders
 from core.ffmpeg_tools import ffmpeg_exists as _ffmpeg_exists_bundled, resolve_ffmpeg_bin, resolve_ffprobe_bin
 from core.log import make_logger
+from core.media_index import get_media_index
 from core.subprocess_utils import windows_no_window_subprocess_kwargs
 
 
@@ -726,7 +727,16 @@ class VideoPreviewController:
         return frame_times, sorted(set(int(i) for i in keyframes if 0 <= int(i) < len(frame_times)))
 
     def _probe_video_frames_for_hybrid_cut(self, src: Path) -> tuple[list[float], list[int]]:
-        """Implement probe video frames for hybrid cut logic."""
+        """Implement probe video frames for hybrid cut logic (cached in the media index)."""
+        index = get_media_index()
+        hits_before = index.hits
+        frame_times, keyframes = index.frame_index(src, lambda: self._build_video_frame_index_for_hybrid_cut(src))
+        if index.hits > hits_before:
+            self._cut_log(f"ffprobe frame index cache hit file={src.name} frames={len(frame_times)} keyframes={len(keyframes)}")
+        return frame_times, keyframes
+
+    def _build_video_frame_index_for_hybrid_cut(self, src: Path) -> tuple[list[float], list[int]]:
+        """Build the frame pts / keyframe index via ffprobe (packets first, frames as fallback)."""
         try:
             return self._probe_video_packets_for_hybrid_cut(src)
         except Exception as packet_err:
@@ -822,45 +832,12 @@ class VideoPreviewController:
     def _probe_primary_video_codec_name(self, src: Path) -> str:
         """Implement probe primary video codec name logic."""
         try:
-            p = subprocess.run(
-                [
-                    resolve_ffprobe_bin(),
-                    "-v",
-                    "error",
-                    "-select_streams",
-                    "v:0",
-                    "-show_entries",
-                    "stream=codec_name",
-                    "-of",
-                    "json",
-                    str(src),
-                ],
-                capture_output=True,
-                text=True,
-                **windows_no_window_subprocess_kwargs(),
-            )
+            info = get_media_index().stream_info(src)
         except Exception as e:
-            raise RuntimeError(f"ffprobe codec start failed: {e}") from e
-
-        if p.returncode != 0:
-            err = (p.stderr or p.stdout or "").strip()
-            if err:
-                lines = [ln.strip() for ln in err.splitlines() if ln.strip()]
-                if lines:
-                    raise RuntimeError(lines[-1])
-            raise RuntimeError(f"ffprobe codec rc={p.returncode}")
-
-        try:
-            payload = json.loads(p.stdout or "{}")
-        except Exception as e:
-            raise RuntimeError(f"ffprobe codec JSON parse failed: {e}") from e
-
-        streams = payload.get("streams") if isinstance(payload, dict) else None
-        if not isinstance(streams, list) or not streams:
-            raise RuntimeError("ffprobe codec returned no video stream")
-        st0 = streams[0]
+            raise RuntimeError(f"ffprobe codec probe failed: {e}") from e
+        st0 = info.get("video")
         if not isinstance(st0, dict):
-            raise RuntimeError("ffprobe codec returned invalid stream payload")
+            raise RuntimeError("ffprobe codec returned no video stream")
         codec_name = str(st0.get("codec_name") or "").strip().lower()
         if codec_name == "":
             raise RuntimeError("ffprobe codec returned empty codec_name")